@@ -4811,6 +4811,7 @@ class CodonAligner(_codonaligner.CodonAligner):
 # fmt: off
 formats = (
     "a2m",        # A2M files created by align2model or hmmscore
+    "bam",        # Binary Alignment/Map (BAM) format
     "bed",        # BED (Browser Extensible Data) files
     "bigbed",     # bigBed format
     "bigmaf",     # MAF file saved as a bigBed file
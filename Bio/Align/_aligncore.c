@@ -6,6 +6,7 @@
  */
 
 
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
 #include <stdbool.h>
 
@@ -482,12 +483,454 @@ static PyTypeObject ParserType = {
     .tp_new = (newfunc)Parser_new,
 };
 
+static PyObject*
+_create_coordinates(Py_ssize_t k, Py_ssize_t** target, Py_ssize_t** query)
+/* Create a bytearray object with space for a coordinates array of shape
+ * (2, k), and set target and query to point to its first and second row.
+ */
+{
+    PyObject* coordinates;
+    coordinates = PyByteArray_FromStringAndSize(NULL,
+                                                2 * k * sizeof(Py_ssize_t));
+    if (!coordinates) return NULL;
+    *target = (Py_ssize_t*) PyByteArray_AS_STRING(coordinates);
+    *query = *target + k;
+    return coordinates;
+}
+
+typedef struct {
+    Py_ssize_t* target;
+    Py_ssize_t* query;
+    char* operations;
+    Py_ssize_t j;
+    Py_ssize_t target_position;
+    Py_ssize_t query_position;
+    Py_ssize_t hard_clip_left;
+    Py_ssize_t hard_clip_right;
+} Cigar;
+
+static bool
+_is_aligned_cigar_operation(char c)
+/* Return true for CIGAR operations that create an aligned block. */
+{
+    switch (c) {
+        case 'M': case 'I': case 'D': case 'N': case '=': case 'X':
+            return true;
+        default:
+            return false;
+    }
+}
+
+static PyObject*
+_create_cigar(Cigar* cigar, Py_ssize_t k, Py_ssize_t target_start,
+              PyObject** operations_array)
+/* Create the coordinates and operations arrays for a CIGAR with k - 1
+ * aligned blocks, and initialize the parser state.
+ */
+{
+    PyObject* coordinates;
+    coordinates = _create_coordinates(k, &cigar->target, &cigar->query);
+    if (!coordinates) return NULL;
+    *operations_array = PyByteArray_FromStringAndSize(NULL, k - 1);
+    if (!*operations_array) {
+        Py_DECREF(coordinates);
+        return NULL;
+    }
+    cigar->operations = PyByteArray_AS_STRING(*operations_array);
+    cigar->j = 0;
+    cigar->target_position = target_start;
+    cigar->query_position = 0;
+    cigar->hard_clip_left = -1;
+    cigar->hard_clip_right = -1;
+    cigar->target[0] = target_start;
+    cigar->query[0] = 0;
+    return coordinates;
+}
+
+static bool
+_add_cigar_operation(Cigar* cigar, char c, Py_ssize_t number)
+/* Apply one CIGAR operation; return false with an exception set on error. */
+{
+    switch (c) {
+        case 'M':  /* alignment match */
+        case '=':  /* sequence match */
+        case 'X':  /* sequence mismatch */
+            cigar->target_position += number;
+            cigar->query_position += number;
+            break;
+        case 'I':  /* insertion to the reference */
+            cigar->query_position += number;
+            break;
+        case 'D':  /* deletion from the reference */
+        case 'N':  /* skipped region from the reference */
+            cigar->target_position += number;
+            break;
+        case 'S':  /* soft clipping */
+            if (cigar->query_position == 0) cigar->query[0] += number;
+            cigar->query_position += number;
+            return true;
+        case 'H':  /* hard clipping */
+            if (cigar->query_position == 0) cigar->hard_clip_left = number;
+            else cigar->hard_clip_right = number;
+            return true;
+        case 'P':  /* padding */
+            PyErr_SetString(PyExc_NotImplementedError,
+                            "padding operator is not yet implemented");
+            return false;
+        default:
+            PyErr_Format(PyExc_ValueError,
+                         "unknown operation '%c' in CIGAR string", c);
+            return false;
+    }
+    cigar->operations[cigar->j] = c;
+    cigar->j++;
+    cigar->target[cigar->j] = cigar->target_position;
+    cigar->query[cigar->j] = cigar->query_position;
+    return true;
+}
+
+static PyObject*
+_cigar_result(Cigar* cigar, PyObject* coordinates, PyObject* operations_array)
+/* Return the tuple (coordinates, operations, query_length, hard_clip_left,
+ * hard_clip_right). Steals the references to coordinates and
+ * operations_array.
+ */
+{
+    PyObject* left;
+    PyObject* right;
+
+    if (cigar->hard_clip_left < 0) {
+        left = Py_None;
+        Py_INCREF(left);
+    }
+    else {
+        left = PyLong_FromSsize_t(cigar->hard_clip_left);
+        if (!left) goto error;
+    }
+    if (cigar->hard_clip_right < 0) {
+        right = Py_None;
+        Py_INCREF(right);
+    }
+    else {
+        right = PyLong_FromSsize_t(cigar->hard_clip_right);
+        if (!right) {
+            Py_DECREF(left);
+            goto error;
+        }
+    }
+    return Py_BuildValue("NNnNN",
+                         coordinates, operations_array, cigar->query_position,
+                         left, right);
+
+error:
+    Py_DECREF(coordinates);
+    Py_DECREF(operations_array);
+    return NULL;
+}
+
+PyDoc_STRVAR(
+    parse_cigar__doc__,
+    "parse_cigar(cigar, target_start=0)\n"
+    "--\n"
+    "\n"
+    "Parse a CIGAR string as defined in the SAM format.\n"
+    "\n"
+    "The return value is the tuple (coordinates, operations, query_length,\n"
+    "hard_clip_left, hard_clip_right), in which\n"
+    " - coordinates is a bytearray object storing the alignment coordinates\n"
+    "   as an array of Py_ssize_t values of shape (2, k), with the target\n"
+    "   coordinates starting at target_start in the first row and the query\n"
+    "   coordinates in the second row;\n"
+    " - operations is a bytearray object of length k - 1 with the CIGAR\n"
+    "   operation (M, I, D, N, =, or X) of each aligned block;\n"
+    " - query_length is the length of the query sequence, including soft\n"
+    "   clipped regions;\n"
+    " - hard_clip_left and hard_clip_right are the number of hard clipped\n"
+    "   bases on each side, or None if there is no hard clipping.\n"
+    "\n"
+    "Soft clipped bases at the start of the query shift the query\n"
+    "coordinates.  Use numpy.frombuffer(coordinates, numpy.intp) and reshape\n"
+    "the result to (2, k) to obtain the coordinates as a NumPy array.");
+
+static PyObject*
+parse_cigar(PyObject* module, PyObject* args, PyObject* keywords)
+{
+    const char* text;
+    Py_ssize_t length;
+    Py_ssize_t target_start = 0;
+    Py_ssize_t i;
+    Py_ssize_t k = 1;
+    Py_ssize_t number = 0;
+    bool digits = false;
+    char c;
+    Cigar cigar;
+    PyObject* coordinates;
+    PyObject* operations_array;
+    static char* kwlist[] = {"cigar", "target_start", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, keywords, "s#|n:parse_cigar",
+                                     kwlist, &text, &length, &target_start))
+        return NULL;
+
+    if (length == 1 && text[0] == '*') length = 0;
+    for (i = 0; i < length; i++) {
+        if (_is_aligned_cigar_operation(text[i])) k++;
+    }
+    coordinates = _create_cigar(&cigar, k, target_start, &operations_array);
+    if (!coordinates) return NULL;
+
+    for (i = 0; i < length; i++) {
+        c = text[i];
+        if (c >= '0' && c <= '9') {
+            number = 10 * number + (c - '0');
+            digits = true;
+            continue;
+        }
+        if (!digits) {
+            PyErr_Format(PyExc_ValueError,
+                         "missing length for operation '%c' in CIGAR string",
+                         c);
+            goto error;
+        }
+        if (!_add_cigar_operation(&cigar, c, number)) goto error;
+        number = 0;
+        digits = false;
+    }
+    if (digits) {
+        PyErr_SetString(PyExc_ValueError,
+                        "missing operation at the end of the CIGAR string");
+        goto error;
+    }
+    return _cigar_result(&cigar, coordinates, operations_array);
+
+error:
+    Py_DECREF(coordinates);
+    Py_DECREF(operations_array);
+    return NULL;
+}
+
+PyDoc_STRVAR(
+    parse_binary_cigar__doc__,
+    "parse_binary_cigar(cigar, target_start=0)\n"
+    "--\n"
+    "\n"
+    "Parse a binary CIGAR as stored in BAM files.\n"
+    "\n"
+    "The argument is a bytes-like object storing the CIGAR operations as\n"
+    "little-endian 32-bit integers, with the operation length in the upper\n"
+    "28 bits and the operation code (an index into \"MIDNSHP=X\") in the\n"
+    "lower 4 bits.  The return value is as for parse_cigar.");
+
+static PyObject*
+parse_binary_cigar(PyObject* module, PyObject* args, PyObject* keywords)
+{
+    Py_buffer view;
+    const unsigned char* data;
+    Py_ssize_t n;
+    Py_ssize_t target_start = 0;
+    Py_ssize_t i;
+    Py_ssize_t k = 1;
+    uint32_t value;
+    unsigned int code;
+    Cigar cigar;
+    PyObject* coordinates;
+    PyObject* operations_array;
+    static const char codes[] = "MIDNSHP=X";
+    static char* kwlist[] = {"cigar", "target_start", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, keywords,
+                                     "y*|n:parse_binary_cigar",
+                                     kwlist, &view, &target_start))
+        return NULL;
+    if (view.len % 4 != 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "length of binary CIGAR is not a multiple of 4");
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    data = view.buf;
+    n = view.len / 4;
+    for (i = 0; i < n; i++) {
+        code = data[4 * i] & 0xF;
+        if (code < 9 && _is_aligned_cigar_operation(codes[code])) k++;
+    }
+    coordinates = _create_cigar(&cigar, k, target_start, &operations_array);
+    if (!coordinates) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    for (i = 0; i < n; i++) {
+        value = (uint32_t)data[4 * i]
+              | (uint32_t)data[4 * i + 1] << 8
+              | (uint32_t)data[4 * i + 2] << 16
+              | (uint32_t)data[4 * i + 3] << 24;
+        code = value & 0xF;
+        if (code >= 9) {
+            PyErr_Format(PyExc_ValueError,
+                         "unknown operation %u in binary CIGAR", code);
+            goto error;
+        }
+        if (!_add_cigar_operation(&cigar, codes[code], value >> 4)) goto error;
+    }
+    PyBuffer_Release(&view);
+    return _cigar_result(&cigar, coordinates, operations_array);
+
+error:
+    PyBuffer_Release(&view);
+    Py_DECREF(coordinates);
+    Py_DECREF(operations_array);
+    return NULL;
+}
+
+typedef enum {NONE, MATCH, QUERY_GAP, TARGET_GAP} State;
+
+static bool
+_is_btop_letter(char c)
+{
+    return (c >= 'A' && c <= 'Z') || c == '-' || c == '*';
+}
+
+static Py_ssize_t
+_parse_btop(const char* btop, Py_ssize_t length,
+            Py_ssize_t* target, Py_ssize_t* query)
+/* Parse a BTOP string, and return the number of columns of the coordinates
+ * array.  The coordinates are stored in target and query if these are not
+ * NULL.
+ */
+{
+    Py_ssize_t i;
+    Py_ssize_t j = 0;
+    Py_ssize_t number;
+    Py_ssize_t target_position = 0;
+    Py_ssize_t query_position = 0;
+    State state = NONE;
+    char c;
+
+    if (target) {
+        target[0] = 0;
+        query[0] = 0;
+    }
+    i = 0;
+    while (i < length) {
+        c = btop[i];
+        if (c >= '0' && c <= '9') {
+            number = 0;
+            do {
+                number = 10 * number + (c - '0');
+                i++;
+                if (i == length) break;
+                c = btop[i];
+            } while (c >= '0' && c <= '9');
+        }
+        else if (_is_btop_letter(c)
+              && i + 1 < length && _is_btop_letter(btop[i+1])) {
+            /* pair of query and target letters */
+            i += 2;
+            if (c == '-') {
+                /* gap in the query */
+                if (state != QUERY_GAP) {
+                    j++;
+                    state = QUERY_GAP;
+                }
+                target_position++;
+                if (target) {
+                    target[j] = target_position;
+                    query[j] = query_position;
+                }
+                continue;
+            }
+            if (btop[i-1] == '-') {
+                /* gap in the target */
+                if (state != TARGET_GAP) {
+                    j++;
+                    state = TARGET_GAP;
+                }
+                query_position++;
+                if (target) {
+                    target[j] = target_position;
+                    query[j] = query_position;
+                }
+                continue;
+            }
+            number = 1;  /* mismatch */
+        }
+        else {
+            i++;
+            continue;
+        }
+        if (state != MATCH) {
+            j++;
+            state = MATCH;
+        }
+        target_position += number;
+        query_position += number;
+        if (target) {
+            target[j] = target_position;
+            query[j] = query_position;
+        }
+    }
+    return j + 1;
+}
+
+PyDoc_STRVAR(
+    parse_btop__doc__,
+    "parse_btop(btop)\n"
+    "--\n"
+    "\n"
+    "Parse a BTOP (Blast trace-back operations) string.\n"
+    "\n"
+    "The return value is a bytearray object storing the alignment\n"
+    "coordinates as an array of Py_ssize_t values of shape (2, k), with\n"
+    "the target coordinates in the first row and the query coordinates in\n"
+    "the second row, both starting at zero.  Use\n"
+    "numpy.frombuffer(coordinates, numpy.intp) and reshape the result to\n"
+    "(2, k) to obtain the coordinates as a NumPy array.");
+
+static PyObject*
+parse_btop(PyObject* module, PyObject* args)
+{
+    const char* btop;
+    Py_ssize_t length;
+    Py_ssize_t k;
+    Py_ssize_t* target;
+    Py_ssize_t* query;
+    PyObject* coordinates;
+
+    if (!PyArg_ParseTuple(args, "s#:parse_btop", &btop, &length)) return NULL;
+
+    k = _parse_btop(btop, length, NULL, NULL);
+    coordinates = _create_coordinates(k, &target, &query);
+    if (!coordinates) return NULL;
+    _parse_btop(btop, length, target, query);
+    return coordinates;
+}
+
+static PyMethodDef module_methods[] = {
+    {"parse_cigar",
+     (PyCFunction)(void(*)(void))parse_cigar,
+     METH_VARARGS | METH_KEYWORDS,
+     parse_cigar__doc__,
+    },
+    {"parse_binary_cigar",
+     (PyCFunction)(void(*)(void))parse_binary_cigar,
+     METH_VARARGS | METH_KEYWORDS,
+     parse_binary_cigar__doc__,
+    },
+    {"parse_btop",
+     (PyCFunction)parse_btop,
+     METH_VARARGS,
+     parse_btop__doc__,
+    },
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
 /* Module initialization function */
 static PyModuleDef moduledef = {
     PyModuleDef_HEAD_INIT,
     .m_name = "_aligncore",
-    .m_doc = "fast C implementation of a parser for printed alignments; for internal use.",
+    .m_doc = "fast C implementation of parsers for printed alignments, CIGAR strings, binary CIGARs, and BTOP strings; for internal use.",
     .m_size = -1,
+    .m_methods = module_methods,
 };
 
 PyMODINIT_FUNC
@@ -0,0 +1,602 @@
+# Copyright 2026 by Michiel de Hoon.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Binning indices for BGZF-compressed alignment files (PRIVATE).
+
+BAM files are indexed by BAI or CSI files, BGZF-compressed SAM files by CSI
+files, and other BGZF-compressed tab-delimited files (such as BED and PSL
+files) by tabix TBI or CSI files. These index files use the same hierarchical
+binning scheme: each record is assigned to the smallest bin that contains its
+region on the reference sequence, and for each bin the index stores the chunks
+(pairs of BGZF virtual offsets) of the file that contain the records in that
+bin. A linear index (BAI) or the offset stored with each bin (CSI) is used to
+skip records that end before the region of interest.
+
+See the SAM/BAM, CSI, and tabix specifications at
+https://samtools.github.io/hts-specs/ for more information.
+"""
+
+import os
+import struct
+
+from Bio import bgzf
+
+_uint64_pair = struct.Struct("<QQ")
+# format, col_seq, col_beg, col_end, meta, skip, l_nm
+_tabix_header = struct.Struct("<iiiiiii")
+
+# Flag in the tabix format field for zero-based, half-open coordinates
+TABIX_UCSC = 0x10000
+
+
+def reg2bin(beg, end, min_shift=14, depth=5):
+    """Return the bin of the smallest bin containing the region [beg, end)."""
+    level = depth
+    shift = min_shift
+    offset = ((1 << depth * 3) - 1) // 7
+    end -= 1
+    while level > 0:
+        if beg >> shift == end >> shift:
+            return offset + (beg >> shift)
+        level -= 1
+        shift += 3
+        offset -= 1 << level * 3
+    return 0
+
+
+def reg2bins(beg, end, min_shift=14, depth=5):
+    """Return a list of all bins that may overlap with the region [beg, end)."""
+    bins = []
+    shift = min_shift + depth * 3
+    offset = 0
+    end -= 1
+    for level in range(depth + 1):
+        bins.extend(range(offset + (beg >> shift), offset + (end >> shift) + 1))
+        shift -= 3
+        offset += 1 << level * 3
+    return bins
+
+
+class _Reference:
+    """Index of the records aligned to one reference sequence (PRIVATE)."""
+
+    def __init__(self):
+        self.bins = {}  # bin -> list of [begin, end] virtual offset pairs
+        self.loffsets = {}  # bin -> smallest virtual offset (CSI only)
+        self.intervals = []  # linear index (BAI only)
+        # virtual offsets of the first and last record, and the number of
+        # mapped and unmapped records, stored as a pseudo-bin
+        self.meta = None
+
+
+class BinningIndex:
+    """Binning index of a BGZF-compressed file, as stored in BAI and CSI files.
+
+    Attributes:
+     - min_shift  - log2 of the size of the smallest bins (14 for BAI files).
+     - depth      - number of levels of the binning index (5 for BAI files).
+     - references - list with the index of each reference sequence.
+     - n_no_coor  - number of records without a reference position, if known.
+     - aux        - auxiliary data stored in CSI files.
+
+    """
+
+    def __init__(self, min_shift=14, depth=5, n_ref=0):
+        """Initialize an empty index for n_ref reference sequences."""
+        self.min_shift = min_shift
+        self.depth = depth
+        self.references = [_Reference() for i in range(n_ref)]
+        self.n_no_coor = None
+        self.aux = b""
+        self._last = (-1, -1)
+
+    def add(self, refID, beg, end, begin_offset, end_offset, mapped=True):
+        """Add a record to the index.
+
+        Arguments:
+         - refID        - index of the reference sequence, or -1 for records
+                          without a reference position.
+         - beg, end     - zero-based start and end position of the record on
+                          the reference sequence.
+         - begin_offset - BGZF virtual offset of the start of the record.
+         - end_offset   - BGZF virtual offset of the end of the record.
+         - mapped       - False for unmapped reads placed on the reference.
+
+        Records must be added in the order in which they appear in the file,
+        which must be sorted by reference sequence and start position.
+        """
+        if refID < 0:
+            self.n_no_coor = (self.n_no_coor or 0) + 1
+            return
+        if (refID, beg) < self._last:
+            raise ValueError("records are not sorted by coordinate")
+        if self.n_no_coor:
+            raise ValueError("records without coordinates must appear last")
+        self._last = (refID, beg)
+        references = self.references
+        while len(references) <= refID:
+            references.append(_Reference())
+        reference = references[refID]
+        if end <= beg:
+            end = beg + 1
+        if end > 1 << (self.min_shift + 3 * self.depth):
+            raise ValueError(
+                f"position {end} is too large for an index of depth {self.depth}"
+            )
+        chunks = reference.bins.setdefault(
+            reg2bin(beg, end, self.min_shift, self.depth), []
+        )
+        if chunks and chunks[-1][1] == begin_offset:
+            chunks[-1][1] = end_offset
+        else:
+            chunks.append([begin_offset, end_offset])
+        intervals = reference.intervals
+        first = beg >> self.min_shift
+        last = (end - 1) >> self.min_shift
+        if len(intervals) <= last:
+            intervals.extend([None] * (last + 1 - len(intervals)))
+        for window in range(first, last + 1):
+            if intervals[window] is None:
+                intervals[window] = begin_offset
+        meta = reference.meta
+        if meta is None:
+            meta = reference.meta = [begin_offset, end_offset, 0, 0]
+        meta[1] = end_offset
+        if mapped:
+            meta[2] += 1
+        else:
+            meta[3] += 1
+
+    def _finish(self):
+        """Fill the gaps in the linear index (PRIVATE)."""
+        for reference in self.references:
+            intervals = reference.intervals
+            previous = 0
+            for i, offset in enumerate(intervals):
+                if offset is None:
+                    intervals[i] = previous
+                else:
+                    previous = offset
+
+    def _bin_start(self, bin_):
+        """Return the first position covered by a bin (PRIVATE)."""
+        offset = 0
+        for level in range(self.depth + 1):
+            size = 1 << level * 3
+            if bin_ < offset + size:
+                break
+            offset += size
+        return (bin_ - offset) << (self.min_shift + 3 * (self.depth - level))
+
+    def query(self, refID, start, end):
+        """Return the chunks of the file that may contain records in a region.
+
+        The chunks are returned as a sorted list of non-overlapping pairs of
+        BGZF virtual offsets.
+        """
+        try:
+            reference = self.references[refID]
+        except IndexError:
+            return []
+        min_shift = self.min_shift
+        depth = self.depth
+        if reference.intervals:
+            window = start >> min_shift
+            intervals = reference.intervals
+            min_offset = intervals[min(window, len(intervals) - 1)]
+        else:
+            loffsets = reference.loffsets
+            bin_ = reg2bin(start, start + 1, min_shift, depth)
+            while bin_ > 0 and bin_ not in loffsets:
+                bin_ = (bin_ - 1) >> 3
+            min_offset = loffsets.get(bin_, 0)
+        bins = reference.bins
+        chunks = []
+        for bin_ in reg2bins(start, end, min_shift, depth):
+            try:
+                values = bins[bin_]
+            except KeyError:
+                continue
+            chunks.extend(chunk for chunk in values if chunk[1] > min_offset)
+        chunks.sort()
+        merged = []
+        for begin_offset, end_offset in chunks:
+            if merged and begin_offset <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end_offset)
+            else:
+                merged.append([begin_offset, end_offset])
+        return [tuple(chunk) for chunk in merged]
+
+    def write_bai(self, stream):
+        """Write the index to a binary stream in the BAI format."""
+        if self.min_shift != 14 or self.depth != 5:
+            raise ValueError("BAI files require min_shift=14 and depth=5")
+        self._finish()
+        stream.write(b"BAI\x01")
+        stream.write(struct.pack("<i", len(self.references)))
+        self._write_references(stream, csi=False)
+
+    def write_csi(self, stream):
+        """Write the index to a binary stream in the BGZF-compressed CSI format."""
+        self._finish()
+        writer = bgzf.BgzfWriter(fileobj=stream, mode="wb")
+        writer.write(b"CSI\x01")
+        writer.write(struct.pack("<iii", self.min_shift, self.depth, len(self.aux)))
+        writer.write(self.aux)
+        writer.write(struct.pack("<i", len(self.references)))
+        self._write_references(writer, csi=True)
+        writer.flush()
+        stream.write(bgzf._bgzf_eof)
+
+    def write_tbi(self, stream):
+        """Write the index to a binary stream in the BGZF-compressed TBI format.
+
+        The tabix header (see pack_tabix_header) must be stored in the aux
+        attribute.
+        """
+        if self.min_shift != 14 or self.depth != 5:
+            raise ValueError("TBI files require min_shift=14 and depth=5")
+        self._finish()
+        writer = bgzf.BgzfWriter(fileobj=stream, mode="wb")
+        writer.write(b"TBI\x01")
+        writer.write(struct.pack("<i", len(self.references)))
+        writer.write(self.aux)
+        self._write_references(writer, csi=False)
+        writer.flush()
+        stream.write(bgzf._bgzf_eof)
+
+    def _write_references(self, stream, csi):
+        pseudo_bin = ((1 << (self.depth + 1) * 3) - 1) // 7 + 1
+        for reference in self.references:
+            bins = reference.bins
+            loffsets = {}
+            if csi:
+                intervals = reference.intervals
+                for bin_ in bins:
+                    window = self._bin_start(bin_) >> self.min_shift
+                    if window < len(intervals):
+                        loffsets[bin_] = intervals[window]
+                    else:
+                        loffsets[bin_] = min(chunk[0] for chunk in bins[bin_])
+            n_bin = len(bins)
+            if reference.meta is not None:
+                n_bin += 1
+            fields = [struct.pack("<i", n_bin)]
+            for bin_ in sorted(bins):
+                chunks = bins[bin_]
+                if csi:
+                    fields.append(
+                        struct.pack("<IQi", bin_, loffsets[bin_], len(chunks))
+                    )
+                else:
+                    fields.append(struct.pack("<Ii", bin_, len(chunks)))
+                for chunk in chunks:
+                    fields.append(_uint64_pair.pack(*chunk))
+            if reference.meta is not None:
+                if csi:
+                    fields.append(struct.pack("<IQi", pseudo_bin, 0, 2))
+                else:
+                    fields.append(struct.pack("<Ii", pseudo_bin, 2))
+                fields.append(struct.pack("<QQQQ", *reference.meta))
+            if not csi:
+                intervals = reference.intervals
+                fields.append(struct.pack("<i", len(intervals)))
+                fields.append(struct.pack("<%dQ" % len(intervals), *intervals))
+            stream.write(b"".join(fields))
+        stream.write(struct.pack("<Q", self.n_no_coor or 0))
+
+    @classmethod
+    def read(cls, stream):
+        """Read an index from a binary stream in the BAI, CSI, or TBI format.
+
+        For TBI files, the tabix header is stored in the aux attribute, as in
+        CSI files created by tabix.
+        """
+        magic = stream.read(4)
+        if magic == b"BAI\x01":
+            index = cls()
+            csi = False
+        elif magic[:2] == b"\x1f\x8b":
+            stream.seek(0)
+            stream = bgzf.BgzfReader(fileobj=stream, mode="rb")
+            magic = stream.read(4)
+            if magic == b"CSI\x01":
+                min_shift, depth, l_aux = struct.unpack("<iii", stream.read(12))
+                index = cls(min_shift, depth)
+                index.aux = stream.read(l_aux)
+                csi = True
+            elif magic == b"TBI\x01":
+                (n_ref,) = struct.unpack("<i", stream.read(4))
+                header = stream.read(_tabix_header.size)
+                l_nm = _tabix_header.unpack(header)[-1]
+                index = cls()
+                index.aux = header + stream.read(l_nm)
+                index._read_references(stream, False, n_ref)
+                return index
+            else:
+                raise ValueError("Unknown index file format")
+        else:
+            raise ValueError("Unknown index file format")
+        (n_ref,) = struct.unpack("<i", stream.read(4))
+        index._read_references(stream, csi, n_ref)
+        return index
+
+    def _read_references(self, stream, csi, n_ref):
+        pseudo_bin = ((1 << (self.depth + 1) * 3) - 1) // 7 + 1
+        for i in range(n_ref):
+            reference = _Reference()
+            (n_bin,) = struct.unpack("<i", stream.read(4))
+            for j in range(n_bin):
+                if csi:
+                    bin_, loffset, n_chunk = struct.unpack("<IQi", stream.read(16))
+                else:
+                    bin_, n_chunk = struct.unpack("<Ii", stream.read(8))
+                values = struct.unpack(
+                    "<%dQ" % (2 * n_chunk), stream.read(16 * n_chunk)
+                )
+                if bin_ == pseudo_bin:
+                    reference.meta = list(values)
+                    continue
+                if csi:
+                    reference.loffsets[bin_] = loffset
+                reference.bins[bin_] = [
+                    [values[k], values[k + 1]] for k in range(0, len(values), 2)
+                ]
+            if not csi:
+                (n_intv,) = struct.unpack("<i", stream.read(4))
+                reference.intervals = list(
+                    struct.unpack("<%dQ" % n_intv, stream.read(8 * n_intv))
+                )
+            self.references.append(reference)
+        data = stream.read(8)
+        if len(data) == 8:
+            (self.n_no_coor,) = struct.unpack("<Q", data)
+
+
+def find_index(source, suffixes):
+    """Find and read the index file of a BGZF-compressed file.
+
+    Arguments:
+     - source   - file name of the BGZF-compressed file, or a file stream
+                  opened from a file.
+     - suffixes - list of suffixes that are appended to the file name of the
+                  BGZF-compressed file to find the index file.
+
+    If the file name ends with an extension in the form of ".bam", the
+    extension is also replaced by each suffix.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = os.fspath(source)
+    else:
+        try:
+            source = os.fspath(source.name)
+        except (AttributeError, TypeError):
+            raise ValueError(
+                "Unable to find the index file for a stream without a file name"
+            ) from None
+    paths = [source + suffix for suffix in suffixes]
+    root, extension = os.path.splitext(source)
+    if extension:
+        paths.extend(root + suffix for suffix in suffixes)
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, "rb") as stream:
+                return BinningIndex.read(stream)
+    raise ValueError(
+        "Failed to find an index file (%s) for %s" % (", ".join(suffixes), source)
+    )
+
+
+def pack_tabix_header(fmt, col_seq, col_beg, col_end, meta, skip, names):
+    """Return the tabix header as stored in TBI files and in CSI files.
+
+    Arguments:
+     - fmt     - format of the file; 0 for generic files, optionally combined
+                 with TABIX_UCSC for zero-based, half-open coordinates.
+     - col_seq - one-based column number of the reference sequence name.
+     - col_beg - one-based column number of the start position.
+     - col_end - one-based column number of the end position, or 0 if
+                 each record covers a single position.
+     - meta    - character at the start of comment lines.
+     - skip    - number of header lines at the start of the file.
+     - names   - list of reference sequence names, in order of appearance.
+    """
+    data = b"".join(name.encode() + b"\x00" for name in names)
+    header = _tabix_header.pack(
+        fmt, col_seq, col_beg, col_end, ord(meta), skip, len(data)
+    )
+    return header + data
+
+
+def unpack_tabix_header(aux):
+    """Return the fields of the tabix header stored in aux as a tuple.
+
+    The tuple contains the same values as the arguments of pack_tabix_header.
+    """
+    if len(aux) < _tabix_header.size:
+        raise ValueError("index file does not contain a tabix header")
+    fmt, col_seq, col_beg, col_end, meta, skip, l_nm = _tabix_header.unpack_from(aux)
+    data = aux[_tabix_header.size : _tabix_header.size + l_nm]
+    names = data.decode().split("\x00")[:-1]
+    return fmt, col_seq, col_beg, col_end, chr(meta), skip, names
+
+
+def _tabix_span(line, fmt, col_seq, col_beg, col_end):
+    """Return the name, start, and end of a line in a tabix-indexed file (PRIVATE).
+
+    The start and end positions are returned as zero-based, half-open
+    coordinates.
+    """
+    fields = line.rstrip("\r\n").split("\t")
+    try:
+        name = fields[col_seq - 1]
+        start = int(fields[col_beg - 1])
+        if col_end:
+            end = int(fields[col_end - 1])
+        else:
+            end = start
+    except (IndexError, ValueError):
+        raise ValueError("Failed to find the position in line %r" % line) from None
+    if not fmt & TABIX_UCSC:
+        start -= 1
+    if end <= start:
+        end = start + 1
+    return name, start, end
+
+
+def create_tabix_index(
+    source,
+    target,
+    fmt,
+    col_seq,
+    col_beg,
+    col_end,
+    meta="#",
+    skip=0,
+    csi=False,
+    min_shift=14,
+    depth=5,
+):
+    """Create a tabix index file for a BGZF-compressed tab-delimited file.
+
+    Arguments:
+     - source    - file name of the BGZF-compressed file.
+     - target    - file name of the index file.
+     - csi       - if True, create a CSI index file; if False, create a TBI
+                   index file.
+     - min_shift - log2 of the size of the smallest bins of a CSI index.
+     - depth     - number of levels of the binning index of a CSI index.
+
+    The remaining arguments describe the layout of the file, as in
+    pack_tabix_header. The lines in the file must be sorted by reference
+    sequence name and start position, with all lines for the same reference
+    sequence appearing together.
+    """
+    names = {}
+    index = BinningIndex(min_shift, depth)
+    with bgzf.BgzfReader(source, "rt") as stream:
+        for i in range(skip):
+            stream.readline()
+        while True:
+            begin_offset = stream.tell()
+            line = stream.readline()
+            if not line:
+                break
+            if line.startswith(meta) or not line.strip():
+                continue
+            name, start, end = _tabix_span(line, fmt, col_seq, col_beg, col_end)
+            refID = names.setdefault(name, len(names))
+            index.add(refID, start, end, begin_offset, stream.tell())
+    index.aux = pack_tabix_header(
+        fmt, col_seq, col_beg, col_end, meta, skip, list(names)
+    )
+    with open(target, "wb") as stream:
+        if csi:
+            index.write_csi(stream)
+        else:
+            index.write_tbi(stream)
+
+
+class BgzfIterator:
+    """Mixin class for alignment iterators reading BGZF-compressed text files.
+
+    If the source is a path to a BGZF-compressed file, as created by
+    ``bgzip``, the file is decompressed while reading.
+    """
+
+    _bgzf = False
+
+    def __init__(self, source):
+        """Create an AlignmentIterator object.
+
+        Arguments:
+        - source - input file stream, or path to input file
+
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as stream:
+                magic = stream.read(4)
+            if magic == b"\x1f\x8b\x08\x04":
+                super().__init__(bgzf.BgzfReader(source, "rt"))
+                self.source = source
+                self._bgzf = True
+                return
+        super().__init__(source)
+
+
+class TabixIterator(BgzfIterator):
+    """Mixin class adding tabix-indexed searches to alignment iterators.
+
+    The alignment iterator must define a _create_alignment method that
+    returns the alignment stored in one line of the file.
+    """
+
+    def search(self, chromosome=None, start=None, end=None):
+        """Iterate over alignments overlapping the specified chromosome region.
+
+        This method uses the tabix index file (TBI or CSI) of a BGZF-compressed
+        file to find alignments to the specified chromosome that fully or
+        partially overlap the chromosome region between start and end. The
+        index file is looked up by appending ".tbi" or ".csi" to the file name,
+        or by replacing its extension by ".tbi" or ".csi"; use the create_index
+        function in the format module, or ``tabix``, to create an index file.
+        Only the parts of the file that may contain overlapping alignments are
+        read and parsed.
+
+        Arguments:
+         - chromosome - chromosome name. If None (default value), include all
+           alignments.
+         - start      - starting position on the chromosome. If None (default
+           value), use 0 as the starting position.
+         - end        - end position on the chromosome. If None (default value),
+           use the end of the chromosome as the end position.
+
+        """
+        if chromosome is None:
+            if start is not None or end is not None:
+                raise ValueError(
+                    "start and end must both be None if chromosome is None"
+                )
+            self.rewind()
+            yield from self
+            return
+        if start is None:
+            if end is not None:
+                raise ValueError("end must be None if start is None")
+            start = 0
+        elif end is None:
+            end = start + 1
+        if not self._bgzf:
+            raise ValueError("searching requires a BGZF-compressed file")
+        try:
+            index = self._tabix_index
+        except AttributeError:
+            index = find_index(self.source, (".tbi", ".csi"))
+            self._tabix_index = index
+        fmt, col_seq, col_beg, col_end, meta, _, names = unpack_tabix_header(index.aux)
+        try:
+            refID = names.index(chromosome)
+        except ValueError:
+            # no alignments to this chromosome
+            return
+        if end is None:
+            end = 1 << (index.min_shift + 3 * index.depth)
+        stream = self._stream
+        for chunk_start, chunk_end in index.query(refID, start, end):
+            stream.seek(chunk_start)
+            while stream.tell() < chunk_end:
+                line = stream.readline()
+                if not line:
+                    break
+                if line.startswith(meta):
+                    continue
+                name, chromStart, chromEnd = _tabix_span(
+                    line, fmt, col_seq, col_beg, col_end
+                )
+                if name != chromosome or chromStart >= end:
+                    return
+                if chromEnd > start:
+                    yield self._create_alignment(line)
@@ -9,10 +9,13 @@
 import sys
 from collections import Counter
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from heapq import heapify
 from heapq import heappop
 from heapq import heappush
 from itertools import permutations
+from itertools import product
+from itertools import repeat
 from math import erfc
 from math import floor
 from math import log
@@ -116,7 +119,11 @@ def _ng86(codons1, codons2, k, codon_table):
                 SN, _count_diff_NG86(codon1, codon2, codon_table=codon_table)
             )
         ]
+    return _ng86_distances(SN, S_sites, N_sites)
 
+
+def _ng86_distances(SN, S_sites, N_sites):
+    """Return dN and dS from the numbers of differences and sites (PRIVATE)."""
     ps = SN[0] / S_sites
     pn = SN[1] / N_sites
     if ps < 3 / 4:
@@ -304,6 +311,15 @@ def _lwl85(codons1, codons2, codon_table):
             i + j
             for i, j in zip(PQ, _diff_codon(codon1, codon2, fold_dict=codon_fold_dict))
         ]
+    return _lwl85_distances(L, PQ)
+
+
+def _lwl85_distances(L, PQ):
+    """Return dN and dS from the numbers of sites and differences (PRIVATE).
+
+    L is the number of sites in each degenerate class, and PQ the number of
+    transitions and transversions in each class (P0, P2, P4, Q0, Q2, Q4).
+    """
     PQ = [i / j for i, j in zip(PQ, L * 2)]
     P = PQ[:3]
     Q = PQ[3:]
@@ -1001,13 +1017,478 @@ def _likelihood_func(t, k, w, pi, codon_cnt, codons, codon_table):
     return likelihood
 
 
-def calculate_dn_ds_matrix(alignment, method="NG86", codon_table=None):
+#################################################################
+#      private functions for dN and dS of all pairs of rows
+#################################################################
+
+
+_codons = ["".join(codon) for codon in product("ACGT", repeat=3)]
+_codon_arrays = {}
+_nucleotide_codes = np.full(256, 5, np.uint8)
+_nucleotide_codes[list(b"ACGT-")] = range(5)
+
+
+class _CodonArrays:
+    """Lookup tables of a codon table for all pairs of codons (PRIVATE).
+
+    The 64 codons are numbered 16 * i + 4 * j + k, where i, j, and k are the
+    indices of their nucleotides in "ACGT". The numbers of differences
+    between two codons are calculated once for each pair of codons, using
+    the functions for a single pair of codons, so that dN and dS calculated
+    for all pairs of sequences agree with those of calculate_dn_ds.
+    """
+
+    def __init__(self, codon_table):
+        """Calculate the tables for the codon table."""
+        forward_table = codon_table.forward_table
+        stop_codons = codon_table.stop_codons
+        amino_acids = [forward_table.get(codon) for codon in _codons]
+        self.stop = np.array([codon in stop_codons for codon in _codons])
+        # the codons in the order in which _ml visits them
+        codons = list(forward_table.keys()) + stop_codons
+        self.order = np.array([_codons.index(c) for c in codons if "U" not in c])
+        sense = ~self.stop
+        self.bases = np.array(
+            [["ACGT".index(base) for base in codon] for codon in _codons]
+        )
+        differences = self.bases[:, None, :] != self.bases[None, :, :]
+        purines = (self.bases == 0) | (self.bases == 2)
+        transversions = purines[:, None, :] != purines[None, :, :]
+        # substitutions of a single nucleotide between sense codons
+        single = (differences.sum(2) == 1) & sense[:, None] & sense[None, :]
+        transition = single & ~transversions.any(2)
+        same = np.array([[aa1 == aa2 for aa2 in amino_acids] for aa1 in amino_acids])
+        self.synonymous = same & sense[:, None] & sense[None, :]
+        np.fill_diagonal(self.synonymous, False)
+        self.nonsynonymous = ~same & sense[:, None] & sense[None, :]
+        self.rates = (
+            (single & ~transition & self.synonymous).astype(float),
+            (transition & self.synonymous).astype(float),
+            (single & ~transition & self.nonsynonymous).astype(float),
+            (transition & self.nonsynonymous).astype(float),
+        )
+        # new nucleotide of a single nucleotide substitution
+        self.substituted = (self.bases[None, :, :] * differences).sum(2)
+        # numbers of transitions and transversions, as in _get_TV
+        self.tv = np.stack(
+            [(differences & ~transversions).sum(2), transversions.sum(2)], axis=2
+        )
+        # Nei-Gojobori differences and sites
+        self.ng86 = np.zeros((64, 64, 2))
+        self.ng86_sites = np.zeros((64, 2))
+        # degenerate classes, as in _lwl85 and _yn00
+        fold_table = _get_codon_fold(codon_table)
+        self.folds = np.zeros((64, 3), int)
+        self.fold_bases = np.zeros((64, 2, 4), int)
+        self.lwl85 = np.zeros((64, 64, 6), int)
+        for i, codon1 in enumerate(_codons):
+            if self.stop[i]:
+                continue
+            self.ng86_sites[i] = _count_site_NG86([codon1], codon_table)
+            fold = fold_table[codon1]
+            for j, f in enumerate("024"):
+                self.folds[i, j] = fold.count(f)
+            for base, f in zip(self.bases[i], fold):
+                if f == "0":
+                    self.fold_bases[i, 0, base] += 1
+                elif f == "4":
+                    self.fold_bases[i, 1, base] += 1
+            for j, codon2 in enumerate(_codons):
+                if self.stop[j]:
+                    continue
+                self.ng86[i, j] = _count_diff_NG86(codon1, codon2, codon_table)
+                if i != j:
+                    self.lwl85[i, j] = _diff_codon(codon1, codon2, fold_table)
+        # substitution steps along the pathways between codons, as in
+        # _count_diff_YN00, with the categories synonymous transition,
+        # synonymous transversion, nonsynonymous transition, and
+        # nonsynonymous transversion
+        purine = (0, 2)
+        pyrimidine = (1, 3)
+
+        def category(codon1, codon2, position):
+            nucleotide1 = self.bases[codon1, position]
+            nucleotide2 = self.bases[codon2, position]
+            if nucleotide1 in purine and nucleotide2 in purine:
+                transversion = 0
+            elif nucleotide1 in pyrimidine and nucleotide2 in pyrimidine:
+                transversion = 0
+            else:
+                transversion = 1
+            if self.stop[codon1] or self.stop[codon2]:
+                return 2 + transversion
+            if amino_acids[codon1] == amino_acids[codon2]:
+                return transversion
+            return 2 + transversion
+
+        def substitute(codon1, codon2, position):
+            bases = list(self.bases[codon1])
+            bases[position] = self.bases[codon2, position]
+            return 16 * bases[0] + 4 * bases[1] + bases[2]
+
+        steps = ([], [], [])
+        for codon1 in range(64):
+            for codon2 in range(64):
+                positions = np.flatnonzero(differences[codon1, codon2])
+                if len(positions) == 1:
+                    steps[0].append(
+                        (codon1, codon2, category(codon1, codon2, positions[0]))
+                    )
+                elif len(positions) == 2:
+                    codons = [substitute(codon1, codon2, i) for i in positions]
+                    categories = [
+                        category(codon1, codon, i)
+                        for codon, i in zip(codons, positions)
+                    ]
+                    steps[1].append((codon1, codon2, codons, categories))
+                elif len(positions) == 3:
+                    codons = []
+                    categories = []
+                    for index1, index2, index3 in permutations([0, 1, 2], 3):
+                        tmp1 = substitute(codon1, codon2, index1)
+                        tmp2 = substitute(tmp1, codon2, index2)
+                        codons.append((tmp1, tmp2))
+                        categories.append(
+                            (
+                                category(codon1, tmp1, index1),
+                                category(tmp1, tmp2, index2),
+                                category(tmp2, codon2, index2),
+                            )
+                        )
+                    steps[2].append((codon1, codon2, codons, categories))
+        self.steps = [
+            tuple(np.array(values) for values in zip(*pathways)) for pathways in steps
+        ]
+
+    def rate_matrix(self, pi, k, w):
+        """Return the substitution rate matrix Q, as in _get_Q."""
+        S_tv, S_ts, N_tv, N_ts = self.rates
+        Q = (S_tv + k * S_ts + w * N_tv + (w * k) * N_ts) * pi
+        Q[np.diag_indices(64)] = -Q.sum(1)
+        Q /= np.dot(pi, -Q.diagonal())
+        return Q
+
+    def yn00_differences(self, P):
+        """Return the weighted differences between codons, as in _count_diff_YN00.
+
+        Returns an array of shape (64, 64, 4), with the numbers of synonymous
+        transitions, synonymous transversions, nonsynonymous transitions, and
+        nonsynonymous transversions between each pair of codons.
+        """
+        TV = np.zeros((64, 64, 4))
+        codons1, codons2, categories = self.steps[0]
+        TV[codons1, codons2, categories] = 1
+        # Pathways through stop codons have zero probability; the differences
+        # are undefined (NaN) if all pathways between two codons go through
+        # a stop codon.
+        codons1, codons2, codons, categories = self.steps[1]
+        path_prob = P[codons1[:, None], codons] * P[codons, codons2[:, None]]
+        with np.errstate(invalid="ignore"):
+            path_prob = 2 * path_prob / path_prob.sum(1, keepdims=True)
+        for i in range(2):
+            TV[codons1, codons2, categories[:, i]] += path_prob[:, i]
+        codons1, codons2, codons, categories = self.steps[2]
+        tmp1 = codons[:, :, 0]
+        tmp2 = codons[:, :, 1]
+        path_prob = (
+            P[codons1[:, None], tmp1] * P[tmp1, tmp2] * P[tmp2, codons2[:, None]]
+        )
+        with np.errstate(invalid="ignore"):
+            path_prob = 3 * path_prob / path_prob.sum(1, keepdims=True)
+        for i in range(6):
+            for j in range(3):
+                TV[codons1, codons2, categories[:, i, j]] += path_prob[:, i] / 3
+        return TV
+
+    def yn00_sites(self, counts, pi, k):
+        """Count synonymous and nonsynonymous sites, as in _count_site_YN00."""
+        S_tv, S_ts, N_tv, N_ts = self.rates
+        S = (S_tv + k * S_ts) * pi * counts[:, None]
+        N = (N_tv + k * N_ts) * pi * counts[:, None]
+        S_sites = S.sum()
+        N_sites = N.sum()
+        norm_const = 3 * counts.sum() / (S_sites + N_sites)
+        freqSN = []
+        for weights in (S, N):
+            freq = np.bincount(self.substituted.ravel(), weights.ravel())[:4]
+            freqSN.append(freq / freq.sum())
+        return S_sites * norm_const, N_sites * norm_const, freqSN
+
+
+def _get_codon_arrays(codon_table):
+    """Return the lookup tables for the codon table, or None (PRIVATE).
+
+    None is returned for codon tables that do not consist of the 64 codons
+    of A, C, G, and T, such as ambiguous codon tables.
+    """
+    try:
+        return _codon_arrays[codon_table]
+    except KeyError:
+        pass
+    arrays = None
+    forward_table = codon_table.forward_table
+    if isinstance(forward_table, dict):
+        codons = list(forward_table.keys()) + codon_table.stop_codons
+        codons = [codon for codon in codons if "U" not in codon]
+        if sorted(codons) == _codons:
+            arrays = _CodonArrays(codon_table)
+    _codon_arrays[codon_table] = arrays
+    return arrays
+
+
+def _encode_codons(rows):
+    """Return the codon indices of aligned sequences (PRIVATE).
+
+    The aligned sequences are given as strings of equal length, with gaps
+    covering complete codons. Returns an array of codon indices, with -1 for
+    gaps, or None if a codon contains a nucleotide other than A, C, G, or T,
+    or is partly a gap.
+    """
+    length = len(rows[0])
+    if length % 3 or any(len(row) != length for row in rows):
+        return None
+    data = "".join(rows).encode("ASCII", "replace")
+    codes = _nucleotide_codes[np.frombuffer(data, np.uint8)]
+    codes = codes.reshape(len(rows), length // 3, 3).astype(int)
+    if (codes == 5).any():
+        return None
+    gaps = codes == 4
+    gap = gaps.all(2)
+    if (gaps.any(2) != gap).any():
+        return None
+    codons = 16 * codes[:, :, 0] + 4 * codes[:, :, 1] + codes[:, :, 2]
+    codons[gap] = -1
+    return codons
+
+
+def _pair_counts(codons1, codons2):
+    """Return the number of times each pair of codons is aligned (PRIVATE)."""
+    aligned = (codons1 >= 0) & (codons2 >= 0)
+    codons = 64 * codons1[aligned] + codons2[aligned]
+    counts = np.bincount(codons, minlength=4096)
+    return counts.reshape(64, 64)
+
+
+def _yn00_counts(arrays, counts):
+    """YN00 method for a pair of sequences given as codon pair counts (PRIVATE).
+
+    This follows _yn00, but counts sites and differences using the lookup
+    tables of the codon table. Returns None if a nucleotide is absent from
+    the non-degenerate or the four-fold degenerate sites; use _yn00 instead.
+    """
+    from scipy.linalg import expm
+
+    counts1 = counts.sum(1)
+    counts2 = counts.sum(0)
+    pi = (counts1 + counts2).astype(float)
+    fold_cnt = np.dot(pi, arrays.fold_bases.reshape(64, 8)).reshape(2, 4)
+    if not fold_cnt.all():
+        return None
+    f0_total, f4_total = fold_cnt.sum(1)
+    fold0_cnt, fold4_cnt = (
+        dict(zip("ACGT", cnt / total))
+        for cnt, total in zip(fold_cnt, (f0_total, f4_total))
+    )
+    observed = counts > 0
+    T, V = np.dot(counts[observed], arrays.tv[observed])
+    sites = 3 * counts.sum()
+    TV = (T / sites, V / sites)
+    k04 = (_get_kappa_t(fold0_cnt, TV), _get_kappa_t(fold4_cnt, TV))
+    kappa = (f0_total * k04[0] + f4_total * k04[1]) / (f0_total + f4_total)
+    S_sites1, N_sites1, bfreqSN1 = arrays.yn00_sites(counts1, pi, kappa)
+    S_sites2, N_sites2, bfreqSN2 = arrays.yn00_sites(counts2, pi, kappa)
+    N_sites = (N_sites1 + N_sites2) / 2
+    S_sites = (S_sites1 + S_sites2) / 2
+    bfreqSN = [
+        dict(zip("ACGT", (freq1 + freq2) / 2))
+        for freq1, freq2 in zip(bfreqSN1, bfreqSN2)
+    ]
+    # use NG86 method to get initial t and w
+    SN = (counts[:, :, None] * arrays.ng86).sum((0, 1))
+    ps = SN[0] / S_sites
+    pn = SN[1] / N_sites
+    p = sum(SN) / (S_sites + N_sites)
+    w = log(1 - 4.0 / 3 * pn) / log(1 - 4.0 / 3 * ps)
+    t = -3 / 4 * log(1 - 4 / 3 * p)
+    tolerance = 1e-5
+    dSdN_pre = [0, 0]
+    for temp in range(20):
+        # count synonymous and nonsynonymous differences under kappa, w, t
+        Q = arrays.rate_matrix(pi, kappa, w)
+        P = expm(Q * t)
+        TV = np.dot(counts[observed], arrays.yn00_differences(P)[observed])
+        TV = (TV[0] / S_sites, TV[1] / S_sites), (TV[2] / N_sites, TV[3] / N_sites)
+        dSdN = []
+        for f, tv in zip(bfreqSN, TV):
+            dSdN.append(_get_kappa_t(f, tv, t=True))
+        t = dSdN[0] * 3 * S_sites / (S_sites + N_sites) + dSdN[1] * 3 * N_sites / (
+            S_sites + N_sites
+        )
+        w = dSdN[1] / dSdN[0]
+        if all(abs(i - j) < tolerance for i, j in zip(dSdN, dSdN_pre)):
+            return dSdN[1], dSdN[0]  # dN, dS
+        dSdN_pre = dSdN
+
+
+def _ml_counts(codon_table, counts):
+    """ML method for a pair of sequences given as codon pair counts (PRIVATE).
+
+    This follows _ml with codon frequencies calculated as F3x4, but uses
+    the lookup tables of the codon table. The codons are visited in the same
+    order, and all sums are accumulated in the same order, as in _ml, so that
+    the optimizer follows the same path and gives the same estimates. It is
+    called in a separate process by _dn_ds_matrices if more than one worker
+    is used.
+    """
+    from scipy.linalg import expm
+    from scipy.optimize import minimize
+
+    arrays = _get_codon_arrays(codon_table)
+    codon_counts = counts.sum(0) + counts.sum(1)
+    fcodon = np.zeros((3, 4))
+    for i in range(3):
+        fcodon[i] = np.bincount(arrays.bases[:, i], codon_counts, minlength=4)
+        fcodon[i] /= fcodon[i].sum()
+    pi = fcodon[0, arrays.bases[:, 0]] * fcodon[1, arrays.bases[:, 1]]
+    pi *= fcodon[2, arrays.bases[:, 2]]
+    order = np.ix_(arrays.order, arrays.order)
+    pi = pi[arrays.order]
+    counts = counts[order]
+    S_tv, S_ts, N_tv, N_ts = (rates[order] for rates in arrays.rates)
+    synonymous = arrays.synonymous[order]
+    nonsynonymous = arrays.nonsynonymous[order]
+    observed = counts > 0
+    counts = counts[observed].tolist()
+
+    def rate_matrix(k, w):
+        # as in _get_Q; cumsum adds the values one by one, like sum
+        Q = (S_tv + k * S_ts + w * N_tv + (w * k) * N_ts) * pi
+        Q[np.diag_indices(len(pi))] = -np.cumsum(Q, 1)[:, -1]
+        Q /= sum((pi * -Q.diagonal()).tolist())
+        return Q
+
+    def likelihood(t, k, w):
+        # as in _likelihood_func
+        P = expm(rate_matrix(k, w) * t)
+        values = (pi[:, None] * P)[observed].tolist()
+        return sum(
+            count * log(value) for count, value in zip(counts, values) if value > 0
+        )
+
+    opt_res = minimize(
+        lambda params: -likelihood(*params),
+        [1, 0.1, 2],
+        method="L-BFGS-B",
+        bounds=((1e-10, 20), (1e-10, 20), (1e-10, 10)),
+        tol=1e-5,
+    )
+    t, k, w = opt_res.x
+    Q = rate_matrix(k, w) * pi[:, None]
+    Sd = sum(Q[synonymous].tolist()) * t
+    Nd = sum(Q[nonsynonymous].tolist()) * t
+    # count differences (with w fixed to 1)
+    opt_res = minimize(
+        lambda params: -likelihood(params[0], params[1], 1.0),
+        [1, 0.1],
+        method="L-BFGS-B",
+        bounds=((1e-10, 20), (1e-10, 20)),
+        tol=1e-5,
+    )
+    t, k = opt_res.x
+    Q = rate_matrix(k, 1.0) * pi[:, None]
+    rhoS = sum(Q[synonymous].tolist()) * 3
+    rhoN = sum(Q[nonsynonymous].tolist()) * 3
+    dN = Nd / rhoN
+    dS = Sd / rhoS
+    return dN, dS
+
+
+def _dn_ds_matrices(codons, method, codon_table, workers=1):
+    """Calculate dN and dS for all pairs of aligned sequences (PRIVATE).
+
+    Arguments:
+     - codons      - Array of codon indices returned by _encode_codons.
+     - method      - NG86, LWL85, YN00, or ML.
+     - codon_table - Codon table to use for forward translation.
+     - workers     - Number of processes used for the ML method.
+
+    Returns the lower triangular dN and dS matrices as lists of lists, or
+    None if the codon table or the codons are not supported, in which case
+    dN and dS should be calculated separately for each pair.
+    """
+    arrays = _get_codon_arrays(codon_table)
+    if arrays is None or method not in ("NG86", "LWL85", "YN00", "ML"):
+        return None
+    aligned = codons >= 0
+    if arrays.stop[codons[aligned]].any():
+        return None
+    size = len(codons)
+    dn_matrix = [[] for i in range(size)]
+    ds_matrix = [[] for i in range(size)]
+    if method in ("NG86", "LWL85"):
+        indices = np.where(aligned, codons, 0)
+        weights = aligned.astype(float)
+        if method == "NG86":
+            sites = arrays.ng86_sites[indices] * weights[:, :, None]
+            table = arrays.ng86
+        else:
+            sites = arrays.folds[indices] * weights[:, :, None]
+            table = arrays.lwl85
+        # number of sites in the codons aligned to a codon of the other row
+        sites = np.einsum("imc,jm->ijc", sites, weights)
+        sites = (sites + sites.transpose(1, 0, 2)) / 2
+        for i in range(1, size):
+            both = aligned[i] & aligned[:i]
+            differences = table[indices[i], indices[:i]] * both[:, :, None]
+            differences = differences.sum(1)
+            for j in range(i):
+                if method == "NG86":
+                    S_sites, N_sites = sites[i, j]
+                    dn, ds = _ng86_distances(list(differences[j]), S_sites, N_sites)
+                else:
+                    L = sites[i, j].tolist()
+                    dn, ds = _lwl85_distances(L, differences[j].tolist())
+                dn_matrix[i].append(dn)
+                ds_matrix[i].append(ds)
+    else:
+        pairs = [(i, j) for i in range(size) for j in range(i)]
+        counts = [_pair_counts(codons[i], codons[j]) for i, j in pairs]
+        if method == "YN00":
+            results = []
+            for (i, j), pair_counts in zip(pairs, counts):
+                result = _yn00_counts(arrays, pair_counts)
+                if result is None:
+                    both = aligned[i] & aligned[j]
+                    codons1 = [_codons[codon] for codon in codons[i, both]]
+                    codons2 = [_codons[codon] for codon in codons[j, both]]
+                    result = _yn00(codons1, codons2, codon_table)
+                results.append(result)
+        elif workers == 1:
+            results = [_ml_counts(codon_table, c) for c in counts]
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                results = list(executor.map(_ml_counts, repeat(codon_table), counts))
+        for (i, j), (dn, ds) in zip(pairs, results):
+            dn_matrix[i].append(float(dn))
+            ds_matrix[i].append(float(ds))
+    for i in range(size):
+        dn_matrix[i].append(0.0)
+        ds_matrix[i].append(0.0)
+    return dn_matrix, ds_matrix
+
+
+def calculate_dn_ds_matrix(alignment, method="NG86", codon_table=None, workers=1):
     """Calculate dN and dS pairwise for the multiple alignment, and return as matrices.
 
     Argument:
      - method       - Available methods include NG86, LWL85, YN00 and ML.
      - codon_table  - Codon table to use for forward translation.
+     - workers      - Number of processes used to calculate dN and dS with
+       the ML method (default 1). If None, the number of processors is used.
 
+    If all gaps in the alignment cover complete codons, the codons are
+    compared using tables calculated once for each pair of codons, instead
+    of separately for each pair of sequences.
     """
     from Bio.Phylo.TreeConstruction import DistanceMatrix
 
@@ -1017,6 +1498,15 @@ def calculate_dn_ds_matrix(alignment, method="NG86", codon_table=None):
     coordinates = alignment.coordinates
     names = [record.id for record in sequences]
     size = len(names)
+    if size > 1:
+        codons = _encode_codons([alignment[i] for i in range(size)])
+        if codons is not None:
+            matrices = _dn_ds_matrices(codons, method, codon_table, workers)
+            if matrices is not None:
+                dn_matrix, ds_matrix = matrices
+                dn_dm = DistanceMatrix(names, matrix=dn_matrix)
+                ds_dm = DistanceMatrix(names, matrix=ds_matrix)
+                return dn_dm, ds_dm
     dn_matrix = []
     ds_matrix = []
     for i in range(size):
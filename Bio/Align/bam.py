@@ -0,0 +1,795 @@
+# Copyright 2026 by Michiel de Hoon.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Bio.Align support for the "bam" pairwise alignment format.
+
+The Binary Alignment/Map (BAM) format is the binary equivalent of the Sequence
+Alignment/Map (SAM) format. A BAM file consists of BGZF-compressed blocks (see
+Bio.bgzf) storing a header, containing the SAM header text and the names and
+lengths of the reference sequences, followed by the alignments in a compact
+binary representation. Sequences are stored with four bits per nucleotide, the
+CIGAR string as an array of 32-bit integers, and tags as typed binary values.
+
+See http://www.htslib.org/ for more information.
+
+You are expected to use this module via the Bio.Align functions.
+
+The alignments returned by the parser store the same information, in the same
+attributes, as the alignments returned by the SAM parser in Bio.Align.sam.
+As in the SAM parser, coordinates are zero-based.
+"""
+
+import copy
+import os
+import struct
+from io import StringIO
+
+import numpy as np
+
+from Bio import bgzf
+from Bio.Align import _aligncore  # type: ignore
+from Bio.Align import Alignment
+from Bio.Align import Alignments
+from Bio.Align import interfaces
+from Bio.Align import sam
+from Bio.Align._htsindex import BinningIndex
+from Bio.Align._htsindex import find_index
+from Bio.Align._htsindex import reg2bin
+from Bio.Seq import reverse_complement
+from Bio.Seq import Seq
+from Bio.Seq import UndefinedSequenceError
+from Bio.SeqRecord import SeqRecord
+
+# Fixed-size part of each alignment record, following the block size:
+# refID, pos, l_read_name, mapq, bin, n_cigar_op, flag, l_seq, next_refID,
+# next_pos, tlen
+_record = struct.Struct("<iiBBHHHIiii")
+_span_record = struct.Struct("<iiBxxxHH")
+
+# CIGAR operations, in the order of their binary code
+_operations = b"MIDNSHP=X"
+_operation_codes = np.full(256, -1, np.intp)
+_operation_codes[np.frombuffer(_operations, np.uint8)] = np.arange(len(_operations))
+# Operations M, D, N, =, X consume the target (reference) sequence;
+# operations M, I, S, =, X consume the query sequence.
+_target_steps = np.array([1, 0, 1, 1, 0, 0, 0, 1, 1], np.intp)
+_query_steps = np.array([1, 1, 0, 0, 1, 0, 0, 1, 1], np.intp)
+
+# Nucleotides are stored as 4-bit codes, two per byte.
+_letters = b"=ACMGRSVTWYHKDBN"
+_high_letters = bytes(_letters[code >> 4] for code in range(256))
+_low_letters = bytes(_letters[code & 0xF] for code in range(256))
+_encoded_letters = np.full(256, 15, np.uint8)  # unknown letters become N
+_encoded_letters[np.frombuffer(_letters, np.uint8)] = np.arange(16)
+_encoded_letters[np.frombuffer(_letters.lower(), np.uint8)] = np.arange(16)
+
+_tag_formats = {
+    b"c": struct.Struct("<b"),
+    b"C": struct.Struct("<B"),
+    b"s": struct.Struct("<h"),
+    b"S": struct.Struct("<H"),
+    b"i": struct.Struct("<i"),
+    b"I": struct.Struct("<I"),
+    b"f": struct.Struct("<f"),
+}
+
+_array_dtypes = {
+    b"c": np.dtype("<i1"),
+    b"C": np.dtype("<u1"),
+    b"s": np.dtype("<i2"),
+    b"S": np.dtype("<u2"),
+    b"i": np.dtype("<i4"),
+    b"I": np.dtype("<u4"),
+    b"f": np.dtype("<f4"),
+}
+
+# Integer types in order of preference when writing tags
+_integer_types = (
+    (b"C", np.dtype("<u1")),
+    (b"c", np.dtype("<i1")),
+    (b"S", np.dtype("<u2")),
+    (b"s", np.dtype("<i2")),
+    (b"I", np.dtype("<u4")),
+    (b"i", np.dtype("<i4")),
+)
+
+
+def _span(data):
+    """Return the reference span of a binary BAM record (PRIVATE).
+
+    This function returns the reference sequence index, the start and end
+    position on the reference sequence, and a boolean indicating if the read
+    is mapped.
+    """
+    refID, pos, l_read_name, n_cigar_op, flag = _span_record.unpack_from(data)
+    if flag & 4 or n_cigar_op == 0:
+        return refID, pos, pos + 1, not flag & 4
+    cigar = struct.unpack_from("<%dI" % n_cigar_op, data, 32 + l_read_name)
+    # M, D, N, =, and X consume the reference sequence
+    end = pos + sum(value >> 4 for value in cigar if 0x18D >> (value & 0xF) & 1)
+    return refID, pos, end, True
+
+
+def _format_tag(key, value):
+    """Return the binary representation of a tag (PRIVATE)."""
+    if isinstance(value, (int, np.integer)):
+        for datatype, dtype in _integer_types:
+            info = np.iinfo(dtype)
+            if info.min <= value <= info.max:
+                break
+        else:
+            raise ValueError(f"Integer value {value} in tag '{key}' is out of range")
+        return key.encode() + datatype + np.array(value, dtype).tobytes()
+    if isinstance(value, (float, np.floating)):
+        return key.encode() + b"f" + struct.pack("<f", value)
+    if isinstance(value, str):
+        if len(value) == 1:
+            return key.encode() + b"A" + value.encode()
+        return key.encode() + b"Z" + value.encode() + b"\x00"
+    if isinstance(value, bytes):
+        return key.encode() + b"H" + value.hex().upper().encode() + b"\x00"
+    if isinstance(value, np.ndarray):
+        if np.issubdtype(value.dtype, np.integer):
+            if len(value) == 0:
+                datatype, dtype = _integer_types[0]
+            else:
+                minimum = value.min()
+                maximum = value.max()
+                for datatype, dtype in _integer_types:
+                    info = np.iinfo(dtype)
+                    if info.min <= minimum and maximum <= info.max:
+                        break
+                else:
+                    raise ValueError(f"Integer array in tag '{key}' is out of range")
+        elif np.issubdtype(value.dtype, np.floating):
+            datatype, dtype = b"f", np.dtype("<f4")
+        else:
+            raise ValueError(
+                f"Array of incompatible data type {value.dtype} in annotation '{key}'"
+            )
+        value = np.asarray(value, dtype)
+        return (
+            key.encode()
+            + b"B"
+            + datatype
+            + struct.pack("<i", len(value))
+            + value.tobytes()
+        )
+    raise ValueError(f"Unable to store value of type {type(value)} in tag '{key}'")
+
+
+class AlignmentWriter(interfaces.AlignmentWriter):
+    """Alignment file writer for the Binary Alignment/Map (BAM) file format."""
+
+    fmt = "BAM"
+    mode = "b"
+
+    def __init__(self, target, md=False, compresslevel=6):
+        """Create an AlignmentWriter object.
+
+        Arguments:
+         - md - If True, calculate the MD tag from the alignment and include it
+                in the output.
+                If False (default), do not include the MD tag in the output.
+         - compresslevel - zlib compression level of the BGZF blocks (default
+                           6).
+
+        """
+        super().__init__(target)
+        self.md = md
+        self.compresslevel = compresslevel
+
+    def write_header(self, stream, alignments):
+        """Write the BAM header.
+
+        The header consists of the SAM header text, followed by the names and
+        lengths of the target sequences in alignments.targets.
+        """
+        text = StringIO()
+        sam.AlignmentWriter(None).write_header(text, alignments)
+        text = text.getvalue().encode()
+        fields = [b"BAM\x01", struct.pack("<i", len(text)), text]
+        targets = alignments.targets
+        fields.append(struct.pack("<i", len(targets)))
+        for record in targets:
+            name = record.id.encode() + b"\x00"
+            fields.append(struct.pack("<i", len(name)))
+            fields.append(name)
+            fields.append(struct.pack("<i", len(record.seq)))
+        stream.write(b"".join(fields))
+        self._target_indices = {
+            record.id: index for index, record in enumerate(targets)
+        }
+
+    def write_file(self, stream, alignments):
+        """Write the alignments to the file stream, and return the number of alignments.
+
+        alignments - A list or iterator returning Alignment objects
+        stream     - Output file stream.
+
+        As the BAM header must contain all target sequences, the alignments are
+        read into memory first if alignments.targets is missing or empty, to
+        collect the target sequences from the alignments.
+        """
+        try:
+            targets = alignments.targets
+        except AttributeError:
+            targets = None
+        if not targets:
+            metadata = getattr(alignments, "metadata", None)
+            alignments = Alignments(alignments)
+            alignments.targets = self._collect_targets(alignments)
+            if metadata is not None:
+                alignments.metadata = metadata
+        writer = bgzf.BgzfWriter(fileobj=stream, compresslevel=self.compresslevel)
+        self.write_header(writer, alignments)
+        count = self.write_alignments(writer, alignments)
+        writer.flush()
+        stream.write(bgzf._bgzf_eof)
+        return count
+
+    @staticmethod
+    def _collect_targets(alignments):
+        """Return the target sequences found in the alignments (PRIVATE)."""
+        lengths = {}
+        for alignment in alignments:
+            target = alignment.sequences[0]
+            if target is None:
+                continue
+            try:
+                name = target.id
+            except AttributeError:
+                name = "target"
+            try:
+                length = len(target)
+            except (TypeError, ValueError):
+                length = 0
+            coordinates = alignment.coordinates
+            if coordinates is not None:
+                length = max(length, coordinates[0, :].max())
+            lengths[name] = max(lengths.get(name, 0), length)
+        return [
+            SeqRecord(Seq(None, length=length), id=name, description="")
+            for name, length in lengths.items()
+        ]
+
+    def format_alignment(self, alignment, md=None):
+        """Return a single alignment as a binary BAM record, including its size."""
+        if not isinstance(alignment, Alignment):
+            raise TypeError("Expected an Alignment object")
+        target, query = alignment.sequences
+        hard_clip_left = None
+        hard_clip_right = None
+        phred = None
+        try:
+            qName = query.id
+        except AttributeError:
+            qName = "query"
+        else:
+            try:
+                hard_clip_left = query.annotations["hard_clip_left"]
+            except (AttributeError, KeyError):
+                pass
+            try:
+                hard_clip_right = query.annotations["hard_clip_right"]
+            except (AttributeError, KeyError):
+                pass
+            try:
+                phred = query.letter_annotations["phred_quality"]
+            except (AttributeError, KeyError):
+                pass
+            query = query.seq
+        qSize = len(query)
+        coordinates = alignment.coordinates
+        if target is None or coordinates is None:
+            # unmapped; place the read at the position of its mate, if any
+            flag = 0x4
+            cigar = np.zeros(0, np.uint32)
+            coordinates = None
+            try:
+                refID = self._target_indices[alignment.rnext]
+            except (AttributeError, KeyError):
+                refID = -1
+                pos = -1
+            else:
+                pos = getattr(alignment, "pnext", -1)
+            end = pos + 1
+        else:
+            try:
+                rname = target.id
+            except AttributeError:
+                rname = "target"
+            else:
+                target = target.seq
+            try:
+                refID = self._target_indices[rname]
+            except KeyError:
+                raise ValueError(
+                    f"Target {rname} is missing from the BAM header"
+                ) from None
+            coordinates = coordinates.transpose()
+            if coordinates[0, 0] > coordinates[-1, 0]:
+                coordinates = coordinates[::-1, :]
+            if coordinates[0, 1] < coordinates[-1, 1]:  # mapped to forward strand
+                flag = 0
+            else:  # mapped to reverse strand
+                flag = 0x10
+                query = reverse_complement(query)
+                coordinates = np.array(coordinates, np.intp)
+                coordinates[:, 1] = qSize - coordinates[:, 1]
+                hard_clip_left, hard_clip_right = hard_clip_right, hard_clip_left
+            steps = np.diff(coordinates, axis=0)
+            tSteps = steps[:, 0]
+            qSteps = steps[:, 1]
+            try:
+                operations = alignment.operations
+            except AttributeError:
+                operations = None
+                codes = np.where(tSteps == 0, 1, np.where(qSteps == 0, 2, 0))
+            else:
+                codes = _operation_codes[np.frombuffer(bytes(operations), np.uint8)]
+                if (
+                    len(codes) != len(steps)
+                    or np.any(codes < 0)
+                    or np.any((_target_steps[codes] == 0) != (tSteps == 0))
+                    or np.any((_query_steps[codes] == 0) != (qSteps == 0))
+                ):
+                    raise ValueError("Operations are inconsistent with the alignment")
+            if np.any((tSteps != qSteps) & (tSteps != 0) & (qSteps != 0)):
+                raise ValueError("Unequal step sizes in alignment")
+            lengths = np.where(tSteps == 0, qSteps, tSteps)
+            cigar = (lengths.astype(np.uint32) << 4) | codes.astype(np.uint32)
+            qStart = coordinates[0, 1]
+            qEnd = coordinates[-1, 1]
+            prefix = []
+            if hard_clip_left is not None:
+                prefix.append((hard_clip_left << 4) | 5)
+            if qStart > 0:
+                prefix.append((qStart << 4) | 4)
+            suffix = []
+            if qEnd < qSize:
+                suffix.append(((qSize - qEnd) << 4) | 4)
+            if hard_clip_right is not None:
+                suffix.append((hard_clip_right << 4) | 5)
+            if prefix or suffix:
+                cigar = np.concatenate([prefix, cigar, suffix]).astype(np.uint32)
+            pos = coordinates[0, 0]
+            end = coordinates[-1, 0]
+        try:
+            flag |= alignment.flag
+        except AttributeError:
+            pass
+        try:
+            sequence = bytes(query)
+        except TypeError:  # string
+            sequence = query.encode()
+        except UndefinedSequenceError:
+            sequence = b""
+        l_seq = len(sequence)
+        codes = _encoded_letters[np.frombuffer(sequence, np.uint8)]
+        if l_seq % 2:
+            codes = np.append(codes, 0)
+        packed = ((codes[0::2] << 4) | codes[1::2]).astype(np.uint8).tobytes()
+        if l_seq == 0:
+            qual = b""
+        elif phred is None:
+            qual = b"\xff" * l_seq
+        else:
+            qual = bytes(phred)
+        mapq = getattr(alignment, "mapq", 255)
+        try:
+            next_refID = self._target_indices[alignment.rnext]
+        except (AttributeError, KeyError):
+            next_refID = -1
+        next_pos = getattr(alignment, "pnext", -1)
+        tlen = getattr(alignment, "tlen", 0)
+        read_name = qName.encode() + b"\x00"
+        fields = [
+            _record.pack(
+                refID,
+                pos,
+                len(read_name),
+                mapq,
+                reg2bin(pos, end),
+                len(cigar),
+                flag,
+                l_seq,
+                next_refID,
+                next_pos,
+                tlen,
+            ),
+            read_name,
+            cigar.astype("<u4").tobytes(),
+            packed,
+            qual,
+        ]
+        if md is None:
+            md = self.md
+        if md is True and coordinates is not None:
+            if l_seq == 0:
+                raise ValueError("requested MD tag with undefined sequence")
+            md = sam._calculate_md(coordinates, operations, target, sequence.decode())
+            fields.append(b"MDZ" + str(md).encode() + b"\x00")
+        try:
+            score = alignment.score
+        except AttributeError:
+            pass
+        else:
+            fields.append(_format_tag("AS", round(score)))
+        try:
+            annotations = alignment.annotations
+        except AttributeError:
+            pass
+        else:
+            for key, value in annotations.items():
+                fields.append(_format_tag(key, value))
+        data = b"".join(fields)
+        return struct.pack("<i", len(data)) + data
+
+
+class AlignmentIterator(interfaces.AlignmentIterator):
+    """Alignment iterator for Binary Alignment/Map (BAM) files.
+
+    Each record in the file contains one genomic alignment, which are decoded
+    and returned incrementally.  The following fields are stored as attributes
+    of the alignment:
+
+      - flag: The FLAG combination of bitwise flags;
+      - mapq: Mapping Quality (only stored if available)
+      - rnext: Reference sequence name of the primary alignment of the next read
+               in the alignment (only stored if available)
+      - pnext: Zero-based position of the primary alignment of the next read in
+               the template (only stored if available)
+      - tlen: signed observed template length (only stored if available)
+
+    Other information associated with the alignment by its tags are stored in
+    the annotations attribute of each alignment.
+
+    Any hard clipping (clipped sequences not present in the query sequence)
+    are stored as 'hard_clip_left' and 'hard_clip_right' in the annotations
+    dictionary attribute of the query sequence record.
+
+    The sequence quality, if available, is stored as 'phred_quality' in the
+    letter_annotations dictionary attribute of the query sequence record.
+    """
+
+    fmt = "BAM"
+    mode = "b"
+
+    def _read_header(self, stream):
+        stream = bgzf.BgzfReader(mode="rb", fileobj=stream)
+        self._bgzf = stream
+        magic = stream.read(4)
+        if magic != b"BAM\x01":
+            raise ValueError("File does not start with the BAM magic string")
+        (l_text,) = struct.unpack("<i", stream.read(4))
+        text = stream.read(l_text).rstrip(b"\x00").decode()
+        header = sam.AlignmentIterator(StringIO(text))
+        self.metadata = header.metadata
+        records = {record.id: record for record in header.targets}
+        self.targets = []
+        (n_ref,) = struct.unpack("<i", stream.read(4))
+        for i in range(n_ref):
+            (l_name,) = struct.unpack("<i", stream.read(4))
+            name = stream.read(l_name)[:-1].decode()
+            (length,) = struct.unpack("<i", stream.read(4))
+            record = records.get(name)
+            if record is None:
+                sequence = Seq(None, length=length)
+                record = SeqRecord(sequence, id=name, description="")
+            self.targets.append(record)
+        self._data_offset = stream.tell()
+
+    @staticmethod
+    def _read_record(stream):
+        """Read the binary data of the next record in the BAM file (PRIVATE)."""
+        data = stream.read(4)
+        if not data:
+            return None
+        if len(data) < 4:
+            raise ValueError("Unexpected end of file")
+        (block_size,) = struct.unpack("<i", data)
+        data = stream.read(block_size)
+        if len(data) < block_size:
+            raise ValueError("Unexpected end of file")
+        return data
+
+    def _read_next_alignment(self, stream):
+        data = self._read_record(self._bgzf)
+        if data is None:
+            return None
+        return self._create_alignment(data)
+
+    def search(self, chromosome=None, start=None, end=None):
+        """Iterate over alignments overlapping the specified chromosome region.
+
+        This method uses the BAI or CSI index file of the BAM file to find
+        alignments to the specified chromosome that fully or partially overlap
+        the chromosome region between start and end. The index file is looked
+        up by appending ".bai" or ".csi" to the file name of the BAM file, or by
+        replacing its extension by ".bai" or ".csi"; use the create_index
+        function in this module to create an index file. Only the parts of the
+        BAM file that may contain overlapping alignments are read and decoded.
+
+        Arguments:
+         - chromosome - chromosome name. If None (default value), include all
+           alignments.
+         - start      - starting position on the chromosome. If None (default
+           value), use 0 as the starting position.
+         - end        - end position on the chromosome. If None (default value),
+           use the length of the chromosome as the end position.
+
+        """
+        stream = self._bgzf
+        if chromosome is None:
+            if start is not None or end is not None:
+                raise ValueError(
+                    "start and end must both be None if chromosome is None"
+                )
+            stream.seek(self._data_offset)
+            while True:
+                data = self._read_record(stream)
+                if data is None:
+                    break
+                yield self._create_alignment(data)
+            return
+        for chromIx, target in enumerate(self.targets):
+            if target.id == chromosome:
+                break
+        else:
+            raise ValueError("Failed to find %s in alignments" % chromosome)
+        if start is None:
+            if end is None:
+                start = 0
+                end = len(target)
+            else:
+                raise ValueError("end must be None if start is None")
+        elif end is None:
+            end = start + 1
+        try:
+            index = self._binning_index
+        except AttributeError:
+            index = find_index(self.source, (".bai", ".csi"))
+            self._binning_index = index
+        for chunk_start, chunk_end in index.query(chromIx, start, end):
+            stream.seek(chunk_start)
+            while stream.tell() < chunk_end:
+                data = self._read_record(stream)
+                if data is None:
+                    break
+                refID, pos, chromEnd, _ = _span(data)
+                if refID != chromIx or pos >= end:
+                    return
+                if chromEnd > start:
+                    yield self._create_alignment(data)
+
+    def _create_alignment(self, data):
+        """Create an Alignment object from a binary BAM record (PRIVATE)."""
+        (
+            refID,
+            pos,
+            l_read_name,
+            mapq,
+            _bin,
+            n_cigar_op,
+            flag,
+            l_seq,
+            next_refID,
+            next_pos,
+            tlen,
+        ) = _record.unpack_from(data)
+        offset = _record.size
+        qname = data[offset : offset + l_read_name - 1].decode()
+        offset += l_read_name
+        cigar = data[offset : offset + 4 * n_cigar_op]
+        offset += 4 * n_cigar_op
+        size = (l_seq + 1) // 2
+        packed = data[offset : offset + size]
+        query = bytearray(2 * size)
+        query[0::2] = packed.translate(_high_letters)
+        query[1::2] = packed.translate(_low_letters)
+        query = bytes(query[:l_seq])
+        offset += size
+        qual = data[offset : offset + l_seq]
+        offset += l_seq
+        md = None
+        score = None
+        annotations = {}
+        end = len(data)
+        while offset < end:
+            tag = data[offset : offset + 2].decode()
+            datatype = data[offset + 2 : offset + 3]
+            offset += 3
+            if datatype == b"Z" or datatype == b"H":
+                index = data.index(b"\x00", offset)
+                value = data[offset:index].decode()
+                offset = index + 1
+                if datatype == b"H":
+                    value = bytes.fromhex(value)
+            elif datatype == b"A":
+                value = chr(data[offset])
+                offset += 1
+            elif datatype == b"B":
+                letter = data[offset : offset + 1]
+                try:
+                    dtype = _array_dtypes[letter]
+                except KeyError:
+                    raise ValueError(
+                        f"Unknown number type '{letter.decode()}' in tag '{tag}'"
+                    ) from None
+                (count,) = struct.unpack_from("<i", data, offset + 1)
+                offset += 5
+                value = np.frombuffer(data, dtype, count, offset).astype(dtype.type)
+                offset += count * dtype.itemsize
+            else:
+                try:
+                    fmt = _tag_formats[datatype]
+                except KeyError:
+                    raise ValueError(
+                        f"Unknown data type '{datatype.decode()}' in tag '{tag}'"
+                    ) from None
+                (value,) = fmt.unpack_from(data, offset)
+                offset += fmt.size
+            if tag == "AS":
+                score = value
+            elif tag == "MD":
+                md = value
+            else:
+                annotations[tag] = value
+        if flag & 0x10:
+            strand = "-"
+        else:
+            strand = "+"
+        (
+            coordinates,
+            operations,
+            query_pos,
+            hard_clip_left,
+            hard_clip_right,
+        ) = _aligncore.parse_binary_cigar(cigar, pos)
+        if flag & 0x4:  # unmapped
+            target = None
+            coordinates = None
+        else:
+            if refID < 0:
+                raise ValueError(f"Mapped read {qname} without a target")
+            target = self.targets[refID]
+            coordinates = np.frombuffer(coordinates, np.intp).reshape(2, -1)
+            if md is not None and l_seq > 0:
+                target = self._create_target(target, query, coordinates, operations, md)
+            if strand == "-":
+                coordinates[1, :] = query_pos - coordinates[1, :]
+        if l_seq == 0:
+            sequence = Seq(None, length=query_pos)
+        else:
+            sequence = Seq(query)
+            if not (flag & 0x4):  # not unmapped
+                if l_seq != query_pos:
+                    raise ValueError(
+                        f"Sequence length {l_seq} of {qname} is inconsistent with CIGAR"
+                    )
+                if strand == "-":
+                    sequence = sequence.reverse_complement()
+        query = SeqRecord(sequence, id=qname, description="")
+        if strand == "-":
+            hard_clip_left, hard_clip_right = hard_clip_right, hard_clip_left
+        if hard_clip_left is not None:
+            query.annotations["hard_clip_left"] = hard_clip_left
+        if hard_clip_right is not None:
+            query.annotations["hard_clip_right"] = hard_clip_right
+        if l_seq > 0 and qual[0] != 0xFF:
+            query.letter_annotations["phred_quality"] = list(qual)
+        records = [target, query]
+        alignment = Alignment(records, coordinates)
+        alignment.flag = flag
+        if mapq != 255:
+            alignment.mapq = mapq
+        if next_refID >= 0:
+            alignment.rnext = self.targets[next_refID].id
+        if next_pos >= 0:
+            alignment.pnext = next_pos
+        if tlen != 0:
+            alignment.tlen = tlen
+        if score is not None:
+            alignment.score = score
+        if annotations:
+            alignment.annotations = annotations
+        if hard_clip_left is not None:
+            alignment.hard_clip_left = hard_clip_left
+        if hard_clip_right is not None:
+            alignment.hard_clip_right = hard_clip_right
+        if b"N" in operations or b"=" in operations or b"X" in operations:
+            alignment.operations = operations
+        return alignment
+
+    @staticmethod
+    def _create_target(record, query, coordinates, operations, md):
+        """Reconstruct the aligned target sequence from the MD tag (PRIVATE)."""
+        seq = b""
+        starts = [coordinates[0, 0]]
+        sizes = []
+        size = 0
+        for operation, (target_start, target_end), (query_start, query_end) in zip(
+            operations,
+            zip(coordinates[0, :-1].tolist(), coordinates[0, 1:].tolist()),
+            zip(coordinates[1, :-1].tolist(), coordinates[1, 1:].tolist()),
+        ):
+            if operation in b"M=X":
+                seq += query[query_start:query_end]
+                size += target_end - target_start
+            elif operation == ord("D"):  # deletion from the reference
+                size += target_end - target_start
+                starts.append(target_end)
+                sizes.append(size)
+                size = 0
+            elif operation == ord("N"):  # skipped region from the reference
+                starts.append(target_end)
+                sizes.append(size)
+                size = 0
+        sizes.append(size)
+        seq = sam._apply_md(seq.decode(), md)
+        data = {}
+        index = 0
+        for start, size in zip(starts, sizes):
+            data[start] = seq[index : index + size]
+            index += size
+        return SeqRecord._from_validated(
+            Seq(data, length=len(record.seq)),
+            record.id,
+            record.name,
+            record.description,
+            annotations={
+                key: copy.copy(val) for key, val in record.annotations.items()
+            },
+        )
+
+
+def create_index(source, target=None, csi=False, min_shift=14, depth=None):
+    """Create a BAI or CSI index file for a coordinate-sorted BAM file.
+
+    Arguments:
+     - source    - file name of the BAM file.
+     - target    - file name of the index file. If None (default value), the
+                   index file is written to the file name of the BAM file
+                   with ".bai" or ".csi" appended.
+     - csi       - if True, create a CSI index file; if False (default value),
+                   create a BAI index file.
+     - min_shift - log2 of the size of the smallest bins of a CSI index
+                   (default value 14). BAI indices always use 14.
+     - depth     - number of levels of the binning index of a CSI index. If
+                   None (default value), use the smallest depth that can
+                   represent the longest reference sequence. BAI indices
+                   always use a depth of 5.
+
+    The alignments in the BAM file must be sorted by reference sequence and
+    position, as created by ``samtools sort``.
+    """
+    with open(source, "rb") as stream:
+        alignments = AlignmentIterator(stream)
+        if csi:
+            if depth is None:
+                length = max((len(record) for record in alignments.targets), default=0)
+                depth = 0
+                while length > 1 << (min_shift + 3 * depth):
+                    depth += 1
+            index = BinningIndex(min_shift, depth, len(alignments.targets))
+        else:
+            index = BinningIndex(n_ref=len(alignments.targets))
+        stream = alignments._bgzf
+        while True:
+            begin_offset = stream.tell()
+            data = AlignmentIterator._read_record(stream)
+            if data is None:
+                break
+            refID, pos, end, mapped = _span(data)
+            index.add(refID, pos, end, begin_offset, stream.tell(), mapped)
+    if target is None:
+        target = os.fspath(source) + (".csi" if csi else ".bai")
+    with open(target, "wb") as stream:
+        if csi:
+            index.write_csi(stream)
+        else:
+            index.write_bai(stream)
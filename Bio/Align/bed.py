@@ -26,12 +26,16 @@ zero-based end position. We can therefore manipulate ``start`` and
 ``start + size`` as python list slice boundaries.
 """
 
+import os
 import sys
 
 import numpy as np
 
 from Bio.Align import Alignment
 from Bio.Align import interfaces
+from Bio.Align._htsindex import create_tabix_index
+from Bio.Align._htsindex import TABIX_UCSC
+from Bio.Align._htsindex import TabixIterator
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 
@@ -154,12 +158,17 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         return "\t".join(fields) + "\n"
 
 
-class AlignmentIterator(interfaces.AlignmentIterator):
+class AlignmentIterator(TabixIterator, interfaces.AlignmentIterator):
     """Alignment iterator for Browser Extensible Data (BED) files.
 
     Each line in the file contains one pairwise alignment, which are loaded
     and returned incrementally.  Additional alignment information is stored as
     attributes of each alignment.
+
+    BED files compressed with BGZF (see Bio.bgzf), as created by ``bgzip``, are
+    decompressed while reading if source is a path. If the file was indexed by
+    ``tabix -p bed`` or by the create_index function in this module, the search
+    method can be used to find the alignments overlapping a chromosome region.
     """
 
     fmt = "BED"
@@ -169,91 +178,115 @@ class AlignmentIterator(interfaces.AlignmentIterator):
             # note that we cannot extract one line by calling next, as stream
             # may be iterable but not an iterator (for example, TemporaryFile
             # or NamedTemporaryFile objects in tempfile).
-            words = line.split()
-            bedN = len(words)
-            if bedN < 3 or bedN > 12:
-                raise ValueError("expected between 3 and 12 columns, found %d" % bedN)
-            chrom = words[0]
-            chromStart = int(words[1])
-            chromEnd = int(words[2])
-            if bedN > 3:
-                name = words[3]
-            else:
-                name = None
-            if bedN > 5:
-                strand = words[5]
-            else:
-                strand = "+"
-            if bedN > 9:
-                blockCount = int(words[9])
-                blockSizes = [
-                    int(blockSize) for blockSize in words[10].rstrip(",").split(",")
-                ]
-                blockStarts = [
-                    int(blockStart) for blockStart in words[11].rstrip(",").split(",")
-                ]
-                if len(blockSizes) != blockCount:
-                    raise ValueError(
-                        "Inconsistent number of block sizes (%d found, expected %d)"
-                        % (len(blockSizes), blockCount)
-                    )
-                if len(blockStarts) != blockCount:
-                    raise ValueError(
-                        "Inconsistent number of block start positions (%d found, expected %d)"
-                        % (len(blockStarts), blockCount)
-                    )
-                blockSizes = np.array(blockSizes)
-                blockStarts = np.array(blockStarts)
-                tPosition = 0
-                qPosition = 0
-                coordinates = [[tPosition, qPosition]]
-                for blockSize, blockStart in zip(blockSizes, blockStarts):
-                    if blockStart != tPosition:
-                        coordinates.append([blockStart, qPosition])
-                        tPosition = blockStart
-                    tPosition += blockSize
-                    qPosition += blockSize
-                    coordinates.append([tPosition, qPosition])
-                coordinates = np.array(coordinates, np.intp).transpose()
-                qSize = sum(blockSizes)
-            else:
-                blockSize = chromEnd - chromStart
-                coordinates = np.array([[0, blockSize], [0, blockSize]], np.intp)
-                qSize = blockSize
-            coordinates[0, :] += chromStart
-            query_sequence = Seq(None, length=qSize)
-            query_record = SeqRecord(query_sequence, id=name, description="")
-            target_sequence = Seq(None, length=sys.maxsize)
-            target_record = SeqRecord(target_sequence, id=chrom, description="")
-            records = [target_record, query_record]
-            if strand == "-":
-                coordinates[1, :] = qSize - coordinates[1, :]
-            if chromStart != coordinates[0, 0]:
+            return self._create_alignment(line)
+
+    def _create_alignment(self, line):
+        """Create an Alignment object from a line in the BED file (PRIVATE)."""
+        words = line.split()
+        bedN = len(words)
+        if bedN < 3 or bedN > 12:
+            raise ValueError("expected between 3 and 12 columns, found %d" % bedN)
+        chrom = words[0]
+        chromStart = int(words[1])
+        chromEnd = int(words[2])
+        if bedN > 3:
+            name = words[3]
+        else:
+            name = None
+        if bedN > 5:
+            strand = words[5]
+        else:
+            strand = "+"
+        if bedN > 9:
+            blockCount = int(words[9])
+            blockSizes = [
+                int(blockSize) for blockSize in words[10].rstrip(",").split(",")
+            ]
+            blockStarts = [
+                int(blockStart) for blockStart in words[11].rstrip(",").split(",")
+            ]
+            if len(blockSizes) != blockCount:
                 raise ValueError(
-                    "Inconsistent chromStart found (%d, expected %d)"
-                    % (chromStart, coordinates[0, 0])
+                    "Inconsistent number of block sizes (%d found, expected %d)"
+                    % (len(blockSizes), blockCount)
                 )
-            if chromEnd != coordinates[0, -1]:
+            if len(blockStarts) != blockCount:
                 raise ValueError(
-                    "Inconsistent chromEnd found (%d, expected %d)"
-                    % (chromEnd, coordinates[0, -1])
+                    "Inconsistent number of block start positions (%d found, expected %d)"
+                    % (len(blockStarts), blockCount)
                 )
-            alignment = Alignment(records, coordinates)
-            if bedN <= 4:
-                return alignment
-            score = words[4]
-            try:
-                score = float(score)
-            except ValueError:
-                pass
-            alignment.score = score
-            if bedN <= 6:
-                return alignment
-            alignment.thickStart = int(words[6])
-            if bedN <= 7:
-                return alignment
-            alignment.thickEnd = int(words[7])
-            if bedN <= 8:
-                return alignment
-            alignment.itemRgb = words[8]
+            blockSizes = np.array(blockSizes)
+            blockStarts = np.array(blockStarts)
+            tPosition = 0
+            qPosition = 0
+            coordinates = [[tPosition, qPosition]]
+            for blockSize, blockStart in zip(blockSizes, blockStarts):
+                if blockStart != tPosition:
+                    coordinates.append([blockStart, qPosition])
+                    tPosition = blockStart
+                tPosition += blockSize
+                qPosition += blockSize
+                coordinates.append([tPosition, qPosition])
+            coordinates = np.array(coordinates, np.intp).transpose()
+            qSize = sum(blockSizes)
+        else:
+            blockSize = chromEnd - chromStart
+            coordinates = np.array([[0, blockSize], [0, blockSize]], np.intp)
+            qSize = blockSize
+        coordinates[0, :] += chromStart
+        query_sequence = Seq(None, length=qSize)
+        query_record = SeqRecord(query_sequence, id=name, description="")
+        target_sequence = Seq(None, length=sys.maxsize)
+        target_record = SeqRecord(target_sequence, id=chrom, description="")
+        records = [target_record, query_record]
+        if strand == "-":
+            coordinates[1, :] = qSize - coordinates[1, :]
+        if chromStart != coordinates[0, 0]:
+            raise ValueError(
+                "Inconsistent chromStart found (%d, expected %d)"
+                % (chromStart, coordinates[0, 0])
+            )
+        if chromEnd != coordinates[0, -1]:
+            raise ValueError(
+                "Inconsistent chromEnd found (%d, expected %d)"
+                % (chromEnd, coordinates[0, -1])
+            )
+        alignment = Alignment(records, coordinates)
+        if bedN <= 4:
             return alignment
+        score = words[4]
+        try:
+            score = float(score)
+        except ValueError:
+            pass
+        alignment.score = score
+        if bedN <= 6:
+            return alignment
+        alignment.thickStart = int(words[6])
+        if bedN <= 7:
+            return alignment
+        alignment.thickEnd = int(words[7])
+        if bedN <= 8:
+            return alignment
+        alignment.itemRgb = words[8]
+        return alignment
+
+
+def create_index(source, target=None, csi=False):
+    """Create a tabix index file for a sorted BGZF-compressed BED file.
+
+    Arguments:
+     - source - file name of the BED file compressed by ``bgzip``.
+     - target - file name of the index file. If None (default value), the
+                index file is written to the file name of the BED file
+                with ".tbi" or ".csi" appended.
+     - csi    - if True, create a CSI index file; if False (default value),
+                create a TBI index file.
+
+    The lines in the BED file must be sorted by chromosome and start position,
+    for example by ``sort -k1,1 -k2,2n``. The index file is equivalent to the
+    index file created by ``tabix -p bed``.
+    """
+    if target is None:
+        target = os.fspath(source) + (".csi" if csi else ".tbi")
+    create_tabix_index(source, target, TABIX_UCSC, 1, 2, 3, csi=csi)
@@ -53,10 +53,16 @@ You are expected to use this module via the Bio.Align functions.
 import copy
 import io
 import itertools
+import mmap
+import os
 import struct
 import sys
+import tempfile
+import threading
 import zlib
+from collections import deque
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import numpy as np
@@ -229,6 +235,7 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         itemsPerSlot=512,
         blockSize=256,
         extraIndex=(),
+        workers=None,
     ):
         """Create an AlignmentWriter object.
 
@@ -265,6 +272,14 @@ class AlignmentWriter(interfaces.AlignmentWriter):
          - extraIndex   - List of strings with the names of extra columns to be
                           indexed.
                           Default value is an empty list.
+         - workers      - Number of threads used to compress the data blocks.
+                          Default value is None, meaning that the number of
+                          threads is chosen by ThreadPoolExecutor in
+                          concurrent.futures.
+
+        The alignments are read only once, and are stored in a temporary file
+        while the bigBed file is being written. The alignments can therefore be
+        provided by an iterator, without keeping all of them in memory.
         """
         if bedN < 3 or bedN > 12:
             raise ValueError("bedN must be between 3 and 12")
@@ -276,6 +291,7 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         self.extraIndexNames = extraIndex
         self.itemsPerSlot = itemsPerSlot
         self.blockSize = blockSize
+        self.workers = workers
 
     def write_file(self, stream, alignments):
         """Write the alignments to the file stream, and return the number of alignments.
@@ -297,48 +313,50 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         declaration = self.declaration
         header.fieldCount = len(declaration)
         extra_indices = _ExtraIndices(self.extraIndexNames, declaration)
-        chromUsageList, aveSize = self._get_chrom_usage(
-            alignments, targets, extra_indices
-        )
-        stream.write(bytes(header.size))
-        stream.write(bytes(_ZoomLevels.size))
-        header.autoSqlOffset = stream.tell()
-        stream.write(bytes(declaration))
-        header.totalSummaryOffset = stream.tell()
-        stream.write(bytes(_Summary.size))
-        header.extraIndicesOffset = stream.tell()
-        stream.write(bytes(extra_indices.size))
-        header.chromosomeTreeOffset = stream.tell()
-        _BPlusTreeFormatter().write(
-            chromUsageList, min(self.blockSize, len(chromUsageList)), stream
-        )
-        header.fullDataOffset = stream.tell()
-        reductions = _ZoomLevels.calculate_reductions(aveSize)
-        stream.write(len(alignments).to_bytes(8, sys.byteorder))
-        extra_indices.initialize(len(alignments))
-        maxBlockSize, regions = self.write_alignments(
-            alignments,
-            stream,
-            reductions,
-            extra_indices,
-        )
-        if self.compress:
-            header.uncompressBufSize = max(
-                maxBlockSize, self.itemsPerSlot * _RegionSummary.size
+        with tempfile.TemporaryFile() as records:
+            chromUsageList, aveSize, bedCount = self._spill_records(
+                alignments, targets, extra_indices, records
+            )
+            stream.write(bytes(header.size))
+            stream.write(bytes(_ZoomLevels.size))
+            header.autoSqlOffset = stream.tell()
+            stream.write(bytes(declaration))
+            header.totalSummaryOffset = stream.tell()
+            stream.write(bytes(_Summary.size))
+            header.extraIndicesOffset = stream.tell()
+            stream.write(bytes(extra_indices.size))
+            header.chromosomeTreeOffset = stream.tell()
+            _BPlusTreeFormatter().write(
+                chromUsageList, min(self.blockSize, len(chromUsageList)), stream
+            )
+            header.fullDataOffset = stream.tell()
+            reductions = _ZoomLevels.calculate_reductions(aveSize)
+            stream.write(bedCount.to_bytes(8, sys.byteorder))
+            extra_indices.initialize(bedCount)
+            maxBlockSize, regions = self.write_alignments(
+                _read_records(records),
+                stream,
+                reductions,
+                extra_indices,
+            )
+            if self.compress:
+                header.uncompressBufSize = max(
+                    maxBlockSize, self.itemsPerSlot * _RegionSummary.size
+                )
+            else:
+                header.uncompressBufSize = 0
+            header.fullIndexOffset = stream.tell()
+            _RTreeFormatter().write(
+                regions, self.blockSize, 1, header.fullIndexOffset, stream
+            )
+            zoomList, totalSum = self._write_zoom_levels(
+                _read_records(records),
+                stream,
+                header.fullIndexOffset - header.fullDataOffset,
+                chromUsageList,
+                reductions,
+                bedCount,
             )
-        else:
-            header.uncompressBufSize = 0
-        header.fullIndexOffset = stream.tell()
-        _RTreeFormatter().write(
-            regions, self.blockSize, 1, header.fullIndexOffset, stream
-        )
-        zoomList, totalSum = self._write_zoom_levels(
-            alignments,
-            stream,
-            header.fullIndexOffset - header.fullDataOffset,
-            chromUsageList,
-            reductions,
-        )
         header.zoomLevels = len(zoomList)
         for extra_index in extra_indices:
             extra_index.fileOffset = stream.tell()
@@ -354,8 +372,12 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         stream.seek(0, io.SEEK_END)
         data = header.signature.to_bytes(4, sys.byteorder)
         stream.write(data)
+        return bedCount
 
-    def _get_chrom_usage(cls, alignments, targets, extra_indices):
+    def _spill_records(self, alignments, targets, extra_indices, records):
+        # Supplemental Table 12: Binary BED-data format, with the size of the
+        # rest field stored explicitly instead of zero-terminating it.
+        formatter = struct.Struct("=IIII")
         aveSize = 0
         chromId = 0
         totalBases = 0
@@ -372,7 +394,7 @@ class AlignmentWriter(interfaces.AlignmentWriter):
             start = alignment.coordinates[0, 0]
             end = alignment.coordinates[0, -1]
             for extra_index in extra_indices:
-                extra_index.updateMaxFieldSize(alignment)
+                extra_index.addKeysFromRow(alignment)
             if start > end:
                 raise ValueError(
                     f"end ({end}) before start ({start}) in alignment [{bedCount}]"
@@ -411,6 +433,9 @@ class AlignmentWriter(interfaces.AlignmentWriter):
                         )
                     minDiff = diff
             lastStart = start
+            chrom, start, end, rest = self._extract_fields(alignment)
+            records.write(formatter.pack(chromId, start, end, len(rest)))
+            records.write(rest)
         if name:
             chromUsageList.append((name, chromId, chromSize))
         chromUsageList = np.array(
@@ -419,15 +444,14 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         )
         if bedCount > 0:
             aveSize = totalBases / bedCount
-        alignments._len = bedCount
-        return chromUsageList, aveSize
+        return chromUsageList, aveSize, bedCount
 
     def _write_zoom_levels(
-        self, alignments, output, dataSize, chromUsageList, reductions
+        self, records, output, dataSize, chromUsageList, reductions, bedCount
     ):
         zoomList = _ZoomLevels()
         totalSum = _Summary()
-        if len(alignments) == 0:
+        if bedCount == 0:
             totalSum.minVal = 0.0
             totalSum.maxVal = 0.0
         else:
@@ -452,7 +476,7 @@ class AlignmentWriter(interfaces.AlignmentWriter):
                 buffer = _BufferedStream(output, size)
             regions = []
             rezoomedList = []
-            trees = _RangeTree.generate(chromUsageList, alignments)
+            trees = _RangeTree.generate(chromUsageList, records)
             scale = int(initialReduction["scale"])
             doubleReductionSize = scale * _ZoomLevels.bbiResIncrement
             for tree in trees:
@@ -598,25 +622,44 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         rest = "\t".join(row).encode()
         return chrom, chromStart, chromEnd, rest
 
-    def write_alignments(self, alignments, output, reductions, extra_indices):
-        """Write alignments to the output file, and return the number of alignments.
+    def write_alignments(self, records, output, reductions, extra_indices):
+        """Write the data blocks, and return the maximum block size and the regions.
 
-        alignments - A list or iterator returning Alignment objects
-        stream     - Output file stream.
+        records - An iterator returning (chromId, start, end, rest) tuples
+        output  - Output file stream.
         """
-        itemsPerSlot = self.itemsPerSlot
-        chromId = -1
-        itemIx = 0
-        sectionStartIx = 0
-        sectionEndIx = 0
-        currentChrom = None
-
         regions = []
-        if self.compress is True:
-            buffer = _ZippedStream()
-        else:
-            buffer = BytesIO()
         maxBlockSize = 0
+        sectionStartIx = 0
+        blocks = self._generate_blocks(records, reductions)
+        if self.compress is True:
+            blocks = _compress_blocks(blocks, self.workers)
+        for data, size, region, count in blocks:
+            if size > maxBlockSize:
+                maxBlockSize = size
+            blockStartOffset = output.tell()
+            output.write(data)
+            if extra_indices:
+                blockEndOffset = output.tell()
+                blockSize = blockEndOffset - blockStartOffset
+                sectionEndIx = sectionStartIx + count
+                for extra_index in extra_indices:
+                    extra_index.addOffsetSize(
+                        blockStartOffset,
+                        blockSize,
+                        sectionStartIx,
+                        sectionEndIx,
+                    )
+                sectionStartIx = sectionEndIx
+            region.offset = blockStartOffset
+            regions.append(region)
+        return maxBlockSize, regions
+
+    def _generate_blocks(self, records, reductions):
+        # Collect the records into blocks of itemsPerSlot items; a new block is
+        # started for each chromosome. For each block, yield the uncompressed
+        # data, its size, the region covered, and the number of items.
+        itemsPerSlot = self.itemsPerSlot
 
         # Supplemental Table 12: Binary BED-data format
         # chromId     4 bytes, unsigned
@@ -625,53 +668,27 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         # rest        zero-terminated string in tab-separated format
         formatter = struct.Struct("=III")
 
-        done = False
+        currentChromId = None
         region = None
-        alignments = iter(alignments)
-        while True:
-            try:
-                alignment = next(alignments)
-            except StopIteration:
-                itemIx = itemsPerSlot
-                done = True
-            else:
-                chrom, start, end, rest = self._extract_fields(alignment)
-                if chrom != currentChrom:
-                    if currentChrom is not None:
-                        itemIx = itemsPerSlot
-                    currentChrom = chrom
-                    chromId += 1
-                    reductions["end"] = 0
-            if itemIx == itemsPerSlot:
-                blockStartOffset = output.tell()
-                size = buffer.tell()
-                if size > maxBlockSize:
-                    maxBlockSize = size
-                data = buffer.getvalue()
-                output.write(data)
-                buffer.seek(0)
-                buffer.truncate(0)
-                if extra_indices:
-                    blockEndOffset = output.tell()
-                    blockSize = blockEndOffset - blockStartOffset
-                    for extra_index in extra_indices:
-                        extra_index.addOffsetSize(
-                            blockStartOffset,
-                            blockSize,
-                            sectionStartIx,
-                            sectionEndIx,
-                        )
-                    sectionStartIx = sectionEndIx
-                region.offset = blockStartOffset
-                if done is True:
-                    break
-                itemIx = 0
-            if itemIx == 0:
+        items = []
+        for chromId, start, end, rest in records:
+            if chromId != currentChromId:
+                if region is not None:
+                    data = b"".join(items)
+                    yield data, len(data), region, len(items)
+                    region = None
+                    items = []
+                currentChromId = chromId
+                reductions["end"] = 0
+            elif len(items) == itemsPerSlot:
+                data = b"".join(items)
+                yield data, len(data), region, len(items)
+                region = None
+                items = []
+            if region is None:
                 region = _Region(chromId, start, end)
-                regions.append(region)
             elif end > region.end:
                 region.end = end
-            itemIx += 1
             for row in reductions:
                 if start >= row["end"]:
                     row["size"] += 1
@@ -679,13 +696,48 @@ class AlignmentWriter(interfaces.AlignmentWriter):
                 while end > row["end"]:
                     row["size"] += 1
                     row["end"] += row["scale"]
-            if extra_indices:
-                for extra_index in extra_indices:
-                    extra_index.addKeysFromRow(alignment, sectionEndIx)
-                sectionEndIx += 1
-            data = formatter.pack(chromId, start, end)
-            buffer.write(data + rest + b"\0")
-        return maxBlockSize, regions
+            items.append(formatter.pack(chromId, start, end) + rest + b"\0")
+        if region is not None:
+            data = b"".join(items)
+            yield data, len(data), region, len(items)
+
+
+def _read_records(stream):
+    # Read the records written to the temporary file by
+    # AlignmentWriter._spill_records.
+    formatter = struct.Struct("=IIII")
+    size = formatter.size
+    stream.seek(0)
+    while True:
+        data = stream.read(size)
+        if not data:
+            break
+        chromId, start, end, length = formatter.unpack(data)
+        rest = stream.read(length)
+        yield chromId, start, end, rest
+
+
+def _compress_blocks(blocks, workers):
+    # Compress the data blocks with zlib in a pool of threads; zlib releases
+    # the GIL while compressing. The compressed blocks are returned in their
+    # original order, while the number of blocks waiting to be written is
+    # limited to keep memory usage bounded.
+    if workers == 1:
+        for data, size, region, count in blocks:
+            yield zlib.compress(data), size, region, count
+        return
+    maxsize = 4 * (workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(workers) as executor:
+        pending = deque()
+        for data, size, region, count in blocks:
+            future = executor.submit(zlib.compress, data)
+            pending.append((future, size, region, count))
+            if len(pending) == maxsize:
+                future, size, region, count = pending.popleft()
+                yield future.result(), size, region, count
+        while pending:
+            future, size, region, count = pending.popleft()
+            yield future.result(), size, region, count
 
 
 class AlignmentIterator(interfaces.AlignmentIterator):
@@ -699,6 +751,35 @@ class AlignmentIterator(interfaces.AlignmentIterator):
     fmt = "bigBed"
     mode = "b"
 
+    def __init__(self, source, cache_size=32, memory_map=False):
+        """Create an AlignmentIterator object.
+
+        Arguments:
+         - source     - input file stream, or path to input file
+         - cache_size - maximum number of decompressed data blocks kept in
+                        memory to speed up repeated searches of the same
+                        region of the file (default: 32). Use 0 to disable
+                        the cache.
+         - memory_map - If True, memory-map the file and read the data blocks
+                        from the memory map instead of from the file stream;
+                        the source must then be a file name or a stream
+                        opened on a file. Searches can then be run
+                        concurrently from multiple threads without waiting
+                        for each other to read the file (default: False).
+        """
+        self._cache = {}
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._memory_map = False
+        super().__init__(source)
+        if memory_map:
+            stream = self._stream
+            self._stream = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            self._memory_map = True
+            if stream is not source:
+                stream.close()
+            self._data = self._iterate_index(self._stream)
+
     def _read_header(self, stream):
         header = _Header.fromfile(stream)
         byteorder = header.byteorder
@@ -815,10 +896,7 @@ class AlignmentIterator(interfaces.AlignmentIterator):
             try:
                 children = node.children
             except AttributeError:
-                stream.seek(node.dataOffset)
-                data = stream.read(node.dataSize)
-                if self._compressed > 0:
-                    data = zlib.decompress(data)
+                data = self._load_block(stream, node.dataOffset, node.dataSize)
                 while data:
                     chromId, chromStart, chromEnd = formatter.unpack(data[:size])
                     i = data.index(0, size) + 1
@@ -843,7 +921,88 @@ class AlignmentIterator(interfaces.AlignmentIterator):
             else:
                 node = children[0]
 
-    def _search_index(self, stream, chromIx, start, end):
+    def _load_block(self, stream, offset, size):
+        # Read a data block from the file, and decompress it if needed.
+        if self._memory_map:
+            data = stream[offset : offset + size]
+        else:
+            stream.seek(offset)
+            data = stream.read(size)
+        if self._compressed:
+            data = zlib.decompress(data)
+        return data
+
+    def _read_blocks(self, blocks):
+        # Return a dictionary with the decompressed data blocks at the file
+        # offsets in the keys of blocks, with the block sizes as values. Data
+        # blocks are taken from the cache if available; data blocks that are
+        # adjacent in the file are read in a single operation.
+        stream = self._stream
+        cache = self._cache
+        compressed = self._compressed
+        data = {}
+        runs = []
+        with self._lock:
+            for offset in sorted(blocks):
+                try:
+                    data[offset] = cache.pop(offset)
+                except KeyError:
+                    size = blocks[offset]
+                    if runs and runs[-1][1] == offset:
+                        runs[-1][1] += size
+                        runs[-1][2].append(offset)
+                    else:
+                        runs.append([offset, offset + size, [offset]])
+        for start, end, offsets in runs:
+            if self._memory_map:
+                buffer = stream[start:end]
+            else:
+                with self._lock:
+                    stream.seek(start)
+                    buffer = stream.read(end - start)
+            for offset in offsets:
+                i = offset - start
+                block = buffer[i : i + blocks[offset]]
+                if compressed:
+                    block = zlib.decompress(block)
+                data[offset] = block
+        with self._lock:
+            # Store the blocks as the most recently used ones
+            for offset, block in data.items():
+                cache[offset] = block
+            while len(cache) > self._cache_size:
+                del cache[next(iter(cache))]
+        return data
+
+    def _find_blocks(self, chromIx, start, end):
+        # Walk the R tree, and yield the leaf nodes of the data blocks that may
+        # contain alignments overlapping the region.
+        padded_start = start - 1
+        padded_end = end + 1
+
+        def visit(node):
+            for child in node.children:
+                if (child.endChromIx, child.endBase) < (chromIx, padded_start):
+                    continue
+                if (chromIx, padded_end) < (child.startChromIx, child.startBase):
+                    # The child nodes are sorted by their start position
+                    break
+                try:
+                    child.children
+                except AttributeError:
+                    yield child
+                else:
+                    yield from visit(child)
+
+        node = self.tree
+        try:
+            node.children
+        except AttributeError:
+            yield node
+        else:
+            yield from visit(node)
+
+    def _search_block(self, data, chromIx, start, end):
         # Supplemental Table 12: Binary BED-data format
         # chromId     4 bytes, unsigned
         # chromStart  4 bytes, unsigned
@@ -851,88 +1010,56 @@ class AlignmentIterator(interfaces.AlignmentIterator):
         # rest        zero-terminated string in tab-separated format
         formatter = struct.Struct(self.byteorder + "III")
         size = formatter.size
-        padded_start = start - 1
-        padded_end = end + 1
-        node = self.tree
-        while True:
-            try:
-                children = node.children
-            except AttributeError:
-                stream.seek(node.dataOffset)
-                data = stream.read(node.dataSize)
-                if self._compressed > 0:
-                    data = zlib.decompress(data)
-                if self.itemsPerSlot == 1:
-                    child_chromIx, child_chromStart, child_chromEnd = formatter.unpack(
-                        data[:size]
+        if self.itemsPerSlot == 1:
+            child_chromIx, child_chromStart, child_chromEnd = formatter.unpack(
+                data[:size]
+            )
+            if child_chromIx == chromIx:
+                if (child_chromStart < end and start < child_chromEnd) or (
+                    child_chromStart == child_chromEnd
+                    and (child_chromStart == end or start == child_chromEnd)
+                ):
+                    yield (
+                        child_chromIx,
+                        child_chromStart,
+                        child_chromEnd,
+                        data,
+                        size,
+                        len(data),
                     )
-                    if child_chromIx == chromIx:
-                        if (child_chromStart < end and start < child_chromEnd) or (
-                            child_chromStart == child_chromEnd
-                            and (child_chromStart == end or start == child_chromEnd)
-                        ):
-                            yield (
-                                child_chromIx,
-                                child_chromStart,
-                                child_chromEnd,
-                                data,
-                                size,
-                                len(data),
-                            )
-                else:
-                    i = 0
-                    n = len(data)
-                    while i < n:
-                        j = i + size
-                        child_chromIx, child_chromStart, child_chromEnd = (
-                            formatter.unpack(data[i:j])
-                        )
-                        i = j
-                        j = data.index(b"\00", i) + 1
-                        rest = data[i:j]
-                        i = j
-                        if child_chromIx != chromIx:
-                            continue
-                        if end <= child_chromStart or child_chromEnd <= start:
-                            if child_chromStart != child_chromEnd:
-                                continue
-                            if child_chromStart != end and child_chromEnd != start:
-                                continue
-                        yield (
-                            child_chromIx,
-                            child_chromStart,
-                            child_chromEnd,
-                            rest,
-                            0,
-                            len(rest),
-                        )
-            else:
-                visit_child = False
-                for child in children:
-                    if (child.endChromIx, child.endBase) < (chromIx, padded_start):
+        else:
+            i = 0
+            n = len(data)
+            while i < n:
+                j = i + size
+                child_chromIx, child_chromStart, child_chromEnd = formatter.unpack(
+                    data[i:j]
+                )
+                i = j
+                j = data.index(b"\00", i) + 1
+                rest = data[i:j]
+                i = j
+                if child_chromIx != chromIx:
+                    continue
+                if end <= child_chromStart or child_chromEnd <= start:
+                    if child_chromStart != child_chromEnd:
                         continue
-                    if (chromIx, padded_end) < (child.startChromIx, child.startBase):
+                    if child_chromStart != end and child_chromEnd != start:
                         continue
-                    visit_child = True
-                    break
-                if visit_child:
-                    node = child
-                    continue
-            while True:
-                parent = node.parent
-                if parent is None:
-                    return
-                for index, child in enumerate(parent.children):
-                    if id(node) == id(child):
-                        break
-                else:
-                    raise RuntimeError("Failed to find child node")
-                try:
-                    node = parent.children[index + 1]
-                except IndexError:
-                    node = parent
-                else:
-                    break
+                yield (
+                    child_chromIx,
+                    child_chromStart,
+                    child_chromEnd,
+                    rest,
+                    0,
+                    len(rest),
+                )
+
+    def _search_index(self, chromIx, start, end):
+        for node in self._find_blocks(chromIx, start, end):
+            offset = node.dataOffset
+            data = self._read_blocks({offset: node.dataSize})[offset]
+            yield from self._search_block(data, chromIx, start, end)
 
     def _read_next_alignment(self, stream):
         try:
@@ -1039,7 +1166,38 @@ class AlignmentIterator(interfaces.AlignmentIterator):
     def __len__(self):
         return self._length
 
-    def search(self, chromosome=None, start=None, end=None):
+    def _create_record(self, chromId, chromStart, chromEnd, rest, dataStart, dataEnd):
+        assert rest[dataEnd - 1] == 0
+        rest = rest[dataStart : dataEnd - 1]
+        chromosome = self.targets[chromId].id
+        if rest:
+            words = rest.decode().split("\t")
+        else:
+            words = []
+        return (chromosome, chromStart, chromEnd, *words)
+
+    def _find_region(self, chromosome, start, end):
+        # Return the chromosome index, start, and end of the region
+        try:
+            indices = self._target_indices
+        except AttributeError:
+            indices = {target.id: i for i, target in enumerate(self.targets)}
+            self._target_indices = indices
+        try:
+            chromIx = indices[chromosome]
+        except KeyError:
+            raise ValueError("Failed to find %s in alignments" % chromosome) from None
+        if start is None:
+            if end is None:
+                start = 0
+                end = len(self.targets[chromIx])
+            else:
+                raise ValueError("end must be None if start is None")
+        elif end is None:
+            end = start + 1
+        return chromIx, start, end
+
+    def search(self, chromosome=None, start=None, end=None, raw=False):
         """Iterate over alignments overlapping the specified chromosome region..
 
         This method searches the index to find alignments to the specified
@@ -1053,35 +1211,71 @@ class AlignmentIterator(interfaces.AlignmentIterator):
            value), use 0 as the starting position.
          - end        - end position on the chromosome. If None (default value),
            use the length of the chromosome as the end position.
-
+         - raw        - If False (default value), return Alignment objects.
+           If True, return a tuple (chromosome, chromStart, chromEnd, ...)
+           with the fields stored in the file for each alignment. The
+           chromosome name and the remaining fields are strings, while
+           chromStart and chromEnd are integers. This avoids the cost of
+           creating an Alignment object.
+
+        Decompressed data blocks are cached, so searching the same region of
+        the file repeatedly does not need to read and decompress the data again.
         """
-        stream = self._stream
+        if raw:
+            create = self._create_record
+        else:
+            create = self._create_alignment
         if chromosome is None:
             if start is not None or end is not None:
                 raise ValueError(
                     "start and end must both be None if chromosome is None"
                 )
+            rows = self._iterate_index(self._stream)
         else:
-            for chromIx, target in enumerate(self.targets):
-                if target.id == chromosome:
-                    break
-            else:
-                raise ValueError("Failed to find %s in alignments" % chromosome)
-            if start is None:
-                if end is None:
-                    start = 0
-                    end = len(target)
-                else:
-                    raise ValueError("end must be None if start is None")
-            elif end is None:
-                end = start + 1
-        data = self._search_index(stream, chromIx, start, end)
-        for row in data:
-            chromIx, chromStart, chromEnd, rest, dataStart, dataEnd = row
-            alignment = self._create_alignment(
-                chromIx, chromStart, chromEnd, rest, dataStart, dataEnd
-            )
-            yield alignment
+            chromIx, start, end = self._find_region(chromosome, start, end)
+            rows = self._search_index(chromIx, start, end)
+        for row in rows:
+            yield create(*row)
+
+    def search_regions(self, regions, raw=False):
+        """Return a list of alignments overlapping each of the regions.
+
+        Arguments:
+         - regions - an iterable of (chromosome, start, end) tuples. As for the
+           search method, start and end may be None.
+         - raw     - If False (default value), return Alignment objects.
+           If True, return a tuple (chromosome, chromStart, chromEnd, ...)
+           with the fields stored in the file for each alignment, as for the
+           search method.
+
+        This method returns a list with one item for each region; each item is
+        a list of the alignments overlapping that region, in the same order as
+        returned by the search method. The index is searched for all regions
+        first, so that data blocks needed for several regions are read and
+        decompressed only once, and data blocks stored next to each other in
+        the file are read in a single operation.
+        """
+        if raw:
+            create = self._create_record
+        else:
+            create = self._create_alignment
+        queries = []
+        blocks = {}
+        for chromosome, start, end in regions:
+            chromIx, start, end = self._find_region(chromosome, start, end)
+            nodes = list(self._find_blocks(chromIx, start, end))
+            queries.append((chromIx, start, end, nodes))
+            for node in nodes:
+                blocks[node.dataOffset] = node.dataSize
+        data = self._read_blocks(blocks)
+        results = []
+        for chromIx, start, end, nodes in queries:
+            result = []
+            for node in nodes:
+                rows = self._search_block(data[node.dataOffset], chromIx, start, end)
+                result.extend(create(*row) for row in rows)
+            results.append(result)
+        return results
 
 
 class _ZippedStream(io.BytesIO):
@@ -1214,13 +1408,21 @@ class _Header:
 
 
 class _ExtraIndex:
-    __slots__ = ("indexField", "maxFieldSize", "fileOffset", "chunks", "get_value")
+    __slots__ = (
+        "indexField",
+        "maxFieldSize",
+        "fileOffset",
+        "keys",
+        "chunks",
+        "get_value",
+    )
 
     formatter = struct.Struct("=xxHQxxxxHxx")
 
     def __init__(self, name, declaration):
         self.maxFieldSize = 0
         self.fileOffset = None
+        self.keys = []
         for index, field in enumerate(declaration):
             if field.name == name:
                 break
@@ -1239,15 +1441,12 @@ class _ExtraIndex:
         else:
             self.get_value = lambda alignment: alignment.annotations[name]
 
-    def updateMaxFieldSize(self, alignment):
-        value = self.get_value(alignment)
+    def addKeysFromRow(self, alignment):
+        value = self.get_value(alignment).encode()
         size = len(value)
         if size > self.maxFieldSize:
             self.maxFieldSize = size
-
-    def addKeysFromRow(self, alignment, recordIx):
-        value = self.get_value(alignment)
-        self.chunks[recordIx]["name"] = value.encode()
+        self.keys.append(value)
 
     def addOffsetSize(self, offset, size, startIx, endIx):
         self.chunks[startIx:endIx]["offset"] = offset
@@ -1281,6 +1480,8 @@ class _ExtraIndices(list):
                 [("name", f"=S{keySize}"), ("offset", "=u8"), ("size", "=u8")]
             )
             extra_index.chunks = np.zeros(bedCount, dtype=dtype)
+            extra_index.chunks["name"] = extra_index.keys
+            extra_index.keys = None
 
     def tofile(self, stream):
         size = self.formatter.size
@@ -1468,8 +1669,9 @@ class _RegionSummary(_Summary):
             self.minVal = np.float32(val)
         if self.maxVal < val:
             self.maxVal = np.float32(val)
-        self.sumData = np.float32(self.sumData + val * overlap)
-        self.sumSquares = np.float32(self.sumSquares + val * val * overlap)
+        # add in double precision, then round to single precision
+        self.sumData = np.float32(self.sumData + np.float64(val * overlap))
+        self.sumSquares = np.float32(self.sumSquares + np.float64(val * val * overlap))
 
     def __bytes__(self):
         return self.formatter.pack(
@@ -1510,7 +1712,7 @@ class _RTreeNode:
 
 
 class _RangeTree:
-    __slots__ = ("root", "n", "freeList", "stack", "chromId", "chromSize")
+    __slots__ = ("root", "n", "freeList", "stack", "chromId", "chromSize", "ranges")
 
     def __init__(self, chromId, chromSize):
         self.root = None
@@ -1520,26 +1722,42 @@ class _RangeTree:
         self.chromSize = chromSize
 
     @classmethod
-    def generate(cls, chromUsageList, alignments):
-        alignments = iter(alignments)
-        alignment = None
+    def generate(cls, chromUsageList, records):
+        record = next(records, None)
         for chromName, chromId, chromSize in chromUsageList:
-            chromName = chromName.decode()
+            starts = []
+            ends = []
+            while record is not None and record[0] == chromId:
+                starts.append(record[1])
+                ends.append(record[2])
+                record = next(records, None)
             tree = _RangeTree(chromId, chromSize)
-            if alignment is not None:
-                tree.addToCoverageDepth(alignment)
-            while True:
-                try:
-                    alignment = next(alignments)
-                except StopIteration:
-                    break
-                if alignment.target.id != chromName:
-                    break
-                tree.addToCoverageDepth(alignment)
+            tree.calculateCoverageDepth(np.array(starts), np.array(ends))
             yield tree
 
+    def calculateCoverageDepth(self, starts, ends):
+        if np.all(starts < ends):
+            # Sweep over the start and end positions of the alignments. This
+            # gives the same ranges as adding the alignments one by one to the
+            # red-black tree, except for alignments of zero length.
+            boundaries = np.unique(np.concatenate([starts, ends]))
+            positions = boundaries[:-1]
+            depths = np.searchsorted(
+                np.sort(starts), positions, "right"
+            ) - np.searchsorted(np.sort(ends), positions, "right")
+            covered = depths > 0
+            self.ranges = zip(
+                positions[covered].tolist(),
+                boundaries[1:][covered].tolist(),
+                depths[covered].tolist(),
+            )
+        else:
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self.addToCoverageDepth(start, end)
+            self.ranges = self.root.traverse()
+
     def generate_summaries(self, scale, totalSum):
-        ranges = self.root.traverse()
+        ranges = self.ranges
         start, end, val = next(ranges)
         chromId = self.chromId
         chromSize = self.chromSize
@@ -1684,9 +1902,7 @@ class _RangeTree:
                 x = m
                 p = self.stack.pop()
 
-    def addToCoverageDepth(self, alignment):
-        start = alignment.coordinates[0, 0]
-        end = alignment.coordinates[0, -1]
+    def addToCoverageDepth(self, start, end):
         if start > end:
             start, end = end, start
         existing = self.find(start, end)
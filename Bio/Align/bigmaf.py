@@ -132,7 +132,7 @@ class AlignmentWriter(bigbed.AlignmentWriter):
         targets = list(alignments.targets)
         targets[0] = SeqRecord(record.seq, id=chromosome)
         fixed_alignments.targets = targets
-        bigbed.AlignmentWriter(
+        return bigbed.AlignmentWriter(
             stream, bedN=3, declaration=declaration, compress=self.compress
         ).write(fixed_alignments)
 
@@ -156,14 +156,18 @@ class AlignmentIterator(bigbed.AlignmentIterator, maf.AlignmentIterator):
     fmt = "bigMaf"
     mode = "b"
 
-    def __init__(self, source):
+    def __init__(self, source, cache_size=32, memory_map=False):
         """Create an AlignmentIterator object.
 
         Arguments:
-        - source - input file stream, or path to input file
+        - source     - input file stream, or path to input file
+        - cache_size - number of decompressed data blocks to cache (default: 32)
+        - memory_map - if True, memory-map the file (default: False)
+
+        See the bigbed.AlignmentIterator class for more information.
         """
         self.reference = None
-        super().__init__(source)
+        super().__init__(source, cache_size, memory_map)
 
     def _read_reference(self, stream):
         # Supplemental Table 12: Binary BED-data format
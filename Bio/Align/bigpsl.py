@@ -426,7 +426,7 @@ class AlignmentWriter(bigbed.AlignmentWriter):
             key=lambda alignment: (alignment.target.id, alignment.coordinates[0, 0])
         )
         fixed_alignments.targets = alignments.targets
-        bigbed.AlignmentWriter(
+        return bigbed.AlignmentWriter(
             stream, bedN=12, declaration=declaration, compress=self.compress
         ).write(fixed_alignments)
 
@@ -456,31 +456,23 @@ class AlignmentIterator(interfaces.AlignmentIterator):
         target_end = int(words[6])
         target_strand = words[7]
         score = float(words[8])
-        qs = 0
-        ts = 0
-        n = (len(words) - 8) // 2
-        coordinates = np.empty((2, n + 1), np.intp)
-        coordinates[0, 0] = ts
-        coordinates[1, 0] = qs
-        for i, (operation, step) in enumerate(zip(words[9::2], words[10::2])):
-            step = int(step)
-            if operation == "M":  # match or mismatch
-                ts += step
-                qs += step
-            elif operation == "I":  # insertion
-                if query_strand == "." and target_strand != ".":
-                    qs += step * 3
-                else:
-                    qs += step
-            elif operation == "D":  # deletion
-                if target_strand == "." and query_strand != ".":
-                    ts += step * 3
-                else:
-                    ts += step
-            else:
-                raise ValueError("Unknown operation %s in cigar string" % operation)
-            coordinates[0, i + 1] = ts
-            coordinates[1, i + 1] = qs
+        steps = np.array(words[10::2], np.intp)
+        operations = np.array(words[9::2][: len(steps)])
+        unknown = ~np.isin(operations, ("M", "I", "D"))
+        if unknown.any():
+            operation = operations[unknown][0]
+            raise ValueError("Unknown operation %s in cigar string" % operation)
+        n = len(steps)
+        coordinates = np.zeros((2, n + 1), np.intp)
+        # M: match or mismatch; I: insertion; D: deletion
+        target_steps = np.where(operations == "I", 0, steps)
+        query_steps = np.where(operations == "D", 0, steps)
+        if query_strand == "." and target_strand != ".":
+            query_steps[operations == "I"] *= 3
+        if target_strand == "." and query_strand != ".":
+            target_steps[operations == "D"] *= 3
+        np.cumsum(target_steps, out=coordinates[0, 1:])
+        np.cumsum(query_steps, out=coordinates[1, 1:])
         if target_strand == "+":
             coordinates[0, :] += target_start
             target_length = target_end
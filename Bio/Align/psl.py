@@ -26,12 +26,16 @@ zero-based end position. We can therefore manipulate ``start`` and
 ``start + size`` as python list slice boundaries.
 """
 
+import os
 from itertools import chain
 
 import numpy as np
 
 from Bio.Align import Alignment
 from Bio.Align import interfaces
+from Bio.Align._htsindex import create_tabix_index
+from Bio.Align._htsindex import TABIX_UCSC
+from Bio.Align._htsindex import TabixIterator
 from Bio.Seq import reverse_complement
 from Bio.Seq import Seq
 from Bio.Seq import UndefinedSequenceError
@@ -307,12 +311,17 @@ match	mis- 	rep. 	N's	Q gap	Q gap	T gap	T gap	strand	Q        	Q   	Q    	Q  	T
         return line
 
 
-class AlignmentIterator(interfaces.AlignmentIterator):
+class AlignmentIterator(TabixIterator, interfaces.AlignmentIterator):
     """Alignment iterator for Pattern Space Layout (PSL) files.
 
     Each line in the file contains one pairwise alignment, which are loaded
     and returned incrementally.  Alignment score information such as the number
     of matches and mismatches are stored as attributes of each alignment.
+
+    PSL files compressed with BGZF (see Bio.bgzf), as created by ``bgzip``, are
+    decompressed while reading if source is a path. If the file was indexed by
+    the create_index function in this module, the search method can be used to
+    find the alignments overlapping a region on a target chromosome.
     """
 
     fmt = "PSL"
@@ -342,200 +351,222 @@ class AlignmentIterator(interfaces.AlignmentIterator):
             del self._line
             lines = chain([line], stream)
         for line in lines:
-            words = line.split()
-            if len(words) == 23:
-                pslx = True
-            elif len(words) == 21:
-                pslx = False
+            return self._create_alignment(line)
+
+    def _create_alignment(self, line):
+        """Create an Alignment object from a line in the PSL file (PRIVATE)."""
+        words = line.split()
+        if len(words) == 23:
+            pslx = True
+        elif len(words) == 21:
+            pslx = False
+        else:
+            raise ValueError("line has %d columns; expected 21 or 23" % len(words))
+        strand = words[8]
+        qName = words[9]
+        qSize = int(words[10])
+        tName = words[13]
+        tSize = int(words[14])
+        blockCount = int(words[17])
+        blockSizes = [int(blockSize) for blockSize in words[18].rstrip(",").split(",")]
+        qStarts = [int(start) for start in words[19].rstrip(",").split(",")]
+        tStarts = [int(start) for start in words[20].rstrip(",").split(",")]
+        if len(blockSizes) != blockCount:
+            raise ValueError(
+                "Inconsistent number of blocks (%d found, expected %d)"
+                % (len(blockSizes), blockCount)
+            )
+        if len(qStarts) != blockCount:
+            raise ValueError(
+                "Inconsistent number of query start positions (%d found, expected %d)"
+                % (len(qStarts), blockCount)
+            )
+        if len(tStarts) != blockCount:
+            raise ValueError(
+                "Inconsistent number of target start positions (%d found, expected %d)"
+                % (len(tStarts), blockCount)
+            )
+        qStarts = np.array(qStarts)
+        tStarts = np.array(tStarts)
+        qBlockSizes = np.array(blockSizes)
+        if strand in ("++", "+-"):
+            # protein sequence aligned against translated DNA sequence
+            tBlockSizes = 3 * qBlockSizes
+        else:
+            tBlockSizes = qBlockSizes
+        qPosition = qStarts[0]
+        tPosition = tStarts[0]
+        coordinates = [[tPosition, qPosition]]
+        for tBlockSize, qBlockSize, tStart, qStart in zip(
+            tBlockSizes, qBlockSizes, tStarts, qStarts
+        ):
+            if tStart != tPosition:
+                coordinates.append([tStart, qPosition])
+                tPosition = tStart
+            if qStart != qPosition:
+                coordinates.append([tPosition, qStart])
+                qPosition = qStart
+            tPosition += tBlockSize
+            qPosition += qBlockSize
+            coordinates.append([tPosition, qPosition])
+        coordinates = np.array(coordinates, np.intp).transpose()
+        qNumInsert = 0
+        qBaseInsert = 0
+        tNumInsert = 0
+        tBaseInsert = 0
+        tStart, qStart = coordinates[:, 0]
+        for tEnd, qEnd in coordinates[:, 1:].transpose():
+            tCount = tEnd - tStart
+            qCount = qEnd - qStart
+            if tCount == 0:
+                if qStart > 0 and qEnd < qSize:
+                    qNumInsert += 1
+                    qBaseInsert += qCount
+                qStart = qEnd
+            elif qCount == 0:
+                if tStart > 0 and tEnd < tSize:
+                    tNumInsert += 1
+                    tBaseInsert += tCount
+                tStart = tEnd
             else:
-                raise ValueError("line has %d columns; expected 21 or 23" % len(words))
-            strand = words[8]
-            qName = words[9]
-            qSize = int(words[10])
-            tName = words[13]
-            tSize = int(words[14])
-            blockCount = int(words[17])
-            blockSizes = [
-                int(blockSize) for blockSize in words[18].rstrip(",").split(",")
-            ]
-            qStarts = [int(start) for start in words[19].rstrip(",").split(",")]
-            tStarts = [int(start) for start in words[20].rstrip(",").split(",")]
-            if len(blockSizes) != blockCount:
-                raise ValueError(
-                    "Inconsistent number of blocks (%d found, expected %d)"
-                    % (len(blockSizes), blockCount)
-                )
-            if len(qStarts) != blockCount:
-                raise ValueError(
-                    "Inconsistent number of query start positions (%d found, expected %d)"
-                    % (len(qStarts), blockCount)
-                )
-            if len(tStarts) != blockCount:
-                raise ValueError(
-                    "Inconsistent number of target start positions (%d found, expected %d)"
-                    % (len(tStarts), blockCount)
-                )
-            qStarts = np.array(qStarts)
-            tStarts = np.array(tStarts)
-            qBlockSizes = np.array(blockSizes)
+                tStart = tEnd
+                qStart = qEnd
+        if qNumInsert != int(words[4]):
+            raise ValueError(
+                "Inconsistent qNumInsert found (%s, expected %d)"
+                % (words[4], qNumInsert)
+            )
+        if qBaseInsert != int(words[5]):
+            raise ValueError(
+                "Inconsistent qBaseInsert found (%s, expected %d)"
+                % (words[5], qBaseInsert)
+            )
+        if tNumInsert != int(words[6]):
+            raise ValueError(
+                "Inconsistent tNumInsert found (%s, expected %d)"
+                % (words[6], tNumInsert)
+            )
+        if tBaseInsert != int(words[7]):
+            raise ValueError(
+                "Inconsistent tBaseInsert found (%s, expected %d)"
+                % (words[7], tBaseInsert)
+            )
+        qStart = int(words[11])
+        qEnd = int(words[12])
+        tStart = int(words[15])
+        tEnd = int(words[16])
+        if strand == "-":
+            qStart, qEnd = qEnd, qStart
+            coordinates[1, :] = qSize - coordinates[1, :]
+        elif strand == "+-":
+            tStart, tEnd = tEnd, tStart
+            coordinates[0, :] = tSize - coordinates[0, :]
+        if tStart != coordinates[0, 0]:
+            raise ValueError(
+                "Inconsistent tStart found (%d, expected %d)"
+                % (tStart, coordinates[0, 0])
+            )
+        if tEnd != coordinates[0, -1]:
+            raise ValueError(
+                "Inconsistent tEnd found (%d, expected %d)" % (tEnd, coordinates[0, -1])
+            )
+        if qStart != coordinates[1, 0]:
+            raise ValueError(
+                "Inconsistent qStart found (%d, expected %d)"
+                % (qStart, coordinates[1, 0])
+            )
+        if qEnd != coordinates[1, -1]:
+            raise ValueError(
+                "Inconsistent qEnd found (%d, expected %d)" % (qEnd, coordinates[1, -1])
+            )
+        feature = None
+        if pslx is True:
+            qSeqs = words[21].rstrip(",").split(",")
+            tSeqs = words[22].rstrip(",").split(",")
+            qSeq = dict(zip(qStarts, qSeqs))
             if strand in ("++", "+-"):
                 # protein sequence aligned against translated DNA sequence
-                tBlockSizes = 3 * qBlockSizes
-            else:
-                tBlockSizes = qBlockSizes
-            qPosition = qStarts[0]
-            tPosition = tStarts[0]
-            coordinates = [[tPosition, qPosition]]
-            for tBlockSize, qBlockSize, tStart, qStart in zip(
-                tBlockSizes, qBlockSizes, tStarts, qStarts
-            ):
-                if tStart != tPosition:
-                    coordinates.append([tStart, qPosition])
-                    tPosition = tStart
-                if qStart != qPosition:
-                    coordinates.append([tPosition, qStart])
-                    qPosition = qStart
-                tPosition += tBlockSize
-                qPosition += qBlockSize
-                coordinates.append([tPosition, qPosition])
-            coordinates = np.array(coordinates, np.intp).transpose()
-            qNumInsert = 0
-            qBaseInsert = 0
-            tNumInsert = 0
-            tBaseInsert = 0
-            tStart, qStart = coordinates[:, 0]
-            for tEnd, qEnd in coordinates[:, 1:].transpose():
-                tCount = tEnd - tStart
-                qCount = qEnd - qStart
-                if tCount == 0:
-                    if qStart > 0 and qEnd < qSize:
-                        qNumInsert += 1
-                        qBaseInsert += qCount
-                    qStart = qEnd
-                elif qCount == 0:
-                    if tStart > 0 and tEnd < tSize:
-                        tNumInsert += 1
-                        tBaseInsert += tCount
-                    tStart = tEnd
-                else:
-                    tStart = tEnd
-                    qStart = qEnd
-            if qNumInsert != int(words[4]):
-                raise ValueError(
-                    "Inconsistent qNumInsert found (%s, expected %d)"
-                    % (words[4], qNumInsert)
-                )
-            if qBaseInsert != int(words[5]):
-                raise ValueError(
-                    "Inconsistent qBaseInsert found (%s, expected %d)"
-                    % (words[5], qBaseInsert)
-                )
-            if tNumInsert != int(words[6]):
-                raise ValueError(
-                    "Inconsistent tNumInsert found (%s, expected %d)"
-                    % (words[6], tNumInsert)
-                )
-            if tBaseInsert != int(words[7]):
-                raise ValueError(
-                    "Inconsistent tBaseInsert found (%s, expected %d)"
-                    % (words[7], tBaseInsert)
-                )
-            qStart = int(words[11])
-            qEnd = int(words[12])
-            tStart = int(words[15])
-            tEnd = int(words[16])
-            if strand == "-":
-                qStart, qEnd = qEnd, qStart
-                coordinates[1, :] = qSize - coordinates[1, :]
-            elif strand == "+-":
-                tStart, tEnd = tEnd, tStart
-                coordinates[0, :] = tSize - coordinates[0, :]
-            if tStart != coordinates[0, 0]:
-                raise ValueError(
-                    "Inconsistent tStart found (%d, expected %d)"
-                    % (tStart, coordinates[0, 0])
-                )
-            if tEnd != coordinates[0, -1]:
-                raise ValueError(
-                    "Inconsistent tEnd found (%d, expected %d)"
-                    % (tEnd, coordinates[0, -1])
-                )
-            if qStart != coordinates[1, 0]:
-                raise ValueError(
-                    "Inconsistent qStart found (%d, expected %d)"
-                    % (qStart, coordinates[1, 0])
-                )
-            if qEnd != coordinates[1, -1]:
-                raise ValueError(
-                    "Inconsistent qEnd found (%d, expected %d)"
-                    % (qEnd, coordinates[1, -1])
-                )
-            feature = None
-            if pslx is True:
-                qSeqs = words[21].rstrip(",").split(",")
-                tSeqs = words[22].rstrip(",").split(",")
-                qSeq = dict(zip(qStarts, qSeqs))
-                if strand in ("++", "+-"):
-                    # protein sequence aligned against translated DNA sequence
-                    target_sequence = Seq(None, length=tSize)
-                    query_sequence = Seq(qSeq, length=qSize)
-                    if strand == "++":
-                        tStart, qStart = coordinates[:, 0]
-                        locations = []
-                        for tEnd, qEnd in coordinates[:, 1:].transpose():
-                            if qStart < qEnd and tStart < tEnd:
-                                location = SimpleLocation(
-                                    ExactPosition(tStart),
-                                    ExactPosition(tEnd),
-                                    strand=+1,
-                                )
-                                locations.append(location)
-                            qStart = qEnd
-                            tStart = tEnd
-                        if len(locations) > 1:
-                            location = CompoundLocation(locations, "join")
-                        tSeq = "".join(tSeqs)
-                        qualifiers = {"translation": [tSeq]}
-                        feature = SeqFeature(
-                            location, type="CDS", qualifiers=qualifiers
-                        )
-                    elif strand == "+-":
-                        tEnd, qStart = coordinates[:, 0]
-                        locations = []
-                        for tStart, qEnd in coordinates[:, 1:].transpose():
-                            if qStart < qEnd and tStart < tEnd:
-                                location = SimpleLocation(
-                                    ExactPosition(tStart),
-                                    ExactPosition(tEnd),
-                                    strand=-1,
-                                )
-                                locations.append(location)
-                            tEnd = tStart
-                            qStart = qEnd
-                        if len(locations) > 1:
-                            location = CompoundLocation(locations, "join")
-                        tSeq = "".join(tSeqs)
-                        qualifiers = {"translation": [tSeq]}
-                        feature = SeqFeature(
-                            location, type="CDS", qualifiers=qualifiers
-                        )
-                else:
-                    tSeq = dict(zip(tStarts, tSeqs))
-                    target_sequence = Seq(tSeq, length=tSize)
-                    query_sequence = Seq(qSeq, length=qSize)
-                    if strand == "-":
-                        query_sequence = query_sequence.reverse_complement()
-            else:
                 target_sequence = Seq(None, length=tSize)
-                query_sequence = Seq(None, length=qSize)
-            target_record = SeqRecord(target_sequence, id=tName, description="")
-            query_record = SeqRecord(query_sequence, id=qName, description="")
-            if feature is not None:
-                target_record.features.append(feature)
-            records = [target_record, query_record]
-            alignment = Alignment(records, coordinates)
-            alignment.matches = int(words[0])
-            alignment.misMatches = int(words[1])
-            alignment.repMatches = int(words[2])
-            alignment.nCount = int(words[3])
-            return alignment
+                query_sequence = Seq(qSeq, length=qSize)
+                if strand == "++":
+                    tStart, qStart = coordinates[:, 0]
+                    locations = []
+                    for tEnd, qEnd in coordinates[:, 1:].transpose():
+                        if qStart < qEnd and tStart < tEnd:
+                            location = SimpleLocation(
+                                ExactPosition(tStart),
+                                ExactPosition(tEnd),
+                                strand=+1,
+                            )
+                            locations.append(location)
+                        qStart = qEnd
+                        tStart = tEnd
+                    if len(locations) > 1:
+                        location = CompoundLocation(locations, "join")
+                    tSeq = "".join(tSeqs)
+                    qualifiers = {"translation": [tSeq]}
+                    feature = SeqFeature(location, type="CDS", qualifiers=qualifiers)
+                elif strand == "+-":
+                    tEnd, qStart = coordinates[:, 0]
+                    locations = []
+                    for tStart, qEnd in coordinates[:, 1:].transpose():
+                        if qStart < qEnd and tStart < tEnd:
+                            location = SimpleLocation(
+                                ExactPosition(tStart),
+                                ExactPosition(tEnd),
+                                strand=-1,
+                            )
+                            locations.append(location)
+                        tEnd = tStart
+                        qStart = qEnd
+                    if len(locations) > 1:
+                        location = CompoundLocation(locations, "join")
+                    tSeq = "".join(tSeqs)
+                    qualifiers = {"translation": [tSeq]}
+                    feature = SeqFeature(location, type="CDS", qualifiers=qualifiers)
+            else:
+                tSeq = dict(zip(tStarts, tSeqs))
+                target_sequence = Seq(tSeq, length=tSize)
+                query_sequence = Seq(qSeq, length=qSize)
+                if strand == "-":
+                    query_sequence = query_sequence.reverse_complement()
+        else:
+            target_sequence = Seq(None, length=tSize)
+            query_sequence = Seq(None, length=qSize)
+        target_record = SeqRecord(target_sequence, id=tName, description="")
+        query_record = SeqRecord(query_sequence, id=qName, description="")
+        if feature is not None:
+            target_record.features.append(feature)
+        records = [target_record, query_record]
+        alignment = Alignment(records, coordinates)
+        alignment.matches = int(words[0])
+        alignment.misMatches = int(words[1])
+        alignment.repMatches = int(words[2])
+        alignment.nCount = int(words[3])
+        return alignment
+
+
+def create_index(source, target=None, csi=False):
+    """Create a tabix index file for a sorted BGZF-compressed PSL file.
+
+    Arguments:
+     - source - file name of the PSL file compressed by ``bgzip``.
+     - target - file name of the index file. If None (default value), the
+                index file is written to the file name of the PSL file
+                with ".tbi" or ".csi" appended.
+     - csi    - if True, create a CSI index file; if False (default value),
+                create a TBI index file.
+
+    The lines in the PSL file must be sorted by target name (tName) and target
+    start position (tStart), for example by ``sort -k14,14 -k16,16n``. The
+    index file is equivalent to the index file created by
+    ``tabix -0 -s 14 -b 16 -e 17 -S 5`` for a PSL file with a header.
+    """
+    with AlignmentIterator(source) as alignments:
+        if getattr(alignments, "metadata", None):
+            skip = 5  # the psLayout header
+        else:
+            skip = 0
+    if target is None:
+        target = os.fspath(source) + (".csi" if csi else ".tbi")
+    create_tabix_index(source, target, TABIX_UCSC, 14, 16, 17, skip=skip, csi=csi)
@@ -23,17 +23,163 @@ with Python and other alignment formats.
 """
 
 import copy
+import os
+import re
 from itertools import chain
 
 import numpy as np
 
+from Bio.Align import _aligncore  # type: ignore
 from Bio.Align import Alignment
 from Bio.Align import interfaces
+from Bio.Align._htsindex import BgzfIterator
+from Bio.Align._htsindex import BinningIndex
+from Bio.Align._htsindex import find_index
 from Bio.Seq import reverse_complement
 from Bio.Seq import Seq
 from Bio.Seq import UndefinedSequenceError
 from Bio.SeqRecord import SeqRecord
 
+_cigar_pattern = re.compile(r"(\d+)([MIDNSHP=X])")
+
+
+def _span(line, target_indices):
+    """Return the reference span of an alignment line in a SAM file (PRIVATE).
+
+    This function returns the reference sequence index, the start and end
+    position on the reference sequence, and a boolean indicating if the read
+    is mapped.
+    """
+    fields = line.split("\t", 6)
+    if len(fields) < 7:
+        raise ValueError("line has %d columns; expected at least 11" % len(fields))
+    flag = int(fields[1])
+    rname = fields[2]
+    if rname == "*":
+        return -1, -1, 0, False
+    try:
+        refID = target_indices[rname]
+    except KeyError:
+        raise ValueError("Failed to find %s in the header" % rname) from None
+    pos = int(fields[3]) - 1
+    cigar = fields[5]
+    if flag & 4 or cigar == "*":
+        return refID, pos, pos + 1, not flag & 4
+    end = pos
+    for length, operation in _cigar_pattern.findall(cigar):
+        if operation in "MDN=X":
+            end += int(length)
+    return refID, pos, end, True
+
+
+def _calculate_md(coordinates, operations, target, query):
+    """Calculate the MD tag from the alignment coordinates and sequences (PRIVATE).
+
+    The coordinates array is in transposed form, with one row for the target
+    and query position at each step of the alignment.
+    """
+    tStart, qStart = coordinates[0, :]
+    number = 0
+    md = ""
+    if operations is None:
+        for tEnd, qEnd in coordinates[1:, :]:
+            tCount = tEnd - tStart
+            qCount = qEnd - qStart
+            if tCount == 0:
+                # insertion to the reference
+                qStart = qEnd
+            elif qCount == 0:
+                if True:
+                    # deletion from the reference
+                    if number:
+                        md += str(number)
+                        number = 0
+                    md += "^" + target[tStart:tEnd]
+                tStart = tEnd
+            else:
+                # alignment match
+                if tCount != qCount:
+                    raise ValueError("Unequal step sizes in alignment")
+                for tc, qc in zip(target[tStart:tEnd], query[qStart:qEnd]):
+                    if tc == qc:
+                        number += 1
+                    else:
+                        md += str(number) + tc
+                        number = 0
+                tStart = tEnd
+                qStart = qEnd
+        if number:
+            md += str(number)
+    else:
+        for operation, (tEnd, qEnd) in zip(operations, coordinates[1:, :]):
+            tCount = tEnd - tStart
+            qCount = qEnd - qStart
+            if tCount == 0:
+                # insertion to the reference
+                qStart = qEnd
+            elif qCount == 0:
+                if operation != ord("N"):
+                    # deletion from the reference
+                    if number:
+                        md += str(number)
+                        number = 0
+                    md += "^" + target[tStart:tEnd]
+                tStart = tEnd
+            else:
+                # alignment match
+                if tCount != qCount:
+                    raise ValueError("Unequal step sizes in alignment")
+                for tc, qc in zip(target[tStart:tEnd], query[qStart:qEnd]):
+                    if tc == qc:
+                        number += 1
+                    else:
+                        md += str(number) + tc
+                        number = 0
+                tStart = tEnd
+                qStart = qEnd
+        if number:
+            md += str(number)
+    return md
+
+
+def _apply_md(seq, md):
+    """Reconstruct the aligned target sequence from the MD tag (PRIVATE).
+
+    The seq argument contains the query letters aligned to the target; any
+    mismatches and deleted target letters are restored from the MD tag.
+    """
+    target = ""
+    number = ""
+    letters = iter(md)
+    for letter in letters:
+        if letter in "ACGTNacgtn":
+            if number:
+                number = int(number)
+                target += seq[:number]
+                seq = seq[number:]
+                number = ""
+            target += letter
+            seq = seq[1:]
+        elif letter == "^":
+            if number:
+                number = int(number)
+                target += seq[:number]
+                seq = seq[number:]
+                number = ""
+            for letter in letters:
+                if letter not in "ACGTNacgtn":
+                    break
+                target += letter
+            else:
+                break
+            number = letter
+        else:
+            number += letter
+    if number:
+        number = int(number)
+        target += seq[:number]
+    return target
+
 
 class AlignmentWriter(interfaces.AlignmentWriter):
     """Alignment file writer for the Sequence Alignment/Map (SAM) file format."""
@@ -100,7 +246,7 @@ class AlignmentWriter(interfaces.AlignmentWriter):
             except AttributeError:
                 pass
             else:
-                if description != "<unknown description>":
+                if description and description != "<unknown description>":
                     fields.append("DS:%s" % description)
             line = "\t".join(fields) + "\n"
             stream.write(line)
@@ -261,68 +407,7 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         if md is True:
             if query == "*":
                 raise ValueError("requested MD tag with undefined sequence")
-            # calculate the MD tag from the alignment coordinates and sequences
-            tStart, qStart = coordinates[0, :]
-            number = 0
-            md = ""
-            if operations is None:
-                for tEnd, qEnd in coordinates[1:, :]:
-                    tCount = tEnd - tStart
-                    qCount = qEnd - qStart
-                    if tCount == 0:
-                        # insertion to the reference
-                        qStart = qEnd
-                    elif qCount == 0:
-                        if True:
-                            # deletion from the reference
-                            if number:
-                                md += str(number)
-                                number = 0
-                            md += "^" + target[tStart:tEnd]
-                        tStart = tEnd
-                    else:
-                        # alignment match
-                        if tCount != qCount:
-                            raise ValueError("Unequal step sizes in alignment")
-                        for tc, qc in zip(target[tStart:tEnd], query[qStart:qEnd]):
-                            if tc == qc:
-                                number += 1
-                            else:
-                                md += str(number) + tc
-                                number = 0
-                        tStart = tEnd
-                        qStart = qEnd
-                if number:
-                    md += str(number)
-            else:
-                for operation, (tEnd, qEnd) in zip(operations, coordinates[1:, :]):
-                    tCount = tEnd - tStart
-                    qCount = qEnd - qStart
-                    if tCount == 0:
-                        # insertion to the reference
-                        qStart = qEnd
-                    elif qCount == 0:
-                        if operation != ord("N"):
-                            # deletion from the reference
-                            if number:
-                                md += str(number)
-                                number = 0
-                            md += "^" + target[tStart:tEnd]
-                        tStart = tEnd
-                    else:
-                        # alignment match
-                        if tCount != qCount:
-                            raise ValueError("Unequal step sizes in alignment")
-                        for tc, qc in zip(target[tStart:tEnd], query[qStart:qEnd]):
-                            if tc == qc:
-                                number += 1
-                            else:
-                                md += str(number) + tc
-                                number = 0
-                        tStart = tEnd
-                        qStart = qEnd
-                if number:
-                    md += str(number)
+            md = _calculate_md(coordinates, operations, target, query)
             field = "MD:Z:%s" % md
             fields.append(field)
         try:
@@ -369,7 +454,7 @@ class AlignmentWriter(interfaces.AlignmentWriter):
         return line
 
 
-class AlignmentIterator(interfaces.AlignmentIterator):
+class AlignmentIterator(BgzfIterator, interfaces.AlignmentIterator):
     """Alignment iterator for Sequence Alignment/Map (SAM) files.
 
     Each line in the file contains one genomic alignment, which are loaded
@@ -393,6 +478,9 @@ class AlignmentIterator(interfaces.AlignmentIterator):
 
     The sequence quality, if available, is stored as 'phred_quality' in the
     letter_annotations dictionary attribute of the query sequence record.
+
+    SAM files compressed with BGZF (see Bio.bgzf), as created by ``bgzip``,
+    are decompressed while reading if source is a path.
     """
 
     fmt = "SAM"
@@ -467,122 +555,142 @@ class AlignmentIterator(interfaces.AlignmentIterator):
             lines = chain([line], stream)
             del self._line
         for line in lines:
-            fields = line.split()
-            if len(fields) < 11:
+            return self._create_alignment(line)
+
+    def search(self, chromosome=None, start=None, end=None):
+        """Iterate over alignments overlapping the specified chromosome region.
+
+        This method uses the CSI index file of a BGZF-compressed SAM file to
+        find alignments to the specified chromosome that fully or partially
+        overlap the chromosome region between start and end. The index file is
+        looked up by appending ".csi" to the file name of the SAM file, or by
+        replacing its extension by ".csi"; use the create_index function in
+        this module to create an index file. Only the parts of the SAM file
+        that may contain overlapping alignments are read and parsed.
+
+        Arguments:
+         - chromosome - chromosome name. If None (default value), include all
+           alignments.
+         - start      - starting position on the chromosome. If None (default
+           value), use 0 as the starting position.
+         - end        - end position on the chromosome. If None (default value),
+           use the length of the chromosome as the end position.
+
+        """
+        if chromosome is None:
+            if start is not None or end is not None:
                 raise ValueError(
-                    "line has %d columns; expected at least 11" % len(fields)
+                    "start and end must both be None if chromosome is None"
                 )
-            qname = fields[0]
-            flag = int(fields[1])
-            rname = fields[2]
-            target_pos = int(fields[3]) - 1
-            mapq = int(fields[4])
-            cigar = fields[5]
-            rnext = fields[6]
-            pnext = int(fields[7]) - 1
-            tlen = int(fields[8])
-            query = fields[9]
-            qual = fields[10]
-            md = None
-            score = None
-            annotations = {}
-            for field in fields[11:]:
-                tag, datatype, value = field.split(":", 2)
-                if tag == "AS":
-                    assert datatype == "i"
-                    score = int(value)
-                elif tag == "MD":
-                    assert datatype == "Z"
-                    md = value
-                else:
-                    if datatype == "i":
-                        value = int(value)
-                    elif datatype == "f":
-                        value = float(value)
-                    elif datatype in ("A", "Z"):  # string
-                        pass
-                    elif datatype == "H":
-                        n = len(value)
-                        value = bytes(int(value[i : i + 2]) for i in range(0, n, 2))
-                    elif datatype == "B":
-                        letter = value[0]
-                        value = value[1:].split(",")
-                        if letter in "cCsSiI":
-                            dtype = int
-                        elif letter == "f":
-                            dtype = float
-                        else:
-                            raise ValueError(
-                                f"Unknown number type '{letter}' in tag '{field}'"
-                            )
-                        value = np.array(value, dtype)
-                    annotations[tag] = value
-            if flag & 0x10:
-                strand = "-"
+            self.rewind()
+            yield from self
+            return
+        if not self._bgzf:
+            raise ValueError("searching requires a BGZF-compressed SAM file")
+        stream = self._stream
+        try:
+            chromIx = self._target_indices[chromosome]
+        except KeyError:
+            raise ValueError("Failed to find %s in alignments" % chromosome) from None
+        if start is None:
+            if end is None:
+                start = 0
+                end = len(self.targets[chromIx])
             else:
-                strand = "+"
-            hard_clip_left = None
-            hard_clip_right = None
-            store_operations = False
-            if flag & 0x4:  # unmapped
-                target = None
-                coordinates = None
-            elif md is None:
-                query_pos = 0
-                coordinates = [[target_pos, query_pos]]
-                number = ""
-                operations = bytearray()
-                for letter in cigar:
-                    if letter == "M":
-                        # M: alignment match
-                        length = int(number)
-                        target_pos += length
-                        query_pos += length
-                    elif letter in "=X":
-                        # =: sequence match
-                        # X: sequence mismatch
-                        length = int(number)
-                        target_pos += length
-                        query_pos += length
-                        store_operations = True
-                    elif letter == "I":
-                        # I: insertion to the reference
-                        length = int(number)
-                        query_pos += length
-                    elif letter == "S":
-                        # S: soft clipping
-                        length = int(number)
-                        if query_pos == 0:
-                            coordinates[0][1] += length
-                        query_pos += length
-                        number = ""
-                        continue
-                    elif letter == "D":
-                        # D: deletion from the reference
-                        length = int(number)
-                        target_pos += length
-                    elif letter == "N":
-                        # N: skipped region from the reference
-                        length = int(number)
-                        target_pos += length
-                        store_operations = True
-                    elif letter == "H":  # hard clipping
-                        if query_pos == 0:
-                            hard_clip_left = int(number)
-                        else:
-                            hard_clip_right = int(number)
-                        number = ""
-                        continue
-                    elif letter == "P":  # padding
-                        raise NotImplementedError(
-                            "padding operator is not yet implemented"
-                        )
+                raise ValueError("end must be None if start is None")
+        elif end is None:
+            end = start + 1
+        try:
+            index = self._binning_index
+        except AttributeError:
+            index = find_index(self.source, (".csi",))
+            self._binning_index = index
+        target_indices = self._target_indices
+        for chunk_start, chunk_end in index.query(chromIx, start, end):
+            stream.seek(chunk_start)
+            while stream.tell() < chunk_end:
+                line = stream.readline()
+                if not line:
+                    break
+                refID, pos, chromEnd, _ = _span(line, target_indices)
+                if refID != chromIx or pos >= end:
+                    return
+                if chromEnd > start:
+                    yield self._create_alignment(line)
+
+    def _create_alignment(self, line):
+        """Create an Alignment object from a line in the SAM file (PRIVATE)."""
+        fields = line.split()
+        if len(fields) < 11:
+            raise ValueError("line has %d columns; expected at least 11" % len(fields))
+        qname = fields[0]
+        flag = int(fields[1])
+        rname = fields[2]
+        target_pos = int(fields[3]) - 1
+        mapq = int(fields[4])
+        cigar = fields[5]
+        rnext = fields[6]
+        pnext = int(fields[7]) - 1
+        tlen = int(fields[8])
+        query = fields[9]
+        qual = fields[10]
+        md = None
+        score = None
+        annotations = {}
+        for field in fields[11:]:
+            tag, datatype, value = field.split(":", 2)
+            if tag == "AS":
+                assert datatype == "i"
+                score = int(value)
+            elif tag == "MD":
+                assert datatype == "Z"
+                md = value
+            else:
+                if datatype == "i":
+                    value = int(value)
+                elif datatype == "f":
+                    value = float(value)
+                elif datatype in ("A", "Z"):  # string
+                    pass
+                elif datatype == "H":
+                    n = len(value)
+                    value = bytes(int(value[i : i + 2]) for i in range(0, n, 2))
+                elif datatype == "B":
+                    letter = value[0]
+                    value = value[1:].split(",")
+                    if letter in "cCsSiI":
+                        dtype = int
+                    elif letter == "f":
+                        dtype = float
                     else:
-                        number += letter
-                        continue
-                    coordinates.append([target_pos, query_pos])
-                    operations.append(ord(letter))
-                    number = ""
+                        raise ValueError(
+                            f"Unknown number type '{letter}' in tag '{field}'"
+                        )
+                    value = np.array(value, dtype)
+                annotations[tag] = value
+        if flag & 0x10:
+            strand = "-"
+        else:
+            strand = "+"
+        hard_clip_left = None
+        hard_clip_right = None
+        store_operations = False
+        if flag & 0x4:  # unmapped
+            target = None
+            coordinates = None
+        else:
+            (
+                coordinates,
+                operations,
+                query_pos,
+                hard_clip_left,
+                hard_clip_right,
+            ) = _aligncore.parse_cigar(cigar, target_pos)
+            coordinates = np.frombuffer(coordinates, np.intp).reshape(2, -1)
+            store_operations = (
+                b"N" in operations or b"=" in operations or b"X" in operations
+            )
+            if md is None:
                 index = self._target_indices.get(rname)
                 if index is None:
                     if self.targets:
@@ -591,175 +699,135 @@ class AlignmentIterator(interfaces.AlignmentIterator):
                 else:
                     target = self.targets[index]
             else:
-                query_pos = 0
-                coordinates = [[target_pos, query_pos]]
-                seq = query
-                target = ""
-                starts = [target_pos]
+                target = self._create_target(rname, query, coordinates, operations, md)
+        if coordinates is not None and strand == "-":
+            coordinates[1, :] = query_pos - coordinates[1, :]
+        if query == "*":
+            length = query_pos
+            sequence = Seq(None, length=length)
+        else:
+            sequence = Seq(query)
+            if not (flag & 0x4):  # not unmapped
+                assert len(query) == query_pos
+                if strand == "-":
+                    sequence = sequence.reverse_complement()
+        query = SeqRecord(sequence, id=qname, description="")
+        if strand == "-":
+            hard_clip_left, hard_clip_right = hard_clip_right, hard_clip_left
+        if hard_clip_left is not None:
+            query.annotations["hard_clip_left"] = hard_clip_left
+        if hard_clip_right is not None:
+            query.annotations["hard_clip_right"] = hard_clip_right
+        if qual != "*":
+            phred = [ord(c) - 33 for c in qual]
+            query.letter_annotations["phred_quality"] = phred
+        records = [target, query]
+        alignment = Alignment(records, coordinates)
+        alignment.flag = flag
+        if mapq != 255:
+            alignment.mapq = mapq
+        if rnext == "=":
+            alignment.rnext = rname
+        elif rnext != "*":
+            alignment.rnext = rnext
+        if pnext >= 0:
+            alignment.pnext = pnext
+        if tlen != 0:
+            alignment.tlen = tlen
+        if score is not None:
+            alignment.score = score
+        if annotations:
+            alignment.annotations = annotations
+        if hard_clip_left is not None:
+            alignment.hard_clip_left = hard_clip_left
+        if hard_clip_right is not None:
+            alignment.hard_clip_right = hard_clip_right
+        if store_operations:
+            alignment.operations = operations
+        return alignment
+
+    def _create_target(self, rname, query, coordinates, operations, md):
+        """Reconstruct the target sequence from the MD tag (PRIVATE)."""
+        target_pos = coordinates[0, 0]
+        target = ""
+        starts = [target_pos]
+        size = 0
+        sizes = []
+        for operation, (target_start, target_end), (query_start, query_end) in zip(
+            operations.decode(),
+            zip(coordinates[0, :-1].tolist(), coordinates[0, 1:].tolist()),
+            zip(coordinates[1, :-1].tolist(), coordinates[1, 1:].tolist()),
+        ):
+            if operation in "M=X":
+                target += query[query_start:query_end]
+                size += target_end - target_start
+            elif operation == "D":  # deletion from the reference
+                size += target_end - target_start
+                starts.append(target_end)
+                sizes.append(size)
                 size = 0
-                sizes = []
-                number = ""
-                operations = bytearray()
-                for letter in cigar:
-                    if letter in "M":
-                        # M: alignment match
-                        length = int(number)
-                        target_pos += length
-                        query_pos += length
-                        target += seq[:length]
-                        seq = seq[length:]
-                        size += length
-                    elif letter in "=X":
-                        # =: sequence match
-                        # X: sequence mismatch
-                        length = int(number)
-                        target_pos += length
-                        query_pos += length
-                        target += seq[:length]
-                        seq = seq[length:]
-                        size += length
-                        store_operations = True
-                    elif letter == "I":
-                        # I: insertion to the reference
-                        length = int(number)
-                        query_pos += length
-                        seq = seq[length:]
-                    elif letter == "S":
-                        # S: soft clipping
-                        length = int(number)
-                        if query_pos == 0:
-                            coordinates[0][1] += length
-                        query_pos += length
-                        seq = seq[length:]
-                        number = ""
-                        continue
-                    elif letter == "D":  # deletion from the reference
-                        length = int(number)
-                        target_pos += length
-                        size += length
-                        starts.append(target_pos)
-                        sizes.append(size)
-                        size = 0
-                    elif letter == "N":  # skipped region from the reference
-                        length = int(number)
-                        target_pos += length
-                        starts.append(target_pos)
-                        sizes.append(size)
-                        size = 0
-                        store_operations = True
-                    elif letter == "H":
-                        # hard clipping (clipped sequences not present in sequence)
-                        if query_pos == 0:
-                            hard_clip_left = int(number)
-                        else:
-                            hard_clip_right = int(number)
-                        number = ""
-                        continue
-                    elif letter == "P":  # padding
-                        raise NotImplementedError(
-                            "padding operator is not yet implemented"
-                        )
-                    else:
-                        number += letter
-                        continue
-                    coordinates.append([target_pos, query_pos])
-                    operations.append(ord(letter))
-                    number = ""
+            elif operation == "N":  # skipped region from the reference
+                starts.append(target_end)
                 sizes.append(size)
-                seq = target
-                target = ""
-                number = ""
-                letters = iter(md)
-                for letter in letters:
-                    if letter in "ACGTNacgtn":
-                        if number:
-                            number = int(number)
-                            target += seq[:number]
-                            seq = seq[number:]
-                            number = ""
-                        target += letter
-                        seq = seq[1:]
-                    elif letter == "^":
-                        if number:
-                            number = int(number)
-                            target += seq[:number]
-                            seq = seq[number:]
-                            number = ""
-                        for letter in letters:
-                            if letter not in "ACGTNacgtn":
-                                break
-                            target += letter
-                        else:
-                            break
-                        number = letter
-                    else:
-                        number += letter
-                if number:
-                    number = int(number)
-                    target += seq[:number]
-                seq = target
-                rname_target = self.targets[self._target_indices[rname]]
-                length = len(rname_target.seq)
-                data = {}
-                index = 0
-                for start, size in zip(starts, sizes):
-                    data[start] = seq[index : index + size]
-                    index += size
-
-                target = SeqRecord._from_validated(
-                    Seq(data, length=length),
-                    rname_target.id,
-                    rname_target.name,
-                    rname_target.description,
-                    annotations={
-                        key: copy.copy(val)
-                        for key, val in rname_target.annotations.items()
-                    },
-                )
-            if coordinates is not None:
-                coordinates = np.array(coordinates, np.intp).transpose()
-                if strand == "-":
-                    coordinates[1, :] = query_pos - coordinates[1, :]
-            if query == "*":
-                length = query_pos
-                sequence = Seq(None, length=length)
-            else:
-                sequence = Seq(query)
-                if not (flag & 0x4):  # not unmapped
-                    assert len(query) == query_pos
-                    if strand == "-":
-                        sequence = sequence.reverse_complement()
-            query = SeqRecord(sequence, id=qname, description="")
-            if strand == "-":
-                hard_clip_left, hard_clip_right = hard_clip_right, hard_clip_left
-            if hard_clip_left is not None:
-                query.annotations["hard_clip_left"] = hard_clip_left
-            if hard_clip_right is not None:
-                query.annotations["hard_clip_right"] = hard_clip_right
-            if qual != "*":
-                phred = [ord(c) - 33 for c in qual]
-                query.letter_annotations["phred_quality"] = phred
-            records = [target, query]
-            alignment = Alignment(records, coordinates)
-            alignment.flag = flag
-            if mapq != 255:
-                alignment.mapq = mapq
-            if rnext == "=":
-                alignment.rnext = rname
-            elif rnext != "*":
-                alignment.rnext = rnext
-            if pnext >= 0:
-                alignment.pnext = pnext
-            if tlen != 0:
-                alignment.tlen = tlen
-            if score is not None:
-                alignment.score = score
-            if annotations:
-                alignment.annotations = annotations
-            if hard_clip_left is not None:
-                alignment.hard_clip_left = hard_clip_left
-            if hard_clip_right is not None:
-                alignment.hard_clip_right = hard_clip_right
-            if store_operations:
-                alignment.operations = operations
-            return alignment
+                size = 0
+        sizes.append(size)
+        seq = _apply_md(target, md)
+        rname_target = self.targets[self._target_indices[rname]]
+        length = len(rname_target.seq)
+        data = {}
+        index = 0
+        for start, size in zip(starts, sizes):
+            data[start] = seq[index : index + size]
+            index += size
+        return SeqRecord._from_validated(
+            Seq(data, length=length),
+            rname_target.id,
+            rname_target.name,
+            rname_target.description,
+            annotations={
+                key: copy.copy(val) for key, val in rname_target.annotations.items()
+            },
+        )
+
+
+def create_index(source, target=None, min_shift=14, depth=None):
+    """Create a CSI index file for a coordinate-sorted BGZF-compressed SAM file.
+
+    Arguments:
+     - source    - file name of the BGZF-compressed SAM file.
+     - target    - file name of the index file. If None (default value), the
+                   index file is written to the file name of the SAM file
+                   with ".csi" appended.
+     - min_shift - log2 of the size of the smallest bins (default value 14).
+     - depth     - number of levels of the binning index. If None (default
+                   value), use the smallest depth that can represent the
+                   longest reference sequence.
+
+    The alignments in the SAM file must be sorted by reference sequence and
+    position, as created by ``samtools sort``, and compressed by ``bgzip``.
+    """
+    with AlignmentIterator(source) as alignments:
+        if not alignments._bgzf:
+            raise ValueError("indexing requires a BGZF-compressed SAM file")
+        stream = alignments._stream
+        target_indices = alignments._target_indices
+        if depth is None:
+            length = max((len(record) for record in alignments.targets), default=0)
+            depth = 0
+            while length > 1 << (min_shift + 3 * depth):
+                depth += 1
+        index = BinningIndex(min_shift, depth, len(alignments.targets))
+        stream.seek(0)
+        while True:
+            begin_offset = stream.tell()
+            line = stream.readline()
+            if not line:
+                break
+            if line.startswith("@"):
+                continue
+            refID, pos, end, mapped = _span(line, target_indices)
+            index.add(refID, pos, end, begin_offset, stream.tell(), mapped)
+    if target is None:
+        target = os.fspath(source) + ".csi"
+    with open(target, "wb") as stream:
+        index.write_csi(stream)
@@ -12,15 +12,17 @@ FASTA alignment tools using the '-m 8CB' or '-m 8CC' arguments.
 """
 
 import enum
-import re
 
 import numpy as np
 
+from Bio.Align import _aligncore  # type: ignore
 from Bio.Align import Alignment
 from Bio.Align import interfaces
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 
+_swap_insertion_deletion = str.maketrans("ID", "DI")
+
 
 class State(enum.Enum):
     """Enumerate alignment states needed when parsing a BTOP string."""
@@ -337,43 +339,8 @@ class AlignmentIterator(interfaces.AlignmentIterator):
         A BTOP (Blast trace-back operations) string is used by BLAST to
         describe a sequence alignment.
         """
-        target_coordinates = []
-        query_coordinates = []
-        target_coordinates.append(0)
-        query_coordinates.append(0)
-        state = State.NONE
-        tokens = re.findall("([A-Z-*]{2}|\\d+)", btop)
-        # each token is now
-        # - an integer
-        # - a pair of characters, which may include dashes
-        for token in tokens:
-            if token.startswith("-"):
-                if state != State.QUERY_GAP:
-                    target_coordinates.append(target_coordinates[-1])
-                    query_coordinates.append(query_coordinates[-1])
-                    state = State.QUERY_GAP
-                target_coordinates[-1] += 1
-            elif token.endswith("-"):
-                if state != State.TARGET_GAP:
-                    target_coordinates.append(target_coordinates[-1])
-                    query_coordinates.append(query_coordinates[-1])
-                    state = State.TARGET_GAP
-                query_coordinates[-1] += 1
-            else:
-                try:
-                    length = int(token)
-                except ValueError:
-                    # pair of mismatched letters
-                    length = 1
-                if state == State.MATCH:
-                    target_coordinates[-1] += length
-                    query_coordinates[-1] += length
-                else:
-                    target_coordinates.append(target_coordinates[-1] + length)
-                    query_coordinates.append(query_coordinates[-1] + length)
-                    state = State.MATCH
-        coordinates = np.array([target_coordinates, query_coordinates], np.intp)
-        return coordinates
+        coordinates = _aligncore.parse_btop(btop)
+        return np.frombuffer(coordinates, np.intp).reshape(2, -1)
 
     def parse_cigar(self, cigar):
         """Parse a CIGAR string and return alignment coordinates.
@@ -382,27 +349,8 @@ class AlignmentIterator(interfaces.AlignmentIterator):
         describes a sequence alignment as a series of lengths and operation
         (alignment/insertion/deletion) codes.
         """
-        target_coordinates = []
-        query_coordinates = []
-        target_coordinate = 0
-        query_coordinate = 0
-        target_coordinates.append(target_coordinate)
-        query_coordinates.append(query_coordinate)
-        state = State.NONE
-        tokens = re.findall("(M|D|I|\\d+)", cigar)
-        # each token is now
-        # - the length of the operation
-        # - the operation
-        for length, operation in zip(tokens[::2], tokens[1::2]):
-            length = int(length)
-            if operation == "M":
-                target_coordinate += length
-                query_coordinate += length
-            elif operation == "I":
-                target_coordinate += length
-            elif operation == "D":
-                query_coordinate += length
-            target_coordinates.append(target_coordinate)
-            query_coordinates.append(query_coordinate)
-        coordinates = np.array([target_coordinates, query_coordinates], np.intp)
-        return coordinates
+        # In this CIGAR string, I and D refer to the target and query,
+        # respectively, which is opposite to the SAM format.
+        cigar = cigar.translate(_swap_insertion_deletion)
+        coordinates = _aligncore.parse_cigar(cigar)[0]
+        return np.frombuffer(coordinates, np.intp).reshape(2, -1)
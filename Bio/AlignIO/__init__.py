@@ -134,46 +134,56 @@ same length.
 #
 # - MSF multiple alignment format, aka GCG, aka PileUp format (*.msf)
 #   http://www.bioperl.org/wiki/MSF_multiple_alignment_format
-from Bio.Align import MultipleSeqAlignment
+import importlib
+
+from Bio._utils import LazyImportDict
 from Bio.File import as_handle
 
-from . import ClustalIO
-from . import EmbossIO
-from . import FastaIO
-from . import MafIO
-from . import MauveIO
-from . import MsfIO
-from . import NexusIO
-from . import PhylipIO
-from . import StockholmIO
+_modules = (
+    "ClustalIO",
+    "EmbossIO",
+    "FastaIO",
+    "MafIO",
+    "MauveIO",
+    "MsfIO",
+    "NexusIO",
+    "PhylipIO",
+    "StockholmIO",
+)
 
 # Convention for format names is "mainname-subtype" in lower case.
 # Please use the same names as BioPerl and EMBOSS where possible.
 
-_FormatToIterator = {  # "fasta" is done via Bio.SeqIO
-    "clustal": ClustalIO.ClustalIterator,
-    "emboss": EmbossIO.EmbossIterator,
-    "fasta-m10": FastaIO.FastaM10Iterator,
-    "maf": MafIO.MafIterator,
-    "mauve": MauveIO.MauveIterator,
-    "msf": MsfIO.MsfIterator,
-    "nexus": NexusIO.NexusIterator,
-    "phylip": PhylipIO.PhylipIterator,
-    "phylip-sequential": PhylipIO.SequentialPhylipIterator,
-    "phylip-relaxed": PhylipIO.RelaxedPhylipIterator,
-    "stockholm": StockholmIO.StockholmIterator,
-}
-
-_FormatToWriter = {  # "fasta" is done via Bio.SeqIO
-    "clustal": ClustalIO.ClustalWriter,
-    "maf": MafIO.MafWriter,
-    "mauve": MauveIO.MauveWriter,
-    "nexus": NexusIO.NexusWriter,
-    "phylip": PhylipIO.PhylipWriter,
-    "phylip-sequential": PhylipIO.SequentialPhylipWriter,
-    "phylip-relaxed": PhylipIO.RelaxedPhylipWriter,
-    "stockholm": StockholmIO.StockholmWriter,
-}
+# "fasta" is done via Bio.SeqIO
+_FormatToIterator = LazyImportDict(
+    {
+        "clustal": "Bio.AlignIO.ClustalIO.ClustalIterator",
+        "emboss": "Bio.AlignIO.EmbossIO.EmbossIterator",
+        "fasta-m10": "Bio.AlignIO.FastaIO.FastaM10Iterator",
+        "maf": "Bio.AlignIO.MafIO.MafIterator",
+        "mauve": "Bio.AlignIO.MauveIO.MauveIterator",
+        "msf": "Bio.AlignIO.MsfIO.MsfIterator",
+        "nexus": "Bio.AlignIO.NexusIO.NexusIterator",
+        "phylip": "Bio.AlignIO.PhylipIO.PhylipIterator",
+        "phylip-sequential": "Bio.AlignIO.PhylipIO.SequentialPhylipIterator",
+        "phylip-relaxed": "Bio.AlignIO.PhylipIO.RelaxedPhylipIterator",
+        "stockholm": "Bio.AlignIO.StockholmIO.StockholmIterator",
+    }
+)
+
+# "fasta" is done via Bio.SeqIO
+_FormatToWriter = LazyImportDict(
+    {
+        "clustal": "Bio.AlignIO.ClustalIO.ClustalWriter",
+        "maf": "Bio.AlignIO.MafIO.MafWriter",
+        "mauve": "Bio.AlignIO.MauveIO.MauveWriter",
+        "nexus": "Bio.AlignIO.NexusIO.NexusWriter",
+        "phylip": "Bio.AlignIO.PhylipIO.PhylipWriter",
+        "phylip-sequential": "Bio.AlignIO.PhylipIO.SequentialPhylipWriter",
+        "phylip-relaxed": "Bio.AlignIO.PhylipIO.RelaxedPhylipWriter",
+        "stockholm": "Bio.AlignIO.StockholmIO.StockholmWriter",
+    }
+)
 
 
 def write(alignments, handle, format):
@@ -191,6 +201,7 @@ def write(alignments, handle, format):
     Returns the number of alignments written (as an integer).
     """
     from Bio import SeqIO
+    from Bio.Align import MultipleSeqAlignment
 
     # Try and give helpful error messages:
     if not isinstance(format, str):
@@ -249,6 +260,7 @@ def _SeqIO_to_alignment_iterator(handle, format, seq_count=None):
     combined into a single MultipleSeqAlignment.
     """
     from Bio import SeqIO
+    from Bio.Align import MultipleSeqAlignment
 
     if format not in SeqIO._FormatToIterator:
         raise ValueError(f"Unknown format '{format}'")
@@ -468,6 +480,18 @@ def convert(in_file, in_format, out_file, out_format, molecule_type=None):
     return write(alignments, out_file, out_format)
 
 
+def __getattr__(name):
+    # The format modules are imported only when needed, but remain available
+    # as attributes of this module for backward compatibility.
+    if name in _modules:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name == "MultipleSeqAlignment":
+        from Bio.Align import MultipleSeqAlignment
+
+        return MultipleSeqAlignment
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
     from Bio._utils import run_doctest
 
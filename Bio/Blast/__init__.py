@@ -27,6 +27,7 @@ import textwrap
 import time
 import warnings
 from collections import UserList
+from itertools import islice
 from urllib.parse import urlencode
 from urllib.request import build_opener
 from urllib.request import HTTPBasicAuthHandler
@@ -884,7 +885,164 @@ Program: %s
         return text
 
 
-def parse(source):
+class Rows:
+    """Iterator over selected fields of the HSPs in BLAST XML output.
+
+    A ``Bio.Blast.Rows`` object is returned by ``Bio.Blast.parse`` if the
+    ``fields`` argument is used. Iterating over it returns one tuple for each
+    HSP, containing the values of the requested fields in the order given.
+    The field names follow the BLAST tabular output format:
+
+     - qseqid, qtitle, qlen:  identifier, definition line, and length of the
+                              query;
+     - sseqid, sacc, stitle:  identifier, accession, and definition line of
+                              the target;
+     - staxid, slen:          taxonomy ID (XML2 only) and length of the target;
+     - qstart, qend:          start and end of the alignment in the query;
+     - sstart, send:          start and end of the alignment in the target;
+     - qframe, sframe:        query and target frame;
+     - evalue, bitscore:      expect value and bit score;
+     - score:                 raw score;
+     - length:                alignment length;
+     - nident, positive:      number of identical and positive-scoring matches;
+     - gaps, mismatch:        number of gaps and mismatches;
+     - pident, ppos:          percentage of identical and positive-scoring
+                              matches.
+
+    Fields that are not available for an HSP are stored as ``None``.
+
+    As no Record, Hit, or HSP objects are created, and the aligned sequences
+    are skipped, this is much faster than iterating over a ``Bio.Blast.Records``
+    object, and the memory use does not depend on the size of the file.
+
+    >>> from Bio import Blast
+    >>> fields = ["qseqid", "sseqid", "evalue", "bitscore"]
+    >>> with Blast.parse("Blast/xml_2226_blastn_004.xml", fields=fields) as rows:
+    ...     for row in rows:
+    ...         print(row)
+    ...
+    ('Query_1', 'gnl|BL_ORD_ID|6', 5.52066e-29, 115.613)
+    ('Query_1', 'gnl|BL_ORD_ID|6', 5.55986e-24, 98.9927)
+    ('Query_1', 'gnl|BL_ORD_ID|5', 5.52066e-29, 115.613)
+    ('Query_1', 'gnl|BL_ORD_ID|9', 7.14143e-28, 111.919)
+    ('Query_1', 'gnl|BL_ORD_ID|8', 7.14143e-28, 111.919)
+    ('Query_1', 'gnl|BL_ORD_ID|7', 7.14143e-28, 111.919)
+
+    Use the ``batches`` method to obtain the rows as NumPy structured arrays
+    instead.
+    """
+
+    def __init__(self, source, fields):
+        """Initialize the Rows object."""
+        from Bio.Blast._parser import FieldHandler
+
+        self.source = source
+        self.fields = tuple(fields)
+        parser = expat.ParserCreate()
+        handler = FieldHandler(parser, self.fields)
+        try:
+            stream = open(source, "rb")
+        except TypeError:  # not a path, assume we received a stream
+            if source.read(0) != b"":
+                raise StreamModeError(
+                    "BLAST output files must be opened in binary mode."
+                ) from None
+            stream = source
+        self._stream = stream
+        self._parser = parser
+        self._rows = handler.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        try:
+            stream = self._stream
+        except AttributeError:
+            return
+        del self._parser
+        if stream is not self.source:
+            stream.close()
+        del self._stream
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        rows = self._rows
+        while True:
+            try:
+                return rows.popleft()
+            except IndexError:  # no row ready to be returned
+                pass
+            try:
+                stream = self._stream
+            except AttributeError:
+                raise StopIteration from None
+            parser = self._parser
+            data = stream.read(BLOCK)
+            try:
+                parser.Parse(data, data == b"")
+            except expat.ExpatError as e:
+                self.__exit__(None, None, None)
+                if parser.StartElementHandler is None:
+                    # We have not seen the initial <?xml declaration, so
+                    # probably the input data is not in XML format.
+                    raise NotXMLError(e) from None
+                if data == b"":
+                    raise ValueError(
+                        f"premature end of XML file: line {e.lineno}, column {e.offset}"
+                    ) from None
+                raise CorruptedXMLError(e) from None
+            if data == b"":
+                self.__exit__(None, None, None)
+
+    def batches(self, size=10000):
+        """Iterate over the rows as NumPy structured arrays of up to size rows.
+
+        The field names are used as the names in the structured array. Text
+        fields are stored as Unicode strings, and integer and floating point
+        fields as int64 and float64, respectively. A ValueError is raised if
+        a field is not available for some of the HSPs.
+
+        >>> from Bio import Blast
+        >>> fields = ["sseqid", "evalue", "length", "pident"]
+        >>> with Blast.parse("Blast/xml_2900_blastp_001.xml", fields=fields) as rows:
+        ...     for batch in rows.batches(4):
+        ...         print(len(batch), batch["length"], batch["pident"].round(1))
+        ...
+        4 [103 103 103 103] [100.  99.  99.  99.]
+        4 [103  89  89  89] [ 98.1 100.  100.  100. ]
+        2 [89 89] [98.9 98.9]
+        >>> batch.dtype
+        dtype([('sseqid', '<U32'), ('evalue', '<f8'), ('length', '<i8'), ('pident', '<f8')])
+
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+        while True:
+            rows = list(islice(self, size))
+            if not rows:
+                return
+            arrays = []
+            for field, column in zip(self.fields, zip(*rows)):
+                if None in column:
+                    raise ValueError(f"field '{field}' is not available for all HSPs")
+                array = np.array(column)
+                if array.dtype.kind == "i":
+                    array = array.astype(np.int64)
+                arrays.append(array)
+            dtype = [(field, array.dtype) for field, array in zip(self.fields, arrays)]
+            batch = np.empty(len(rows), dtype)
+            for field, array in zip(self.fields, arrays):
+                batch[field] = array
+            yield batch
+
+    def __repr__(self):
+        return f"<Bio.Blast.Rows source={self.source!r} fields={self.fields!r}>"
+
+
+def parse(source, fields=None):
     """Parse an XML file containing BLAST output and return a Bio.Blast.Records object.
 
     This returns an iterator object; iterating over it returns Bio.Blast.Record
@@ -910,7 +1068,15 @@ def parse(source):
     Query_5 gi|53729353:216-1313 Homo sapiens wingless-type MMTV integration site family, member 6 (WNT6), mRNA
     >>> stream.close()
 
+    If fields is a list of field names (using the names of the BLAST tabular
+    output format, such as "qseqid", "sseqid", "evalue", and "bitscore"), a
+    Bio.Blast.Rows object is returned instead. Iterating over it returns a
+    tuple with the values of these fields for each HSP, without creating
+    Record, Hit, or HSP objects; see the Bio.Blast.Rows class for details.
+
     """
+    if fields is not None:
+        return Rows(source, fields)
     return Records(source)
 
 
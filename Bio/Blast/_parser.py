@@ -1224,3 +1224,200 @@ class XMLHandler:
             return f"<Bio.Blast._parser.XMLHandler object at {address} with stream {stream} and no parser>"
         else:
             return f"<Bio.Blast._parser.XMLHandler object at {address} with stream {stream} and parser {parser}>"
+
+
+# Map the XML (DTD) and XML2 (XML schema) element names to the name of the
+# corresponding XML2 element. Elements at the query level are stored in
+# FieldHandler._query, at the hit level in FieldHandler._hit, and at the HSP
+# level in FieldHandler._hsp.
+_QUERY_ELEMENTS = {
+    "Iteration_query-ID": "query-id",
+    "Iteration_query-def": "query-title",
+    "Iteration_query-len": "query-len",
+    "query-id": "query-id",
+    "query-title": "query-title",
+    "query-len": "query-len",
+}
+_HEADER_ELEMENTS = {
+    "BlastOutput_query-ID": "query-id",
+    "BlastOutput_query-def": "query-title",
+    "BlastOutput_query-len": "query-len",
+}
+_HIT_ELEMENTS = {
+    "Hit_id": "id",
+    "Hit_def": "title",
+    "Hit_accession": "accession",
+    "Hit_len": "len",
+    "id": "id",
+    "title": "title",
+    "accession": "accession",
+    "taxid": "taxid",
+    "len": "len",
+}
+_HSP_ELEMENTS = {
+    "Hsp_bit-score": "bit-score",
+    "Hsp_score": "score",
+    "Hsp_evalue": "evalue",
+    "Hsp_query-from": "query-from",
+    "Hsp_query-to": "query-to",
+    "Hsp_hit-from": "hit-from",
+    "Hsp_hit-to": "hit-to",
+    "Hsp_query-frame": "query-frame",
+    "Hsp_hit-frame": "hit-frame",
+    "Hsp_identity": "identity",
+    "Hsp_positive": "positive",
+    "Hsp_gaps": "gaps",
+    "Hsp_align-len": "align-len",
+    "bit-score": "bit-score",
+    "score": "score",
+    "evalue": "evalue",
+    "query-from": "query-from",
+    "query-to": "query-to",
+    "hit-from": "hit-from",
+    "hit-to": "hit-to",
+    "query-frame": "query-frame",
+    "hit-frame": "hit-frame",
+    "identity": "identity",
+    "positive": "positive",
+    "gaps": "gaps",
+    "align-len": "align-len",
+}
+
+# Field names follow the BLAST tabular output format; for each field, we
+# store the XML2 element names it needs and the function to calculate it.
+_FIELDS = {
+    "qseqid": (("query-id",), str),
+    "qtitle": (("query-title",), str),
+    "qlen": (("query-len",), int),
+    "sseqid": (("id",), str),
+    "sacc": (("accession",), str),
+    "stitle": (("title",), str),
+    "staxid": (("taxid",), int),
+    "slen": (("len",), int),
+    "qstart": (("query-from",), int),
+    "qend": (("query-to",), int),
+    "sstart": (("hit-from",), int),
+    "send": (("hit-to",), int),
+    "qframe": (("query-frame",), int),
+    "sframe": (("hit-frame",), int),
+    "evalue": (("evalue",), float),
+    "bitscore": (("bit-score",), float),
+    "score": (("score",), int),
+    "length": (("align-len",), int),
+    "nident": (("identity",), int),
+    "positive": (("positive",), int),
+    "gaps": (("gaps",), int),
+    "pident": (
+        ("identity", "align-len"),
+        lambda identity, length: 100.0 * int(identity) / int(length),
+    ),
+    "ppos": (
+        ("positive", "align-len"),
+        lambda positive, length: 100.0 * int(positive) / int(length),
+    ),
+    "mismatch": (
+        ("identity", "gaps", "align-len"),
+        lambda identity, gaps, length: int(length) - int(identity) - int(gaps),
+    ),
+}
+
+
+class FieldHandler:
+    """Handler extracting selected HSP fields from BLAST XML data.
+
+    In contrast to XMLHandler, this handler does not create any Record, Hit,
+    or HSP objects, and ignores the text of all elements that are not needed
+    for the requested fields; in particular, the aligned sequences are never
+    stored. For each HSP, a tuple with the requested values is appended to the
+    rows attribute. As the DTD and XML schema are not used, both XML and XML2
+    output can be parsed by the same handler.
+    """
+
+    def __init__(self, parser, fields):
+        """Initialize the expat parser to extract the requested fields."""
+        keys = set()
+        getters = []
+        for field in fields:
+            try:
+                names, function = _FIELDS[field]
+            except KeyError:
+                raise ValueError(
+                    "unknown field '%s'; expected one of %s"
+                    % (field, ", ".join(_FIELDS))
+                ) from None
+            keys.update(names)
+            getters.append((names, function))
+        self._getters = getters
+        elements = {}
+        for level, mapping in (
+            ("header", _HEADER_ELEMENTS),
+            ("query", _QUERY_ELEMENTS),
+            ("hit", _HIT_ELEMENTS),
+            ("hsp", _HSP_ELEMENTS),
+        ):
+            for name, key in mapping.items():
+                if key in keys:
+                    elements[name] = (level, key)
+        self._elements = elements
+        self._header = {}
+        self._query = {}
+        self._hit = {}
+        self._hsp = {}
+        self._characters = []
+        self.rows = deque()
+        parser.buffer_text = True
+        parser.XmlDeclHandler = self._xmlDeclHandler
+        self._parser = parser
+
+    def _xmlDeclHandler(self, version, encoding, standalone):
+        parser = self._parser
+        parser.StartElementHandler = self._startElementHandler
+        parser.EndElementHandler = self._endElementHandler
+        parser.XmlDeclHandler = None
+
+    def _startElementHandler(self, name, attributes):
+        """Found XML start tag."""
+        if name in self._elements:
+            self._parser.CharacterDataHandler = self._characters.append
+        elif name == "Hsp":
+            self._hsp = {}
+        elif name == "Hit":
+            self._hit = {}
+        elif name in ("Iteration", "Search"):
+            self._query = dict(self._header)
+
+    def _endElementHandler(self, name):
+        """Found XML end tag."""
+        element = self._elements.get(name)
+        if element is None:
+            if name == "Hsp":
+                self._add_row()
+            return
+        level, key = element
+        self._parser.CharacterDataHandler = None
+        characters = "".join(self._characters)
+        self._characters.clear()
+        if level == "hsp":
+            self._hsp[key] = characters
+        elif level == "hit":
+            # XML2 may list several descriptions for each hit; use the first
+            self._hit.setdefault(key, characters)
+        elif level == "query":
+            self._query[key] = characters
+        else:
+            self._header[key] = characters
+
+    def _add_row(self):
+        values = dict(self._query)
+        values.update(self._hit)
+        values.update(self._hsp)
+        row = []
+        for names, function in self._getters:
+            try:
+                arguments = [values[name] for name in names]
+            except KeyError:  # not available for this HSP
+                value = None
+            else:
+                value = function(*arguments)
+            row.append(value)
+        self.rows.append(tuple(row))
@@ -125,6 +125,15 @@ Functions:
 
     - _open        Internally used function.
 
+Classes:
+
+    - Session      Sends many requests efficiently, reusing connections to the
+      NCBI server, sharing a rate limiter between threads, optionally caching
+      responses on disk, and fetching long lists of records in batches using
+      the history server.
+    - AsyncSession Same as Session, for use with asyncio.
+    - TokenBucket  Thread-safe rate limiter, which can be shared by sessions.
+
 """
 
 import io
@@ -137,6 +146,9 @@ from urllib.request import Request
 from urllib.request import urlopen
 
 from Bio._utils import function_with_previous
+from Bio.Entrez._session import AsyncSession
+from Bio.Entrez._session import Session
+from Bio.Entrez._session import TokenBucket
 
 email = None
 max_tries = 3
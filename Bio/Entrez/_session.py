@@ -0,0 +1,590 @@
+# Copyright 2026 by The Biopython Contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Sessions for sending many requests to the NCBI Entrez Utilities (PRIVATE).
+
+The ``Session`` and ``AsyncSession`` classes defined here are available from
+``Bio.Entrez`` directly; see the ``Session`` class for details.
+"""
+
+import asyncio
+import hashlib
+import http.client
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from urllib.error import HTTPError
+from urllib.error import URLError
+from urllib.parse import urlsplit
+from urllib.request import getproxies
+from urllib.request import urlopen
+
+from Bio import Entrez
+
+# Tool name, CGI script, and options passed to Entrez._build_request
+_tools = {
+    "epost": ("epost.fcgi", {"post": True}),
+    "efetch": ("efetch.fcgi", {}),
+    "esearch": ("esearch.fcgi", {}),
+    "elink": ("elink.fcgi", {"join_ids": False}),
+    "einfo": ("einfo.fcgi", {}),
+    "esummary": ("esummary.fcgi", {}),
+    "espell": ("espell.fcgi", {}),
+    "ecitmatch": ("ecitmatch.cgi", {"ecitmatch": True}),
+}
+
+# Parameters that identify the user, and do not affect the response
+_identity = ("email", "tool", "api_key")
+
+
+class TokenBucket:
+    """Thread-safe token bucket to limit the rate of requests.
+
+    Tokens are added to the bucket at ``rate`` tokens per second, up to a
+    maximum of ``capacity`` tokens. Each request takes one token from the
+    bucket, waiting until a token is available if the bucket is empty.
+    A single bucket can be shared by several sessions and threads to keep
+    their combined request rate within the NCBI limit.
+
+    >>> from Bio.Entrez import TokenBucket
+    >>> limiter = TokenBucket(rate=10)
+    >>> limiter.reserve()  # the first token is available immediately
+    0.0
+    >>> round(limiter.reserve(), 1)  # the next one after 0.1 seconds
+    0.1
+    """
+
+    def __init__(self, rate, capacity=1):
+        """Initialize the token bucket.
+
+        :param rate: number of tokens added to the bucket per second.
+        :param capacity: maximum number of tokens in the bucket, allowing
+            short bursts of up to this number of requests.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token from the bucket, and return how long to wait for it.
+
+        The token is reserved immediately, so that the caller can wait for
+        the returned number of seconds in whichever way is appropriate, e.g.
+        using ``time.sleep`` or ``asyncio.sleep``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens = self._tokens + (now - self._time) * self.rate
+            self._tokens = min(self.capacity, tokens) - 1
+            self._time = now
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Take a token from the bucket, waiting until one is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _Request:
+    """Prepared request to the Entrez Utilities (PRIVATE)."""
+
+    def __init__(self, request, key):
+        self.method = request.method
+        self.url = request.full_url
+        self.data = request.data
+        self.key = key
+
+
+class Session:
+    """Session sending requests to the NCBI Entrez Utilities.
+
+    A session provides the same functions as the ``Bio.Entrez`` module
+    (``efetch``, ``esearch``, ``epost``, and so on), taking the same
+    arguments and returning the same kind of handles, but is designed for
+    sending many requests:
+
+     - Connections to the NCBI server are kept alive and reused between
+       requests, with one connection for each thread using the session;
+     - The NCBI rate limit is enforced by a thread-safe token bucket, which
+       is shared by all threads using the session, and optionally by other
+       sessions;
+     - Responses can be stored in an on-disk cache, so that repeating a
+       request does not contact the NCBI server again;
+     - The ``efetch_batches`` method retrieves a long list of records in
+       batches using the Entrez history server.
+
+    The response is read completely before it is returned, so that the
+    connection can be reused for the next request. The handles returned
+    are therefore in-memory file-like objects, with a ``.url`` attribute as
+    for the handles returned by the ``Bio.Entrez`` functions.
+
+    >>> from Bio import Entrez
+    >>> session = Entrez.Session(email="Your.Name.Here@example.org")
+    >>> handle = session.efetch(db="nucleotide", id="AY851612", rettype="gb", retmode="text")
+    >>> print(handle.readline().strip())
+    LOCUS       AY851612                 892 bp    DNA     linear   PLN 10-APR-2007
+    >>> handle.close()
+    >>> session.close()
+
+    Sessions can also be used as a context manager, closing their
+    connections at the end of the ``with`` block.
+    """
+
+    def __init__(
+        self,
+        email=None,
+        tool=None,
+        api_key=None,
+        cache=None,
+        limiter=None,
+        batch_size=500,
+        timeout=60,
+        base_url="https://eutils.ncbi.nlm.nih.gov/entrez/eutils/",
+    ):
+        """Initialize the session.
+
+        :param email: email address sent with each request; by default, the
+            value of ``Bio.Entrez.email`` is used.
+        :param tool: tool name sent with each request; by default, the value
+            of ``Bio.Entrez.tool`` is used.
+        :param api_key: NCBI API key sent with each request; by default, the
+            value of ``Bio.Entrez.api_key`` is used.
+        :param cache: directory to store responses in, or None (default) to
+            disable the cache. Requests that use the history server (e.g.
+            ``epost``, or any request with a ``WebEnv`` argument) are never
+            cached, as their response depends on the state of the server.
+        :param limiter: ``TokenBucket`` used to enforce the rate limit. By
+            default, a new one is created allowing 10 requests per second
+            with an API key, and about 3 requests per second without.
+        :param batch_size: default number of records retrieved per request
+            by ``efetch_batches``.
+        :param timeout: timeout in seconds for connecting to the server and
+            reading the response.
+        :param base_url: URL of the Entrez Utilities, allowing the use of a
+            mirror or of a local server for testing.
+
+        The number of times failed requests are tried, and the delay between
+        tries, are taken from ``Bio.Entrez.max_tries`` and
+        ``Bio.Entrez.sleep_between_tries``.
+        """
+        self.email = email
+        self.tool = tool
+        self.api_key = api_key
+        if cache is not None:
+            os.makedirs(cache, exist_ok=True)
+        self.cache = cache
+        if limiter is None:
+            if api_key is None:
+                api_key = Entrez.api_key
+            # Same delays as used by Bio.Entrez._open
+            delay = 0.1 if api_key else 0.37
+            limiter = TokenBucket(1 / delay)
+        self.limiter = limiter
+        self.batch_size = batch_size
+        self.timeout = timeout
+        if not base_url.endswith("/"):
+            base_url += "/"
+        self.base_url = base_url
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close all connections opened by this session."""
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def epost(self, db, **keywds):
+        """Post a file of identifiers for future use; see ``Bio.Entrez.epost``."""
+        return self._open(self._prepare("epost", {"db": db, **keywds}))
+
+    def efetch(self, db, **keywds):
+        """Fetch Entrez results; see ``Bio.Entrez.efetch``."""
+        return self._open(self._prepare("efetch", {"db": db, **keywds}))
+
+    def esearch(self, db, term, **keywds):
+        """Run an Entrez search; see ``Bio.Entrez.esearch``."""
+        params = {"db": db, "term": term, **keywds}
+        return self._open(self._prepare("esearch", params))
+
+    def elink(self, **keywds):
+        """Check for linked external articles; see ``Bio.Entrez.elink``."""
+        return self._open(self._prepare("elink", keywds))
+
+    def einfo(self, **keywds):
+        """Return a summary of the Entrez databases; see ``Bio.Entrez.einfo``."""
+        return self._open(self._prepare("einfo", keywds))
+
+    def esummary(self, **keywds):
+        """Retrieve document summaries; see ``Bio.Entrez.esummary``."""
+        return self._open(self._prepare("esummary", keywds))
+
+    def espell(self, **keywds):
+        """Retrieve spelling suggestions; see ``Bio.Entrez.espell``."""
+        return self._open(self._prepare("espell", keywds))
+
+    def ecitmatch(self, **keywds):
+        """Retrieve PMIDs for input citation strings; see ``Bio.Entrez.ecitmatch``."""
+        return self._open(self._prepare("ecitmatch", keywds))
+
+    def efetch_batches(self, db, id=None, batch_size=None, **keywds):
+        """Fetch a long list of records in batches, using the history server.
+
+        The identifiers are first uploaded to the Entrez history server using
+        ``epost``, after which the records are retrieved with ``efetch`` in
+        batches of ``batch_size`` records (by default, the ``batch_size`` of
+        the session). This function is a generator returning one handle for
+        each batch; as each handle contains a complete response, XML data can
+        be parsed with ``Bio.Entrez.read`` or ``Bio.Entrez.parse`` batch by
+        batch.
+
+        Alternatively, records stored on the history server by a previous
+        ``epost`` or ``esearch`` request can be retrieved by passing the
+        ``webenv`` and ``query_key`` arguments, together with ``count``
+        giving the total number of records.
+
+        Any other keyword arguments (e.g. ``rettype`` and ``retmode``) are
+        passed to ``efetch``.
+        """
+        if batch_size is None:
+            batch_size = self.batch_size
+        webenv, query_key, count = self._post_ids(db, id, keywds)
+        for start in range(0, count, batch_size):
+            params = dict(keywds)
+            params.update(
+                db=db,
+                webenv=webenv,
+                query_key=query_key,
+                retstart=start,
+                retmax=batch_size,
+            )
+            yield self._open(self._prepare("efetch", params))
+
+    def _post_ids(self, db, ids, keywds):
+        """Upload identifiers to the history server if needed (PRIVATE).
+
+        Returns the WebEnv, the query key, and the number of records.
+        """
+        if ids is None:
+            try:
+                webenv = keywds.pop("webenv")
+                query_key = keywds.pop("query_key")
+                count = keywds.pop("count")
+            except KeyError:
+                raise ValueError(
+                    "either id, or webenv, query_key, and count must be given"
+                ) from None
+            return webenv, query_key, count
+        ids = Entrez._format_ids(ids).split(",")
+        handle = self.epost(db, id=ids)
+        record = Entrez.read(handle)
+        handle.close()
+        return record["WebEnv"], record["QueryKey"], len(ids)
+
+    def _prepare(self, name, params):
+        """Build the request for the given E-utility (PRIVATE)."""
+        cgi, options = _tools[name]
+        if name == "ecitmatch":
+            params = Entrez._update_ecitmatch_variables(params)
+        if self.tool is not None:
+            params.setdefault("tool", self.tool)
+        if self.email is not None:
+            params.setdefault("email", self.email)
+        if self.api_key is not None:
+            params.setdefault("api_key", self.api_key)
+        request = Entrez._build_request(self.base_url + cgi, params, **options)
+        # Entrez._build_request adds the default values to params
+        if self.cache is None or name == "epost":
+            key = None
+        elif any(param.lower() in ("webenv", "usehistory") for param in params):
+            key = None
+        else:
+            values = sorted(
+                (param, str(value))
+                for param, value in params.items()
+                if param not in _identity
+            )
+            data = json.dumps([cgi, values]).encode()
+            key = hashlib.sha256(data).hexdigest()
+        return _Request(request, key)
+
+    def _open(self, request):
+        """Send the request and return a handle to the response (PRIVATE)."""
+        handle = self._read_cache(request)
+        if handle is not None:
+            return handle
+        self.limiter.acquire()
+        return self._send(request)
+
+    def _read_cache(self, request):
+        """Return a handle to the cached response, or None (PRIVATE)."""
+        if request.key is None:
+            return None
+        path = os.path.join(self.cache, request.key)
+        try:
+            with open(path, "rb") as stream:
+                subtype = stream.readline().rstrip(b"\n").decode()
+                data = stream.read()
+        except FileNotFoundError:
+            return None
+        return _make_handle(data, subtype, request.url)
+
+    def _write_cache(self, request, data, subtype):
+        """Store the response in the cache (PRIVATE)."""
+        if request.key is None:
+            return
+        path = os.path.join(self.cache, request.key)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache, prefix=".tmp")
+        with os.fdopen(fd, "wb") as stream:
+            stream.write(subtype.encode() + b"\n")
+            stream.write(data)
+        os.replace(temp_path, path)
+
+    def _send(self, request):
+        """Send the request, trying again after transient errors (PRIVATE).
+
+        The errors raised, and the conditions under which the request is
+        tried again, are the same as for ``Bio.Entrez._open``.
+        """
+        max_tries = Entrez.max_tries
+        for i in range(max_tries):
+            try:
+                data, subtype = self._fetch(request)
+            except HTTPError as exception:
+                if i >= max_tries - 1:
+                    raise
+                if exception.code // 100 == 4 and exception.code != 429:
+                    raise
+            except URLError:
+                if i >= max_tries - 1:
+                    raise
+                time.sleep(Entrez.sleep_between_tries)
+            else:
+                break
+        self._write_cache(request, data, subtype)
+        return _make_handle(data, subtype, request.url)
+
+    def _fetch(self, request):
+        """Send the request once, returning the data and content subtype (PRIVATE)."""
+        url = urlsplit(request.url)
+        if url.scheme in getproxies():
+            # Let urllib deal with the proxy
+            try:
+                with urlopen(request.url, request.data, self.timeout) as response:
+                    return response.read(), response.headers.get_content_subtype()
+            except HTTPError as exception:
+                # Read the body, so that the error can be inspected later
+                body = exception.read()
+                raise HTTPError(
+                    request.url,
+                    exception.code,
+                    exception.reason,
+                    exception.headers,
+                    io.BytesIO(body),
+                ) from None
+        path = url.path
+        if url.query:
+            path += "?" + url.query
+        headers = {"Connection": "keep-alive"}
+        if request.data is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        for attempt in (0, 1):
+            connection, reused = self._get_connection(url.scheme, url.netloc)
+            try:
+                connection.request(request.method, path, request.data, headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException) as exception:
+                self._drop_connection(url.scheme, url.netloc)
+                if reused and attempt == 0:
+                    # The server may have closed an idle connection
+                    continue
+                raise URLError(exception) from exception
+            break
+        if response.will_close:
+            self._drop_connection(url.scheme, url.netloc)
+        if response.status != 200:
+            raise HTTPError(
+                request.url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(data),
+            )
+        return data, response.headers.get_content_subtype()
+
+    def _get_connection(self, scheme, netloc):
+        """Return this thread's connection to the server (PRIVATE).
+
+        The second value returned is True if the connection was used before.
+        """
+        connections = self._local.__dict__.setdefault("connections", {})
+        connection = connections.get((scheme, netloc))
+        if connection is not None:
+            return connection, True
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        elif scheme == "http":
+            connection = http.client.HTTPConnection(netloc, timeout=self.timeout)
+        else:
+            raise ValueError(f"unsupported URL scheme '{scheme}'")
+        connections[scheme, netloc] = connection
+        with self._lock:
+            self._connections.append(connection)
+        return connection, False
+
+    def _drop_connection(self, scheme, netloc):
+        """Close this thread's connection to the server (PRIVATE)."""
+        connections = self._local.__dict__.get("connections", {})
+        connection = connections.pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+
+
+class AsyncSession:
+    """Asynchronous session sending requests to the NCBI Entrez Utilities.
+
+    This class provides the same methods as ``Session``, taking the same
+    arguments, but as coroutines for use with ``asyncio``. While waiting
+    for the rate limiter, the event loop is free to run other tasks; the
+    requests themselves are sent from worker threads, each using its own
+    keep-alive connection. For example, to search several databases
+    concurrently::
+
+        import asyncio
+        from Bio import Entrez
+
+        async def count(session, databases, term):
+            handles = await asyncio.gather(
+                *[session.esearch(db=db, term=term) for db in databases]
+            )
+            return [Entrez.read(handle)["Count"] for handle in handles]
+
+        async def main():
+            async with Entrez.AsyncSession(email="A.N.Other@example.com") as session:
+                return await count(session, ["pubmed", "nucleotide"], "biopython")
+
+        print(asyncio.run(main()))
+
+    The keyword arguments are passed to ``Session``; the synchronous
+    session used internally is available as the ``session`` attribute.
+    """
+
+    def __init__(self, **keywds):
+        """Initialize the session; the arguments are as for ``Session``."""
+        self.session = Session(**keywds)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close all connections opened by this session."""
+        self.session.close()
+
+    async def epost(self, db, **keywds):
+        """Post a file of identifiers for future use; see ``Bio.Entrez.epost``."""
+        return await self._open(self.session._prepare("epost", {"db": db, **keywds}))
+
+    async def efetch(self, db, **keywds):
+        """Fetch Entrez results; see ``Bio.Entrez.efetch``."""
+        return await self._open(self.session._prepare("efetch", {"db": db, **keywds}))
+
+    async def esearch(self, db, term, **keywds):
+        """Run an Entrez search; see ``Bio.Entrez.esearch``."""
+        params = {"db": db, "term": term, **keywds}
+        return await self._open(self.session._prepare("esearch", params))
+
+    async def elink(self, **keywds):
+        """Check for linked external articles; see ``Bio.Entrez.elink``."""
+        return await self._open(self.session._prepare("elink", keywds))
+
+    async def einfo(self, **keywds):
+        """Return a summary of the Entrez databases; see ``Bio.Entrez.einfo``."""
+        return await self._open(self.session._prepare("einfo", keywds))
+
+    async def esummary(self, **keywds):
+        """Retrieve document summaries; see ``Bio.Entrez.esummary``."""
+        return await self._open(self.session._prepare("esummary", keywds))
+
+    async def espell(self, **keywds):
+        """Retrieve spelling suggestions; see ``Bio.Entrez.espell``."""
+        return await self._open(self.session._prepare("espell", keywds))
+
+    async def ecitmatch(self, **keywds):
+        """Retrieve PMIDs for input citation strings; see ``Bio.Entrez.ecitmatch``."""
+        return await self._open(self.session._prepare("ecitmatch", keywds))
+
+    async def efetch_batches(self, db, id=None, batch_size=None, **keywds):
+        """Fetch a long list of records in batches; see ``Session.efetch_batches``.
+
+        This is an asynchronous generator, to be used with ``async for``.
+        """
+        if batch_size is None:
+            batch_size = self.session.batch_size
+        if id is None:
+            webenv, query_key, count = self.session._post_ids(db, id, keywds)
+        else:
+            ids = Entrez._format_ids(id).split(",")
+            handle = await self.epost(db, id=ids)
+            record = Entrez.read(handle)
+            handle.close()
+            webenv, query_key, count = record["WebEnv"], record["QueryKey"], len(ids)
+        for start in range(0, count, batch_size):
+            params = dict(keywds)
+            params.update(
+                db=db,
+                webenv=webenv,
+                query_key=query_key,
+                retstart=start,
+                retmax=batch_size,
+            )
+            yield await self._open(self.session._prepare("efetch", params))
+
+    async def _open(self, request):
+        """Send the request and return a handle to the response (PRIVATE)."""
+        handle = self.session._read_cache(request)
+        if handle is not None:
+            return handle
+        wait = self.session.limiter.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return await asyncio.to_thread(self.session._send, request)
+
+
+def _make_handle(data, subtype, url):
+    """Return a handle to the response data, as Bio.Entrez._open does (PRIVATE)."""
+    handle = io.BytesIO(data)
+    if subtype == "plain":
+        handle = io.TextIOWrapper(handle, encoding="UTF-8")
+    handle.url = url
+    return handle
@@ -17,6 +17,7 @@ import itertools
 import os
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     import sqlite3
@@ -25,6 +26,10 @@ except ImportError:
     sqlite3 = None  # type: ignore
 
 
+# Maximum number of bytes of an SQLite index file that is memory mapped
+_MMAP_SIZE = 2**30
+
+
 @contextlib.contextmanager
 def as_handle(handleish, mode="r", **kwargs):
     r"""Context manager to ensure we are using a handle.
@@ -264,6 +269,18 @@ class _IndexedSeqFileDict(collections.abc.Mapping):
         self._proxy._handle.close()
 
 
+def _index_file(proxy_factory, fmt, filename):
+    """Return the keys, offsets, and lengths of the records in a file (PRIVATE).
+
+    This is used to index files in separate processes.
+    """
+    random_access_proxy = proxy_factory(fmt, filename)
+    try:
+        return list(random_access_proxy)
+    finally:
+        random_access_proxy._handle.close()
+
+
 class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
     """Read only dictionary interface to many sequential record files.
 
@@ -277,6 +294,10 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
     There are OS limits on the number of files that can be open at once,
     so a pool are kept. If a record is required from a closed file, then
     one of the open handles is closed first.
+
+    When building a new index with more than one worker, the files are
+    indexed in separate processes, which requires a picklable proxy factory.
+    The offsets are then inserted into the database in a single transaction.
     """
 
     def __init__(
@@ -288,6 +309,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         key_function,
         repr,
         max_open=10,
+        workers=1,
     ):
         """Initialize the class."""
         # TODO? - Don't keep filename list in memory (just in DB)?
@@ -313,6 +335,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         self._proxy_factory = proxy_factory
         self._repr = repr
         self._max_open = max_open
+        self._workers = workers
         self._proxies = {}
 
         # Note if using SQLite :memory: trick index filename, this will
@@ -334,6 +357,8 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
 
         con = sqlite3.dbapi2.connect(index_filename, check_same_thread=False)
         self._con = con
+        # Memory map the database file for faster look ups
+        con.execute("PRAGMA mmap_size=%i" % _MMAP_SIZE)
         # Check the count...
         try:
             (count,) = con.execute(
@@ -450,6 +475,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         # Sqlite PRAGMA settings for speed
         con.execute("PRAGMA synchronous=OFF")
         con.execute("PRAGMA locking_mode=EXCLUSIVE")
+        con.execute("PRAGMA mmap_size=%i" % _MMAP_SIZE)
         # Don't index the key column until the end (faster)
         # con.execute("CREATE TABLE offset_data (key TEXT PRIMARY KEY, "
         #             "offset INTEGER);")
@@ -466,6 +492,20 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             "CREATE TABLE offset_data (key TEXT, "
             "file_number INTEGER, offset INTEGER, length INTEGER);"
         )
+        workers = self._workers
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(filenames))
+        if workers > 1:
+            executor = ProcessPoolExecutor(workers)
+            results = executor.map(
+                _index_file,
+                itertools.repeat(proxy_factory),
+                itertools.repeat(fmt),
+                filenames,
+            )
+        else:
+            executor = None
         count = 0
         for file_index, filename in enumerate(filenames):
             # Default to storing as an absolute path,
@@ -489,19 +529,31 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
                 "INSERT INTO file_data (file_number, name) VALUES (?,?);",
                 (file_index, f),
             )
-            random_access_proxy = proxy_factory(fmt, filename)
+            if executor is None:
+                random_access_proxy = proxy_factory(fmt, filename)
+                offsets = random_access_proxy
+            else:
+                random_access_proxy = None
+                try:
+                    offsets = next(results)
+                except BaseException:
+                    executor.shutdown(cancel_futures=True)
+                    con.close()
+                    raise
             if key_function:
                 offset_iter = (
                     (key_function(key), file_index, offset, length)
-                    for (key, offset, length) in random_access_proxy
+                    for (key, offset, length) in offsets
                 )
             else:
                 offset_iter = (
                     (key, file_index, offset, length)
-                    for (key, offset, length) in random_access_proxy
+                    for (key, offset, length) in offsets
                 )
+            # All offsets are inserted in a single transaction, committed
+            # once all files have been indexed
             while True:
-                batch = list(itertools.islice(offset_iter, 100))
+                batch = list(itertools.islice(offset_iter, 10000))
                 if not batch:
                     break
                 # print("Inserting batch of %i offsets, %s ... %s"
@@ -510,12 +562,14 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
                     "INSERT INTO offset_data (key,file_number,offset,length) VALUES (?,?,?,?);",
                     batch,
                 )
-                con.commit()
                 count += len(batch)
-            if len(random_access_proxies) < max_open:
-                random_access_proxies[file_index] = random_access_proxy
-            else:
-                random_access_proxy._handle.close()
+            if random_access_proxy is not None:
+                if len(random_access_proxies) < max_open:
+                    random_access_proxies[file_index] = random_access_proxy
+                else:
+                    random_access_proxy._handle.close()
+        if executor is not None:
+            executor.shutdown()
         self._length = count
         # print("About to index %i entries" % count)
         try:
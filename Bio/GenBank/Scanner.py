@@ -32,10 +32,12 @@ import re
 import sys
 import warnings
 from collections import defaultdict
+from io import StringIO
 
 from Bio import BiopythonParserWarning
 from Bio.File import as_handle
 from Bio.Seq import Seq
+from Bio.SeqRecord import _RestrictedDict
 from Bio.SeqRecord import SeqRecord
 
 
@@ -144,6 +146,50 @@ class InsdcScanner:
         self.line = line
         return header_lines
 
+    def _read_record(self):
+        """Read the next record, finding the ends of its header and features (PRIVATE).
+
+        Returns a tuple with the text of the record, the end of the header,
+        and the end of the feature table (both as offsets in the text), or
+        None at the end of the file.
+        """
+        line = self.find_start()
+        if line is None:
+            return None
+        lines = [line]
+        size = len(line)
+        header_end = features_end = None
+        readline = self.handle.readline
+        while True:
+            line = readline()
+            if not line:
+                if features_end is None:
+                    raise ValueError("Premature end of file")
+                # Let parse_footer deal with the missing // marker
+                break
+            stripped = line.rstrip()
+            if features_end is not None:
+                if stripped == "//":
+                    lines.append(line)
+                    break
+            elif header_end is None:
+                if stripped in self.FEATURE_START_MARKERS:
+                    header_end = size
+                elif line[: self.HEADER_WIDTH].rstrip() in self.SEQUENCE_HEADERS:
+                    header_end = features_end = size
+                elif stripped == "//":
+                    raise ValueError("Premature end of sequence data marker '//' found")
+            elif line[: self.HEADER_WIDTH].rstrip() in self.SEQUENCE_HEADERS:
+                features_end = size
+            elif stripped in self.FEATURE_END_MARKERS:
+                features_end = size + len(line)
+            elif stripped == "//":
+                raise ValueError("Premature end of features table, marker '//' found")
+            lines.append(line)
+            size += len(line)
+        self.line = "//"
+        return "".join(lines), header_end, features_end
+
     def parse_features(self, skip=False):
         """Return list of tuples for the features (if present).
 
@@ -481,36 +527,63 @@ class InsdcScanner:
         # And we are done
         return True
 
-    def parse(self, handle, do_features=True):
+    def parse(self, handle, do_features=True, compact_features=False):
         """Return a SeqRecord (with SeqFeatures if do_features=True).
 
+        If compact_features=True, the features are stored in a FeatureTable,
+        which creates each SeqFeature object only when it is accessed.
+
         See also the method parse_records() for use on multi-record files.
         """
+        from Bio.GenBank import _CompactFeatureConsumer
         from Bio.GenBank import _FeatureConsumer
         from Bio.GenBank.utils import FeatureValueCleaner
 
-        consumer = _FeatureConsumer(
-            use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
-        )
+        if compact_features:
+            consumer = _CompactFeatureConsumer(
+                use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
+            )
+        else:
+            consumer = _FeatureConsumer(
+                use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
+            )
 
         if self.feed(handle, consumer, do_features):
             return consumer.data
         else:
             return None
 
-    def parse_records(self, handle, do_features=True):
+    def parse_records(
+        self, handle, do_features=True, compact_features=False, lazy=False
+    ):
         """Parse records, return a SeqRecord object iterator.
 
         Each record (from the ID/LOCUS line to the // line) becomes a SeqRecord
 
-        The SeqRecord objects include SeqFeatures if do_features=True
+        The SeqRecord objects include SeqFeatures if do_features=True, stored
+        in a FeatureTable if compact_features=True.
+
+        If lazy=True, the text of each record is only split into the header,
+        the feature table, and the footer with the sequence. Each part is then
+        parsed when one of its attributes is first accessed; the annotations
+        require both the header and the footer.
 
         This method is intended for use in Bio.SeqIO
         """
         # This is a generator function
         with as_handle(handle) as handle:
+            if lazy:
+                self.set_handle(handle)
+                while True:
+                    sections = self._read_record()
+                    if sections is None:
+                        break
+                    yield _LazyRecord._from_text(
+                        type(self), *sections, do_features, compact_features
+                    )
+                return
             while True:
-                record = self.parse(handle, do_features)
+                record = self.parse(handle, do_features, compact_features)
                 if record is None:
                     break
                 if record.id is None:
@@ -617,6 +690,151 @@ class InsdcScanner:
                         yield record
 
 
+class _LazyRecord(SeqRecord):
+    """SeqRecord parsing each part of a GenBank or EMBL record when needed (PRIVATE).
+
+    The header (with the id, name, description, and dbxrefs), the feature
+    table, and the footer (with the sequence) are parsed when one of their
+    attributes is first accessed. As the footer can also contain annotations
+    (such as the CONTIG line), the annotations are available after parsing
+    both the header and the footer.
+    """
+
+    _sections = {
+        "id": "header",
+        "name": "header",
+        "description": "header",
+        "dbxrefs": "header",
+        "features": "features",
+        "annotations": "footer",
+        "_seq": "footer",
+        "_per_letter_annotations": "footer",
+    }
+
+    @classmethod
+    def _from_text(
+        cls, scanner, text, header_end, features_end, do_features, compact_features
+    ):
+        """Store the text of the record, and the ends of its header and features.
+
+        This does not call SeqRecord.__init__, as the attributes are set when
+        they are first accessed.
+        """
+        record = cls.__new__(cls)
+        record._scanner = scanner
+        record._text = text
+        record._header_end = header_end
+        record._features_end = features_end
+        record._do_features = do_features
+        record._compact_features = compact_features
+        record._consumer = None
+        record._parsed = set()
+        return record
+
+    def __getattr__(self, name):
+        """Parse the part of the record containing the attribute (PRIVATE)."""
+        section = _LazyRecord._sections.get(name)
+        if section is None or "_parsed" not in self.__dict__:
+            # Records created by SeqRecord methods have all attributes
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        self._parse_header()
+        if section == "features":
+            self._parse_features()
+        elif section == "footer":
+            self._parse_footer()
+        return self.__dict__[name]
+
+    def _section(self, start, end):
+        """Return a handle to the text from start to the line after end (PRIVATE)."""
+        text = self._text
+        end = text.find("\n", end) + 1 or len(text)
+        return StringIO(text[start:end])
+
+    def _release(self):
+        """Release the text of the record once all parts are parsed (PRIVATE)."""
+        if len(self._parsed) == 3:
+            del self._text
+            del self._consumer
+
+    def _parse_header(self):
+        """Parse the header of the record (PRIVATE)."""
+        if "header" in self._parsed:
+            return
+        from Bio.GenBank import _CompactFeatureConsumer
+        from Bio.GenBank import _FeatureConsumer
+        from Bio.GenBank.utils import FeatureValueCleaner
+
+        if self._compact_features:
+            consumer = _CompactFeatureConsumer(
+                use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
+            )
+        else:
+            consumer = _FeatureConsumer(
+                use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
+            )
+        scanner = self._scanner()
+        scanner.set_handle(self._section(0, self._header_end))
+        scanner.find_start()
+        scanner._feed_first_line(consumer, scanner.line)
+        scanner._feed_header_lines(consumer, scanner.parse_header())
+        consumer.start_feature_table()
+        consumer._finish_header()
+        record = consumer.data
+        if record.id is None:
+            raise ValueError("Failed to parse the record's ID. Invalid ID line?")
+        if record.name == "<unknown name>":
+            raise ValueError("Failed to parse the record's name. Invalid ID line?")
+        if record.description == "<unknown description>":
+            raise ValueError("Failed to parse the record's description")
+        self._consumer = consumer
+        for name in ("id", "name", "description", "dbxrefs"):
+            self.__dict__.setdefault(name, getattr(record, name))
+        self._parsed.add("header")
+        self._release()
+
+    def _parse_features(self):
+        """Parse the feature table of the record (PRIVATE)."""
+        if "features" in self._parsed:
+            return
+        consumer = self._consumer
+        if self._do_features and self._header_end < self._features_end:
+            scanner = self._scanner()
+            handle = self._section(self._header_end, self._features_end)
+            scanner.set_handle(handle)
+            scanner.line = handle.readline()
+            scanner._feed_feature_table(consumer, scanner.parse_features())
+        self.__dict__.setdefault("features", consumer.data.features)
+        self._parsed.add("features")
+        self._release()
+
+    def _parse_footer(self):
+        """Parse the footer of the record, including the sequence (PRIVATE)."""
+        if "footer" in self._parsed:
+            return
+        consumer = self._consumer
+        scanner = self._scanner()
+        handle = StringIO(self._text[self._features_end :])
+        scanner.set_handle(handle)
+        line = handle.readline()
+        if self._header_end == self._features_end:
+            # Without a feature table, parse_header leaves the line stripped
+            line = line.rstrip()
+        scanner.line = line
+        misc_lines, sequence_string = scanner.parse_footer()
+        scanner._feed_misc_lines(consumer, misc_lines)
+        consumer.sequence(sequence_string)
+        consumer._finish_sequence()
+        record = consumer.data
+        self.__dict__.setdefault("annotations", record.annotations)
+        if "_seq" not in self.__dict__:
+            self._seq = record.seq
+            self._per_letter_annotations = _RestrictedDict(length=len(record.seq))
+        self._parsed.add("footer")
+        self._release()
+
+
 class EmblScanner(InsdcScanner):
     """For extracting chunks of information in EMBL files."""
 
@@ -42,6 +42,7 @@ import warnings
 
 from Bio import BiopythonParserWarning
 from Bio.Seq import Seq
+from Bio.SeqFeature import FeatureTable
 from Bio.SeqFeature import Location
 from Bio.SeqFeature import LocationParserError
 from Bio.SeqFeature import Reference
@@ -293,6 +294,46 @@ class _BaseGenBankConsumer:
         return new_start, new_end
 
 
+def _add_qualifier(qualifiers, key, value, feature_cleaner):
+    """Add a qualifier key and its value to the qualifiers dictionary (PRIVATE).
+
+    Can receive None, since you can have valueless keys such as /pseudo
+    """
+    # Hack to try to preserve historical behaviour of /pseudo etc
+    if value is None:
+        # if the key doesn't exist yet, add an empty string
+        if key not in qualifiers:
+            qualifiers[key] = [""]
+            return
+        # otherwise just skip this key
+        return
+
+    # Remove enclosing quotation marks
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+        value = value[1:-1]
+
+    # Handle NCBI escaping
+    # Warn if escaping is not according to standard
+    if re.search(r'[^"]"[^"]|^"[^"]|[^"]"$', value):
+        warnings.warn(
+            'The NCBI states double-quote characters like " should be escaped as "" '
+            "(two double - quotes), but here it was not: %r" % value,
+            BiopythonParserWarning,
+        )
+    # Undo escaping, repeated double quotes -> one double quote
+    value = value.replace('""', '"')
+
+    if feature_cleaner is not None:
+        value = feature_cleaner.clean_value(key, value)
+
+    # if the qualifier name exists, append the value
+    if key in qualifiers:
+        qualifiers[key].append(value)
+    # otherwise start a new list of the key with its values
+    else:
+        qualifiers[key] = [value]
+
+
 class _FeatureConsumer(_BaseGenBankConsumer):
     """Create a SeqRecord object with Features to return (PRIVATE).
 
@@ -700,6 +741,11 @@ class _FeatureConsumer(_BaseGenBankConsumer):
         This uses simple Python code with some regular expressions to do the
         parsing, and then translates the results into appropriate objects.
         """
+        location_line = self._location_line(content)
+        self._cur_feature.location = self._parse_location(location_line)
+
+    def _location_line(self, content):
+        """Clean up the location string before parsing it (PRIVATE)."""
         # clean up newlines and other whitespace inside the location before
         # parsing - locations should have no whitespace whatsoever
         location_line = self._clean_location(content)
@@ -712,12 +758,19 @@ class _FeatureConsumer(_BaseGenBankConsumer):
         if "replace" in location_line:
             comma_pos = location_line.find(",")
             location_line = location_line[8:comma_pos]
+        return location_line
 
+    def _location_arguments(self):
+        """Return the sequence length, topology, and strandedness (PRIVATE)."""
         length = self._expected_size
         # Check if the sequence is circular for features that span the origin
         is_circular = "circular" in self.data.annotations.get("topology", "").lower()
         stranded = "PROTEIN" not in self._seq_type.upper()
+        return length, is_circular, stranded
 
+    def _parse_location(self, location_line):
+        """Parse the cleaned location string, returning None on failure (PRIVATE)."""
+        length, is_circular, stranded = self._location_arguments()
         try:
             location = Location.fromstring(location_line, length, is_circular, stranded)
         except LocationParserError as e:
@@ -725,46 +778,14 @@ class _FeatureConsumer(_BaseGenBankConsumer):
                 f"{e}; setting feature location to None.", BiopythonParserWarning
             )
             location = None
-        self._cur_feature.location = location
+        return location
 
     def feature_qualifier(self, key, value):
         """When we get a qualifier key and its value.
 
         Can receive None, since you can have valueless keys such as /pseudo
         """
-        # Hack to try to preserve historical behaviour of /pseudo etc
-        if value is None:
-            # if the key doesn't exist yet, add an empty string
-            if key not in self._cur_feature.qualifiers:
-                self._cur_feature.qualifiers[key] = [""]
-                return
-            # otherwise just skip this key
-            return
-
-        # Remove enclosing quotation marks
-        if len(value) > 1 and value[0] == '"' and value[-1] == '"':
-            value = value[1:-1]
-
-        # Handle NCBI escaping
-        # Warn if escaping is not according to standard
-        if re.search(r'[^"]"[^"]|^"[^"]|[^"]"$', value):
-            warnings.warn(
-                'The NCBI states double-quote characters like " should be escaped as "" '
-                "(two double - quotes), but here it was not: %r" % value,
-                BiopythonParserWarning,
-            )
-        # Undo escaping, repeated double quotes -> one double quote
-        value = value.replace('""', '"')
-
-        if self._feature_cleaner is not None:
-            value = self._feature_cleaner.clean_value(key, value)
-
-        # if the qualifier name exists, append the value
-        if key in self._cur_feature.qualifiers:
-            self._cur_feature.qualifiers[key].append(value)
-        # otherwise start a new list of the key with its values
-        else:
-            self._cur_feature.qualifiers[key] = [value]
+        _add_qualifier(self._cur_feature.qualifiers, key, value, self._feature_cleaner)
 
     def feature_qualifier_name(self, content_list):
         """Use feature_qualifier instead (OBSOLETE)."""
@@ -814,6 +835,11 @@ class _FeatureConsumer(_BaseGenBankConsumer):
 
     def record_end(self, content):
         """Clean up when we've finished the record."""
+        self._finish_header()
+        self._finish_sequence()
+
+    def _finish_header(self):
+        """Set the record id and molecule type from the header data (PRIVATE)."""
         # Try and append the version number to the accession for the full id
         if not self.data.id:
             if "accessions" in self.data.annotations:
@@ -828,21 +854,6 @@ class _FeatureConsumer(_BaseGenBankConsumer):
             except KeyError:
                 pass
 
-        # add the sequence information
-
-        sequence = "".join(self._seq_data)
-
-        if (
-            self._expected_size is not None
-            and len(sequence) != 0
-            and self._expected_size != len(sequence)
-        ):
-            warnings.warn(
-                "Expected sequence length %i, found %i (%s)."
-                % (self._expected_size, len(sequence), self.data.id),
-                BiopythonParserWarning,
-            )
-
         molecule_type = None
         if self._seq_type:
             # mRNA is really also DNA, since it is actually cDNA
@@ -871,12 +882,91 @@ class _FeatureConsumer(_BaseGenBankConsumer):
             self.data.annotations["molecule_type"] = self.data.annotations.get(
                 "molecule_type", molecule_type
             )
+
+    def _finish_sequence(self):
+        """Add the sequence information to the record (PRIVATE)."""
+        sequence = "".join(self._seq_data)
+
+        if (
+            self._expected_size is not None
+            and len(sequence) != 0
+            and self._expected_size != len(sequence)
+        ):
+            warnings.warn(
+                "Expected sequence length %i, found %i (%s)."
+                % (self._expected_size, len(sequence), self.data.id),
+                BiopythonParserWarning,
+            )
+
         if not sequence and self._expected_size:
             self.data.seq = Seq(None, length=self._expected_size)
         else:
             self.data.seq = Seq(sequence)
 
 
+class _FeatureLoader:
+    """Create a SeqFeature from the data stored by _CompactFeatureConsumer (PRIVATE)."""
+
+    def __init__(self, length, is_circular, stranded, feature_cleaner):
+        self.length = length
+        self.is_circular = is_circular
+        self.stranded = stranded
+        self.feature_cleaner = feature_cleaner
+
+    def __call__(self, data):
+        key, location_line, qualifiers = data
+        feature = SeqFeature(type=key)
+        if location_line is not None:
+            feature.location = Location.fromstring(
+                location_line, self.length, self.is_circular, self.stranded
+            )
+        for q_key, q_value in qualifiers:
+            _add_qualifier(feature.qualifiers, q_key, q_value, self.feature_cleaner)
+        return feature
+
+
+class _CompactFeatureConsumer(_FeatureConsumer):
+    """Create a SeqRecord object storing its features in a FeatureTable (PRIVATE).
+
+    For each feature, only the feature key, the location string, and the
+    qualifier keys and values are stored. The SeqFeature object is created
+    when the feature is first accessed.
+    """
+
+    def start_feature_table(self):
+        """Indicate we've got to the start of the feature table."""
+        _FeatureConsumer.start_feature_table(self)
+        if not isinstance(self.data.features, FeatureTable):
+            length, is_circular, stranded = self._location_arguments()
+            loader = _FeatureLoader(
+                length, is_circular, stranded, self._feature_cleaner
+            )
+            self.data.features = FeatureTable(loader=loader)
+
+    def feature_key(self, content):
+        self._cur_feature = content
+
+    def location(self, content):
+        """Store the location string, and the span of the location."""
+        key = self._cur_feature
+        location_line = self._location_line(content)
+        location = self._parse_location(location_line)
+        if location is None:
+            location_line = None
+            start = end = strand = None
+        else:
+            start = location.start
+            end = location.end
+            strand = location.strand
+        self._cur_feature = []
+        data = (key, location_line, self._cur_feature)
+        self.data.features.append_lazy(data, key, start, end, strand)
+
+    def feature_qualifier(self, key, value):
+        """Store the qualifier key and its value."""
+        self._cur_feature.append((key, value))
+
+
 class _RecordConsumer(_BaseGenBankConsumer):
     """Create a GenBank Record object from scanner generated information (PRIVATE)."""
 
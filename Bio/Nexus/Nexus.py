@@ -19,6 +19,8 @@ import sys
 import warnings
 from functools import reduce
 
+import numpy as np
+
 from Bio import BiopythonWarning
 from Bio import File
 from Bio.Data import IUPACData
@@ -327,11 +329,91 @@ def _unique_label(previous_labels, label):
     return label
 
 
+def _split_taxon_name(line):
+    """Split a row of the MATRIX command into the taxon name and the rest (PRIVATE).
+
+    Only the taxon name is passed to CharBuffer, as it would copy the
+    characters of long sequences into a list.
+    """
+    quote = line[0]
+    if quote == "'" or quote == '"':
+        # find the closing quote, skipping doubled quotes
+        end = 1
+        while True:
+            end = line.find(quote, end) + 1
+            if end == 0 or line[end : end + 1] != quote:
+                break
+            end += 1
+        name = line[:end] if end else line
+    else:
+        name = line.split(None, 1)[0]
+    linechars = CharBuffer(name)
+    word = linechars.next_word()
+    return quotestrip(word), line[len(name) - len(linechars.buffer) :]
+
+
 def _seqmatrix2strmatrix(matrix):
     """Convert a Seq-object matrix to a plain sequence-string matrix (PRIVATE)."""
     return {t: str(matrix[t]) for t in matrix}
 
 
+def _array2seqs(array):
+    """Convert the rows of a uint8 character array into Seq objects (PRIVATE)."""
+    return [Seq(row.tobytes()) for row in array]
+
+
+def _wrap_characters(characters, width):
+    """Return a uint8 character array as lines of the given width (PRIVATE)."""
+    nlines, remainder = divmod(len(characters), width)
+    lines = np.empty((nlines, width + 1), np.uint8)
+    lines[:, :-1] = characters[: nlines * width].reshape(nlines, width)
+    lines[:, -1] = ord("\n")
+    text = lines.tobytes().decode()
+    if remainder:
+        text += characters[nlines * width :].tobytes().decode() + "\n"
+    return text
+
+
+def _format_blocks(labels, array, blocksize):
+    """Format a uint8 character array as interleaved blocks of text (PRIVATE).
+
+    The number of characters in the array must be a multiple of blocksize.
+    The labels are passed as an array of Unicode code points, with one row
+    for each row of the character array. Each block ends with an empty line.
+    """
+    ntax, nchar = array.shape
+    nblocks = nchar // blocksize
+    width = labels.shape[1]
+    lines = np.empty((nblocks, ntax, width + blocksize + 1), np.uint32)
+    lines[:, :, :width] = labels
+    lines[:, :, width:-1] = array.reshape(ntax, nblocks, blocksize).swapaxes(0, 1)
+    lines[:, :, -1] = ord("\n")
+    text = np.empty((nblocks, lines[0].size + 1), np.uint32)
+    text[:, :-1] = lines.reshape(nblocks, -1)
+    text[:, -1] = ord("\n")
+    return str(text.reshape(-1).view(f"U{text.size}")[0])
+
+
+def _write_interleaved(fh, labels, array, blocksize):
+    """Write a uint8 character array as interleaved blocks (PRIVATE).
+
+    The text of many blocks is formatted at once with NumPy, instead of line
+    by line, which matters for matrices with millions of characters.
+    """
+    ntax, nchar = array.shape
+    labels = np.array([[ord(c) for c in label] for label in labels], np.uint32)
+    nblocks = nchar // blocksize
+    # limit the memory used for the text of the blocks
+    step = max(1, 2**20 // (ntax * blocksize))
+    for start in range(0, nblocks, step):
+        stop = min(start + step, nblocks)
+        block = array[:, start * blocksize : stop * blocksize]
+        fh.write(_format_blocks(labels, block, blocksize))
+    if nchar > nblocks * blocksize:
+        block = array[:, nblocks * blocksize :]
+        fh.write(_format_blocks(labels, block, block.shape[1]))
+
+
 def _compact4nexus(orig_list):
     r"""Compact lists for Nexus output (PRIVATE).
 
@@ -975,27 +1057,21 @@ class Nexus:
         # print("Command statelabels is not supported and will be ignored.")
         pass
 
-    def _matrix(self, options):
-        """Create a matrix for NEXUS object (PRIVATE)."""
-        if not self.ntax or not self.nchar:
-            raise NexusError("Dimensions must be specified before matrix!")
-        self.matrix = {}
+    def _get_matrix_rows(self, options):
+        """Iterate over the rows of the MATRIX command (PRIVATE).
+
+        Yield a tuple (taxcount, first_matrix_block, id, chars) for each row,
+        where taxcount is the position of the taxon in its block of an
+        interleaved matrix, and chars is the character data without
+        whitespace.
+        """
         taxcount = 0
         first_matrix_block = True
 
         # eliminate empty lines and leading/trailing whitespace
         lines = [_.strip() for _ in options.split("\n") if _.strip() != ""]
         lineiter = iter(lines)
-        while True:
-            try:
-                line = next(lineiter)
-            except StopIteration:
-                if taxcount < self.ntax:
-                    raise NexusError("Not enough taxa in matrix.") from None
-                elif taxcount > self.ntax:
-                    raise NexusError("Too many taxa in matrix.") from None
-                else:
-                    break
+        for line in lineiter:
             # count the taxa and check for interleaved matrix
             taxcount += 1
             if taxcount > self.ntax:
@@ -1007,66 +1083,143 @@ class Nexus:
                     taxcount = 1
                     first_matrix_block = False
             # get taxon name and sequence
-            linechars = CharBuffer(line)
-            id = quotestrip(linechars.next_word())
-            line = linechars.rest().strip()
-            chars = ""
+            id, line = _split_taxon_name(line)
             if self.interleave:
                 # interleaved matrix
-                if line:
-                    chars = "".join(line.split())
-                else:
-                    chars = "".join(next(lineiter).split())
+                if not line:
+                    line = next(lineiter, None)
+                    if line is None:
+                        raise NexusError(f"No characters found for taxon {id}")
+                chars = "".join(line.split())
             else:
                 # non-interleaved matrix
-                chars = "".join(line.split())
-                while len(chars) < self.nchar:
-                    line = next(lineiter)
-                    chars += "".join(line.split())
-
-            # Reformat sequence for non-standard datatypes
-            if self.datatype != "standard":
-                iupac_seq = Seq(
-                    _replace_parenthesized_ambigs(chars, self.rev_ambiguous_values)
+                chars = ["".join(line.split())]
+                length = len(chars[0])
+                while length < self.nchar:
+                    line = next(lineiter, None)
+                    if line is None:
+                        break
+                    line = "".join(line.split())
+                    chars.append(line)
+                    length += len(line)
+                chars = "".join(chars)
+            yield taxcount, first_matrix_block, id, chars
+        if taxcount < self.ntax:
+            raise NexusError("Not enough taxa in matrix.")
+
+    def _matrix(self, options):
+        """Create a matrix for NEXUS object (PRIVATE)."""
+        if not self.ntax or not self.nchar:
+            raise NexusError("Dimensions must be specified before matrix!")
+        if self.datatype == "standard":
+            self._standard_matrix(options)
+        else:
+            self._sequence_matrix(options)
+        # check all sequences for length according to nchar
+        for taxon in self.matrix:
+            if len(self.matrix[taxon]) != self.nchar:
+                raise NexusError(
+                    "Matrix Nchar %d does not match data length (%d) for taxon %s"
+                    % (self.nchar, len(self.matrix[taxon]), taxon)
                 )
-                # first taxon has the reference sequence if matchhar is used
-                if taxcount == 1:
-                    refseq = iupac_seq
-                else:
-                    if self.matchchar:
-                        while True:
-                            p = iupac_seq.find(self.matchchar)
-                            if p == -1:
-                                break
-                            iupac_seq = Seq(
-                                iupac_seq[:p] + refseq[p] + iupac_seq[p + 1 :]
-                            )
+        # check that taxlabels is identical with matrix.keys. If not, it's a problem
+        matrixkeys = sorted(self.matrix)
+        taxlabelssort = sorted(self.taxlabels[:])
+        if matrixkeys != taxlabelssort:
+            raise ValueError(
+                "ERROR: TAXLABELS must be identical with MATRIX. "
+                "Please Report this as a bug, and send in data file."
+            )
 
-                # Check for invalid characters
-                for i, c in enumerate(iupac_seq):
-                    if (
-                        c not in self.valid_characters
-                        and c != self.gap
-                        and c != self.missing
-                    ):
-                        raise NexusError(
-                            "Taxon %s: Illegal character %s in sequence %s "
-                            "(check dimensions/interleaving)" % (id, c, iupac_seq)
-                        )
+    def _sequence_matrix(self, options):
+        """Create a matrix of Seq objects for non-standard datatypes (PRIVATE).
+
+        The characters are checked for all taxa at once using NumPy, so that
+        matrices with millions of characters can be parsed quickly.
+        """
+        ids = []
+        rows = []
+        nextaxa = None
+        for taxcount, first_matrix_block, id, chars in self._get_matrix_rows(options):
+            if "(" in chars:
+                chars = _replace_parenthesized_ambigs(chars, self.rev_ambiguous_values)
+            if first_matrix_block:
+                self.unaltered_taxlabels.append(id)
+                id = _unique_label(ids, id)
+                ids.append(id)
+                rows.append([chars])
+                self.taxlabels.append(id)
             else:
-                iupac_seq = StandardData(chars)
-
-                # Check for invalid characters
-                for i, c in enumerate(iupac_seq):
-                    # Go through each coding for each character
-                    for coding in c["d"]:
-                        if coding not in self.valid_characters:
-                            if coding != self.gap and coding != self.missing:
-                                raise NexusError(
-                                    "Taxon %s: Illegal character %s in sequence %s "
-                                    "(check dimensions/interleaving)"
-                                    % (id, coding, iupac_seq)
-                                )
+                if nextaxa is None:
+                    # According to NEXUS standard, underscores shall be
+                    # treated as spaces (see _check_taxlabels)
+                    nextaxa = {t.replace(" ", "_"): t for t in self.taxlabels}
+                    indices = {t: i for i, t in enumerate(ids)}
+                # taxon names need to be in the same order in each interleaved block
+                id = _unique_label(self.taxlabels[: taxcount - 1], id)
+                taxon_present = nextaxa.get(id.replace(" ", "_"))
+                if taxon_present in indices:
+                    rows[indices[taxon_present]].append(chars)
+                else:
+                    raise NexusError(
+                        "Taxon %s not in first block of interleaved "
+                        "matrix. Check matrix dimensions and interleave." % id
+                    )
+        valid = np.zeros(256, bool)
+        characters = self.valid_characters
+        for c in (self.gap, self.missing):
+            if c:
+                characters += c
+        valid[np.frombuffer(characters.encode("ascii", "ignore"), np.uint8)] = True
+        matchchar = self.matchchar and ord(self.matchchar)
+        self.matrix = {}
+        refseq = None
+        for id, chars in zip(ids, rows):
+            chars = "".join(chars)
+            try:
+                data = chars.encode("ascii")
+            except UnicodeEncodeError as exception:
+                c = chars[exception.start]
+                raise NexusError(
+                    "Taxon %s: Illegal character %s in sequence %s "
+                    "(check dimensions/interleaving)" % (id, c, chars)
+                ) from None
+            sequence = np.frombuffer(data, np.uint8)
+            # first taxon has the reference sequence if matchchar is used
+            if refseq is None:
+                refseq = sequence
+            elif matchchar and len(sequence) == len(refseq):
+                matches = sequence == matchchar
+                if matches.any():
+                    sequence = np.where(matches, refseq, sequence)
+                    data = sequence.tobytes()
+            # Check for invalid characters
+            invalid = ~valid[sequence]
+            if invalid.any():
+                c = chr(sequence[invalid.argmax()])
+                raise NexusError(
+                    "Taxon %s: Illegal character %s in sequence %s "
+                    "(check dimensions/interleaving)" % (id, c, data.decode())
+                )
+            self.matrix[id] = Seq(data)
+
+    def _standard_matrix(self, options):
+        """Create a matrix of StandardData objects for the standard datatype (PRIVATE)."""
+        self.matrix = {}
+        for taxcount, first_matrix_block, id, chars in self._get_matrix_rows(options):
+            iupac_seq = StandardData(chars)
+
+            # Check for invalid characters
+            for i, c in enumerate(iupac_seq):
+                # Go through each coding for each character
+                for coding in c["d"]:
+                    if coding not in self.valid_characters:
+                        if coding != self.gap and coding != self.missing:
+                            raise NexusError(
+                                "Taxon %s: Illegal character %s in sequence %s "
+                                "(check dimensions/interleaving)"
+                                % (id, coding, iupac_seq)
+                            )
 
             # add sequence to matrix
             if first_matrix_block:
@@ -1085,21 +1238,6 @@ class Nexus:
                         "Taxon %s not in first block of interleaved "
                         "matrix. Check matrix dimensions and interleave." % id
                     )
-        # check all sequences for length according to nchar
-        for taxon in self.matrix:
-            if len(self.matrix[taxon]) != self.nchar:
-                raise NexusError(
-                    "Matrix Nchar %d does not match data length (%d) for taxon %s"
-                    % (self.nchar, len(self.matrix[taxon]), taxon)
-                )
-        # check that taxlabels is identical with matrix.keys. If not, it's a problem
-        matrixkeys = sorted(self.matrix)
-        taxlabelssort = sorted(self.taxlabels[:])
-        if matrixkeys != taxlabelssort:
-            raise ValueError(
-                "ERROR: TAXLABELS must be identical with MATRIX. "
-                "Please Report this as a bug, and send in data file."
-            )
 
     def _translate(self, options):
         """Translate a Nexus file (PRIVATE)."""
@@ -1552,11 +1690,21 @@ class Nexus:
         undelete = [
             taxon for taxon in self.taxlabels if taxon in matrix and taxon not in delete
         ]
-        cropped_matrix = _seqmatrix2strmatrix(
-            self.crop_matrix(matrix, exclude=exclude, delete=delete)
-        )
+        cropped_matrix = self.crop_matrix(matrix, exclude=exclude, delete=delete)
+        lengths = {len(cropped_matrix[t]) for t in undelete}
+        if (
+            not interleave_by_partition
+            and len(lengths) == 1
+            and all(isinstance(cropped_matrix[t], Seq) for t in undelete)
+        ):
+            # write the characters from an array instead of line by line
+            array = self.get_array(cropped_matrix)
+            nchar_adjusted = array.shape[1]
+        else:
+            array = None
+            cropped_matrix = _seqmatrix2strmatrix(cropped_matrix)
+            nchar_adjusted = len(cropped_matrix[undelete[0]])
         ntax_adjusted = len(undelete)
-        nchar_adjusted = len(cropped_matrix[undelete[0]])
         if not undelete or (undelete and undelete[0] == ""):
             return
 
@@ -1622,6 +1770,12 @@ class Nexus:
                     else:
                         fh.write("[empty]\n\n")
                     seek += len(newpartition[p])
+            elif interleave and array is not None:
+                labels = [
+                    safename(taxon, mrbayes=mrbayes).ljust(namelength + 1)
+                    for taxon in undelete
+                ]
+                _write_interleaved(fh, labels, array, blocksize)
             elif interleave:
                 for seek in range(0, nchar_adjusted, blocksize):
                     for taxon in undelete:
@@ -1629,11 +1783,14 @@ class Nexus:
                         fh.write(cropped_matrix[taxon][seek : seek + blocksize] + "\n")
                     fh.write("\n")
             else:
-                for taxon in undelete:
+                for i, taxon in enumerate(undelete):
                     if blocksize < nchar_adjusted:
                         fh.write(safename(taxon, mrbayes=mrbayes) + "\n")
                     else:
                         fh.write(safename(taxon, mrbayes=mrbayes).ljust(namelength + 1))
+                    if array is not None:
+                        fh.write(_wrap_characters(array[i], blocksize))
+                        continue
                     taxon_seq = cropped_matrix[taxon]
                     for seek in range(0, nchar_adjusted, blocksize):
                         fh.write(taxon_seq[seek : seek + blocksize] + "\n")
@@ -1905,6 +2062,49 @@ class Nexus:
                     m.add(b1.upper(), b2.upper(), 1)
         return m.transformation().weighting().smprint(name=name)
 
+    def get_array(self, matrix=None, delete=(), exclude=()):
+        """Return the characters of the matrix as a NumPy array.
+
+        The array has one row for each taxon in taxlabels that is in the
+        matrix and not deleted, and one column for each character that is
+        not excluded. The characters are stored as their ASCII codes in an
+        array of data type uint8, which takes one byte per character:
+
+        >>> from Bio.Nexus import Nexus
+        >>> n = Nexus.Nexus("Nexus/codonposset.nex")
+        >>> array = n.get_array(exclude=range(10, n.nchar))
+        >>> array.shape
+        (2, 10)
+        >>> array.tobytes()
+        b'AAAAAGGCAT?????????T'
+
+        This is only supported for matrices of Seq objects, not for the
+        standard datatype.
+        """
+        if not matrix:
+            matrix = self.matrix
+        if [t for t in delete if not self._check_taxlabels(t)]:
+            raise NexusError(
+                f"Unknown taxa: {', '.join(set(delete).difference(self.taxlabels))}"
+            )
+        undelete = [t for t in self.taxlabels if t in matrix and t not in delete]
+        if not undelete:
+            return np.zeros((0, 0), np.uint8)
+        if not all(isinstance(matrix[t], Seq) for t in undelete):
+            raise NexusError("Matrix must consist of Seq objects")
+        nchar = len(matrix[undelete[0]])
+        if any(len(matrix[t]) != nchar for t in undelete):
+            raise NexusError("Sequences in the matrix must have the same length")
+        data = b"".join(bytes(matrix[t]) for t in undelete)
+        array = np.frombuffer(data, np.uint8).reshape(len(undelete), nchar)
+        if exclude:
+            exclude = np.fromiter(exclude, int)
+            exclude = exclude[(exclude >= 0) & (exclude < nchar)]
+            keep = np.ones(nchar, bool)
+            keep[exclude] = False
+            array = array[:, keep]
+        return array
+
     def crop_matrix(self, matrix=None, delete=(), exclude=()):
         """Return a matrix without deleted taxa and excluded characters."""
         if not matrix:
@@ -1917,6 +2117,10 @@ class Nexus:
             undelete = [t for t in self.taxlabels if t in matrix and t not in delete]
             if not undelete:
                 return {}
+            lengths = {len(matrix[t]) for t in undelete}
+            if len(lengths) == 1 and all(isinstance(matrix[t], Seq) for t in undelete):
+                array = self.get_array(matrix, delete=delete, exclude=exclude)
+                return dict(zip(undelete, _array2seqs(array)))
             m = [str(matrix[k]) for k in undelete]
             sitesm = [s for i, s in enumerate(zip(*m)) if i not in exclude]
             if sitesm == []:
@@ -1929,6 +2133,25 @@ class Nexus:
                 t: matrix[t] for t in self.taxlabels if t in matrix and t not in delete
             }
 
+    def extract_charset(self, name, matrix=None, delete=()):
+        """Return a matrix with the characters of a character set.
+
+        The character set is looked up by name in charsets, and the
+        characters are returned in their order in the matrix.
+        """
+        if name not in self.charsets:
+            raise NexusError(f"Unknown character set: {name!r}")
+        if not matrix:
+            matrix = self.matrix
+        undelete = [t for t in self.taxlabels if t in matrix and t not in delete]
+        if undelete and all(isinstance(matrix[t], Seq) for t in undelete):
+            array = self.get_array(matrix, delete=delete)
+            columns = np.unique(np.array(self.charsets[name], int))
+            columns = columns[columns < array.shape[1]]
+            return dict(zip(undelete, _array2seqs(array[:, columns])))
+        exclude = self.invert(self.charsets[name])
+        return self.crop_matrix(matrix, delete=delete, exclude=exclude)
+
     def bootstrap(self, matrix=None, delete=(), exclude=()):
         """Return a bootstrapped matrix."""
         if not matrix:
@@ -1943,15 +2166,18 @@ class Nexus:
             return cm
         undelete = [t for t in self.taxlabels if t in cm]
         if seqobjects:
-            sitesm = list(zip(*(str(cm[t]) for t in undelete)))
-        else:
-            sitesm = list(zip(*(cm[t] for t in undelete)))
+            array = self.get_array(cm)
+            nchar = array.shape[1]
+            # Seed NumPy from the random module, so that random.seed can
+            # still be used to make the bootstrap reproducible
+            rng = np.random.default_rng(random.getrandbits(64))
+            array = array[:, rng.integers(nchar, size=nchar)]
+            return dict(zip(undelete, _array2seqs(array)))
+        sitesm = list(zip(*(cm[t] for t in undelete)))
         bootstrapsitesm = [
             sitesm[random.randint(0, len(sitesm) - 1)] for _ in range(len(sitesm))
         ]
         bootstrapseqs = ["".join(x) for x in zip(*bootstrapsitesm)]
-        if seqobjects:
-            bootstrapseqs = [Seq(s) for s in bootstrapseqs]
         return dict(zip(undelete, bootstrapseqs))
 
     def add_sequence(self, name, sequence):
@@ -7,6 +7,9 @@
 
 import os
 import warnings
+from io import StringIO
+
+import numpy as np
 
 from Bio.Data.IUPACData import atom_weights
 from Bio.PDB.PDBExceptions import PDBIOException, PDBIOWarning
@@ -483,3 +486,87 @@ class PDBIO(StructureIO):
 
         if isinstance(file, str):
             fhandle.close()
+
+    def save_frames(
+        self,
+        file,
+        frames,
+        select=_select,
+        write_end=True,
+        preserve_atom_numbering=False,
+    ):
+        """Save a series of coordinate frames of the structure as models.
+
+        This is intended for trajectories and ensembles in which all models
+        share the atoms of the structure (e.g. molecular dynamics frames).
+        The ATOM/HETATM and TER records of the first model accepted by select
+        are formatted once into a template, after which each frame only
+        requires formatting its coordinates. Frames are written to the file
+        as they are taken from the iterable, so they need not all be kept in
+        memory.
+
+        :param file: output file
+        :type file: string or filehandle
+
+        :param frames: iterable of Nx3 coordinate arrays, with N the number of
+            atoms written for the first accepted model, in the same order.
+            Frame i (starting from 1) is written as MODEL i.
+
+        :param select: selects which entities will be written (see save).
+        """
+        for model in self.structure.get_list():
+            if select.accept_model(model):
+                break
+        else:
+            raise PDBIOException("No model of the structure was selected")
+
+        # Write the selected model once, with all coordinates set to zero so
+        # that the coordinate columns have a fixed width, and turn the records
+        # into a format string.
+        model = model.copy()
+        for chain in model:
+            for residue in chain.get_unpacked_list():
+                for atom in residue.get_unpacked_list():
+                    atom.set_coord(np.zeros(3, "f"))
+        sb = StructureBuilder()
+        sb.init_structure(self.structure.id)
+        sb.structure.add(model)
+        io = PDBIO(is_pqr=self.is_pqr)
+        io.set_structure(sb.structure)
+        handle = StringIO()
+        io.save(
+            handle,
+            select=select,
+            write_end=False,
+            preserve_atom_numbering=preserve_atom_numbering,
+        )
+        n_atoms = 0
+        template = []
+        for line in handle.getvalue().splitlines(True):
+            line = line.replace("%", "%%")
+            if line.startswith(("ATOM  ", "HETATM")):
+                line = line[:30] + "%8.3f%8.3f%8.3f" + line[54:]
+                n_atoms += 1
+            template.append(line)
+        template = "".join(template)
+
+        if isinstance(file, str):
+            fhandle = open(file, "w")
+        else:
+            fhandle = file
+        try:
+            for serial_num, frame in enumerate(frames, 1):
+                frame = np.asarray(frame, dtype=np.float64)
+                if frame.shape != (n_atoms, 3):
+                    raise PDBIOException(
+                        f"Frame {serial_num} has shape {frame.shape}, "
+                        f"expected ({n_atoms}, 3)"
+                    )
+                fhandle.write(f"MODEL      {serial_num}\n")
+                fhandle.write(template % tuple(frame.ravel().tolist()))
+                fhandle.write("ENDMDL\n")
+            if write_end:
+                fhandle.write("END   \n")
+        finally:
+            if isinstance(file, str):
+                fhandle.close()
@@ -36,21 +36,282 @@
 """Access the PDB over the internet (e.g. to download structures)."""
 
 import contextlib
-import functools
 import gzip
+import hashlib
+import http.client
 import json
 import os
 import re
 import shutil
 import sys
+import threading
+import zlib
+from concurrent.futures import as_completed
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from urllib.error import HTTPError
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+from urllib.request import getproxies
 from urllib.request import Request
-from urllib.request import urlcleanup
 from urllib.request import urlopen
 from urllib.request import urlretrieve
 
 
+class _HTTPStatusError(OSError):
+    """The server refused a download request (PRIVATE)."""
+
+
+class DownloadManager:
+    """Download files over HTTP(S) concurrently into a local mirror.
+
+    Files are downloaded by a pool of worker threads, each of which keeps its
+    HTTP connections open between requests (HTTP/1.1 keep-alive), so that
+    fetching many small files from the same server does not require a new
+    connection for every file.
+
+    Downloads are written to a temporary ``.part`` file next to the final
+    file, which is moved into place only once the download is complete and
+    verified. If a download is interrupted, the next attempt resumes from the
+    end of the ``.part`` file with an HTTP range request, so that a mirror
+    sync can be restarted and continue where it stopped. Files are verified
+    against the size announced by the server, against an optional checksum,
+    and, when decompressing gzipped files, against the CRC and length stored
+    in the gzip trailer.
+
+    If a proxy is configured in the environment (e.g. HTTP_PROXY), requests
+    are sent through urllib instead, without connection reuse. The same is
+    done for URLs with other schemes than http and https, such as ftp:// or
+    file:// mirrors; these downloads are not resumed.
+
+    >>> from Bio.PDB.PDBList import DownloadManager
+    >>> manager = DownloadManager(max_num_threads=8)
+    >>> manager.max_num_threads
+    8
+    >>> manager.close()
+
+    """
+
+    def __init__(self, max_num_threads=None, retries=3, timeout=60):
+        """Initialize the download manager.
+
+        :param max_num_threads: maximum number of concurrent downloads
+            (default: as for concurrent.futures.ThreadPoolExecutor).
+        :param retries: number of times a failed download is resumed before
+            giving up.
+        :param timeout: timeout in seconds for network operations.
+        """
+        self.max_num_threads = max_num_threads
+        self.retries = retries
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def _get_connection(self, scheme, netloc):
+        """Return a kept-alive connection of the current thread (PRIVATE)."""
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            if scheme == "https":
+                connection = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            elif scheme == "http":
+                connection = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            else:
+                raise ValueError(f"Unsupported URL scheme '{scheme}'")
+            connections[(scheme, netloc)] = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _drop_connections(self):
+        """Close and forget the connections of the current thread (PRIVATE)."""
+        connections = getattr(self._local, "connections", {})
+        for connection in connections.values():
+            connection.close()
+        connections.clear()
+
+    def _request(self, url, headers):
+        """Send a GET request and return the status, headers and response (PRIVATE).
+
+        Redirects are followed. The response object must be read completely
+        (or closed) by the caller.
+        """
+        for _ in range(10):
+            parts = urlsplit(url)
+            if parts.scheme in getproxies() or parts.scheme not in ("http", "https"):
+                request = Request(url, headers=headers)
+                try:
+                    response = urlopen(request, timeout=self.timeout)
+                except HTTPError as error:
+                    return error.code, error.headers, error
+                if response.status is None:
+                    # not HTTP; the whole file is returned
+                    return 200, response.headers, response
+                return response.status, response.headers, response
+            connection = self._get_connection(parts.scheme, parts.netloc)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+            except (http.client.HTTPException, OSError):
+                # The server may have closed an idle kept-alive connection
+                self._drop_connections()
+                raise
+            if response.status in (301, 302, 303, 307, 308):
+                response.read()
+                url = urljoin(url, response.headers["Location"])
+                continue
+            return response.status, response.headers, response
+        raise OSError(f"Too many redirects for {url}")
+
+    def _fetch(self, url, part):
+        """Download url into the file part, resuming if it exists (PRIVATE).
+
+        Returns once the file is complete; raises OSError otherwise.
+        """
+        try:
+            offset = os.path.getsize(part)
+        except OSError:
+            offset = 0
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        status, response_headers, response = self._request(url, headers)
+        with contextlib.closing(response):
+            if status == 416 and offset:
+                # Range not satisfiable; the partial file is unusable.
+                response.read()
+                os.remove(part)
+                raise OSError(f"Could not resume download of {url}")
+            if status == 206:
+                mode = "ab"
+                content_range = response_headers.get("Content-Range", "")
+                start, _, total = content_range.partition(" ")[2].partition("/")
+                if int(start.partition("-")[0]) != offset:
+                    response.read()
+                    os.remove(part)
+                    raise OSError(f"Unexpected range {content_range} from {url}")
+                expected = int(total) if total not in ("", "*") else None
+            elif status == 200:
+                mode = "wb"
+                length = response_headers.get("Content-Length")
+                expected = int(length) if length is not None else None
+            else:
+                response.read()
+                raise _HTTPStatusError(
+                    f"HTTP error {status} {response.reason} for {url}"
+                )
+            with open(part, mode) as handle:
+                shutil.copyfileobj(response, handle, 1 << 16)
+        size = os.path.getsize(part)
+        if expected is not None and size != expected:
+            raise OSError(
+                f"Incomplete download of {url}: got {size} of {expected} bytes"
+            )
+
+    def download(self, url, filename, decompress=False, checksum=None):
+        """Download a single file and store it atomically as filename.
+
+        :param url: URL of the file.
+        :param filename: local file name; missing directories are created.
+        :param decompress: if True, the downloaded file is gzip decompressed
+            before it is stored as filename.
+        :param checksum: optional tuple (algorithm, hexdigest), e.g.
+            ``("md5", "...")``, to verify the downloaded (compressed) file.
+        :return: filename
+
+        Raises OSError if the download fails after the configured number of
+        retries; the partial download is kept so a later call can resume it.
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        part = filename + ".part"
+        for attempt in range(self.retries + 1):
+            try:
+                self._fetch(url, part)
+            except _HTTPStatusError:
+                raise
+            except (http.client.HTTPException, OSError) as error:
+                # The connection may be left in an undefined state
+                self._drop_connections()
+                if attempt == self.retries:
+                    raise OSError(f"Download of {url} failed: {error}") from error
+            else:
+                break
+        if checksum is not None:
+            algorithm, expected = checksum
+            digest = hashlib.new(algorithm)
+            with open(part, "rb") as handle:
+                for block in iter(lambda: handle.read(1 << 16), b""):
+                    digest.update(block)
+            if digest.hexdigest() != expected.lower():
+                os.remove(part)
+                raise OSError(f"Checksum mismatch for {url}")
+        if decompress:
+            temp = filename + ".tmp"
+            try:
+                with gzip.open(part, "rb") as gz, open(temp, "wb") as out:
+                    shutil.copyfileobj(gz, out, 1 << 16)
+            except (OSError, EOFError, zlib.error) as error:
+                # Corrupt or truncated archive; start again next time
+                os.remove(part)
+                with contextlib.suppress(OSError):
+                    os.remove(temp)
+                raise OSError(f"Corrupt download from {url}: {error}") from error
+            os.replace(temp, filename)
+            os.remove(part)
+        else:
+            os.replace(part, filename)
+        return filename
+
+    def download_many(self, jobs):
+        """Download many files concurrently, yielding results as they finish.
+
+        :param jobs: iterable of (url, filename) tuples, or of dictionaries
+            with the keyword arguments of the download method.
+
+        For each job, a tuple (job, filename, error) is yielded in order of
+        completion, where error is None on success and the exception raised
+        by the download otherwise.
+        """
+        with ThreadPoolExecutor(self.max_num_threads) as executor:
+            futures = {}
+            for job in jobs:
+                if isinstance(job, dict):
+                    future = executor.submit(self.download, **job)
+                else:
+                    future = executor.submit(self.download, *job)
+                futures[future] = job
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    yield job, future.result(), None
+                except Exception as error:
+                    yield job, None, error
+
+    def close(self):
+        """Close all open connections."""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+    def __enter__(self):
+        """Use the download manager as a context manager."""
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Close all open connections on leaving the with statement."""
+        self.close()
+
+
 class PDBList:
     """Quick access to the structure lists on the PDB or its mirrors.
 
@@ -77,6 +338,10 @@ class PDBList:
     the proxy variable to your environment, e.g. in Unix:
     export HTTP_PROXY='http://realproxy.charite.de:888'
     (This can also be added to ~/.bashrc)
+
+    The connections to the server are kept open between downloads. Call the
+    close method, or use the PDBList object in a with statement, to close
+    them when you are done.
     """
 
     PDB_REF = """
@@ -117,6 +382,21 @@ class PDBList:
         # variable for command-line option
         self.flat_tree = False
 
+        # keeps connections to the server open between downloads
+        self._download_manager = DownloadManager()
+
+    def close(self):
+        """Close the connections to the server."""
+        self._download_manager.close()
+
+    def __enter__(self):
+        """Use the PDBList object as a context manager."""
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Close the connections to the server on leaving the with statement."""
+        self.close()
+
     @staticmethod
     def _print_default_format_warning(file_format):
         """Print a warning to stdout (PRIVATE).
@@ -267,6 +547,32 @@ class PDBList:
         # Deprecation warning
         file_format = self._print_default_format_warning(file_format)
 
+        url, final_file = self._get_pdb_file_location(
+            pdb_code, obsolete, pdir, file_format
+        )
+
+        # Skip download if the file already exists
+        if not overwrite:
+            if os.path.exists(final_file):
+                if self._verbose:
+                    print(f"Structure exists: '{final_file}' ")
+                return final_file
+
+        # Retrieve the file(s)
+        if self._verbose:
+            print(f"Downloading PDB structure '{pdb_code}'...")
+        try:
+            self._download_manager.download(url, final_file, decompress=True)
+        except (OSError, ValueError) as e:
+            print(
+                "Desired structure not found or download failed."
+                f" '{pdb_code}': {str(e)}"
+            )
+            return None
+        return final_file
+
+    def _get_pdb_file_location(self, pdb_code, obsolete, pdir, file_format):
+        """Return the URL and local file name of a PDB structure file (PRIVATE)."""
         # Get the compressed PDB structure
         pdb_code = pdb_code.lower()
         archive_dict = {
@@ -311,9 +617,6 @@ class PDBList:
                 path = os.path.join(path, pdb_code[1:3])
         else:  # Put in specified directory
             path = pdir
-        if not os.access(path, os.F_OK):
-            os.makedirs(path)
-        filename = os.path.join(path, archive)
         final = {
             "pdb": f"pdb{pdb_code}.ent",
             "mmCif": f"{pdb_code}.cif",
@@ -322,40 +625,51 @@ class PDBList:
             "bundle": f"{pdb_code}-pdb-bundle.tar",
         }
         final_file = os.path.join(path, final[file_format])
+        return url, final_file
 
-        # Skip download if the file already exists
-        if not overwrite:
-            if os.path.exists(final_file):
-                if self._verbose:
-                    print(f"Structure exists: '{final_file}' ")
-                return final_file
+    def _download_files(self, jobs, max_num_threads, overwrite=False):
+        """Download (url, filename, description) jobs concurrently (PRIVATE).
 
-        # Retrieve the file(s)
-        if self._verbose:
-            print(f"Downloading PDB structure '{pdb_code}'...")
-        try:
-            urlcleanup()
-            urlretrieve(url, filename)
-        except OSError as e:
-            print(
-                "Desired structure not found or download failed."
-                f" '{pdb_code}': {str(e)}"
-            )
-            return None
-        else:
-            with gzip.open(filename, "rb") as gz:
-                with open(final_file, "wb") as out:
-                    out.writelines(gz)
-            os.remove(filename)
-        return final_file
-
-    def update_pdb(self, file_format=None, with_assemblies=False):
+        Files that already exist are skipped unless overwrite is True.
+        Returns the list of file names that are present after downloading.
+        """
+        filenames = []
+        descriptions = {}
+        for url, filename, description in jobs:
+            if not overwrite and os.path.exists(filename):
+                if self._verbose:
+                    print(f"Structure exists: '{filename}' ")
+                filenames.append(filename)
+            else:
+                descriptions[(url, filename, True)] = description
+        manager = DownloadManager(max_num_threads)
+        with contextlib.closing(manager):
+            for job, filename, error in manager.download_many(descriptions):
+                description = descriptions[job]
+                if error is None:
+                    if self._verbose:
+                        print(f"Downloaded {description}")
+                    filenames.append(filename)
+                else:
+                    print(f"Download failed for {description}: {error}")
+        return filenames
+
+    def update_pdb(
+        self,
+        file_format=None,
+        with_assemblies=False,
+        max_num_threads: int | None = None,
+    ):
         """Update your local copy of the PDB files.
 
         I guess this is the 'most wanted' function from this module.
         It gets the weekly lists of new and modified pdb entries and
         automatically downloads the according PDB files.
         You can call this module as a weekly cron job.
+
+        Files are downloaded concurrently using up to max_num_threads
+        threads. An interrupted update can simply be run again; partially
+        downloaded files are resumed.
         """
         assert os.path.isdir(self.local_pdb)
         if os.path.exists(self.obsolete_pdb):
@@ -366,23 +680,28 @@ class PDBList:
 
         new, modified, obsolete = self.get_recent_changes()
 
-        for pdb_code in new + modified:
-            try:
-                self.retrieve_pdb_file(pdb_code, file_format=file_format)
-                if with_assemblies:
-                    assemblies = self.get_all_assemblies()
-                    for a_pdb_code, assembly_num in assemblies:
-                        if a_pdb_code == pdb_code:
-                            pl.retrieve_assembly_file(
-                                pdb_code,
-                                assembly_num,
-                                file_format=file_format,
-                                overwrite=True,
-                            )
-            except Exception as err:
-                print(f"error {pdb_code}: {err}\n")
-                # you can insert here some more log notes that
-                # something has gone wrong.
+        # New entries are skipped if already present, e.g. when an earlier
+        # update was interrupted; modified entries are always downloaded.
+        self.download_pdb_files(
+            new, file_format=file_format, max_num_threads=max_num_threads
+        )
+        self.download_pdb_files(
+            modified,
+            file_format=file_format,
+            overwrite=True,
+            max_num_threads=max_num_threads,
+        )
+        if with_assemblies:
+            updated = set(new + modified)
+            jobs = [
+                self._get_assembly_file_location(
+                    pdb_code, assembly_num, None, file_format
+                )
+                + (f"assembly {assembly_num} of '{pdb_code}'",)
+                for pdb_code, assembly_num in self.get_all_assemblies()
+                if pdb_code in updated
+            ]
+            self._download_files(jobs, max_num_threads, overwrite=True)
 
         # Move the obsolete files to a special folder
         # NOTE: This should be updated to handle multiple file types and
@@ -445,20 +764,21 @@ class PDBList:
         :param overwrite: If set to true, existing structure files will be overwritten. (default: ``False``)
 
         :param max_num_threads: The maximum number of threads to use when downloading files
+
+        Files are downloaded concurrently, reusing connections to the server.
+        Each file is written to a temporary file first and only moved into
+        place once complete; an interrupted download is resumed the next time.
+
+        :return: the file names of the structures present after downloading
         """
         # Deprecation warning
         file_format = self._print_default_format_warning(file_format)
-        with ThreadPoolExecutor(max_num_threads) as executor:
-            executor.map(
-                functools.partial(
-                    self.retrieve_pdb_file,
-                    obsolete=obsolete,
-                    pdir=pdir,
-                    file_format=file_format,
-                    overwrite=overwrite,
-                ),
-                pdb_codes,
-            )
+        jobs = (
+            self._get_pdb_file_location(pdb_code, obsolete, pdir, file_format)
+            + (f"PDB structure '{pdb_code.lower()}'",)
+            for pdb_code in pdb_codes
+        )
+        return self._download_files(jobs, max_num_threads, overwrite)
 
     def get_all_assemblies(self, file_format: str = "") -> list[tuple[str, str]]:
         """Retrieve the list of PDB entries with an associated bio assembly.
@@ -515,6 +835,31 @@ class PDBList:
         :rtype : str
         :return: file name of the downloaded assembly file.
         """
+        file_format = self._print_default_format_warning(file_format)
+        url, assembly_final_file = self._get_assembly_file_location(
+            pdb_code, assembly_num, pdir, file_format
+        )
+
+        # Skip download if the file already exists
+        if not overwrite:
+            if os.path.exists(assembly_final_file):
+                if self._verbose:
+                    print(f"Structure exists: '{assembly_final_file}' ")
+                return assembly_final_file
+
+        # Otherwise,retrieve the file(s)
+        if self._verbose:
+            print(
+                f"Downloading assembly ({assembly_num}) for PDB entry '{pdb_code}'..."
+            )
+        try:
+            self._download_manager.download(url, assembly_final_file, decompress=True)
+        except (OSError, ValueError) as err:
+            print(f"Download failed! Maybe the desired assembly does not exist: {err}")
+        return assembly_final_file
+
+    def _get_assembly_file_location(self, pdb_code, assembly_num, pdir, file_format):
+        """Return the URL and local file name of an assembly file (PRIVATE)."""
         pdb_code = pdb_code.lower()
         assembly_num = int(assembly_num)
         archive = {
@@ -522,7 +867,6 @@ class PDBList:
             "mmcif": f"{pdb_code}-assembly{assembly_num}.cif.gz",
         }
 
-        file_format = self._print_default_format_warning(file_format)
         file_format = file_format.lower()  # we should standardize this.
         if file_format not in archive:
             raise Exception(
@@ -547,35 +891,9 @@ class PDBList:
                 path = os.path.join(path, pdb_code[1:3])
         else:  # Put in specified directory
             path = pdir
-        if not os.access(path, os.F_OK):
-            os.makedirs(path)
 
-        assembly_gz_file = os.path.join(path, archive_fn)
         assembly_final_file = os.path.join(path, archive_fn[:-3])  # no .gz
-
-        # Skip download if the file already exists
-        if not overwrite:
-            if os.path.exists(assembly_final_file):
-                if self._verbose:
-                    print(f"Structure exists: '{assembly_final_file}' ")
-                return assembly_final_file
-
-        # Otherwise,retrieve the file(s)
-        if self._verbose:
-            print(
-                f"Downloading assembly ({assembly_num}) for PDB entry '{pdb_code}'..."
-            )
-        try:
-            urlcleanup()
-            urlretrieve(url, assembly_gz_file)
-        except OSError as err:
-            print(f"Download failed! Maybe the desired assembly does not exist: {err}")
-        else:
-            with gzip.open(assembly_gz_file, "rb") as gz:
-                with open(assembly_final_file, "wb") as out:
-                    out.writelines(gz)
-            os.remove(assembly_gz_file)
-        return assembly_final_file
+        return url, assembly_final_file
 
     def download_all_assemblies(
         self,
@@ -595,15 +913,12 @@ class PDBList:
         # Deprecation warning
         file_format = self._print_default_format_warning(file_format)
         assemblies = self.get_all_assemblies()
-        with ThreadPoolExecutor(max_num_threads) as executor:
-            for pdb_code, assembly_num in assemblies:
-                executor.submit(
-                    functools.partial(
-                        self.retrieve_assembly_file, file_format=file_format
-                    ),
-                    pdb_code,
-                    assembly_num,
-                )
+        jobs = (
+            self._get_assembly_file_location(pdb_code, assembly_num, None, file_format)
+            + (f"assembly {assembly_num} of '{pdb_code}'",)
+            for pdb_code, assembly_num in assemblies
+        )
+        self._download_files(jobs, max_num_threads)
         # Write the list
         if listfile:
             with open(listfile, "w") as outfile:
@@ -634,11 +949,9 @@ class PDBList:
         # Deprecation warning
         file_format = self._print_default_format_warning(file_format)
         entries = self.get_all_entries()
-        with ThreadPoolExecutor(max_num_threads) as executor:
-            executor.map(
-                functools.partial(self.retrieve_pdb_file, file_format=file_format),
-                entries,
-            )
+        self.download_pdb_files(
+            entries, file_format=file_format, max_num_threads=max_num_threads
+        )
         # Write the list
         if listfile:
             with open(listfile, "w") as outfile:
@@ -667,13 +980,12 @@ class PDBList:
         # Deprecation warning
         file_format = self._print_default_format_warning(file_format)
         entries = self.get_all_obsolete()
-        with ThreadPoolExecutor(max_num_threads) as executor:
-            executor.map(
-                functools.partial(
-                    self.retrieve_pdb_file, obsolete=True, file_format=file_format
-                ),
-                entries,
-            )
+        self.download_pdb_files(
+            entries,
+            obsolete=True,
+            file_format=file_format,
+            max_num_threads=max_num_threads,
+        )
         # Write the list
         if listfile:
             with open(listfile, "w") as outfile:
@@ -0,0 +1,463 @@
+/* Copyright (C) 2026, The Biopython Contributors
+ *
+ * This file is part of the Biopython distribution and governed by your
+ * choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+ * Please see the LICENSE file that should have been included as part of this
+ * package.
+ *
+ * Batched Quaternion Characteristic Polynomial (QCP) superposition.
+ *
+ * This is a C port of the qcp function in Bio/PDB/qcprot.py, operating on
+ * stacks of coordinate sets so that all-against-all RMSD matrices and
+ * superpositions of an ensemble onto a reference can be calculated without
+ * going through Python for every pair. The GIL is released during the
+ * calculations.
+ *
+ * Algorithm described in:
+ *
+ * Theobald DL.
+ * Rapid calculation of RMSDs using a quaternion-based characteristic
+ * polynomial. Acta Crystallogr A. 2005 Jul;61(Pt 4):478-80.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <math.h>
+
+
+/* Inner product matrix A = mobile.T @ reference (row-major, 3x3) for two
+ * centered N x 3 coordinate sets. */
+static void
+inner_product(const double *reference, const double *mobile, Py_ssize_t n,
+              double *A)
+{
+    Py_ssize_t k;
+    double x1, y1, z1, x2, y2, z2;
+    int i;
+
+    for (i = 0; i < 9; i++) A[i] = 0.0;
+    for (k = 0; k < n; k++) {
+        x1 = reference[3 * k];
+        y1 = reference[3 * k + 1];
+        z1 = reference[3 * k + 2];
+        x2 = mobile[3 * k];
+        y2 = mobile[3 * k + 1];
+        z2 = mobile[3 * k + 2];
+        A[0] += x2 * x1;
+        A[1] += x2 * y1;
+        A[2] += x2 * z1;
+        A[3] += y2 * x1;
+        A[4] += y2 * y1;
+        A[5] += y2 * z1;
+        A[6] += z2 * x1;
+        A[7] += z2 * y1;
+        A[8] += z2 * z1;
+    }
+}
+
+/* Self inner product (sum of squared coordinates) of a centered N x 3 set. */
+static double
+self_inner_product(const double *coords, Py_ssize_t n)
+{
+    Py_ssize_t k;
+    double G = 0.0;
+
+    for (k = 0; k < 3 * n; k++) G += coords[k] * coords[k];
+    return G;
+}
+
+/* Calculate the RMSD, and optionally the right-multiplying rotation matrix,
+ * from the inner product matrix A and the self inner products G1 and G2.
+ * Mirrors Bio.PDB.qcprot.qcp. */
+static double
+qcp(const double *A, double G1, double G2, Py_ssize_t natoms, double *rot)
+{
+    const double Sxx = A[0], Sxy = A[1], Sxz = A[2];
+    const double Syx = A[3], Syy = A[4], Syz = A[5];
+    const double Szx = A[6], Szy = A[7], Szz = A[8];
+    const double E0 = (G1 + G2) * 0.5;
+    const double evalprec = 1e-11;
+    const double evecprec = 1e-6;
+    double Sxx2, Syy2, Szz2, Sxy2, Syz2, Sxz2, Syx2, Szy2, Szx2;
+    double SyzSzymSyySzz2, Sxx2Syy2Szz2Syz2Szy2, Sxy2Sxz2Syx2Szx2;
+    double SxzpSzx, SyzpSzy, SxypSyx, SyzmSzy, SxzmSzx, SxymSyx;
+    double SxxpSyy, SxxmSyy;
+    double C0, C1, C2;
+    double mxEigenV, oldg, x2, a, b, f, f_prime, delta;
+    double rmsd;
+    double a11, a12, a13, a14, a21, a22, a23, a24;
+    double a31, a32, a33, a34, a41, a42, a43, a44;
+    double a3344_4334, a3244_4234, a3243_4233, a3143_4133, a3144_4134;
+    double a3142_4132, a1324_1423, a1224_1422, a1223_1322, a1124_1421;
+    double a1123_1321, a1122_1221;
+    double q1, q2, q3, q4, qsqr, normq;
+    double a2, y2, z2, xy, az, zx, ay, yz, ax;
+    int i;
+
+    Sxx2 = Sxx * Sxx;
+    Syy2 = Syy * Syy;
+    Szz2 = Szz * Szz;
+    Sxy2 = Sxy * Sxy;
+    Syz2 = Syz * Syz;
+    Sxz2 = Sxz * Sxz;
+    Syx2 = Syx * Syx;
+    Szy2 = Szy * Szy;
+    Szx2 = Szx * Szx;
+
+    SyzSzymSyySzz2 = 2.0 * (Syz * Szy - Syy * Szz);
+    Sxx2Syy2Szz2Syz2Szy2 = Syy2 + Szz2 - Sxx2 + Syz2 + Szy2;
+
+    C2 = -2.0 * (Sxx2 + Syy2 + Szz2 + Sxy2 + Syx2 + Sxz2 + Szx2 + Syz2 + Szy2);
+    C1 = 8.0 * (Sxx * Syz * Szy + Syy * Szx * Sxz + Szz * Sxy * Syx
+                - Sxx * Syy * Szz - Syz * Szx * Sxy - Szy * Syx * Sxz);
+
+    SxzpSzx = Sxz + Szx;
+    SyzpSzy = Syz + Szy;
+    SxypSyx = Sxy + Syx;
+    SyzmSzy = Syz - Szy;
+    SxzmSzx = Sxz - Szx;
+    SxymSyx = Sxy - Syx;
+    SxxpSyy = Sxx + Syy;
+    SxxmSyy = Sxx - Syy;
+    Sxy2Sxz2Syx2Szx2 = Sxy2 + Sxz2 - Syx2 - Szx2;
+
+    C0 = Sxy2Sxz2Syx2Szx2 * Sxy2Sxz2Syx2Szx2
+        + (Sxx2Syy2Szz2Syz2Szy2 + SyzSzymSyySzz2)
+        * (Sxx2Syy2Szz2Syz2Szy2 - SyzSzymSyySzz2)
+        + (-SxzpSzx * SyzmSzy + SxymSyx * (SxxmSyy - Szz))
+        * (-SxzmSzx * SyzpSzy + SxymSyx * (SxxmSyy + Szz))
+        + (-SxzpSzx * SyzpSzy - SxypSyx * (SxxpSyy - Szz))
+        * (-SxzmSzx * SyzmSzy - SxypSyx * (SxxpSyy + Szz))
+        + (SxypSyx * SyzpSzy + SxzpSzx * (SxxmSyy + Szz))
+        * (-SxymSyx * SyzmSzy + SxzpSzx * (SxxpSyy + Szz))
+        + (SxypSyx * SyzmSzy + SxzmSzx * (SxxmSyy - Szz))
+        * (-SxymSyx * SyzpSzy + SxzmSzx * (SxxpSyy - Szz));
+
+    /* Newton-Raphson for the largest root of the quartic, starting at E0. */
+    mxEigenV = E0;
+    for (i = 0; i < 50; i++) {
+        oldg = mxEigenV;
+        x2 = mxEigenV * mxEigenV;
+        b = (x2 + C2) * mxEigenV;
+        a = b + C1;
+        f = a * mxEigenV + C0;
+        f_prime = 2.0 * x2 * mxEigenV + b + a;
+        delta = f / (f_prime + evalprec);
+        mxEigenV = fabs(mxEigenV - delta);
+        if (fabs(mxEigenV - oldg) < evalprec * mxEigenV) break;
+    }
+
+    rmsd = sqrt(2.0 * fabs(E0 - mxEigenV) / natoms);
+    if (rot == NULL) return rmsd;
+
+    a11 = SxxpSyy + Szz - mxEigenV;
+    a12 = SyzmSzy;
+    a13 = -SxzmSzx;
+    a14 = SxymSyx;
+    a21 = SyzmSzy;
+    a22 = SxxmSyy - Szz - mxEigenV;
+    a23 = SxypSyx;
+    a24 = SxzpSzx;
+    a31 = a13;
+    a32 = a23;
+    a33 = Syy - Sxx - Szz - mxEigenV;
+    a34 = SyzpSzy;
+    a41 = a14;
+    a42 = a24;
+    a43 = a34;
+    a44 = Szz - SxxpSyy - mxEigenV;
+    a3344_4334 = a33 * a44 - a43 * a34;
+    a3244_4234 = a32 * a44 - a42 * a34;
+    a3243_4233 = a32 * a43 - a42 * a33;
+    a3143_4133 = a31 * a43 - a41 * a33;
+    a3144_4134 = a31 * a44 - a41 * a34;
+    a3142_4132 = a31 * a42 - a41 * a32;
+    q1 = a22 * a3344_4334 - a23 * a3244_4234 + a24 * a3243_4233;
+    q2 = -a21 * a3344_4334 + a23 * a3144_4134 - a24 * a3143_4133;
+    q3 = a21 * a3244_4234 - a22 * a3144_4134 + a24 * a3142_4132;
+    q4 = -a21 * a3243_4233 + a22 * a3143_4133 - a23 * a3142_4132;
+    qsqr = q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4;
+
+    if (qsqr < evecprec) {
+        q1 = a12 * a3344_4334 - a13 * a3244_4234 + a14 * a3243_4233;
+        q2 = -a11 * a3344_4334 + a13 * a3144_4134 - a14 * a3143_4133;
+        q3 = a11 * a3244_4234 - a12 * a3144_4134 + a14 * a3142_4132;
+        q4 = -a11 * a3243_4233 + a12 * a3143_4133 - a13 * a3142_4132;
+        qsqr = q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4;
+
+        if (qsqr < evecprec) {
+            a1324_1423 = a13 * a24 - a14 * a23;
+            a1224_1422 = a12 * a24 - a14 * a22;
+            a1223_1322 = a12 * a23 - a13 * a22;
+            a1124_1421 = a11 * a24 - a14 * a21;
+            a1123_1321 = a11 * a23 - a13 * a21;
+            a1122_1221 = a11 * a22 - a12 * a21;
+
+            q1 = a42 * a1324_1423 - a43 * a1224_1422 + a44 * a1223_1322;
+            q2 = -a41 * a1324_1423 + a43 * a1124_1421 - a44 * a1123_1321;
+            q3 = a41 * a1224_1422 - a42 * a1124_1421 + a44 * a1122_1221;
+            q4 = -a41 * a1223_1322 + a42 * a1123_1321 - a43 * a1122_1221;
+            qsqr = q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4;
+
+            if (qsqr < evecprec) {
+                q1 = a32 * a1324_1423 - a33 * a1224_1422 + a34 * a1223_1322;
+                q2 = -a31 * a1324_1423 + a33 * a1124_1421 - a34 * a1123_1321;
+                q3 = a31 * a1224_1422 - a32 * a1124_1421 + a34 * a1122_1221;
+                q4 = -a31 * a1223_1322 + a32 * a1123_1321 - a33 * a1122_1221;
+                qsqr = q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4;
+
+                if (qsqr < evecprec) {
+                    /* The rotation is the identity. */
+                    for (i = 0; i < 9; i++) rot[i] = 0.0;
+                    rot[0] = rot[4] = rot[8] = 1.0;
+                    return rmsd;
+                }
+            }
+        }
+    }
+
+    normq = sqrt(qsqr);
+    q1 /= normq;
+    q2 /= normq;
+    q3 /= normq;
+    q4 /= normq;
+
+    a2 = q1 * q1;
+    x2 = q2 * q2;
+    y2 = q3 * q3;
+    z2 = q4 * q4;
+
+    xy = q2 * q3;
+    az = q1 * q4;
+    zx = q4 * q2;
+    ay = q1 * q3;
+    yz = q3 * q4;
+    ax = q1 * q2;
+
+    rot[0] = a2 + x2 - y2 - z2;
+    rot[1] = 2 * (xy + az);
+    rot[2] = 2 * (zx - ay);
+    rot[3] = 2 * (xy - az);
+    rot[4] = a2 - x2 + y2 - z2;
+    rot[5] = 2 * (yz + ax);
+    rot[6] = 2 * (zx + ay);
+    rot[7] = 2 * (yz - ax);
+    rot[8] = a2 - x2 - y2 + z2;
+
+    return rmsd;
+}
+
+/* Get a C-contiguous float64 buffer and check its shape. The last dimension
+ * must be 3 if check_xyz is set. */
+static int
+get_double_buffer(PyObject *object, Py_buffer *view, int ndim, int writable,
+                  int check_xyz, const char *name)
+{
+    int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+
+    if (writable) flags |= PyBUF_WRITABLE;
+    if (PyObject_GetBuffer(object, view, flags) != 0) return 0;
+    if (view->ndim != ndim) {
+        PyErr_Format(PyExc_ValueError,
+                     "%s should be %d-dimensional (found %d dimensions)",
+                     name, ndim, view->ndim);
+        PyBuffer_Release(view);
+        return 0;
+    }
+    if (view->itemsize != sizeof(double) || strcmp(view->format, "d") != 0) {
+        PyErr_Format(PyExc_ValueError,
+                     "%s should contain float64 values", name);
+        PyBuffer_Release(view);
+        return 0;
+    }
+    if (check_xyz && view->shape[ndim - 1] != 3) {
+        PyErr_Format(PyExc_ValueError,
+                     "%s should contain three-dimensional coordinates", name);
+        PyBuffer_Release(view);
+        return 0;
+    }
+    return 1;
+}
+
+static char rmsd_matrix__doc__[] =
+"rmsd_matrix(coords, out)\n"
+"\n"
+"Calculate the all-against-all RMSD matrix of an ensemble.\n"
+"\n"
+"coords must be a C-contiguous (M, N, 3) float64 array of coordinate sets,\n"
+"each centered at the origin; out must be a writable C-contiguous (M, M)\n"
+"float64 array, which is filled with the optimal RMSD of each pair.\n";
+
+static PyObject *
+rmsd_matrix(PyObject *self, PyObject *args)
+{
+    PyObject *coords_obj;
+    PyObject *out_obj;
+    Py_buffer coords;
+    Py_buffer out;
+    Py_ssize_t m, n, i, j;
+    double *G = NULL;
+    double *data;
+    double *matrix;
+    double A[9];
+    double rmsd;
+
+    if (!PyArg_ParseTuple(args, "OO:rmsd_matrix", &coords_obj, &out_obj))
+        return NULL;
+    if (!get_double_buffer(coords_obj, &coords, 3, 0, 1, "coords"))
+        return NULL;
+    if (!get_double_buffer(out_obj, &out, 2, 1, 0, "out")) {
+        PyBuffer_Release(&coords);
+        return NULL;
+    }
+    m = coords.shape[0];
+    n = coords.shape[1];
+    if (out.shape[0] != m || out.shape[1] != m) {
+        PyErr_SetString(PyExc_ValueError,
+                        "out should be a square matrix of size equal to the "
+                        "number of coordinate sets");
+        goto exit;
+    }
+    if (n == 0) {
+        PyErr_SetString(PyExc_ValueError, "coordinate sets are empty");
+        goto exit;
+    }
+    G = PyMem_Malloc(m * sizeof(double));
+    if (!G) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    data = coords.buf;
+    matrix = out.buf;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (i = 0; i < m; i++) G[i] = self_inner_product(data + i * n * 3, n);
+    for (i = 0; i < m; i++) {
+        matrix[i * m + i] = 0.0;
+        for (j = i + 1; j < m; j++) {
+            inner_product(data + i * n * 3, data + j * n * 3, n, A);
+            rmsd = qcp(A, G[i], G[j], n, NULL);
+            matrix[i * m + j] = rmsd;
+            matrix[j * m + i] = rmsd;
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+exit:
+    PyMem_Free(G);
+    PyBuffer_Release(&coords);
+    PyBuffer_Release(&out);
+    if (PyErr_Occurred()) return NULL;
+    Py_RETURN_NONE;
+}
+
+static char superimpose__doc__[] =
+"superimpose(reference, coords, rotations, rmsds)\n"
+"\n"
+"Superimpose each coordinate set of an ensemble onto a reference.\n"
+"\n"
+"reference must be a C-contiguous (N, 3) float64 array and coords a\n"
+"C-contiguous (M, N, 3) float64 array, all centered at the origin. The\n"
+"right-multiplying rotation matrix of each coordinate set is stored in the\n"
+"writable (M, 3, 3) float64 array rotations, and the RMSD after\n"
+"superposition in the writable (M,) float64 array rmsds.\n";
+
+static PyObject *
+superimpose(PyObject *self, PyObject *args)
+{
+    PyObject *reference_obj;
+    PyObject *coords_obj;
+    PyObject *rotations_obj;
+    PyObject *rmsds_obj;
+    Py_buffer reference;
+    Py_buffer coords;
+    Py_buffer rotations;
+    Py_buffer rmsds;
+    Py_ssize_t m, n, i;
+    double *ref_data;
+    double *data;
+    double *rot_data;
+    double *rmsd_data;
+    double A[9];
+    double G_ref;
+
+    if (!PyArg_ParseTuple(args, "OOOO:superimpose", &reference_obj,
+                          &coords_obj, &rotations_obj, &rmsds_obj))
+        return NULL;
+    if (!get_double_buffer(reference_obj, &reference, 2, 0, 1, "reference"))
+        return NULL;
+    if (!get_double_buffer(coords_obj, &coords, 3, 0, 1, "coords")) {
+        PyBuffer_Release(&reference);
+        return NULL;
+    }
+    if (!get_double_buffer(rotations_obj, &rotations, 3, 1, 1, "rotations")) {
+        PyBuffer_Release(&reference);
+        PyBuffer_Release(&coords);
+        return NULL;
+    }
+    if (!get_double_buffer(rmsds_obj, &rmsds, 1, 1, 0, "rmsds")) {
+        PyBuffer_Release(&reference);
+        PyBuffer_Release(&coords);
+        PyBuffer_Release(&rotations);
+        return NULL;
+    }
+    m = coords.shape[0];
+    n = coords.shape[1];
+    if (reference.shape[0] != n) {
+        PyErr_SetString(PyExc_ValueError,
+                        "reference and coordinate sets differ in size");
+        goto exit;
+    }
+    if (rotations.shape[0] != m || rotations.shape[1] != 3
+     || rmsds.shape[0] != m) {
+        PyErr_SetString(PyExc_ValueError,
+                        "output arrays do not match the number of "
+                        "coordinate sets");
+        goto exit;
+    }
+    if (n == 0) {
+        PyErr_SetString(PyExc_ValueError, "coordinate sets are empty");
+        goto exit;
+    }
+    ref_data = reference.buf;
+    data = coords.buf;
+    rot_data = rotations.buf;
+    rmsd_data = rmsds.buf;
+
+    Py_BEGIN_ALLOW_THREADS
+    G_ref = self_inner_product(ref_data, n);
+    for (i = 0; i < m; i++) {
+        inner_product(ref_data, data + i * n * 3, n, A);
+        rmsd_data[i] = qcp(A, G_ref, self_inner_product(data + i * n * 3, n),
+                           n, rot_data + i * 9);
+    }
+    Py_END_ALLOW_THREADS
+
+exit:
+    PyBuffer_Release(&reference);
+    PyBuffer_Release(&coords);
+    PyBuffer_Release(&rotations);
+    PyBuffer_Release(&rmsds);
+    if (PyErr_Occurred()) return NULL;
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef qcprot_methods[] = {
+    {"rmsd_matrix", rmsd_matrix, METH_VARARGS, rmsd_matrix__doc__},
+    {"superimpose", superimpose, METH_VARARGS, superimpose__doc__},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_qcprot",
+    "Batched QCP superposition (C implementation).",
+    -1,
+    qcprot_methods
+};
+
+PyMODINIT_FUNC
+PyInit__qcprot(void)
+{
+    return PyModule_Create(&moduledef);
+}
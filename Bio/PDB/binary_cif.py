@@ -4,6 +4,7 @@ A module to interact with BinaryCIF-formatted files.
 
 import gzip
 from collections import deque
+from functools import partial
 from typing import Optional
 
 import numpy as np
@@ -18,6 +19,11 @@ except ImportError:
     ) from None
 
 import Bio.PDB._bcif_helper as _bcif_helper
+from Bio.PDB.mmcifio import _atom_site_missing
+from Bio.PDB.mmcifio import _get_atom_site_columns
+from Bio.PDB.mmcifio import _get_data_block_name
+from Bio.PDB.PDBIO import Select
+from Bio.PDB.PDBIO import StructureIO
 from Bio.PDB.Structure import Structure
 from Bio.PDB.StructureBuilder import StructureBuilder
 
@@ -36,6 +42,10 @@ _dtypes = {
     33: np.dtype("<f8"),  # Float64
 }
 
+_types = {dtype: type_code for type_code, dtype in _dtypes.items()}
+
+_select = Select()
+
 
 def _byte_array_decoder(column):
     encoding = column["data"]["encoding"][-1]
@@ -303,3 +313,253 @@ class BinaryCIFParser:
             self._structure_builder.init_atom(**atoms[index])
 
         return self._structure_builder.get_structure()
+
+
+# Encoders, each the inverse of the decoder of the same kind above. They take
+# the data produced by the previous encoder and append their encoding to the
+# list of encodings, which is decoded in reverse order.
+
+
+def _byte_array_encoder(data, encodings):
+    data = data.astype(data.dtype.newbyteorder("<"), copy=False)
+    encodings.append({"kind": "ByteArray", "type": _types[data.dtype]})
+    return data.tobytes()
+
+
+def _fixed_point_encoder(data, encodings, factor):
+    encodings.append(
+        {"kind": "FixedPoint", "factor": factor, "srcType": _types[data.dtype]}
+    )
+    return np.round(data * factor).astype("<i4")
+
+
+def _run_length_encoder(data, encodings):
+    encodings.append(
+        {"kind": "RunLength", "srcType": _types[data.dtype], "srcSize": len(data)}
+    )
+    if len(data) == 0:
+        return np.empty(0, "<i4")
+    starts = np.flatnonzero(np.diff(data)) + 1
+    starts = np.concatenate(([0], starts))
+    counts = np.diff(np.append(starts, len(data)))
+    return np.column_stack((data[starts], counts)).ravel().astype("<i4")
+
+
+def _delta_encoder(data, encodings):
+    data = data.astype("<i4")
+    origin = int(data[0]) if len(data) else 0
+    encodings.append({"kind": "Delta", "origin": origin, "srcType": 3})
+    return np.diff(data, prepend=origin).astype("<i4")
+
+
+def _integer_packing_encoder(data, encodings):
+    data = data.astype(np.int64)
+    is_unsigned = len(data) == 0 or bool(data.min() >= 0)
+    if is_unsigned:
+        limits = ((1, 255, 0, "<u1"), (2, 65535, 0, "<u2"))
+    else:
+        limits = ((1, 127, -128, "<i1"), (2, 32767, -32768, "<i2"))
+    best = None
+    for byte_count, upper, lower, dtype in limits:
+        # Values beyond the limits are split into a run of limit values
+        # followed by the remainder.
+        if is_unsigned:
+            runs = data // upper
+        else:
+            runs = np.where(data >= 0, data // upper, data // lower)
+        size = len(data) + int(runs.sum())
+        if best is None or size * byte_count < best[0] * best[1]:
+            best = (size, byte_count, upper, lower, dtype, runs)
+    size, byte_count, upper, lower, dtype, runs = best
+    packed = np.repeat(np.where(data >= 0, upper, lower), runs + 1)
+    remainders = data - runs * np.where(data >= 0, upper, lower)
+    packed[np.cumsum(runs + 1) - 1] = remainders
+    encodings.append(
+        {
+            "kind": "IntegerPacking",
+            "byteCount": byte_count,
+            "isUnsigned": is_unsigned,
+            "srcSize": len(data),
+        }
+    )
+    return packed.astype(dtype)
+
+
+def _string_array_encoder(data, encodings):
+    unique_strings, indices = np.unique(data, return_inverse=True)
+    offsets = np.zeros(len(unique_strings) + 1, "<i4")
+    np.cumsum([len(value) for value in unique_strings], out=offsets[1:])
+    offset_encodings = []
+    offsets = _encode(offsets, _integer_encoders, offset_encodings)
+    data_encodings = []
+    indices = _encode(indices.astype("<i4"), _integer_encoders, data_encodings)
+    encodings.append(
+        {
+            "kind": "StringArray",
+            "dataEncoding": data_encodings,
+            "stringData": "".join(unique_strings),
+            "offsetEncoding": offset_encodings,
+            "offsets": offsets,
+        }
+    )
+    return indices
+
+
+def _encode(data, encoders, encodings):
+    for encoder in encoders:
+        data = encoder(data, encodings)
+    return data
+
+
+_integer_encoders = (
+    _delta_encoder,
+    _run_length_encoder,
+    _integer_packing_encoder,
+    _byte_array_encoder,
+)
+
+_mask_encoders = (_run_length_encoder, _integer_packing_encoder, _byte_array_encoder)
+
+_coordinate_encoders = (
+    partial(_fixed_point_encoder, factor=1000),
+    _delta_encoder,
+    _integer_packing_encoder,
+    _byte_array_encoder,
+)
+
+_float_encoders = (
+    partial(_fixed_point_encoder, factor=100),
+    _run_length_encoder,
+    _integer_packing_encoder,
+    _byte_array_encoder,
+)
+
+# Data types and encoders of the _atom_site columns
+_atom_site_encoding = {
+    "group_PDB": (object, (_string_array_encoder,)),
+    "id": (np.int32, _integer_encoders),
+    "type_symbol": (object, (_string_array_encoder,)),
+    "label_atom_id": (object, (_string_array_encoder,)),
+    "label_alt_id": (object, (_string_array_encoder,)),
+    "label_comp_id": (object, (_string_array_encoder,)),
+    "label_asym_id": (object, (_string_array_encoder,)),
+    "label_entity_id": (object, (_string_array_encoder,)),
+    "label_seq_id": (np.int32, _integer_encoders),
+    "pdbx_PDB_ins_code": (object, (_string_array_encoder,)),
+    "occupancy": (np.float64, _float_encoders),
+    "B_iso_or_equiv": (np.float64, _float_encoders),
+    "auth_seq_id": (np.int32, _integer_encoders),
+    "auth_asym_id": (object, (_string_array_encoder,)),
+    "pdbx_PDB_model_num": (np.int32, _integer_encoders),
+}
+
+
+def _encode_column(name, values, dtype, encoders, missing="?"):
+    """Encode a list of values, with None for missing values, as a column (PRIVATE)."""
+    is_missing = [value is None for value in values]
+    if any(is_missing):
+        # Mask values are 0 (present), 1 (".", not applicable) or 2 ("?", unknown)
+        mask = np.array(is_missing, np.uint8) * (1 if missing == "." else 2)
+        mask_encodings = []
+        mask = {
+            "data": _encode(mask, _mask_encoders, mask_encodings),
+            "encoding": mask_encodings,
+        }
+        empty = "" if dtype is object else 0
+        values = [empty if value is None else value for value in values]
+    else:
+        mask = None
+    if dtype is object:
+        data = np.array(values, dtype=object)
+        data[:] = [str(value) for value in values]
+    else:
+        data = np.array(values, dtype=dtype)
+    encodings = []
+    data = _encode(data, encoders, encodings)
+    return {"name": name, "data": {"data": data, "encoding": encodings}, "mask": mask}
+
+
+class BinaryCIFIO(StructureIO):
+    """Write a Structure object as a BinaryCIF file.
+
+    The _atom_site category is written with the same items as MMCIFIO, with
+    each column encoded in a compact binary representation (e.g. coordinates
+    as fixed point integers, delta and integer packing encoded). Files can be
+    read back with BinaryCIFParser. Filenames ending in ".gz" are compressed.
+
+    See the `BinaryCIF specification <https://github.com/molstar/BinaryCIF>`_.
+
+    Examples
+    --------
+        >>> from Bio.PDB import MMCIFParser
+        >>> from Bio.PDB.binary_cif import BinaryCIFIO
+        >>> parser = MMCIFParser()
+        >>> structure = parser.get_structure("1a8o", "PDB/1A8O.cif")
+        >>> io = BinaryCIFIO()
+        >>> io.set_structure(structure)
+        >>> io.save("bio-pdb-bcifio-out.bcif")
+        >>> import os
+        >>> os.remove("bio-pdb-bcifio-out.bcif")  # tidy up
+
+    """
+
+    def save(self, filepath, select=_select, preserve_atom_numbering=False):
+        """Save the structure to a file.
+
+        :param filepath: output file
+        :type filepath: string or binary filehandle
+
+        :param select: selects which entities will be written, as for
+            MMCIFIO.save.
+        """
+        columns, coords = _get_atom_site_columns(
+            self.structure.get_list(), select, preserve_atom_numbering
+        )
+        atom_site_columns = []
+        for name, values in columns.items():
+            dtype, encoders = _atom_site_encoding[name]
+            column = _encode_column(
+                name, values, dtype, encoders, _atom_site_missing.get(name, "?")
+            )
+            atom_site_columns.append(column)
+            if name == "pdbx_PDB_ins_code":
+                for i, name in enumerate(("Cartn_x", "Cartn_y", "Cartn_z")):
+                    encodings = []
+                    data = _encode(coords[:, i], _coordinate_encoders, encodings)
+                    atom_site_columns.append(
+                        {
+                            "name": name,
+                            "data": {"data": data, "encoding": encodings},
+                            "mask": None,
+                        }
+                    )
+        block_name = _get_data_block_name(self.structure.id)
+        entry_column = _encode_column(
+            "id", [block_name], object, (_string_array_encoder,)
+        )
+        data = {
+            "version": "0.3.0",
+            "encoder": "Biopython",
+            "dataBlocks": [
+                {
+                    "header": block_name,
+                    "categories": [
+                        {"name": "_entry", "rowCount": 1, "columns": [entry_column]},
+                        {
+                            "name": "_atom_site",
+                            "rowCount": len(coords),
+                            "columns": atom_site_columns,
+                        },
+                    ],
+                }
+            ],
+        }
+        if isinstance(filepath, str):
+            if filepath.endswith(".gz"):
+                handle = gzip.open(filepath, "wb")
+            else:
+                handle = open(filepath, "wb")
+            with handle:
+                msgpack.pack(data, handle)
+        else:
+            msgpack.pack(data, filepath)
@@ -11,7 +11,8 @@ See https://www.iucr.org/resources/cif/spec/version1.1/cifsyntax for syntax.
 """
 
 import re
-from collections import defaultdict
+
+import numpy as np
 
 from Bio.PDB.PDBIO import Select
 from Bio.PDB.PDBIO import StructureIO
@@ -45,9 +46,173 @@ mmcif_order = {
 }
 
 
+# Placeholder written for missing values in _atom_site columns
+_atom_site_missing = {
+    "type_symbol": "?",
+    "label_alt_id": ".",
+    "label_entity_id": "?",
+    "label_seq_id": ".",
+    "pdbx_PDB_ins_code": "?",
+    "auth_asym_id": ".",
+}
+
+
 _select = Select()
 
 
+def _get_label_asym_id(entity_id):
+    # Convert a positive integer into a chain ID
+    # Goes A to Z, then AA to ZA, AB to ZB etc
+    # This is in line with existing mmCIF files
+    div = entity_id
+    out = ""
+    while div > 0:
+        mod = (div - 1) % 26
+        out += chr(65 + mod)
+        div = int((div - mod) / 26)
+    return out
+
+
+def _get_data_block_name(structure_id):
+    # Data block name is the structure ID with special characters removed
+    for c in ["#", "$", "'", '"', "[", "]", " ", "\t", "\n"]:
+        structure_id = structure_id.replace(c, "")
+    return structure_id
+
+
+def _get_atom_site_columns(models, select, preserve_atom_numbering):
+    """Collect the _atom_site values of the given models column by column (PRIVATE).
+
+    Returns a dictionary mapping _atom_site item names (without the category
+    prefix) to lists of Python values, with None for missing values (see
+    _atom_site_missing), and an Nx3 array with the atomic coordinates. This
+    is shared by the mmCIF and BinaryCIF writers.
+    """
+    rows = []
+    coords = []
+    for model in models:
+        if not select.accept_model(model):
+            continue
+        # mmCIF files with a single model have it specified as model 1
+        if model.serial_num == 0:
+            model_n = 1
+        else:
+            model_n = model.serial_num
+        # This is used to write label_entity_id and label_asym_id and
+        # increments from 1, changing with each molecule
+        entity_id = 0
+        if not preserve_atom_numbering:
+            atom_number = 1
+        for chain in model.get_list():
+            if not select.accept_chain(chain):
+                continue
+            chain_id = chain.get_id()
+            if chain_id == " ":
+                chain_id = None
+            # This is used to write label_seq_id and increments from 1,
+            # remaining blank for hetero residues
+            residue_number = 1
+            prev_residue_type = ""
+            prev_resname = ""
+            for residue in chain.get_unpacked_list():
+                if not select.accept_residue(residue):
+                    continue
+                hetfield, resseq, icode = residue.get_id()
+                if hetfield == " ":
+                    residue_type = "ATOM"
+                    label_seq_id = residue_number
+                    residue_number += 1
+                else:
+                    residue_type = "HETATM"
+                    label_seq_id = None
+                if icode == " ":
+                    icode = None
+                resname = residue.get_resname()
+                # Check if the molecule changes within the chain
+                # This will always increment for the first residue in a
+                # chain due to the starting values above
+                if residue_type != prev_residue_type or (
+                    residue_type == "HETATM" and resname != prev_resname
+                ):
+                    entity_id += 1
+                prev_residue_type = residue_type
+                prev_resname = resname
+                label_asym_id = _get_label_asym_id(entity_id)
+                comp_id = resname.strip()
+                for atom in residue.get_unpacked_list():
+                    if not select.accept_atom(atom):
+                        continue
+                    if preserve_atom_numbering:
+                        atom_number = atom.get_serial_number()
+                    altloc = atom.get_altloc()
+                    rows.append(
+                        (
+                            residue_type,
+                            atom_number,
+                            atom.element.strip() or None,
+                            atom.get_name().strip(),
+                            None if altloc == " " else altloc,
+                            comp_id,
+                            label_asym_id,
+                            # The entity ID should be the same for similar
+                            # chains. However this is non-trivial to
+                            # calculate so we leave it unknown.
+                            None,
+                            label_seq_id,
+                            icode,
+                            atom.get_occupancy(),
+                            atom.get_bfactor(),
+                            resseq,
+                            chain_id,
+                            model_n,
+                        )
+                    )
+                    coords.append(atom.get_coord())
+                    if not preserve_atom_numbering:
+                        atom_number += 1
+    names = (
+        "group_PDB",
+        "id",
+        "type_symbol",
+        "label_atom_id",
+        "label_alt_id",
+        "label_comp_id",
+        "label_asym_id",
+        "label_entity_id",
+        "label_seq_id",
+        "pdbx_PDB_ins_code",
+        "occupancy",
+        "B_iso_or_equiv",
+        "auth_seq_id",
+        "auth_asym_id",
+        "pdbx_PDB_model_num",
+    )
+    if rows:
+        columns = dict(zip(names, map(list, zip(*rows))))
+        coords = np.array(coords, dtype=np.float64)
+    else:
+        columns = {name: [] for name in names}
+        coords = np.empty((0, 3), dtype=np.float64)
+    return columns, coords
+
+
+def _format_atom_site_columns(columns, coords):
+    """Convert _atom_site columns to the string lists of an mmCIF dictionary (PRIVATE)."""
+    atom_dict = {}
+    for name, values in columns.items():
+        missing = _atom_site_missing.get(name)
+        if missing is None:
+            values = [str(value) for value in values]
+        else:
+            values = [missing if value is None else str(value) for value in values]
+        atom_dict["_atom_site." + name] = values
+    for i, name in enumerate(("Cartn_x", "Cartn_y", "Cartn_z")):
+        atom_dict["_atom_site." + name] = [
+            f"{value:.3f}" for value in coords[:, i].tolist()
+        ]
+    return atom_dict
+
+
 class MMCIFIO(StructureIO):
     """Write a Structure object or a mmCIF dictionary as a mmCIF file.
 
@@ -116,6 +281,82 @@ class MMCIFIO(StructureIO):
         if close_file:
             fp.close()
 
+    def save_frames(
+        self, filepath, frames, select=_select, preserve_atom_numbering=False
+    ):
+        """Save a series of coordinate frames of the structure as models.
+
+        This is intended for trajectories and ensembles in which all models
+        share the atoms of the structure (e.g. molecular dynamics frames).
+        The _atom_site rows of the first model accepted by select are
+        formatted once into a template, after which each frame only requires
+        formatting its coordinates. Frames are written to the file as they
+        are taken from the iterable, so they need not all be kept in memory.
+
+        :param filepath: output file
+        :type filepath: string or filehandle
+
+        :param frames: iterable of Nx3 coordinate arrays, with N the number of
+            atoms written for the first accepted model, in the same order.
+            Frame i (starting from 1) is written as model number i.
+
+        :param select: selects which entities will be written (see save).
+        """
+        if not hasattr(self, "structure"):
+            raise ValueError("Use set_structure to set a structure to write out")
+        for model in self.structure.get_list():
+            if select.accept_model(model):
+                break
+        else:
+            raise ValueError("No model of the structure was selected")
+        columns, coords = _get_atom_site_columns(
+            [model], select, preserve_atom_numbering
+        )
+        n_atoms = len(coords)
+        atom_dict = _format_atom_site_columns(columns, coords)
+        # The model number is filled in for each frame
+        atom_dict["_atom_site.pdbx_PDB_model_num"] = ["\0"] * n_atoms
+        key_list = [
+            key for key in mmcif_order["_atom_site"] if "_atom_site." + key in atom_dict
+        ]
+        template_columns = []
+        for key in key_list:
+            column = self._format_mmcif_loop_col(atom_dict["_atom_site." + key])
+            if key.startswith("Cartn_"):
+                # Keep the width of the formatted coordinates of this model
+                width = len(column[0]) - 1 if column else 0
+                column = [f"%-{width}.3f "] * n_atoms
+            else:
+                column = [value.replace("%", "%%") for value in column]
+            template_columns.append(column)
+        template = "".join("".join(row) + "\n" for row in zip(*template_columns))
+
+        if isinstance(filepath, str):
+            fp = open(filepath, "w")
+            close_file = True
+        else:
+            fp = filepath
+            close_file = False
+        try:
+            fp.write(f"data_{_get_data_block_name(self.structure.id)}\n#\n")
+            fp.write("loop_\n")
+            for key in key_list:
+                fp.write("_atom_site." + key + "\n")
+            for model_n, frame in enumerate(frames, 1):
+                frame = np.asarray(frame, dtype=np.float64)
+                if frame.shape != (n_atoms, 3):
+                    raise ValueError(
+                        f"Frame {model_n} has shape {frame.shape}, "
+                        f"expected ({n_atoms}, 3)"
+                    )
+                fp.write(
+                    template.replace("\0", str(model_n)) % tuple(frame.ravel().tolist())
+                )
+            fp.write("#\n")
+        finally:
+            if close_file:
+                fp.close()
+
     def _save_dict(self, out_file):
         # Form dictionary where key is first part of mmCIF key and value is list
         # of corresponding second parts
@@ -189,31 +430,15 @@ class MMCIFIO(StructureIO):
             # If the value is more than one value, write as keys then a value table
             elif isinstance(sample_val, list):
                 out_file.write("loop_\n")
-                col_widths = {}
-                # Write keys and find max widths for each set of values
+                # Write keys, then format each column padded to its max width
+                columns = []
                 for i in key_list:
                     out_file.write(key + "." + i + "\n")
-                    col_widths[i] = 0
-                    for val in self.dic[key + "." + i]:
-                        len_val = len(val)
-                        # If the value requires quoting it will add 2 characters
-                        if self._requires_quote(val) and not self._requires_newline(
-                            val
-                        ):
-                            len_val += 2
-                        if len_val > col_widths[i]:
-                            col_widths[i] = len_val
+                    columns.append(self._format_mmcif_loop_col(self.dic[key + "." + i]))
                 # Technically the max of the sum of the column widths is 2048
 
                 # Write the values as rows
-                for i in range(n_vals):
-                    for col in key_list:
-                        out_file.write(
-                            self._format_mmcif_col(
-                                self.dic[key + "." + col][i], col_widths[col] + 1
-                            )
-                        )
-                    out_file.write("\n")
+                out_file.writelines("".join(row) + "\n" for row in zip(*columns))
             else:
                 raise ValueError(
                     "Invalid type in mmCIF dictionary: " + str(type(sample_val))
@@ -241,6 +466,27 @@ class MMCIFIO(StructureIO):
         else:
             return "{v: <{width}}".format(v=val, width=col_width)
 
+    def _format_mmcif_loop_col(self, values):
+        """Format all values of a loop column, padded to a common width (PRIVATE).
+
+        Values in a column typically repeat many times (residue names, chain
+        identifiers, elements), so each distinct value is checked for quoting
+        and formatted only once.
+        """
+        width = 0
+        quoted = {}
+        for val in set(values):
+            len_val = len(val)
+            # If the value requires quoting it will add 2 characters
+            if self._requires_quote(val) and not self._requires_newline(val):
+                len_val += 2
+            if len_val > width:
+                width = len_val
+            quoted[val] = None
+        for val in quoted:
+            quoted[val] = self._format_mmcif_col(val, width + 1)
+        return [quoted[val] for val in values]
+
     def _requires_newline(self, val):
         # Technically the space can be a tab too
         if "\n" in val or ("' " in val and '" ' in val):
@@ -264,115 +510,18 @@ class MMCIFIO(StructureIO):
 
     def _get_label_asym_id(self, entity_id):
         # Convert a positive integer into a chain ID
-        # Goes A to Z, then AA to ZA, AB to ZB etc
-        # This is in line with existing mmCIF files
-        div = entity_id
-        out = ""
-        while div > 0:
-            mod = (div - 1) % 26
-            out += chr(65 + mod)
-            div = int((div - mod) / 26)
-        return out
+        return _get_label_asym_id(entity_id)
 
     def _save_structure(self, out_file, select, preserve_atom_numbering):
-        atom_dict = defaultdict(list)
-
-        for model in self.structure.get_list():
-            if not select.accept_model(model):
-                continue
-            # mmCIF files with a single model have it specified as model 1
-            if model.serial_num == 0:
-                model_n = "1"
-            else:
-                model_n = str(model.serial_num)
-            # This is used to write label_entity_id and label_asym_id and
-            # increments from 1, changing with each molecule
-            entity_id = 0
-            if not preserve_atom_numbering:
-                atom_number = 1
-            for chain in model.get_list():
-                if not select.accept_chain(chain):
-                    continue
-                chain_id = chain.get_id()
-                if chain_id == " ":
-                    chain_id = "."
-                # This is used to write label_seq_id and increments from 1,
-                # remaining blank for hetero residues
-                residue_number = 1
-                prev_residue_type = ""
-                prev_resname = ""
-                for residue in chain.get_unpacked_list():
-                    if not select.accept_residue(residue):
-                        continue
-                    hetfield, resseq, icode = residue.get_id()
-                    if hetfield == " ":
-                        residue_type = "ATOM"
-                        label_seq_id = str(residue_number)
-                        residue_number += 1
-                    else:
-                        residue_type = "HETATM"
-                        label_seq_id = "."
-                    resseq = str(resseq)
-                    if icode == " ":
-                        icode = "?"
-                    resname = residue.get_resname()
-                    # Check if the molecule changes within the chain
-                    # This will always increment for the first residue in a
-                    # chain due to the starting values above
-                    if residue_type != prev_residue_type or (
-                        residue_type == "HETATM" and resname != prev_resname
-                    ):
-                        entity_id += 1
-                    prev_residue_type = residue_type
-                    prev_resname = resname
-                    label_asym_id = self._get_label_asym_id(entity_id)
-                    for atom in residue.get_unpacked_list():
-                        if select.accept_atom(atom):
-                            atom_dict["_atom_site.group_PDB"].append(residue_type)
-                            if preserve_atom_numbering:
-                                atom_number = atom.get_serial_number()
-                            atom_dict["_atom_site.id"].append(str(atom_number))
-                            if not preserve_atom_numbering:
-                                atom_number += 1
-                            element = atom.element.strip()
-                            if element == "":
-                                element = "?"
-                            atom_dict["_atom_site.type_symbol"].append(element)
-                            atom_dict["_atom_site.label_atom_id"].append(
-                                atom.get_name().strip()
-                            )
-                            altloc = atom.get_altloc()
-                            if altloc == " ":
-                                altloc = "."
-                            atom_dict["_atom_site.label_alt_id"].append(altloc)
-                            atom_dict["_atom_site.label_comp_id"].append(
-                                resname.strip()
-                            )
-                            atom_dict["_atom_site.label_asym_id"].append(label_asym_id)
-                            # The entity ID should be the same for similar chains
-                            # However this is non-trivial to calculate so we write "?"
-                            atom_dict["_atom_site.label_entity_id"].append("?")
-                            atom_dict["_atom_site.label_seq_id"].append(label_seq_id)
-                            atom_dict["_atom_site.pdbx_PDB_ins_code"].append(icode)
-                            coord = atom.get_coord()
-                            atom_dict["_atom_site.Cartn_x"].append(f"{coord[0]:.3f}")
-                            atom_dict["_atom_site.Cartn_y"].append(f"{coord[1]:.3f}")
-                            atom_dict["_atom_site.Cartn_z"].append(f"{coord[2]:.3f}")
-                            atom_dict["_atom_site.occupancy"].append(
-                                str(atom.get_occupancy())
-                            )
-                            atom_dict["_atom_site.B_iso_or_equiv"].append(
-                                str(atom.get_bfactor())
-                            )
-                            atom_dict["_atom_site.auth_seq_id"].append(resseq)
-                            atom_dict["_atom_site.auth_asym_id"].append(chain_id)
-                            atom_dict["_atom_site.pdbx_PDB_model_num"].append(model_n)
+        columns, coords = _get_atom_site_columns(
+            self.structure.get_list(), select, preserve_atom_numbering
+        )
+        atom_dict = {}
+        if len(coords):
+            atom_dict.update(_format_atom_site_columns(columns, coords))
 
         # Data block name is the structure ID with special characters removed
-        structure_id = self.structure.id
-        for c in ["#", "$", "'", '"', "[", "]", " ", "\t", "\n"]:
-            structure_id = structure_id.replace(c, "")
-        atom_dict["data_"] = structure_id
+        atom_dict["data_"] = _get_data_block_name(self.structure.id)
 
         # Set the dictionary and write out using the generic dictionary method
         self.dic = atom_dict
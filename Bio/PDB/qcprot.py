@@ -19,10 +19,17 @@ Theobald DL.
 Rapid calculation of RMSDs using a quaternion-based characteristic polynomial.
 Acta Crystallogr A. 2005 Jul;61(Pt 4):478-80. doi: 10.1107/S0108767305015266.
 Epub 2005 Jun 23. PMID: 15973002.
+
+For ensembles of conformers (e.g. NMR models or molecular dynamics frames),
+the functions rmsd_matrix and superimpose_ensemble operate on a stack of
+coordinate sets at once, using a C implementation of the same algorithm.
+The function get_ensemble_coords extracts such a stack from the models of a
+Structure.
 """
 
 import numpy as np
 
+from Bio.PDB import _qcprot
 from Bio.PDB.PDBExceptions import PDBException
 
 
@@ -361,3 +368,116 @@ class QCPSuperimposer:
         if self.rms is None:
             raise PDBException("Nothing superimposed yet.")
         return self.rms
+
+
+def _center_ensemble(coords):
+    """Return a centered float64 copy of an (M, N, 3) array and its centroids (PRIVATE)."""
+    coords = np.array(coords, dtype=np.float64, order="C")
+    if coords.ndim != 3 or coords.shape[2] != 3:
+        raise PDBException("Coordinates must be an MxNx3 array.")
+    if coords.shape[1] == 0:
+        raise PDBException("Coordinate sets are empty.")
+    centroids = coords.mean(axis=1)
+    coords -= centroids[:, np.newaxis, :]
+    return coords, centroids
+
+
+def rmsd_matrix(coords):
+    """Return the all-against-all RMSD matrix of an ensemble of coordinate sets.
+
+    Each pair of coordinate sets is optimally superimposed using QCP before
+    the RMSD is calculated; the coordinates themselves are not modified.
+
+    :param coords: array of shape (M, N, 3) with M coordinate sets of N points,
+        for example as returned by get_ensemble_coords.
+    :return: symmetric (M, M) numpy array of RMSD values.
+
+    >>> import numpy as np
+    >>> from Bio.PDB.qcprot import rmsd_matrix
+    >>> x = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 2.0, 0.0]])
+    >>> rotated = x @ np.array([[0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    >>> print(np.round(rmsd_matrix([x, rotated + 5.0]), 6))
+    [[0. 0.]
+     [0. 0.]]
+
+    """
+    coords, _ = _center_ensemble(coords)
+    m = coords.shape[0]
+    matrix = np.empty((m, m), dtype=np.float64)
+    _qcprot.rmsd_matrix(coords, matrix)
+    return matrix
+
+
+def superimpose_ensemble(coords, reference=0):
+    """Superimpose every coordinate set of an ensemble onto a reference.
+
+    :param coords: array of shape (M, N, 3) with M coordinate sets of N points.
+    :param reference: either the index of the reference coordinate set in
+        coords, or a separate (N, 3) array of reference coordinates.
+    :return: a tuple (rmsds, rotations, translations), with rmsds an (M,)
+        array of RMSD values after superposition, rotations an (M, 3, 3)
+        array of right multiplying rotation matrices and translations an
+        (M, 3) array of translation vectors, such that
+        ``coords[i] @ rotations[i] + translations[i]`` lies on top of the
+        reference (as in QCPSuperimposer.get_rotran).
+    """
+    coords, centroids = _center_ensemble(coords)
+    m, n, _ = coords.shape
+    if isinstance(reference, (int, np.integer)):
+        reference_coords = coords[reference]
+        reference_centroid = centroids[reference]
+    else:
+        reference_coords = np.array(reference, dtype=np.float64, order="C")
+        if reference_coords.shape != (n, 3):
+            raise PDBException("Reference must be an Nx3 array.")
+        reference_centroid = reference_coords.mean(axis=0)
+        reference_coords -= reference_centroid
+    rotations = np.empty((m, 3, 3), dtype=np.float64)
+    rmsds = np.empty(m, dtype=np.float64)
+    _qcprot.superimpose(reference_coords, coords, rotations, rmsds)
+    translations = reference_centroid - np.einsum("ij,ijk->ik", centroids, rotations)
+    return rmsds, rotations, translations
+
+
+def get_ensemble_coords(structure, atom_names=None):
+    """Return the coordinates of the models in a structure as an (M, N, 3) array.
+
+    Atoms are matched between models by chain identifier, residue identifier
+    and atom name, using the atom order of the first model. Models whose atoms
+    appear in the same order as in the first model (the usual case for NMR
+    ensembles and trajectories) are copied directly without lookups.
+
+    :param structure: a Structure object, or any iterable of Model objects.
+    :param atom_names: optional collection of atom names (e.g. ``{"CA"}``)
+        to restrict the coordinates to.
+    """
+    models = list(structure)
+    if not models:
+        raise PDBException("Structure does not contain any models.")
+
+    def get_atoms(model):
+        atoms = model.get_atoms()
+        if atom_names is not None:
+            atoms = (atom for atom in atoms if atom.name in atom_names)
+        return list(atoms)
+
+    def get_keys(atoms):
+        return [(atom.parent.parent.id, atom.parent.id, atom.name) for atom in atoms]
+
+    atoms = get_atoms(models[0])
+    keys = get_keys(atoms)
+    coords = np.empty((len(models), len(atoms), 3), dtype=np.float64)
+    coords[0] = [atom.coord for atom in atoms]
+    for i, model in enumerate(models[1:], 1):
+        atoms = get_atoms(model)
+        if get_keys(atoms) == keys:
+            coords[i] = [atom.coord for atom in atoms]
+            continue
+        lookup = {key: atom.coord for key, atom in zip(get_keys(atoms), atoms)}
+        try:
+            coords[i] = [lookup[key] for key in keys]
+        except KeyError as exception:
+            raise PDBException(
+                f"Atom {exception.args[0]} of the first model is missing in model {model.id}"
+            ) from None
+    return coords
@@ -0,0 +1,210 @@
+# Copyright 2026 by The Biopython Contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Run many CODEML, BASEML, or YN00 analyses in a batch.
+
+The ``run`` function runs a collection of ``Codeml``, ``Baseml``, or ``Yn00``
+instances, for example one for each gene family in a genome-wide analysis,
+and yields the parsed results of each analysis as soon as it finishes::
+
+    from Bio.Phylo.PAML import batch, codeml
+    jobs = {}
+    for name in families:
+        cml = codeml.Codeml(alignment=name + ".phy", tree=name + ".tree")
+        cml.set_options(seqtype=1, model=0, NSsites=[0, 1, 2])
+        jobs[name] = cml
+    for name, results in batch.run(jobs, workers=8, cache_dir="cache"):
+        print(name, results["NSsites"][0]["lnL"])
+
+Each analysis is run in its own temporary working directory, so that the
+auxiliary files written by PAML (such as ``rst`` and ``rub``) of analyses
+running at the same time do not overwrite each other. The ``working_dir``,
+``out_file``, and ``ctl_file`` attributes of the instances are ignored.
+
+If ``cache_dir`` is given, the parsed results of each analysis are stored in
+that directory, keyed by a hash of the alignment, the tree, and the options
+of the analysis. Rerunning the batch then skips the analyses that were
+already completed.
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+import subprocess
+import tempfile
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
+
+from . import baseml
+from . import codeml
+from . import yn00
+from ._paml import PamlError
+
+
+def _get_program(job):
+    """Return the default command and results parser of a PAML analysis (PRIVATE)."""
+    if isinstance(job, codeml.Codeml):
+        return "codeml", codeml.read
+    if isinstance(job, baseml.Baseml):
+        return "baseml", baseml.read
+    if isinstance(job, yn00.Yn00):
+        return "yn00", yn00.read
+    raise TypeError(
+        "Expected a Codeml, Baseml, or Yn00 instance, got %s" % type(job).__name__
+    )
+
+
+def _check_job(job):
+    """Check that the input files of a PAML analysis exist (PRIVATE)."""
+    _get_program(job)
+    if job.alignment is None:
+        raise ValueError("Alignment file not specified.")
+    if not os.path.exists(job.alignment):
+        raise FileNotFoundError("The specified alignment file does not exist.")
+    if isinstance(job, yn00.Yn00):
+        return
+    if job.tree is None:
+        raise ValueError("Tree file not specified.")
+    if not os.path.exists(job.tree):
+        raise FileNotFoundError("The specified tree file does not exist.")
+
+
+def _get_cache_key(job):
+    """Return a hash of the input files and options of a PAML analysis (PRIVATE)."""
+    checksum = hashlib.sha256()
+    checksum.update(type(job).__name__.encode())
+    for filename in (job.alignment, getattr(job, "tree", None)):
+        if filename is None:
+            checksum.update(b"\0")
+        else:
+            with open(filename, "rb") as handle:
+                data = handle.read()
+            checksum.update(b"%i\0" % len(data))
+            checksum.update(data)
+    checksum.update(repr(sorted(job.get_all_options())).encode())
+    return checksum.hexdigest()
+
+
+def _run_job(job, command, verbose):
+    """Run a single PAML analysis in a temporary directory (PRIVATE).
+
+    Return the parsed results.
+    """
+    default_command, read = _get_program(job)
+    if command is None:
+        command = default_command
+    with tempfile.TemporaryDirectory() as working_dir:
+        job = copy.copy(job)
+        job.working_dir = working_dir
+        job.out_file = os.path.join(working_dir, "results.out")
+        job.ctl_file = os.path.join(working_dir, os.path.basename(job.ctl_file))
+        job.write_ctl_file()
+        if verbose:
+            result_code = subprocess.call([command, job.ctl_file], cwd=working_dir)
+        else:
+            result_code = subprocess.call(
+                [command, job.ctl_file],
+                cwd=working_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        if result_code > 0:
+            # If the program fails for any reason
+            raise PamlError(
+                "%s has failed (return code %i). Run with verbose = True to view error message"
+                % (command, result_code)
+            )
+        if result_code < 0:
+            # If the PAML process is killed by a signal somehow
+            raise OSError(
+                "The %s process was killed (return code %i)." % (command, result_code)
+            )
+        return read(job.out_file)
+
+
+def run(jobs, workers=1, cache_dir=None, command=None, verbose=False):
+    """Run PAML analyses, and yield their results as they finish.
+
+    Arguments:
+     - jobs      - a dictionary of ``Codeml``, ``Baseml``, or ``Yn00``
+                   instances, or a sequence of such instances, in which case
+                   their index in the sequence is used as their name.
+     - workers   - the number of analyses to run at the same time, each in a
+                   separate process. The default value of 1 runs the analyses
+                   one by one, while None runs as many analyses at the same
+                   time as there are CPUs.
+     - cache_dir - optional directory in which the parsed results of each
+                   analysis are stored. Analyses whose results are found in
+                   the cache are not run again.
+     - command   - the PAML executable to run. By default, this is
+                   ``codeml``, ``baseml``, or ``yn00``, depending on the type
+                   of each analysis.
+     - verbose   - if True, show the output of the PAML executable.
+
+    This function yields a tuple (name, results) for each analysis, where
+    results is the dictionary returned by the ``read`` function of the
+    ``codeml``, ``baseml``, or ``yn00`` module. Cached results are yielded
+    first, followed by the other results in the order in which the analyses
+    finish. If an analysis fails, the exception is raised and the remaining
+    analyses are cancelled.
+    """
+    if not hasattr(jobs, "items"):
+        jobs = dict(enumerate(jobs))
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    pending = []
+    for name, job in jobs.items():
+        _check_job(job)
+        if cache_dir is None:
+            cache_filename = None
+        else:
+            key = _get_cache_key(job)
+            cache_filename = os.path.join(cache_dir, key + ".pickle")
+            try:
+                with open(cache_filename, "rb") as handle:
+                    results = pickle.load(handle)
+            except FileNotFoundError:
+                pass
+            else:
+                yield name, results
+                continue
+        pending.append((name, job, cache_filename))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(pending) <= 1:
+        for name, job, cache_filename in pending:
+            results = _run_job(job, command, verbose)
+            _save_results(results, cache_filename)
+            yield name, results
+        return
+    with ProcessPoolExecutor(min(workers, len(pending))) as executor:
+        futures = {
+            executor.submit(_run_job, job, command, verbose): (name, cache_filename)
+            for name, job, cache_filename in pending
+        }
+        try:
+            for future in as_completed(futures):
+                name, cache_filename = futures[future]
+                results = future.result()
+                _save_results(results, cache_filename)
+                yield name, results
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _save_results(results, cache_filename):
+    """Store the parsed results of a PAML analysis in the cache (PRIVATE)."""
+    if cache_filename is None:
+        return
+    # Write to a temporary file first, so that an interrupted batch does not
+    # leave a truncated file in the cache
+    temp_filename = cache_filename + ".tmp"
+    with open(temp_filename, "wb") as handle:
+        pickle.dump(results, handle)
+    os.replace(temp_filename, cache_filename)
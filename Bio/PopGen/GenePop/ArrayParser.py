@@ -0,0 +1,336 @@
+# Copyright 2026 by The Biopython Contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Parsing of GenePop files into NumPy arrays.
+
+The standard parser stores the genotypes as nested lists of tuples. This
+parser stores the genotypes as a NumPy array instead, which uses much less
+memory, and allows allele frequencies, heterozygosities, and F-statistics
+to be calculated for all loci at once.
+
+Classes:
+- Record - Holds GenePop data as NumPy arrays.
+
+Functions:
+- read - Parses a GenePop record (file) into a Record object.
+- read_chunks - Parses a GenePop file in chunks of loci.
+
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Please install NumPy if you want to use Bio.PopGen.GenePop.ArrayParser. "
+        "See http://www.numpy.org/"
+    ) from None
+
+
+def _read_header(handle):
+    """Read the comment line and the loci names (PRIVATE).
+
+    Return the comment line, the list of loci names, and the offset of the
+    population data in the handle.
+    """
+    comment_line = handle.readline().rstrip()
+    # We can now have one loci per line or all loci in a single line
+    # separated by either space or comma+space...
+    # We will remove all commas on loci... that should not be a problem
+    sample_loci_line = handle.readline().rstrip().replace(",", "")
+    loci_list = sample_loci_line.split(" ")
+    for line in iter(handle.readline, ""):
+        line = line.rstrip()
+        if line.upper() == "POP":
+            break
+        loci_list.append(line)
+    else:
+        raise ValueError("No population data found, file probably not GenePop related")
+    try:
+        offset = handle.tell()
+    except OSError:
+        offset = None
+    return comment_line, loci_list, offset
+
+
+def _read_data(handle, nloci, start, stop):
+    """Read the genotypes of the loci from start to stop (PRIVATE).
+
+    Return the marker length, the population names, the individual names,
+    the population offsets, and the genotypes.
+    """
+    marker_len = 0
+    pop_list = []
+    indiv_names = []
+    pop_offsets = [0]
+    genotypes = []
+    width = None
+    for line in handle:
+        line = line.rstrip()
+        if not line:
+            continue
+        if line.upper() == "POP":
+            if len(indiv_names) == pop_offsets[-1]:
+                raise ValueError("Population without individuals")
+            pop_list.append(indiv_names[-1])
+            pop_offsets.append(len(indiv_names))
+            continue
+        indiv_name, marker_line = line.split(",")
+        # Don't split the markers after the last locus that we need
+        markers = marker_line.split(None, stop)
+        if len(markers) < stop or (stop == nloci and len(markers) > nloci):
+            raise ValueError("Expected %i loci for individual %s" % (nloci, indiv_name))
+        if width is None:
+            width = len(markers[0])
+            if width in [2, 4]:  # 2 digits per allele
+                marker_len = 2
+            else:
+                marker_len = 3
+        markers = " ".join(markers[start:stop]) + " "
+        data = np.frombuffer(markers.encode("ascii"), np.uint8)
+        try:
+            data = data.reshape(-1, width + 1)
+        except ValueError:
+            data = None
+        if data is None or (data[:, -1] != ord(" ")).any():
+            raise ValueError(
+                "Inconsistent allele code lengths for individual %s" % indiv_name
+            )
+        digits = data[:, :-1] - ord("0")
+        if (digits > 9).any():
+            raise ValueError("Invalid allele codes for individual %s" % indiv_name)
+        # Combine the digits of each allele into a number
+        digits = digits.reshape(len(data), -1, marker_len).astype(np.int16)
+        genotype = np.zeros(digits.shape[:2], np.int16)
+        for i in range(marker_len):
+            genotype *= 10
+            genotype += digits[:, :, i]
+        indiv_names.append(indiv_name)
+        genotypes.append(genotype)
+    if len(indiv_names) == pop_offsets[-1]:
+        raise ValueError("Population without individuals")
+    pop_list.append(indiv_names[-1])
+    pop_offsets.append(len(indiv_names))
+    genotypes = np.array(genotypes, np.int16).reshape(
+        len(indiv_names), stop - start, width // marker_len
+    )
+    pop_offsets = np.array(pop_offsets)
+    return marker_len, pop_list, indiv_names, pop_offsets, genotypes
+
+
+def read(handle):
+    """Parse a handle containing a GenePop file.
+
+    Arguments:
+    - handle is a file-like object that contains a GenePop record.
+
+    """
+    record = Record()
+    record.comment_line, record.loci_list, _ = _read_header(handle)
+    nloci = len(record.loci_list)
+    (
+        record.marker_len,
+        record.pop_list,
+        record.indiv_names,
+        record.pop_offsets,
+        record.genotypes,
+    ) = _read_data(handle, nloci, 0, nloci)
+    return record
+
+
+def read_chunks(handle, size=10000):
+    """Parse a GenePop file in chunks of loci.
+
+    Arguments:
+    - handle is a seekable file-like object that contains a GenePop record.
+    - size is the number of loci in each chunk.
+
+    This function yields a Record object for every ``size`` consecutive
+    loci, with the genotypes of all individuals for these loci. The data
+    are reread from the handle for each chunk, so that memory use is
+    bounded by the number of individuals times the chunk size, even for
+    files with hundreds of thousands of loci. As the statistics of the
+    Record are calculated per locus, they can be calculated chunk by chunk.
+    """
+    if size < 1:
+        raise ValueError("size must be positive")
+    comment_line, loci_list, offset = _read_header(handle)
+    if offset is None:
+        raise ValueError("handle must be seekable")
+    nloci = len(loci_list)
+    for start in range(0, nloci, size):
+        stop = min(start + size, nloci)
+        handle.seek(offset)
+        record = Record()
+        record.comment_line = comment_line
+        record.loci_list = loci_list[start:stop]
+        (
+            record.marker_len,
+            record.pop_list,
+            record.indiv_names,
+            record.pop_offsets,
+            record.genotypes,
+        ) = _read_data(handle, nloci, start, stop)
+        yield record
+
+
+class Record:
+    """Hold information from a GenePop record as NumPy arrays.
+
+    Members:
+
+        - marker_len         The marker length (2 or 3 digit code per allele).
+
+        - comment_line       Comment line.
+
+        - loci_list          List of loci names.
+
+        - pop_list           List of population names.
+
+        - indiv_names        List of individual names.
+
+        - pop_offsets        Array with the index of the first individual of
+                             each population, followed by the number of
+                             individuals.
+
+        - genotypes          Array of allele codes, of shape (individuals,
+                             loci, ploidy) and data type int16. As in the
+                             GenePop format, missing alleles are stored as 0.
+
+    The individuals of population i are stored in the rows from
+    ``pop_offsets[i]`` to ``pop_offsets[i + 1]`` of ``genotypes``.
+    """
+
+    def __init__(self):
+        """Initialize the class."""
+        self.marker_len = 0
+        self.comment_line = ""
+        self.loci_list = []
+        self.pop_list = []
+        self.indiv_names = []
+        self.pop_offsets = np.zeros(1, int)
+        self.genotypes = np.zeros((0, 0, 2), np.int16)
+
+    def allele_counts(self):
+        """Count the alleles of each locus in each population.
+
+        Return a tuple (alleles, counts). The alleles array has one row for
+        each locus, listing the allele codes found at that locus in
+        increasing order, padded with zeros. The counts array has shape
+        (populations, loci, alleles), and stores the number of copies of
+        each allele in each population. Missing alleles are not counted.
+        """
+        npops = len(self.pop_list)
+        nloci = self.genotypes.shape[1]
+        pops = np.repeat(np.arange(npops), np.diff(self.pop_offsets))
+        size = int(self.genotypes.max(initial=0)) + 1
+        if npops * nloci * size <= 4 * self.genotypes.size:
+            # Count the copies of each allele code directly
+            indices = pops[:, None, None] * nloci + np.arange(nloci)[:, None]
+            indices = indices * size + self.genotypes
+            counts = np.bincount(indices.ravel(), minlength=npops * nloci * size)
+            counts = counts.reshape(npops, nloci, size)[:, :, 1:]
+            loci, columns = np.nonzero(counts.any(axis=0))
+            codes = columns + 1
+            counts = counts[:, loci, columns]
+        else:
+            # Number the (locus, allele) pairs found to avoid a huge array
+            present = self.genotypes > 0
+            keys = np.arange(nloci)[:, None] * 1000 + self.genotypes
+            keys, columns = np.unique(keys[present], return_inverse=True)
+            indices = np.broadcast_to(pops[:, None, None], present.shape)[present]
+            indices = indices * len(keys) + columns
+            counts = np.bincount(indices, minlength=npops * len(keys))
+            counts = counts.reshape(npops, len(keys))
+            loci = keys // 1000
+            codes = keys % 1000
+        # Store the alleles of each locus in the first columns of the arrays
+        ranks = np.arange(len(loci)) - np.searchsorted(loci, loci)
+        nalleles = ranks.max() + 1 if len(ranks) else 0
+        alleles = np.zeros((nloci, nalleles), np.int16)
+        alleles[loci, ranks] = codes
+        compact = np.zeros((npops, nloci, nalleles), int)
+        compact[:, loci, ranks] = counts
+        return alleles, compact
+
+    def allele_frequencies(self):
+        """Calculate the allele frequencies of each locus in each population.
+
+        Return a tuple (alleles, frequencies), where alleles is as returned
+        by ``allele_counts``, and frequencies is an array of shape
+        (populations, loci, alleles). The frequencies are nan for loci
+        without data in a population.
+        """
+        alleles, counts = self.allele_counts()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frequencies = counts / counts.sum(axis=2, keepdims=True)
+        return alleles, frequencies
+
+    def _get_observed_heterozygosity(self):
+        """Return the observed heterozygosity of each locus in each population (PRIVATE)."""
+        if self.genotypes.shape[2] != 2:
+            raise ValueError("heterozygosity requires diploid data")
+        first, second = self.genotypes[:, :, 0], self.genotypes[:, :, 1]
+        typed = (first > 0) & (second > 0)
+        heterozygous = typed & (first != second)
+        offsets = self.pop_offsets[:-1]
+        typed = np.add.reduceat(typed, offsets, axis=0)
+        heterozygous = np.add.reduceat(heterozygous, offsets, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return heterozygous / typed
+
+    def heterozygosity(self):
+        """Calculate the heterozygosity of each locus in each population.
+
+        Return a tuple (observed, expected) of arrays of shape (populations,
+        loci). The observed heterozygosity is the fraction of heterozygous
+        individuals among the individuals without missing alleles at the
+        locus. The expected heterozygosity is calculated from the allele
+        frequencies as one minus the sum of their squares. The values are
+        nan for loci without data in a population.
+        """
+        observed = self._get_observed_heterozygosity()
+        _, frequencies = self.allele_frequencies()
+        expected = 1 - (frequencies**2).sum(axis=2)
+        return observed, expected
+
+    def f_statistics(self):
+        """Calculate the F-statistics of each locus.
+
+        Return a tuple (fis, fst, fit) of arrays with one value for each
+        locus, calculated from the heterozygosities following Nei (1977):
+
+         - Fis = 1 - Ho / Hs
+         - Fst = 1 - Hs / Ht
+         - Fit = 1 - Ho / Ht
+
+        where Ho and Hs are the mean observed and expected heterozygosity
+        over the populations with data at the locus, and Ht is the expected
+        heterozygosity of the mean allele frequencies of these populations.
+        """
+        observed = self._get_observed_heterozygosity()
+        _, frequencies = self.allele_frequencies()
+        expected = 1 - (frequencies**2).sum(axis=2)
+        ho = _nanmean(observed)
+        hs = _nanmean(expected)
+        ht = 1 - (_nanmean(frequencies) ** 2).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fis = 1 - ho / hs
+            fst = 1 - hs / ht
+            fit = 1 - ho / ht
+        return fis, fst, fit
+
+
+def _nanmean(values):
+    """Return the mean over the populations, ignoring nan values (PRIVATE).
+
+    Unlike numpy.nanmean, this does not warn if all values are nan.
+    """
+    valid = ~np.isnan(values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(valid, values, 0).sum(axis=0) / valid.sum(axis=0)
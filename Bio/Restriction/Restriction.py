@@ -87,6 +87,8 @@ import re
 import string
 import warnings
 
+import numpy as np
+
 from Bio import BiopythonWarning
 from Bio.Restriction.PrintFormat import PrintFormat
 from Bio.Restriction.Restriction_Dictionary import rest_dict as enzymedict
@@ -245,6 +247,252 @@ class FormattedSeq:
         return self.klass(self.data[i])
 
 
+class _StreamedSeq:
+    """Length and shape of a sequence searched in chunks (PRIVATE).
+
+    Stands in for the ``FormattedSeq`` of the enzymes after a search with
+    ``RestrictionBatch.search_chunks``, as the sequence itself is not kept.
+    """
+
+    def __init__(self, length, linear=True):
+        """Initialize with the length and the topology of the sequence."""
+        self.length = length
+        self.linear = linear
+
+    def __len__(self):
+        """Return the length of the sequence."""
+        return self.length
+
+    def is_linear(self):
+        """Return if sequence is linear (True) or circular (False)."""
+        return self.linear
+
+
+class _SiteFinder:
+    """Find the sites of all enzymes of a batch in a single scan (PRIVATE).
+
+    The sequence is read in blocks. In each block, the positions of the
+    k-mers of unambiguous nucleotides are sorted by k-mer once. Each site is
+    then looked up through the k-mer buckets of its most specific stretch of
+    up to four positions (its anchor), and only these candidate positions are
+    compared to the rest of the site. The last bases of a block are carried
+    over to the next block, and the first bases of a circular sequence are
+    appended to its last block, so that sites spanning a block boundary or
+    the origin are found without copying the sequence.
+
+    The sites found are the same as those matched by the regular expression
+    of each enzyme (``compsite``), which is used directly for the few sites
+    that cannot be anchored.
+    """
+
+    blocksize = 1 << 20
+    _lookahead = re.compile(r"\(\?=\(\?P<(\w+)>([^()]*)\)\)")
+    _token = re.compile(r"\[[A-Z]+\]|[A-Z.]")
+    _codes = np.full(256, 4, np.uint8)
+    _codes[list(b"ACGT")] = range(4)
+
+    def __init__(self, enzymes):
+        """Initialize the finder with the enzymes of a batch."""
+        self.enzymes = list(enzymes)
+        self.sites = []  # (enzyme, forward, size, k, offset, kmers, checks)
+        self.fallback = []
+        tables = {}
+        for enzyme in self.enzymes:
+            sites = []
+            pattern = enzyme.compsite.pattern
+            lookaheads = self._lookahead.findall(pattern)
+            if "|".join(f"(?=(?P<{n}>{s}))" for n, s in lookaheads) != pattern:
+                lookaheads = []
+            for name, site in lookaheads:
+                tokens = self._token.findall(site)
+                anchor = self._anchor(tokens)
+                if "".join(tokens) != site or anchor is None:
+                    break
+                k, offset, kmers = anchor
+                checks = []
+                for i, token in enumerate(tokens):
+                    if token == "." or offset <= i < offset + k:
+                        continue
+                    letters = token.strip("[]").encode()
+                    table = tables.get(letters)
+                    if table is None:
+                        table = np.zeros(256, bool)
+                        table[list(letters)] = True
+                        tables[letters] = table
+                    checks.append((len(letters), i, table))
+                # Test the most specific positions first
+                checks = [(i, table) for count, i, table in sorted(checks)]
+                forward = name == str(enzyme)
+                sites.append((enzyme, forward, len(tokens), k, offset, kmers, checks))
+            if sites and len(sites) == len(lookaheads):
+                self.sites.extend(sites)
+            else:
+                self.fallback.append(enzyme)
+        sizes = [site[2] for site in self.sites]
+        sizes += [enzyme.size for enzyme in self.fallback]
+        self.size = max(sizes, default=1)
+        self.ks = {site[3] for site in self.sites}
+
+    @staticmethod
+    def _anchor(tokens):
+        """Return the most specific stretch of nucleotide positions (PRIVATE).
+
+        Returns a tuple (k, offset, kmers), with the codes of the k-mers
+        matched by the k positions starting at offset, or None if none of the
+        positions is restricted to A, C, G, and T.
+        """
+        best = None
+        for offset in range(len(tokens)):
+            choices = []
+            count = 1
+            for token in tokens[offset : offset + 4]:
+                letters = token.strip("[]")
+                if letters == "." or letters.strip("ACGT"):
+                    break
+                choices.append(letters)
+                count *= len(letters)
+                cost = count / 4 ** len(choices)
+                if best is None or cost < best[0]:
+                    best = (cost, offset, choices[:])
+        if best is None:
+            return None
+        cost, offset, choices = best
+        kmers = []
+        for kmer in itertools.product(*choices):
+            code = 0
+            for letter in kmer:
+                code = 4 * code + "ACGT".index(letter)
+            kmers.append(code)
+        return len(choices), offset, sorted(kmers)
+
+    def _blocks(self, chunks, linear):
+        """Yield the blocks of the sequence (PRIVATE).
+
+        Each block is yielded as a tuple (position, data, limit), where data
+        are the bytes starting at the 0-based position in the sequence, and
+        only sites starting in the first limit bytes of data are reported.
+        The length of the sequence is yielded last.
+        """
+        overlap = self.size - 1
+        position = 0
+        head = b""
+        pending = []
+        size = 0
+        for chunk in chunks:
+            if not linear and len(head) < overlap:
+                head += chunk[: overlap - len(head)]
+            pending.append(chunk)
+            size += len(chunk)
+            if size >= self.blocksize and size > overlap:
+                data = b"".join(pending)
+                limit = size - overlap
+                yield position, data, limit
+                position += limit
+                pending = [data[limit:]]
+                size = overlap
+        tail = b"".join(pending)
+        if tail:
+            if linear:
+                yield position, tail, len(tail)
+            else:
+                yield position, tail + head, len(tail)
+        yield position + len(tail)
+
+    def _scan(self, data, limit):
+        """Return the 0-based starts of each site in a block (PRIVATE)."""
+        size = len(data)
+        data = np.frombuffer(data, np.uint8)
+        codes = self._codes[data]
+        buckets = {}
+        for k in self.ks:
+            n = size - k + 1
+            if n <= 0:
+                continue
+            kmers = np.zeros(n, np.uint16)
+            invalid = np.zeros(n, bool)
+            for i in range(k):
+                kmers <<= 2
+                kmers |= codes[i : i + n] & 3
+                invalid |= codes[i : i + n] > 3
+            kmers[invalid] = 4**k
+            order = np.argsort(kmers, kind="stable")
+            bounds = np.zeros(4**k + 2, np.intp)
+            np.cumsum(np.bincount(kmers, minlength=4**k + 1), out=bounds[1:])
+            buckets[k] = (order, bounds)
+        starts = []
+        for enzyme, forward, length, k, offset, kmers, checks in self.sites:
+            if k not in buckets:
+                starts.append(None)
+                continue
+            order, bounds = buckets[k]
+            indices = [order[bounds[kmer] : bounds[kmer + 1]] for kmer in kmers]
+            if len(indices) == 1:
+                indices = indices[0] - offset
+            else:
+                indices = np.concatenate(indices) - offset
+                indices.sort()
+            indices = indices[
+                (indices >= 0) & (indices < min(limit, size - length + 1))
+            ]
+            for i, table in checks:
+                indices = indices[table[data[indices + i]]]
+            starts.append(indices)
+        return starts
+
+    def search(self, chunks, linear=True):
+        """Return the starts of the sites of each enzyme, and the length.
+
+        chunks is an iterable of bytes, formatted as the data of a
+        ``FormattedSeq`` but without the leading space. Returns a dictionary
+        mapping each enzyme to a tuple of two lists, with the 1-based starts
+        of the sites on the forward strand and on the reverse strand, and the
+        length of the sequence. As for the regular expressions, a start is
+        reported on the reverse strand only if the site is not found on the
+        forward strand at the same position.
+        """
+        found = [[] for site in self.sites]
+        matches = {enzyme: ([], []) for enzyme in self.fallback}
+        for block in self._blocks(chunks, linear):
+            if isinstance(block, int):
+                length = block
+                break
+            position, data, limit = block
+            for indices, starts in zip(self._scan(data, limit), found):
+                if indices is not None and len(indices):
+                    starts.append(indices + (position + 1))
+            if self.fallback:
+                text = data.decode("ASCII")
+                for enzyme, (forward, reverse) in matches.items():
+                    name = str(enzyme)
+                    for match in enzyme.compsite.finditer(text):
+                        start = match.start()
+                        if start >= limit:
+                            break
+                        if match.group(name):
+                            forward.append(position + start + 1)
+                        else:
+                            reverse.append(position + start + 1)
+        sites = {enzyme: ([], []) for enzyme in self.enzymes}
+        for site, starts in zip(self.sites, found):
+            enzyme, forward = site[:2]
+            sites[enzyme][0 if forward else 1].extend(starts)
+        results = {}
+        for enzyme, (forward, reverse) in sites.items():
+            if enzyme in matches:
+                results[enzyme] = matches[enzyme]
+                continue
+            forward = np.concatenate(forward) if forward else np.zeros(0, np.intp)
+            if reverse:
+                reverse = np.concatenate(reverse)
+                if len(forward):
+                    indices = np.searchsorted(forward, reverse)
+                    indices[indices == len(forward)] = 0
+                    reverse = reverse[forward[indices] != reverse]
+                reverse = reverse.tolist()
+            results[enzyme] = (forward.tolist(), reverse)
+        return results, length
+
+
 class RestrictionType(type):
     """RestrictionType. Type from which all enzyme classes are derived.
 
@@ -972,7 +1220,19 @@ class Palindromic(AbstractCut):
         Implement the search method for palindromic enzymes.
         """
         siteloc = cls.dna.finditer(cls.compsite, cls.size)
-        cls.results = [r for s, g in siteloc for r in cls._modify(s)]
+        return cls._cut_sites([s for s, g in siteloc], [])
+
+    @classmethod
+    def _cut_sites(cls, forward, reverse):
+        """Return the cutting sites for the given site starts (PRIVATE).
+
+        For internal use only.
+
+        forward and reverse are the lists of the sites found on each strand,
+        as returned by ``_SiteFinder.search``. For palindromic enzymes, all
+        sites are found on the forward strand.
+        """
+        cls.results = [r for s in forward for r in cls._modify(s)]
         if cls.results:
             cls._drop()
         return cls.results
@@ -1001,17 +1261,29 @@ class NonPalindromic(AbstractCut):
         Implement the search method for non palindromic enzymes.
         """
         iterator = cls.dna.finditer(cls.compsite, cls.size)
-        cls.results = []
-        modif = cls._modify
-        revmodif = cls._rev_modify
         s = str(cls)
-        cls.on_minus = []
-
+        forward = []
+        reverse = []
         for start, group in iterator:
             if group(s):
-                cls.results += list(modif(start))
+                forward.append(start)
             else:
-                cls.on_minus += list(revmodif(start))
+                reverse.append(start)
+        return cls._cut_sites(forward, reverse)
+
+    @classmethod
+    def _cut_sites(cls, forward, reverse):
+        """Return the cutting sites for the given site starts (PRIVATE).
+
+        For internal use only.
+
+        forward and reverse are the lists of the sites found on each strand,
+        as returned by ``_SiteFinder.search``.
+        """
+        modif = cls._modify
+        revmodif = cls._rev_modify
+        cls.results = [r for start in forward for r in modif(start)]
+        cls.on_minus = [r for start in reverse for r in revmodif(start)]
         cls.results += cls.on_minus
 
         if cls.results:
@@ -2212,36 +2484,107 @@ class RestrictionBatch(set):
         supply = [" = ".join(i) for i in cls.suppl_codes().items()]
         print("\n".join(supply))
 
+    def _site_finder(self):
+        """Return the site finder for the enzymes in the batch (PRIVATE).
+
+        The finder is built once, and again only if enzymes were added to or
+        removed from the batch since, in which case the cached search results
+        are discarded.
+        """
+        enzymes = frozenset(self)
+        finder = getattr(self, "_finder", None)
+        if finder is None or finder[0] != enzymes:
+            finder = enzymes, _SiteFinder(self)
+            self._finder = finder
+            self.already_mapped = None
+        return finder[1]
+
+    def _map(self, dna, sites):
+        """Store the cutting sites of each enzyme in the mapping (PRIVATE)."""
+        self.mapping = {}
+        for enzyme in self:
+            enzyme.dna = dna
+            self.mapping[enzyme] = enzyme._cut_sites(*sites[enzyme])
+        return self.mapping
+
     def search(self, dna, linear=True):
-        """Return a dic of cutting sites in the seq for the batch enzymes."""
+        """Return a dic of cutting sites in the seq for the batch enzymes.
+
+        The sites of all the enzymes are found in a single scan of the
+        sequence, which is read in blocks. The results are cached, and
+        returned again if the same sequence is searched for next.
+        """
         #
         #   here we replace the search method of the individual enzymes
         #   with one unique testing method.
         #
-        if not hasattr(self, "already_mapped"):
-            # TODO - Why does this happen!
-            # Try the "doctest" at the start of PrintFormat.py
-            self.already_mapped = None
         if isinstance(dna, DNA):
-            # For the searching, we just care about the sequence as a string,
-            # if that is the same we can use the cached search results.
-            # At the time of writing, Seq == method isn't implemented,
-            # and therefore does object identity which is stricter.
-            if (str(dna), linear) == self.already_mapped:
-                return self.mapping
-            else:
-                self.already_mapped = str(dna), linear
-                fseq = FormattedSeq(dna, linear)
-                self.mapping = {x: x.search(fseq) for x in self}
-                return self.mapping
-        elif isinstance(dna, FormattedSeq):
-            if (str(dna), dna.linear) == self.already_mapped:
-                return self.mapping
-            else:
-                self.already_mapped = str(dna), dna.linear
-                self.mapping = {x: x.search(dna) for x in self}
+            dna = FormattedSeq(dna, linear)
+        elif not isinstance(dna, FormattedSeq):
+            raise TypeError(
+                f"Expected Seq or MutableSeq instance, got {type(dna)} instead"
+            )
+        finder = self._site_finder()
+        # For the searching, we just care about the sequence as a string,
+        # if that is the same we can use the cached search results.
+        # Comparing the data of a FormattedSeq to itself is immediate.
+        if self.already_mapped is not None:
+            data, is_linear = self.already_mapped
+            if is_linear == dna.linear and data == dna.data:
                 return self.mapping
-        raise TypeError(f"Expected Seq or MutableSeq instance, got {type(dna)} instead")
+        data = dna.data
+        blocksize = finder.blocksize
+        chunks = (
+            data[i : i + blocksize].encode("ASCII")
+            for i in range(1, len(data), blocksize)
+        )
+        sites = finder.search(chunks, dna.linear)[0]
+        self.already_mapped = data, dna.linear
+        return self._map(dna, sites)
+
+    def _search_chunks(self, chunks, linear=True):
+        """Search a sequence given in chunks, and return its length (PRIVATE)."""
+        table = FormattedSeq._table
+        remove = FormattedSeq._remove_chars
+
+        def format_chunks():
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("ASCII", "replace")
+                else:
+                    chunk = bytes(chunk)
+                data = chunk.translate(table, delete=remove)
+                if 0 in data:
+                    raise TypeError(f"Invalid character found in {chunk.decode()}")
+                yield data
+
+        finder = self._site_finder()
+        sites, length = finder.search(format_chunks(), linear)
+        self.already_mapped = None
+        self._map(_StreamedSeq(length, linear), sites)
+        return length
+
+    def search_chunks(self, chunks, linear=True):
+        """Return a dic of cutting sites for a sequence given in chunks.
+
+        chunks is an iterable of consecutive parts of the sequence, as
+        ``Seq`` or ``MutableSeq`` objects, strings, or bytes, for example the
+        lines of a large FASTA file. The chunks are scanned in blocks of about
+        a million bases, and only the last bases of a block are kept after it
+        was scanned, so that sites spanning two blocks are found. If linear is
+        False, sites spanning the end and the start of the sequence are found
+        as well.
+
+        >>> from Bio.Restriction import EcoRI, RestrictionBatch
+        >>> rb = RestrictionBatch([EcoRI])
+        >>> rb.search_chunks(["AAAGAA", "TTCAAAGA", "ATTC"])
+        {EcoRI: [5, 14]}
+        >>> rb.search_chunks(["ATTCAAAAG", "A"], linear=False)
+        {EcoRI: [10]}
+
+        """
+        self._search_chunks(chunks, linear)
+        return self.mapping
 
 
 ###############################################################################
@@ -2267,13 +2610,23 @@ class Analysis(RestrictionBatch, PrintFormat):
         If no dictionary is given a new analysis using the RestrictionBatch
         which has been given when the Analysis class has been instantiated,
         will be carried out and used.
+
+        The sequence can also be given as an iterable of chunks, as for
+        ``RestrictionBatch.search_chunks``, to analyse a long sequence without
+        reading it into memory. The sequence is then stored as an undefined
+        sequence of the same length, and cannot be searched again or printed
+        as a map.
         """
         RestrictionBatch.__init__(self, restrictionbatch)
         self.rb = restrictionbatch
-        self.sequence = sequence
         self.linear = linear
-        if self.sequence:
-            self.search(self.sequence, self.linear)
+        if isinstance(sequence, (str, bytes, Seq, MutableSeq, FormattedSeq)):
+            self.sequence = sequence
+            if self.sequence:
+                self.search(self.sequence, self.linear)
+        else:
+            length = self._search_chunks(sequence, linear)
+            self.sequence = DNA(None, length)
 
     def __repr__(self):
         """Represent ``Analysis`` class as a string."""
@@ -225,6 +225,12 @@ file, so there is no need to specify it again in SearchIO.
 'comments' and 'fields' keyword arguments are both applicable for parsing,
 indexing, and writing.
 
+For large files, the read_batches and read_queries class methods of
+BlastTabParser read the rows into NumPy structured arrays, with one column per
+field, without creating QueryResult, Hit, and HSP objects. read_batches returns
+the rows in arrays of a fixed maximum size, while read_queries returns the rows
+of each query in a separate array.
+
 blast-tab provides the following attributes for each SearchIO objects:
 
 +-------------+-------------------+--------------+
@@ -8,12 +8,16 @@
 """Bio.SearchIO parser for BLAST+ tab output format, with or without comments."""
 
 import re
+from itertools import pairwise
 
+from Bio.File import as_handle
 from Bio.SearchIO._index import SearchIndexer
 from Bio.SearchIO._model import Hit
 from Bio.SearchIO._model import HSP
 from Bio.SearchIO._model import HSPFragment
 from Bio.SearchIO._model import QueryResult
+from Bio.SearchIO._utils import concatenate_tables
+from Bio.SearchIO._utils import make_table
 
 __all__ = ("BlastTabIndexer", "BlastTabParser", "BlastTabWriter")
 
@@ -206,6 +210,100 @@ def _augment_blast_hsp(hsp, attr):
         hsp.gap_pct = hsp.gap_num / hsp.aln_span * 100
 
 
+def _prep_fields(fields):
+    """Validate and format the given fields for use by the parser (PRIVATE)."""
+    # cast into list if fields is a space-separated string
+    if isinstance(fields, str):
+        fields = fields.strip().split(" ")
+    # blast allows 'std' as a proxy for the standard default lists
+    # we want to transform 'std' to its proper column names
+    if "std" in fields:
+        idx = fields.index("std")
+        fields = fields[:idx] + _DEFAULT_FIELDS + fields[idx + 1 :]
+    # if set(fields) has a null intersection with minimum required
+    # fields for hit and query, raise an exception
+    if not set(fields).intersection(_MIN_QUERY_FIELDS) or not set(fields).intersection(
+        _MIN_HIT_FIELDS
+    ):
+        raise ValueError("Required query and/or hit ID field not found.")
+
+    return fields
+
+
+def _table_fields(fields):
+    """Return the (name, type) pairs of the columns in a table (PRIVATE)."""
+    table_fields = []
+    for field in fields:
+        for mapping in (_COLUMN_QRESULT, _COLUMN_HIT, _COLUMN_HSP, _COLUMN_FRAG):
+            if field in mapping:
+                caster = mapping[field][1]
+                break
+        else:
+            caster = str
+        if caster not in (int, float):
+            # lists are stored as the semicolon-separated string
+            caster = str
+        table_fields.append((field, caster))
+    return table_fields
+
+
+def _iter_row_blocks(handle, comments, fields, size):
+    """Iterate over blocks of rows in a BLAST tabular file (PRIVATE).
+
+    This yields tuples (fields, rows, query_id), where rows is a list of at
+    most size rows, each split into its columns. For a commented file, the
+    fields are taken from the comment lines. A query without hits in a
+    commented file is reported as an empty list of rows, with query_id set
+    to the query ID in the comments; query_id is None otherwise.
+    """
+    fields = _prep_fields(fields)
+    rows = []
+    # ID of a query in the comments for which no rows were found yet
+    query_id = None
+    for line in handle:
+        if line.startswith("#"):
+            if not comments:
+                raise ValueError(
+                    "Encountered unexpected character '#' at the beginning of a line. "
+                    "Set comments=True if the file is a commented file."
+                )
+            if line.startswith(("# Query: ", "# BLAST processed")):
+                if query_id is not None:
+                    if rows:
+                        yield fields, rows, None
+                        rows = []
+                    yield fields, [], query_id
+                    query_id = None
+                if line.startswith("# Query: "):
+                    query_id = line[len("# Query: ") :].split(None, 1)[0]
+            elif line.startswith("# Fields: "):
+                long_fields = line[len("# Fields: ") :].strip().split(", ")
+                new_fields = [_LONG_SHORT_MAP[long_name] for long_name in long_fields]
+                new_fields = _prep_fields(new_fields)
+                if new_fields != fields:
+                    if rows:
+                        yield fields, rows, None
+                        rows = []
+                    fields = new_fields
+            continue
+        query_id = None
+        columns = line.rstrip("\r\n").split("\t")
+        if len(columns) != len(fields):
+            if not line.strip():
+                continue
+            raise ValueError(
+                "Expected %i columns, found: %i" % (len(fields), len(columns))
+            )
+        rows.append(columns)
+        if len(rows) == size:
+            yield fields, rows, None
+            rows = []
+    if rows:
+        yield fields, rows, None
+    if query_id is not None:
+        yield fields, [], query_id
+
+
 class BlastTabParser:
     """Parser for the BLAST tabular format."""
 
@@ -234,24 +332,98 @@ class BlastTabParser:
 
         yield from iterfunc()
 
+    @classmethod
+    def read_batches(cls, source, comments=False, fields=_DEFAULT_FIELDS, size=100000):
+        """Read the rows into NumPy structured arrays of up to size rows each.
+
+        Arguments:
+         - source   - File name or handle of the BLAST tabular output.
+         - comments - Whether the file contains comment lines (default False).
+         - fields   - Column names, as in the BLAST command line. For a
+                      commented file, the fields are read from the comments.
+         - size     - Maximum number of rows in each array (default 100000).
+
+        This iterates over structured arrays with one row for each HSP,
+        without creating QueryResult, Hit, and HSP objects. The columns of the
+        arrays are named after the fields. Integer and floating point fields
+        are stored as numbers; all other fields are stored as strings, as
+        found in the file. Coordinates are as in the file, i.e. 1-based, with
+        the start coordinate larger than the end coordinate on the minus
+        strand.
+
+        >>> from Bio.SearchIO.BlastIO import BlastTabParser
+        >>> filename = "Blast/tab_2226_tblastn_004.txt"
+        >>> for table in BlastTabParser.read_batches(filename, size=4):
+        ...     print(table["sstart"], table["send"], table["evalue"])
+        ...
+        [ 95 542  78 804] [ 388  754  371 1103] [2.e-67 4.e-05 2.e-67 3.e-09]
+        [161 866 173 899] [ 454 1165  466 1198] [4.e-67 3.e-09 2.e-66 1.e-09]
+        [3181] [3336] [1.7]
+        """
+        with as_handle(source) as handle:
+            blocks = _iter_row_blocks(handle, comments, fields, size)
+            for names, rows, query_id in blocks:
+                if rows:
+                    yield make_table(_table_fields(names), rows)
+
+    @classmethod
+    def read_queries(cls, source, comments=False, fields=_DEFAULT_FIELDS, size=100000):
+        """Read the rows of each query into a NumPy structured array.
+
+        Arguments:
+         - source   - File name or handle of the BLAST tabular output.
+         - comments - Whether the file contains comment lines (default False).
+         - fields   - Column names, as in the BLAST command line. For a
+                      commented file, the fields are read from the comments.
+         - size     - Number of rows read from the file at a time (default
+                      100000).
+
+        This iterates over (query_id, table) tuples, where table is a
+        structured array as returned by read_batches, containing the rows of
+        consecutive lines with the same query ID. For a commented file,
+        queries without hits are included as empty arrays.
+
+        >>> from Bio.SearchIO.BlastIO import BlastTabParser
+        >>> filename = "Blast/tab_2226_tblastn_005.txt"
+        >>> for query_id, table in BlastTabParser.read_queries(filename, comments=True):
+        ...     print(query_id, len(table), table["bitscore"].max(initial=0))
+        ...
+        random_s00 0 0.0
+        gi|16080617|ref|NP_391444.1| 3 34.7
+        gi|11464971:4-101 9 202.0
+        """
+        import numpy as np
+
+        pending = []  # parts of the table of the current query
+        pending_names = None
+        key = None
+        with as_handle(source) as handle:
+            blocks = _iter_row_blocks(handle, comments, fields, size)
+            for names, rows, query_id in blocks:
+                if pending and (not rows or names != pending_names):
+                    yield str(pending[0][key][0]), concatenate_tables(pending)
+                    pending = []
+                table_fields = _table_fields(names)
+                if not rows:
+                    yield query_id, make_table(table_fields, [])
+                    continue
+                key = next(k for k in ("qseqid", "qacc", "qaccver") if k in names)
+                table = make_table(table_fields, rows)
+                query_ids = table[key]
+                starts = np.flatnonzero(query_ids[1:] != query_ids[:-1]) + 1
+                boundaries = [0, *starts.tolist(), len(table)]
+                for start, end in pairwise(boundaries):
+                    if pending and pending[0][key][0] != query_ids[start]:
+                        yield str(pending[0][key][0]), concatenate_tables(pending)
+                        pending = []
+                    pending.append(table[start:end])
+                pending_names = names
+        if pending:
+            yield str(pending[0][key][0]), concatenate_tables(pending)
+
     def _prep_fields(self, fields):
         """Validate and format the given fields for use by the parser (PRIVATE)."""
-        # cast into list if fields is a space-separated string
-        if isinstance(fields, str):
-            fields = fields.strip().split(" ")
-        # blast allows 'std' as a proxy for the standard default lists
-        # we want to transform 'std' to its proper column names
-        if "std" in fields:
-            idx = fields.index("std")
-            fields = fields[:idx] + _DEFAULT_FIELDS + fields[idx + 1 :]
-        # if set(fields) has a null intersection with minimum required
-        # fields for hit and query, raise an exception
-        if not set(fields).intersection(_MIN_QUERY_FIELDS) or not set(
-            fields
-        ).intersection(_MIN_HIT_FIELDS):
-            raise ValueError("Required query and/or hit ID field not found.")
-
-        return fields
+        return _prep_fields(fields)
 
     def _parse_commented_qresult(self):
         """Yield ``QueryResult`` objects from a commented file (PRIVATE)."""
@@ -56,6 +56,12 @@ Also note that when using the domain table format writers, it will use HMMER's
 naming convention ('hmm' and 'ali') so the files you write will be similar to
 files written by a real HMMER program.
 
+For large 'hmmer3-text' and 'hmmer3-domtab' files, the read_table class method
+of the parsers (Hmmer3TextParser, Hmmer3DomtabHmmhitParser, and
+Hmmer3DomtabHmmqueryParser) reads the hits and domains into NumPy structured
+arrays without creating QueryResult, Hit, and HSP objects. It can split the file
+at query results and parse the parts in multiple processes.
+
 
 hmmer2-text and hmmer3-text
 ===========================
@@ -5,7 +5,13 @@
 # package.
 """Bio.SearchIO base classes for HMMER-related code."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from Bio.File import as_handle
 from Bio.SearchIO._index import SearchIndexer
+from Bio.SearchIO._utils import concatenate_tables
 
 
 class _BaseHmmerTextIndexer(SearchIndexer):
@@ -43,3 +49,77 @@ class _BaseHmmerTextIndexer(SearchIndexer):
                 break
 
         return qresult_raw
+
+    def _find_qresult(self, offset):
+        """Return the offset of the first query result after offset, or None (PRIVATE)."""
+        handle = self._handle
+        handle.seek(offset)
+        handle.readline()
+        while True:
+            start_offset = handle.tell()
+            line = handle.readline()
+            if not line:
+                return None
+            if line.startswith(self.qresult_start):
+                return start_offset
+
+
+def _parse_region(parse, filename, start, end, args):
+    """Parse the query results in a region of the file (PRIVATE)."""
+    with open(filename, "rb") as stream:
+        stream.seek(start)
+        data = stream.read(end - start)
+    return parse(data.decode().splitlines(), *args)
+
+
+def _read_tables(source, parse, args, indexer, workers):
+    """Parse HMMER output into tables of hits and domains (PRIVATE).
+
+    Arguments:
+     - source  - File name or handle of the HMMER output.
+     - parse   - Function returning the hit and domain tables parsed from
+                 an iterable of lines.
+     - args    - Additional arguments passed to the parse function.
+     - indexer - Indexer class for the format, used to find the offsets of
+                 query results if more than one worker is used.
+     - workers - Number of processes; None uses the number of processors.
+
+    With more than one worker, the file is split at query results into
+    regions of about the same size, and each region is parsed in a separate
+    process.
+    """
+    if workers == 1:
+        with as_handle(source) as handle:
+            return parse(handle, *args)
+    try:
+        filename = os.fspath(source)
+    except TypeError:
+        raise ValueError("workers can only be used with a file name") from None
+    if workers is None:
+        workers = os.cpu_count() or 1
+    size = os.path.getsize(filename)
+    indexer = indexer(filename)
+    boundaries = [0]
+    try:
+        for i in range(1, workers):
+            offset = indexer._find_qresult(size * i // workers)
+            if offset is None:
+                break
+            if offset > boundaries[-1]:
+                boundaries.append(offset)
+    finally:
+        indexer._handle.close()
+    boundaries.append(size)
+    with ProcessPoolExecutor(len(boundaries) - 1) as executor:
+        results = list(
+            executor.map(
+                _parse_region,
+                repeat(parse),
+                repeat(filename),
+                boundaries[:-1],
+                boundaries[1:],
+                repeat(args),
+            )
+        )
+    hits, domains = zip(*results)
+    return concatenate_tables(hits), concatenate_tables(domains)
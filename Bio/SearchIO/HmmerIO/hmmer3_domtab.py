@@ -11,7 +11,9 @@ from Bio.SearchIO._model import Hit
 from Bio.SearchIO._model import HSP
 from Bio.SearchIO._model import HSPFragment
 from Bio.SearchIO._model import QueryResult
+from Bio.SearchIO._utils import make_table
 
+from ._base import _read_tables
 from .hmmer3_tab import Hmmer3TabIndexer
 from .hmmer3_tab import Hmmer3TabParser
 
@@ -24,6 +26,70 @@ __all__ = (
     "Hmmer3DomtabHmmqueryWriter",
 )
 
+# columns of the hit and domain tables returned by Hmmer3DomtabParser.read_table
+_HIT_FIELDS = (
+    ("query_id", str),
+    ("hit_id", str),
+    ("accession", str),
+    ("seq_len", int),
+    ("evalue", float),
+    ("bitscore", float),
+    ("bias", float),
+    ("description", str),
+)
+_DOMAIN_FIELDS = (
+    ("query_id", str),
+    ("hit_id", str),
+    ("domain_index", int),
+    ("evalue_cond", float),
+    ("evalue", float),
+    ("bitscore", float),
+    ("bias", float),
+    ("query_start", int),
+    ("query_end", int),
+    ("hit_start", int),
+    ("hit_end", int),
+    ("env_start", int),
+    ("env_end", int),
+    ("acc_avg", float),
+)
+
+
+def _parse_table(lines, hmm_as_hit):
+    """Parse the rows of HMMER3 domain table output into hits and domains (PRIVATE).
+
+    Consecutive rows with the same query and hit identifiers belong to the
+    same hit, as in Hmmer3DomtabParser.
+    """
+    hits = []
+    domains = []
+    key = None
+    for line in lines:
+        if line.startswith("#"):
+            continue
+        cols = line.split(None, 22)
+        if not cols:
+            continue
+        if key != (cols[3], cols[0]):
+            key = (cols[3], cols[0])
+            if len(cols) == 23:
+                description = " ".join(cols[22].split())
+            else:
+                description = ""
+            hits.append((cols[3], cols[0], cols[1], cols[2], *cols[6:9], description))
+        if hmm_as_hit:
+            coordinates = (cols[17], cols[18], cols[15], cols[16])
+        else:
+            coordinates = cols[15:19]
+        domains.append(
+            (cols[3], cols[0], cols[9], *cols[11:15], *coordinates, *cols[19:22])
+        )
+    hits = make_table(_HIT_FIELDS, hits)
+    domains = make_table(_DOMAIN_FIELDS, domains)
+    for name in ("query_start", "hit_start", "env_start"):
+        domains[name] -= 1
+    return hits, domains
+
 
 class Hmmer3DomtabParser(Hmmer3TabParser):
     """Base hmmer3-domtab iterator."""
@@ -83,6 +149,38 @@ class Hmmer3DomtabParser(Hmmer3TabParser):
 
         return {"qresult": qresult, "hit": hit, "hsp": hsp, "frag": frag}
 
+    @classmethod
+    def read_table(cls, source, workers=1):
+        """Read the hits and domains into NumPy structured arrays.
+
+        Arguments:
+         - source  - File name or handle of the HMMER3 domain table output.
+         - workers - Number of processes used to parse the file (default 1).
+                     If None, the number of processors is used. Using more
+                     than one worker requires a file name.
+
+        This returns the tuple (hits, domains) of structured arrays, with one
+        row for each hit and for each domain, without creating QueryResult,
+        Hit, and HSP objects. The fields are named after the corresponding
+        attributes of the Hit and HSP objects, as well as query_id and
+        hit_id. Start coordinates are 0-based, as in the HSP objects.
+
+        >>> from Bio.SearchIO.HmmerIO import Hmmer3DomtabHmmhitParser
+        >>> filename = "Hmmer/domtab_30_hmmscan_001.out"
+        >>> hits, domains = Hmmer3DomtabHmmhitParser.read_table(filename)
+        >>> len(hits), len(domains)
+        (10, 13)
+        >>> print(hits["hit_id"][:3])
+        ['Globin' 'Ig_3' 'Ig_2']
+        """
+        return _read_tables(
+            source,
+            _parse_table,
+            (cls.hmm_as_hit,),
+            Hmmer3DomtabHmmhitIndexer,
+            workers,
+        )
+
     def _parse_qresult(self):
         """Return QueryResult objects (PRIVATE)."""
         # state values, determines what to do for each line
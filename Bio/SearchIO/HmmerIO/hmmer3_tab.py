@@ -213,6 +213,24 @@ class Hmmer3TabIndexer(SearchIndexer):
 
         return qresult_raw
 
+    def _find_qresult(self, offset):
+        """Return the offset of the first query result after offset, or None (PRIVATE)."""
+        handle = self._handle
+        handle.seek(offset)
+        handle.readline()
+        query_id_idx = self._query_id_idx
+        qresult_key = None
+        while True:
+            start_offset = handle.tell()
+            line = handle.readline()
+            if not line or line.startswith(b"#"):
+                return None
+            curr_key = line.split()[query_id_idx]
+            if qresult_key is None:
+                qresult_key = curr_key
+            elif curr_key != qresult_key:
+                return start_offset
+
 
 class Hmmer3TabWriter:
     """Writer for hmmer3-tab output format."""
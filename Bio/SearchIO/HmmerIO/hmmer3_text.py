@@ -5,15 +5,18 @@
 # package.
 """Bio.SearchIO parser for HMMER plain text output format."""
 
+import os
 import re
 
 from Bio.SearchIO._model import Hit
 from Bio.SearchIO._model import HSP
 from Bio.SearchIO._model import HSPFragment
 from Bio.SearchIO._model import QueryResult
+from Bio.SearchIO._utils import make_table
 from Bio.SearchIO._utils import read_forward
 
 from ._base import _BaseHmmerTextIndexer
+from ._base import _read_tables
 
 __all__ = ("Hmmer3TextParser", "Hmmer3TextIndexer")
 
@@ -34,6 +37,113 @@ _HRE_VALIDATE = re.compile(r"score:\s(-?\d+\.?\d+)\sbits.*value:\s(.*)")
 _HRE_ANNOT_LINE = re.compile(r"^(\s+)(.+)\s(\w+)")
 _HRE_ID_LINE = re.compile(r"^(\s+\S+\s+[0-9-]+ )(.+?)(\s+[0-9-]+)")
 
+# columns of the hit and domain tables returned by Hmmer3TextParser.read_table
+_HIT_FIELDS = (
+    ("query_id", str),
+    ("hit_id", str),
+    ("description", str),
+    ("evalue", float),
+    ("bitscore", float),
+    ("bias", float),
+    ("domain_exp_num", float),
+    ("domain_obs_num", int),
+    ("is_included", bool),
+)
+_DOMAIN_FIELDS = (
+    ("query_id", str),
+    ("hit_id", str),
+    ("domain_index", int),
+    ("is_included", bool),
+    ("bitscore", float),
+    ("bias", float),
+    ("evalue_cond", float),
+    ("evalue", float),
+    ("query_start", int),
+    ("query_end", int),
+    ("query_endtype", str),
+    ("hit_start", int),
+    ("hit_end", int),
+    ("hit_endtype", str),
+    ("env_start", int),
+    ("env_end", int),
+    ("env_endtype", str),
+    ("acc_avg", float),
+)
+
+# line prefixes of the lines parsed by _parse_table outside of the tables
+_TABLE_MARKS = ("Query:", ">> ", "    ------- ------ -----", " ---   ------", "#")
+
+
+def _parse_table(lines, hmm_as_hit=None):
+    """Parse the hit and domain tables of HMMER3 text output (PRIVATE).
+
+    Only the hit and domain tables are parsed; the alignments are skipped.
+    If hmm_as_hit is None, it is set from the program name in the preamble.
+    As in the Hit objects, the description in the hit table is replaced by
+    the complete description of hits with domains.
+    """
+    hits = []
+    domains = []
+    qid = hid = hdesc = None
+    query_hits = {}
+    table = None
+    for line in lines:
+        if table is None:
+            if not line.startswith(_TABLE_MARKS):
+                continue
+            if line.startswith("Query:"):
+                qid = _QRE_ID_LEN.search(line).group(1).strip()
+                query_hits = {}
+            elif line.startswith(">> "):
+                hid, _, hdesc = line[3:].partition("  ")
+                hid = hid.strip()
+                hdesc = hdesc.strip()
+            elif line.startswith("    ------- ------ -----"):
+                table = hits
+                is_included = True
+            elif line.startswith(" ---   ------ ----- --------"):
+                table = domains
+            elif hmm_as_hit is None and line.startswith("#"):
+                regx = _RE_PROGRAM.search(line)
+                if regx:
+                    hmm_as_hit = regx.group(1) == "hmmscan"
+        elif not line.strip() or line.startswith("   [No "):
+            table = None
+        elif table is hits:
+            if line.startswith("  ------ inclusion"):
+                is_included = False
+                continue
+            row = line.split(None, 9)
+            if len(row) == 10:
+                description = " ".join(row[9].split())
+            else:
+                description = ""
+            hit = [qid, row[8], description, *row[:3], row[6], row[7], is_included]
+            hits.append(hit)
+            query_hits[row[8]] = hit
+        else:
+            row = line.split()
+            assert len(row) == 16
+            if hdesc:
+                hit = query_hits[hid]
+                if hit[2] and hdesc.startswith(hit[2]):
+                    hit[2] = hdesc
+                hdesc = None
+            if hmm_as_hit:
+                query = row[9:12]
+                hit = row[6:9]
+            else:
+                query = row[6:9]
+                hit = row[9:12]
+            domains.append(
+                (qid, hid, row[0], row[1] == "!", *row[2:6], *query, *hit, *row[12:])
+            )
+    hits = make_table(_HIT_FIELDS, hits)
+    domains = make_table(_DOMAIN_FIELDS, domains)
+    for name in ("query_start", "hit_start", "env_start"):
+        domains[name] -= 1
+    return hits, domains
+
 
 class Hmmer3TextParser:
     """Parser for the HMMER 3.0 text output."""
@@ -48,6 +158,44 @@ class Hmmer3TextParser:
         """Iterate over query results."""
         yield from self._parse_qresult()
 
+    @classmethod
+    def read_table(cls, source, workers=1):
+        """Read the hit and domain tables into NumPy structured arrays.
+
+        Arguments:
+         - source  - File name or handle of the HMMER3 text output.
+         - workers - Number of processes used to parse the file (default 1).
+                     If None, the number of processors is used. Using more
+                     than one worker requires a file name.
+
+        This returns the tuple (hits, domains) of structured arrays, with one
+        row for each hit and for each domain, without creating QueryResult,
+        Hit, and HSP objects. The alignments are not parsed. The fields are
+        named after the corresponding attributes of the Hit and HSP objects,
+        as well as query_id and hit_id. Start coordinates are 0-based, as in
+        the HSP objects.
+
+        >>> from Bio.SearchIO.HmmerIO import Hmmer3TextParser
+        >>> hits, domains = Hmmer3TextParser.read_table("Hmmer/text_30_hmmscan_001.out")
+        >>> len(hits), len(domains)
+        (10, 13)
+        >>> print(hits["hit_id"][:3])
+        ['Globin' 'Ig_3' 'Ig_2']
+        >>> print(domains["hit_id"][0], domains["query_start"][0], domains["query_end"][0])
+        Globin 6 112
+        """
+        if workers == 1:
+            args = ()
+        else:
+            try:
+                filename = os.fspath(source)
+            except TypeError:
+                raise ValueError("workers can only be used with a file name") from None
+            with open(filename) as handle:
+                program = cls(handle)._meta.get("program")
+            args = (program == "hmmscan",)
+        return _read_tables(source, _parse_table, args, Hmmer3TextIndexer, workers)
+
     def _read_until(self, bool_func):
         """Read the file handle until the given function returns True (PRIVATE)."""
         while True:
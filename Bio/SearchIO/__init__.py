@@ -196,6 +196,8 @@ of the format's documentation.
 
 """
 
+import functools
+
 from Bio.File import as_handle
 from Bio.SearchIO._model import Hit
 from Bio.SearchIO._model import HSP
@@ -494,7 +496,14 @@ def index(filename, format=None, key_function=None, **kwargs):
     )
 
 
-def index_db(index_filename, filenames=None, format=None, key_function=None, **kwargs):
+def index_db(
+    index_filename,
+    filenames=None,
+    format=None,
+    key_function=None,
+    workers=1,
+    **kwargs,
+):
     """Indexes several search output files into an SQLite database.
 
      - index_filename - The SQLite filename.
@@ -506,6 +515,9 @@ def index_db(index_filename, filenames=None, format=None, key_function=None, **k
      - key_function - Optional callback function which when given a
                       QueryResult identifier string should return a unique
                       key for the dictionary.
+     - workers      - Number of processes used to index the files when
+                      creating a new index; the default value of 1 indexes
+                      the files serially, while None uses all CPUs.
      - kwargs       - Format-specific keyword arguments.
 
     The ``index_db`` function is similar to ``index`` in that it indexes the start
@@ -543,6 +555,19 @@ def index_db(index_filename, filenames=None, format=None, key_function=None, **k
     of one thousand sequences each in order to run as ten separate BLAST jobs
     on a cluster. You could use ``index_db`` to index the ten BLAST output
     files together for seamless access to all the results as one dictionary.
+    With ``workers`` set to a value larger than 1, the files are scanned in
+    parallel, with each file indexed by a separate process:
+
+    >>> db_idx = SearchIO.index_db(idx_filename, files, 'blast-xml', workers=2)
+    >>> len(db_idx)
+    8
+    >>> db_idx['33212']
+    QueryResult(id='33212', 44 hits)
+    >>> db_idx.close()
+
+    The index database is memory mapped when reloaded from an index file, so
+    that looking up queries in a large index does not require reading the
+    entire index file first.
 
     Note that ':memory:' rather than an index filename tells SQLite to hold
     the index database in memory. This is useful for quick tests, but using
@@ -563,18 +588,29 @@ def index_db(index_filename, filenames=None, format=None, key_function=None, **k
 
     repr = f"SearchIO.index_db({index_filename!r}, filenames={filenames!r}, {format!r}, key_function={key_function!r})"
 
-    def proxy_factory(format, filename=None):
-        """Given a filename returns proxy object, else boolean if format OK."""
-        if filename:
-            return get_processor(format, _INDEXER_MAP)(filename, **kwargs)
-        else:
-            return format in _INDEXER_MAP
+    # Use a module level function so that the proxy factory can be pickled
+    # if the files are indexed in separate processes
+    proxy_factory = functools.partial(_proxy_factory, kwargs)
 
     return _SQLiteManySeqFilesDict(
-        index_filename, filenames, proxy_factory, format, key_function, repr
+        index_filename,
+        filenames,
+        proxy_factory,
+        format,
+        key_function,
+        repr,
+        workers=workers,
     )
 
 
+def _proxy_factory(kwargs, format, filename=None):
+    """Given a filename returns proxy object, else boolean if format OK (PRIVATE)."""
+    if filename:
+        return get_processor(format, _INDEXER_MAP)(filename, **kwargs)
+    else:
+        return format in _INDEXER_MAP
+
+
 def write(qresults, handle, format=None, **kwargs):
     """Write QueryResult objects to a file in the given format.
 
@@ -32,6 +32,39 @@ def read_forward(handle):
             return line
 
 
+def make_table(fields, rows):
+    """Return the rows as a NumPy structured array.
+
+    The fields are (name, type) pairs; values of numeric fields may be given
+    as strings.
+    """
+    import numpy as np
+
+    columns = list(zip(*rows)) or [()] * len(fields)
+    arrays = [np.array(column, dtype) for column, (name, dtype) in zip(columns, fields)]
+    dtype = [(name, array.dtype) for (name, _), array in zip(fields, arrays)]
+    table = np.empty(len(rows), dtype)
+    for (name, _), array in zip(fields, arrays):
+        table[name] = array
+    return table
+
+
+def concatenate_tables(tables):
+    """Concatenate structured arrays with the same fields."""
+    import numpy as np
+
+    names = tables[0].dtype.names
+    dtype = [(name, np.result_type(*[t.dtype[name] for t in tables])) for name in names]
+    table = np.empty(sum(len(t) for t in tables), dtype)
+    start = 0
+    for t in tables:
+        end = start + len(t)
+        for name in names:
+            table[name][start:end] = t[name]
+        start = end
+    return table
+
+
 def get_processor(format, mapping):
     """Return the object to process the given format according to the mapping.
 
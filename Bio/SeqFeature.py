@@ -22,6 +22,12 @@ Base class to hold a Feature
 Classes:
  - SeqFeature
 
+Store features compactly, indexed by their location
+---------------------------------------------------
+
+Classes:
+ - FeatureTable
+
 Hold information about a Reference
 ----------------------------------
 
@@ -61,11 +67,14 @@ Exceptions:
 
 """
 
+import array
+import bisect
 import functools
 import re
 import warnings
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import MutableSequence
 
 from Bio import BiopythonParserWarning
 from Bio.Seq import MutableSeq
@@ -544,6 +553,316 @@ class SeqFeature:
         return value in self.location
 
 
+# --- Feature tables
+
+
+class FeatureTable(MutableSequence):
+    """Compact list of SeqFeature objects, indexed by their location.
+
+    A FeatureTable can be used instead of a plain list for the features of a
+    SeqRecord. It stores the start, end, strand, and type of each feature in
+    arrays, and builds an index on the feature locations (a nested containment
+    list) the first time it is searched. This lets you find the features that
+    overlap a region of the sequence without scanning all features:
+
+    >>> from Bio.SeqFeature import FeatureTable, SeqFeature, SimpleLocation
+    >>> features = FeatureTable()
+    >>> features.append(SeqFeature(SimpleLocation(0, 5000, strand=1), type="gene"))
+    >>> features.append(SeqFeature(SimpleLocation(100, 900, strand=1), type="CDS"))
+    >>> features.append(SeqFeature(SimpleLocation(2000, 2300, strand=-1), type="CDS"))
+    >>> features.append(SeqFeature(SimpleLocation(2250, 2400), type="repeat"))
+    >>> len(features)
+    4
+    >>> for feature in features.overlapping(2200, 2260):
+    ...     print(feature.type, feature.location)
+    ...
+    gene [0:5000](+)
+    CDS [2000:2300](-)
+    repeat [2250:2400]
+
+    Use the type and strand arguments to select features using the stored
+    arrays only:
+
+    >>> for feature in features.overlapping(0, 3000, type="CDS", strand=-1):
+    ...     print(feature.type, feature.location)
+    ...
+    CDS [2000:2300](-)
+
+    Otherwise a FeatureTable behaves like a list of SeqFeature objects.
+    Features that span the origin of a circular sequence are indexed by their
+    overall span, from ``location.start`` to ``location.end``. Features
+    without a location, or with an unknown start or end, are never found by
+    ``overlapping``.
+
+    Parsers can also add the data needed to create a feature, together with
+    its type, start, end, and strand, using ``append_lazy``. The loader
+    function passed to the FeatureTable is then used to create the SeqFeature
+    object when the feature is first accessed:
+
+    >>> def loader(data):
+    ...     name, start, end = data.split()
+    ...     location = SimpleLocation(int(start), int(end))
+    ...     return SeqFeature(location, type="exon", id=name)
+    ...
+    >>> exons = FeatureTable(loader=loader)
+    >>> exons.append_lazy("exon1 10 50", "exon", 10, 50)
+    >>> exons.append_lazy("exon2 80 120", "exon", 80, 120)
+    >>> [exon.id for exon in exons.overlapping(40, 100)]
+    ['exon1', 'exon2']
+
+    The SeqFeature objects are stored once they are created. If you change the
+    location of a SeqFeature stored in a FeatureTable, assign it to the table
+    again (e.g. ``features[i] = feature``) to update the index.
+    """
+
+    _no_strand = 2  # strand code used for None
+
+    def __init__(self, features=(), loader=None):
+        """Create a FeatureTable.
+
+        Arguments:
+         - features - an iterable of SeqFeature objects (optional).
+         - loader - a function creating a SeqFeature from the data added by
+           ``append_lazy`` (optional).
+
+        """
+        self._loader = loader
+        self._clear()
+        for feature in features:
+            self.append(feature)
+
+    def _clear(self):
+        """Remove all features (PRIVATE)."""
+        self._items = []
+        self._starts = array.array("q")
+        self._ends = array.array("q")
+        self._strands = array.array("b")
+        self._types = array.array("I")
+        self._type_names = []
+        self._type_codes = {}
+        self._index = None
+
+    def _encode(self, type, start, end, strand):
+        """Return the values stored in the arrays for one feature (PRIVATE)."""
+        try:
+            start = int(start)
+            end = int(end)
+        except TypeError:
+            # No location, or an UnknownPosition
+            start = end = -1
+        if strand is None:
+            strand = self._no_strand
+        try:
+            code = self._type_codes[type]
+        except KeyError:
+            code = len(self._type_names)
+            self._type_names.append(type)
+            self._type_codes[type] = code
+        return code, start, end, strand
+
+    def _insert(self, index, item, values):
+        """Insert a feature or its data with the given array values (PRIVATE)."""
+        code, start, end, strand = values
+        self._items.insert(index, item)
+        self._types.insert(index, code)
+        self._starts.insert(index, start)
+        self._ends.insert(index, end)
+        self._strands.insert(index, strand)
+        self._index = None
+
+    def _feature_values(self, feature):
+        """Return the array values for a SeqFeature (PRIVATE)."""
+        if not isinstance(feature, SeqFeature):
+            raise TypeError(f"expected a SeqFeature, not {type(feature).__name__}")
+        location = feature.location
+        if location is None:
+            return self._encode(feature.type, None, None, None)
+        return self._encode(feature.type, location.start, location.end, location.strand)
+
+    def append_lazy(self, data, type, start, end, strand=None):
+        """Add the data for a feature, to be converted to a SeqFeature when needed.
+
+        Arguments:
+         - data - passed to the loader function to create the SeqFeature.
+         - type - the feature type, e.g. "CDS".
+         - start - the start of the feature location (zero-based), or None.
+         - end - the end of the feature location, or None.
+         - strand - the strand of the feature location (1, -1, 0, or None).
+
+        """
+        if self._loader is None:
+            raise ValueError("a loader is required to add features lazily")
+        values = self._encode(type, start, end, strand)
+        self._insert(len(self._items), data, values)
+
+    def __len__(self):
+        """Return the number of features."""
+        return len(self._items)
+
+    def _load(self, index):
+        """Return the SeqFeature at the index, creating it if needed (PRIVATE)."""
+        item = self._items[index]
+        if not isinstance(item, SeqFeature):
+            item = self._loader(item)
+            self._items[index] = item
+        return item
+
+    def __getitem__(self, index):
+        """Return a SeqFeature, or a list of SeqFeature objects for a slice."""
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self._items)))]
+        return self._load(index)
+
+    def __iter__(self):
+        """Iterate over the SeqFeature objects."""
+        for i in range(len(self._items)):
+            yield self._load(i)
+
+    def __setitem__(self, index, value):
+        """Replace a SeqFeature, or a slice of SeqFeature objects."""
+        if isinstance(index, slice):
+            features = self[:]
+            features[index] = value
+            self._clear()
+            for feature in features:
+                self.append(feature)
+            return
+        code, start, end, strand = self._feature_values(value)
+        self._items[index] = value
+        self._types[index] = code
+        self._starts[index] = start
+        self._ends[index] = end
+        self._strands[index] = strand
+        self._index = None
+
+    def __delitem__(self, index):
+        """Remove a SeqFeature, or a slice of SeqFeature objects."""
+        del self._items[index]
+        del self._types[index]
+        del self._starts[index]
+        del self._ends[index]
+        del self._strands[index]
+        self._index = None
+
+    def insert(self, index, feature):
+        """Insert a SeqFeature before the index."""
+        values = self._feature_values(feature)
+        self._insert(index, feature, values)
+
+    def sort(self, key=None, reverse=False):
+        """Sort the features in place.
+
+        Without a key, features are sorted by their start and end position.
+        Otherwise, this creates all SeqFeature objects to calculate the key.
+        """
+        if key is None:
+            indices = sorted(
+                range(len(self._items)),
+                key=lambda i: (self._starts[i], self._ends[i]),
+                reverse=reverse,
+            )
+        else:
+            indices = sorted(
+                range(len(self._items)),
+                key=lambda i: key(self._load(i)),
+                reverse=reverse,
+            )
+        self._items[:] = [self._items[i] for i in indices]
+        for values in (self._types, self._starts, self._ends, self._strands):
+            values[:] = array.array(values.typecode, [values[i] for i in indices])
+        self._index = None
+
+    def __repr__(self):
+        """Represent the FeatureTable as a string for debugging."""
+        return f"<{self.__class__.__name__} with {len(self._items)} features>"
+
+    def _build_index(self):
+        """Build the nested containment list of the feature locations (PRIVATE).
+
+        Features are sorted by start, and by decreasing end for equal starts.
+        Each feature is placed in the sublist of the last preceding feature
+        containing it, so that no feature in a sublist contains another one.
+        The starts and ends in each sublist are therefore both sorted, and
+        the sublists are stored consecutively, breadth first.
+        """
+        starts = self._starts
+        ends = self._ends
+        order = sorted(
+            (i for i in range(len(starts)) if starts[i] >= 0),
+            key=lambda i: (starts[i], -ends[i]),
+        )
+        children = {-1: []}
+        stack = []
+        for i in order:
+            end = ends[i]
+            while stack and ends[stack[-1]] < end:
+                stack.pop()
+            parent = stack[-1] if stack else -1
+            children[parent].append(i)
+            children[i] = []
+            stack.append(i)
+        count = len(children[-1])
+        layout = list(children[-1])
+        first = array.array("q")
+        last = array.array("q")
+        j = 0
+        while j < len(layout):
+            sublist = children[layout[j]]
+            first.append(len(layout))
+            layout.extend(sublist)
+            last.append(len(layout))
+            j += 1
+        self._index = (
+            array.array("q", layout),
+            array.array("q", [starts[i] for i in layout]),
+            array.array("q", [ends[i] for i in layout]),
+            first,
+            last,
+            count,
+        )
+
+    def _overlapping_indices(self, start, end):
+        """Return the sorted indices of features overlapping start:end (PRIVATE)."""
+        if self._index is None:
+            self._build_index()
+        layout, starts, ends, first, last, count = self._index
+        indices = []
+        sublists = [(0, count)]
+        while sublists:
+            lo, hi = sublists.pop()
+            j = bisect.bisect_right(ends, start, lo, hi)
+            while j < hi and starts[j] < end:
+                indices.append(layout[j])
+                if first[j] < last[j]:
+                    sublists.append((first[j], last[j]))
+                j += 1
+        indices.sort()
+        return indices
+
+    def overlapping(self, start, end, type=None, strand=None):
+        """Return a list of the features overlapping the region start:end.
+
+        Arguments:
+         - start - start of the region (zero-based).
+         - end - end of the region (exclusive).
+         - type - if given, only return features of this type.
+         - strand - if given, only return features on this strand (1, -1, 0).
+
+        A feature overlaps the region if its location starts before the end
+        of the region, and ends after the start of the region. The features
+        are returned in the order in which they are stored in the table.
+        """
+        indices = self._overlapping_indices(start, end)
+        if type is not None:
+            code = self._type_codes.get(type)
+            types = self._types
+            indices = [i for i in indices if types[i] == code]
+        if strand is not None:
+            strands = self._strands
+            indices = [i for i in indices if strands[i] == strand]
+        return [self._load(i) for i in indices]
+
+
 # --- References
 
 
@@ -64,10 +64,13 @@ class GenBankIterator(SequenceIterator):
 
     modes = "t"
 
-    def __init__(self, source):
+    def __init__(self, source, compact_features=False):
         """Break up a Genbank file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
+        If compact_features is True, the features of each record are stored in
+        a FeatureTable (see Bio.SeqFeature), which creates the SeqFeature
+        objects only when needed, and can find the features in a region.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
@@ -100,24 +103,77 @@ class GenBankIterator(SequenceIterator):
         L31939.1
         AF297471.1
 
+        Use compact_features=True to find the features in a region:
+
+        >>> record = next(GenBankIterator("GenBank/NC_005816.gb", compact_features=True))
+        >>> for feature in record.features.overlapping(3000, 3100, strand=+1):
+        ...     print(feature.type, feature.location)
+        ...
+        source [0:9609](+)
+        gene [2924:3119](+)
+        CDS [2924:3119](+)
+        misc_feature [2924:3107](+)
+
         """
         super().__init__(source, fmt="GenBank")
-        self.records = GenBankScanner(debug=0).parse_records(self.stream)
+        self.records = GenBankScanner(debug=0).parse_records(
+            self.stream, compact_features=compact_features
+        )
 
     def __next__(self):
         """Return the next SeqRecord."""
         return next(self.records)
 
 
+class GenBankLazyIterator(GenBankIterator):
+    """Parser for GenBank files, parsing each part of a record when needed."""
+
+    def __init__(self, source, compact_features=False):
+        """Break up a GenBank file into SeqRecord objects, without parsing them.
+
+        Argument source is a file-like object opened in text mode or a path to a file.
+        Each record is only split into its header, feature table, and footer
+        with the sequence. These parts are parsed when one of their attributes
+        is first accessed, so scanning a file for a few fields such as the id
+        or description does not parse the features and sequences. Any parsing
+        errors are raised when the attribute is accessed. The annotations need
+        both the header and the footer, as the footer can contain annotations
+        such as the CONTIG line. If compact_features is True, the features are
+        stored in a FeatureTable.
+
+        This gets called internally by Bio.SeqIO for the "genbank-lazy" format,
+        and by Bio.SeqIO.index:
+
+        >>> from Bio import SeqIO
+        >>> for record in SeqIO.parse("GenBank/cor6_6.gb", "genbank-lazy"):
+        ...     print(record.id, record.description[:40])
+        ...
+        X55053.1 A.thaliana cor6.6 mRNA
+        X62281.1 A.thaliana kin2 gene
+        M81224.1 Rapeseed Kin1 protein (kin1) mRNA, compl
+        AJ237582.1 Armoracia rusticana csp14 gene (partial)
+        L31939.1 Brassica rapa (clone bif72) kin mRNA, co
+        AF297471.1 Brassica napus BN28a (BN28a) gene, compl
+
+        """
+        SequenceIterator.__init__(self, source, fmt="GenBank")
+        self.records = GenBankScanner(debug=0).parse_records(
+            self.stream, compact_features=compact_features, lazy=True
+        )
+
+
 class EmblIterator(SequenceIterator):
     """Parser for EMBL files."""
 
     modes = "t"
 
-    def __init__(self, source):
+    def __init__(self, source, compact_features=False):
         """Break up an EMBL file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
+        If compact_features is True, the features of each record are stored in
+        a FeatureTable (see Bio.SeqFeature), which creates the SeqFeature
+        objects only when needed, and can find the features in a region.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
@@ -158,13 +214,31 @@ class EmblIterator(SequenceIterator):
 
         """
         super().__init__(source, fmt="EMBL")
-        self.records = EmblScanner(debug=0).parse_records(self.stream)
+        self.records = EmblScanner(debug=0).parse_records(
+            self.stream, compact_features=compact_features
+        )
 
     def __next__(self):
         """Return the next SeqRecord."""
         return next(self.records)
 
 
+class EmblLazyIterator(EmblIterator):
+    """Parser for EMBL files, parsing each part of a record when needed."""
+
+    def __init__(self, source, compact_features=False):
+        """Break up an EMBL file into SeqRecord objects, without parsing them.
+
+        Argument source is a file-like object opened in text mode or a path to a file.
+        See GenBankLazyIterator for details. This gets called internally by
+        Bio.SeqIO for the "embl-lazy" format.
+        """
+        SequenceIterator.__init__(self, source, fmt="EMBL")
+        self.records = EmblScanner(debug=0).parse_records(
+            self.stream, compact_features=compact_features, lazy=True
+        )
+
+
 class ImgtIterator(SequenceIterator):
     """Parser for IMGT files."""
 
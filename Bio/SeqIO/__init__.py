@@ -372,36 +372,41 @@ making up each alignment as SeqRecords.
 #
 # --Peter
 
+import importlib
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from collections.abc import Iterable
 from typing import Union
 
 from Bio import AlignIO
-from Bio.SeqIO import AbiIO
-from Bio.SeqIO import AceIO
-from Bio.SeqIO import FastaIO
-from Bio.SeqIO import GckIO
-from Bio.SeqIO import GfaIO
-from Bio.SeqIO import IgIO  # IntelliGenetics or MASE format
-from Bio.SeqIO import InsdcIO  # EMBL and GenBank
-from Bio.SeqIO import NibIO
-from Bio.SeqIO import PdbIO
-from Bio.SeqIO import PhdIO
-from Bio.SeqIO import PirIO
-from Bio.SeqIO import QualityIO  # FastQ and qual files
-from Bio.SeqIO import SeqXmlIO
-from Bio.SeqIO import SffIO
-from Bio.SeqIO import SnapGeneIO
-from Bio.SeqIO import SwissIO
-from Bio.SeqIO import TabIO
-from Bio.SeqIO import TwoBitIO
-from Bio.SeqIO import UniprotIO
-from Bio.SeqIO import XdnaIO
+from Bio._utils import LazyImportDict
 from Bio.SeqRecord import SeqRecord
 
 from .Interfaces import _IOSource, _TextIOSource, SequenceIterator, SequenceWriter
 
+_modules = (
+    "AbiIO",
+    "AceIO",
+    "FastaIO",
+    "GckIO",
+    "GfaIO",
+    "IgIO",
+    "InsdcIO",
+    "NibIO",
+    "PdbIO",
+    "PhdIO",
+    "PirIO",
+    "QualityIO",
+    "SeqXmlIO",
+    "SffIO",
+    "SnapGeneIO",
+    "SwissIO",
+    "TabIO",
+    "TwoBitIO",
+    "UniprotIO",
+    "XdnaIO",
+)
+
 # Convention for format names is "mainname-subtype" in lower case.
 # Please use the same names as BioPerl or EMBOSS where possible.
 #
@@ -411,68 +416,74 @@ from .Interfaces import _IOSource, _TextIOSource, SequenceIterator, SequenceWrit
 #
 # Most alignment file formats will be handled via Bio.AlignIO
 
-_FormatToIterator = {
-    "abi": AbiIO.AbiIterator,
-    "abi-trim": AbiIO._AbiTrimIterator,
-    "ace": AceIO.AceIterator,
-    "fasta": FastaIO.FastaIterator,
-    "fasta-2line": FastaIO.FastaTwoLineIterator,
-    "fasta-blast": FastaIO.FastaBlastIterator,
-    "fasta-pearson": FastaIO.FastaPearsonIterator,
-    "ig": IgIO.IgIterator,
-    "embl": InsdcIO.EmblIterator,
-    "embl-cds": InsdcIO.EmblCdsFeatureIterator,
-    "gb": InsdcIO.GenBankIterator,
-    "gck": GckIO.GckIterator,
-    "genbank": InsdcIO.GenBankIterator,
-    "genbank-cds": InsdcIO.GenBankCdsFeatureIterator,
-    "gfa1": GfaIO.Gfa1Iterator,
-    "gfa2": GfaIO.Gfa2Iterator,
-    "imgt": InsdcIO.ImgtIterator,
-    "nib": NibIO.NibIterator,
-    "cif-seqres": PdbIO.CifSeqresIterator,
-    "cif-atom": PdbIO.CifAtomIterator,
-    "pdb-atom": PdbIO.PdbAtomIterator,
-    "pdb-seqres": PdbIO.PdbSeqresIterator,
-    "phd": PhdIO.PhdIterator,
-    "pir": PirIO.PirIterator,
-    "fastq": QualityIO.FastqPhredIterator,
-    "fastq-sanger": QualityIO.FastqPhredIterator,
-    "fastq-solexa": QualityIO.FastqSolexaIterator,
-    "fastq-illumina": QualityIO.FastqIlluminaIterator,
-    "qual": QualityIO.QualPhredIterator,
-    "seqxml": SeqXmlIO.SeqXmlIterator,
-    "sff": SffIO.SffIterator,
-    "snapgene": SnapGeneIO.SnapGeneIterator,
-    "sff-trim": SffIO._SffTrimIterator,  # Not sure about this in the long run
-    "swiss": SwissIO.SwissIterator,
-    "tab": TabIO.TabIterator,
-    "twobit": TwoBitIO.TwoBitIterator,
-    "uniprot-xml": UniprotIO.UniprotIterator,
-    "xdna": XdnaIO.XdnaIterator,
-}
+_FormatToIterator = LazyImportDict(
+    {
+        "abi": "Bio.SeqIO.AbiIO.AbiIterator",
+        "abi-trim": "Bio.SeqIO.AbiIO._AbiTrimIterator",
+        "ace": "Bio.SeqIO.AceIO.AceIterator",
+        "fasta": "Bio.SeqIO.FastaIO.FastaIterator",
+        "fasta-2line": "Bio.SeqIO.FastaIO.FastaTwoLineIterator",
+        "fasta-blast": "Bio.SeqIO.FastaIO.FastaBlastIterator",
+        "fasta-pearson": "Bio.SeqIO.FastaIO.FastaPearsonIterator",
+        "ig": "Bio.SeqIO.IgIO.IgIterator",
+        "embl": "Bio.SeqIO.InsdcIO.EmblIterator",
+        "embl-cds": "Bio.SeqIO.InsdcIO.EmblCdsFeatureIterator",
+        "embl-lazy": "Bio.SeqIO.InsdcIO.EmblLazyIterator",
+        "gb": "Bio.SeqIO.InsdcIO.GenBankIterator",
+        "gck": "Bio.SeqIO.GckIO.GckIterator",
+        "genbank": "Bio.SeqIO.InsdcIO.GenBankIterator",
+        "genbank-cds": "Bio.SeqIO.InsdcIO.GenBankCdsFeatureIterator",
+        "genbank-lazy": "Bio.SeqIO.InsdcIO.GenBankLazyIterator",
+        "gfa1": "Bio.SeqIO.GfaIO.Gfa1Iterator",
+        "gfa2": "Bio.SeqIO.GfaIO.Gfa2Iterator",
+        "imgt": "Bio.SeqIO.InsdcIO.ImgtIterator",
+        "nib": "Bio.SeqIO.NibIO.NibIterator",
+        "cif-seqres": "Bio.SeqIO.PdbIO.CifSeqresIterator",
+        "cif-atom": "Bio.SeqIO.PdbIO.CifAtomIterator",
+        "pdb-atom": "Bio.SeqIO.PdbIO.PdbAtomIterator",
+        "pdb-seqres": "Bio.SeqIO.PdbIO.PdbSeqresIterator",
+        "phd": "Bio.SeqIO.PhdIO.PhdIterator",
+        "pir": "Bio.SeqIO.PirIO.PirIterator",
+        "fastq": "Bio.SeqIO.QualityIO.FastqPhredIterator",
+        "fastq-sanger": "Bio.SeqIO.QualityIO.FastqPhredIterator",
+        "fastq-solexa": "Bio.SeqIO.QualityIO.FastqSolexaIterator",
+        "fastq-illumina": "Bio.SeqIO.QualityIO.FastqIlluminaIterator",
+        "qual": "Bio.SeqIO.QualityIO.QualPhredIterator",
+        "seqxml": "Bio.SeqIO.SeqXmlIO.SeqXmlIterator",
+        "sff": "Bio.SeqIO.SffIO.SffIterator",
+        "snapgene": "Bio.SeqIO.SnapGeneIO.SnapGeneIterator",
+        "sff-trim": "Bio.SeqIO.SffIO._SffTrimIterator",  # Not sure about this in the long run
+        "swiss": "Bio.SeqIO.SwissIO.SwissIterator",
+        "tab": "Bio.SeqIO.TabIO.TabIterator",
+        "twobit": "Bio.SeqIO.TwoBitIO.TwoBitIterator",
+        "uniprot-xml": "Bio.SeqIO.UniprotIO.UniprotIterator",
+        "xdna": "Bio.SeqIO.XdnaIO.XdnaIterator",
+    }
+)
 
 # Right now used in the unit tests as proxy for all supported outputs...
-_FormatToWriter = {
-    "fasta": FastaIO.FastaWriter,
-    "fasta-2line": FastaIO.FastaTwoLineWriter,
-    "gb": InsdcIO.GenBankWriter,
-    "genbank": InsdcIO.GenBankWriter,
-    "embl": InsdcIO.EmblWriter,
-    "imgt": InsdcIO.ImgtWriter,
-    "nib": NibIO.NibWriter,
-    "phd": PhdIO.PhdWriter,
-    "pir": PirIO.PirWriter,
-    "fastq": QualityIO.FastqPhredWriter,
-    "fastq-sanger": QualityIO.FastqPhredWriter,
-    "fastq-solexa": QualityIO.FastqSolexaWriter,
-    "fastq-illumina": QualityIO.FastqIlluminaWriter,
-    "qual": QualityIO.QualPhredWriter,
-    "seqxml": SeqXmlIO.SeqXmlWriter,
-    "sff": SffIO.SffWriter,
-    "tab": TabIO.TabWriter,
-    "xdna": XdnaIO.XdnaWriter,
-}
+_FormatToWriter = LazyImportDict(
+    {
+        "fasta": "Bio.SeqIO.FastaIO.FastaWriter",
+        "fasta-2line": "Bio.SeqIO.FastaIO.FastaTwoLineWriter",
+        "gb": "Bio.SeqIO.InsdcIO.GenBankWriter",
+        "genbank": "Bio.SeqIO.InsdcIO.GenBankWriter",
+        "embl": "Bio.SeqIO.InsdcIO.EmblWriter",
+        "imgt": "Bio.SeqIO.InsdcIO.ImgtWriter",
+        "nib": "Bio.SeqIO.NibIO.NibWriter",
+        "phd": "Bio.SeqIO.PhdIO.PhdWriter",
+        "pir": "Bio.SeqIO.PirIO.PirWriter",
+        "fastq": "Bio.SeqIO.QualityIO.FastqPhredWriter",
+        "fastq-sanger": "Bio.SeqIO.QualityIO.FastqPhredWriter",
+        "fastq-solexa": "Bio.SeqIO.QualityIO.FastqSolexaWriter",
+        "fastq-illumina": "Bio.SeqIO.QualityIO.FastqIlluminaWriter",
+        "qual": "Bio.SeqIO.QualityIO.QualPhredWriter",
+        "seqxml": "Bio.SeqIO.SeqXmlIO.SeqXmlWriter",
+        "sff": "Bio.SeqIO.SffIO.SffWriter",
+        "tab": "Bio.SeqIO.TabIO.TabWriter",
+        "xdna": "Bio.SeqIO.XdnaIO.XdnaWriter",
+    }
+)
 
 
 class AlignmentSequenceIterator(SequenceIterator):
@@ -485,20 +496,16 @@ class AlignmentSequenceIterator(SequenceIterator):
     def fmt(self):
         """Alignment file format name."""
 
-    @property
-    @abstractmethod
-    def _alignment_iterator_class(self):
-        """Alignment iterator class."""
-
     def __init__(self, source: _IOSource) -> None:
         """Initialize the iterator."""
+        from Bio import AlignIO
+
         super().__init__(source, fmt=self.fmt)
-        # We need type(self) here, because _alignment_iterator_class is
-        # actually a function instead of a class for some formats in
-        # Bio.AlignIO, and Python will turn the function into a bound method
-        # with self as the first argument.
-        alignment_iterator_class = type(self)._alignment_iterator_class
-        alignments = alignment_iterator_class(self.stream, None)  # type: ignore
+        # The alignment iterator is imported from Bio.AlignIO only when needed.
+        # Note that it is actually a function instead of a class for some
+        # formats in Bio.AlignIO.
+        alignment_iterator_class = AlignIO._FormatToIterator[self.fmt]
+        alignments = alignment_iterator_class(self.stream, None)
         self.iterator = (record for alignment in alignments for record in alignment)
 
     def __next__(self):
@@ -506,16 +513,9 @@ class AlignmentSequenceIterator(SequenceIterator):
         return next(self.iterator)
 
 
-for fmt, alignment_iterator_class in AlignIO._FormatToIterator.items():
+for fmt in AlignIO._FormatToIterator:
     name = fmt.replace("-", " ").title().replace(" ", "") + "AlignmentSequenceIterator"
-    cls = type(
-        name,
-        (AlignmentSequenceIterator,),
-        {
-            "fmt": fmt,
-            "_alignment_iterator_class": alignment_iterator_class,
-        },
-    )
+    cls = type(name, (AlignmentSequenceIterator,), {"fmt": fmt})
     _FormatToIterator[fmt] = cls
 
 
@@ -526,18 +526,19 @@ class AlignmentSequenceWriter(SequenceWriter):
 
     @property
     @abstractmethod
-    def _alignment_writer_class(self):
-        """Alignment writer class."""
+    def fmt(self):
+        """Alignment file format name."""
 
     def write_records(self, records):
         """Write records to the output file, and return the number of records.
 
         records - A list or iterator returning SeqRecord objects
         """
+        from Bio import AlignIO
         from Bio.Align import MultipleSeqAlignment
 
         alignment = MultipleSeqAlignment(records)
-        alignment_writer_class = self._alignment_writer_class
+        alignment_writer_class = AlignIO._FormatToWriter[self.fmt]
         alignment_writer = alignment_writer_class(self.handle)
         alignment_count = alignment_writer.write_file([alignment])
         if alignment_count != 1:
@@ -549,14 +550,10 @@ class AlignmentSequenceWriter(SequenceWriter):
         return count
 
 
-for fmt, alignment_writer_class in AlignIO._FormatToWriter.items():
+for fmt in AlignIO._FormatToWriter:
     name = fmt.replace("-", " ").title().replace(" ", "") + "AlignmentSequenceWriter"
-    cls = type(
-        name,
-        (AlignmentSequenceWriter,),
-        {"_alignment_writer_class": alignment_writer_class},
-    )
-    _FormatToWriter[fmt] = cls  # type: ignore
+    cls = type(name, (AlignmentSequenceWriter,), {"fmt": fmt})
+    _FormatToWriter[fmt] = cls
 
 
 del AlignIO
@@ -1046,42 +1043,86 @@ def index_db(
 
 
 # TODO? - Handling aliases explicitly would let us shorten this list:
-_converter = {
-    ("genbank", "fasta"): InsdcIO._genbank_convert_fasta,
-    ("gb", "fasta"): InsdcIO._genbank_convert_fasta,
-    ("embl", "fasta"): InsdcIO._embl_convert_fasta,
-    ("fastq", "fasta"): QualityIO._fastq_convert_fasta,
-    ("fastq-sanger", "fasta"): QualityIO._fastq_convert_fasta,
-    ("fastq-solexa", "fasta"): QualityIO._fastq_convert_fasta,
-    ("fastq-illumina", "fasta"): QualityIO._fastq_convert_fasta,
-    ("fastq", "tab"): QualityIO._fastq_convert_tab,
-    ("fastq-sanger", "tab"): QualityIO._fastq_convert_tab,
-    ("fastq-solexa", "tab"): QualityIO._fastq_convert_tab,
-    ("fastq-illumina", "tab"): QualityIO._fastq_convert_tab,
-    ("fastq", "fastq"): QualityIO._fastq_sanger_convert_fastq_sanger,
-    ("fastq-sanger", "fastq"): QualityIO._fastq_sanger_convert_fastq_sanger,
-    ("fastq-solexa", "fastq"): QualityIO._fastq_solexa_convert_fastq_sanger,
-    ("fastq-illumina", "fastq"): QualityIO._fastq_illumina_convert_fastq_sanger,
-    ("fastq", "fastq-sanger"): QualityIO._fastq_sanger_convert_fastq_sanger,
-    ("fastq-sanger", "fastq-sanger"): QualityIO._fastq_sanger_convert_fastq_sanger,
-    ("fastq-solexa", "fastq-sanger"): QualityIO._fastq_solexa_convert_fastq_sanger,
-    ("fastq-illumina", "fastq-sanger"): QualityIO._fastq_illumina_convert_fastq_sanger,
-    ("fastq", "fastq-solexa"): QualityIO._fastq_sanger_convert_fastq_solexa,
-    ("fastq-sanger", "fastq-solexa"): QualityIO._fastq_sanger_convert_fastq_solexa,
-    ("fastq-solexa", "fastq-solexa"): QualityIO._fastq_solexa_convert_fastq_solexa,
-    ("fastq-illumina", "fastq-solexa"): QualityIO._fastq_illumina_convert_fastq_solexa,
-    ("fastq", "fastq-illumina"): QualityIO._fastq_sanger_convert_fastq_illumina,
-    ("fastq-sanger", "fastq-illumina"): QualityIO._fastq_sanger_convert_fastq_illumina,
-    ("fastq-solexa", "fastq-illumina"): QualityIO._fastq_solexa_convert_fastq_illumina,
-    (
-        "fastq-illumina",
-        "fastq-illumina",
-    ): QualityIO._fastq_illumina_convert_fastq_illumina,
-    ("fastq", "qual"): QualityIO._fastq_sanger_convert_qual,
-    ("fastq-sanger", "qual"): QualityIO._fastq_sanger_convert_qual,
-    ("fastq-solexa", "qual"): QualityIO._fastq_solexa_convert_qual,
-    ("fastq-illumina", "qual"): QualityIO._fastq_illumina_convert_qual,
-}
+_converter = LazyImportDict(
+    {
+        ("genbank", "fasta"): "Bio.SeqIO.InsdcIO._genbank_convert_fasta",
+        ("gb", "fasta"): "Bio.SeqIO.InsdcIO._genbank_convert_fasta",
+        ("embl", "fasta"): "Bio.SeqIO.InsdcIO._embl_convert_fasta",
+        ("fastq", "fasta"): "Bio.SeqIO.QualityIO._fastq_convert_fasta",
+        ("fastq-sanger", "fasta"): "Bio.SeqIO.QualityIO._fastq_convert_fasta",
+        ("fastq-solexa", "fasta"): "Bio.SeqIO.QualityIO._fastq_convert_fasta",
+        ("fastq-illumina", "fasta"): "Bio.SeqIO.QualityIO._fastq_convert_fasta",
+        ("fastq", "tab"): "Bio.SeqIO.QualityIO._fastq_convert_tab",
+        ("fastq-sanger", "tab"): "Bio.SeqIO.QualityIO._fastq_convert_tab",
+        ("fastq-solexa", "tab"): "Bio.SeqIO.QualityIO._fastq_convert_tab",
+        ("fastq-illumina", "tab"): "Bio.SeqIO.QualityIO._fastq_convert_tab",
+        ("fastq", "fastq"): "Bio.SeqIO.QualityIO._fastq_sanger_convert_fastq_sanger",
+        (
+            "fastq-sanger",
+            "fastq",
+        ): "Bio.SeqIO.QualityIO._fastq_sanger_convert_fastq_sanger",
+        (
+            "fastq-solexa",
+            "fastq",
+        ): "Bio.SeqIO.QualityIO._fastq_solexa_convert_fastq_sanger",
+        (
+            "fastq-illumina",
+            "fastq",
+        ): "Bio.SeqIO.QualityIO._fastq_illumina_convert_fastq_sanger",
+        (
+            "fastq",
+            "fastq-sanger",
+        ): "Bio.SeqIO.QualityIO._fastq_sanger_convert_fastq_sanger",
+        (
+            "fastq-sanger",
+            "fastq-sanger",
+        ): "Bio.SeqIO.QualityIO._fastq_sanger_convert_fastq_sanger",
+        (
+            "fastq-solexa",
+            "fastq-sanger",
+        ): "Bio.SeqIO.QualityIO._fastq_solexa_convert_fastq_sanger",
+        (
+            "fastq-illumina",
+            "fastq-sanger",
+        ): "Bio.SeqIO.QualityIO._fastq_illumina_convert_fastq_sanger",
+        (
+            "fastq",
+            "fastq-solexa",
+        ): "Bio.SeqIO.QualityIO._fastq_sanger_convert_fastq_solexa",
+        (
+            "fastq-sanger",
+            "fastq-solexa",
+        ): "Bio.SeqIO.QualityIO._fastq_sanger_convert_fastq_solexa",
+        (
+            "fastq-solexa",
+            "fastq-solexa",
+        ): "Bio.SeqIO.QualityIO._fastq_solexa_convert_fastq_solexa",
+        (
+            "fastq-illumina",
+            "fastq-solexa",
+        ): "Bio.SeqIO.QualityIO._fastq_illumina_convert_fastq_solexa",
+        (
+            "fastq",
+            "fastq-illumina",
+        ): "Bio.SeqIO.QualityIO._fastq_sanger_convert_fastq_illumina",
+        (
+            "fastq-sanger",
+            "fastq-illumina",
+        ): "Bio.SeqIO.QualityIO._fastq_sanger_convert_fastq_illumina",
+        (
+            "fastq-solexa",
+            "fastq-illumina",
+        ): "Bio.SeqIO.QualityIO._fastq_solexa_convert_fastq_illumina",
+        (
+            "fastq-illumina",
+            "fastq-illumina",
+        ): "Bio.SeqIO.QualityIO._fastq_illumina_convert_fastq_illumina",
+        ("fastq", "qual"): "Bio.SeqIO.QualityIO._fastq_sanger_convert_qual",
+        ("fastq-sanger", "qual"): "Bio.SeqIO.QualityIO._fastq_sanger_convert_qual",
+        ("fastq-solexa", "qual"): "Bio.SeqIO.QualityIO._fastq_solexa_convert_qual",
+        ("fastq-illumina", "qual"): "Bio.SeqIO.QualityIO._fastq_illumina_convert_qual",
+    }
+)
 
 
 def convert(in_file, in_format, out_file, out_format, molecule_type=None):
@@ -1166,6 +1207,14 @@ def convert(in_file, in_format, out_file, out_format, molecule_type=None):
     return count
 
 
+def __getattr__(name):
+    # The format modules are imported only when needed, but remain available
+    # as attributes of this module for backward compatibility.
+    if name in _modules:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
     from Bio._utils import run_doctest
 
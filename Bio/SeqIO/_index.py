@@ -187,8 +187,10 @@ class SequentialSeqFileRandomAccess(SeqFileRandomAccess):
         marker = {
             "ace": b"CO ",
             "embl": b"ID ",
+            "embl-lazy": b"ID ",
             "fasta": b">",
             "genbank": b"LOCUS ",
+            "genbank-lazy": b"LOCUS ",
             "gb": b"LOCUS ",
             "imgt": b"ID ",
             "phd": b"BEGIN_SEQUENCE",
@@ -698,6 +700,7 @@ class FastqRandomAccess(SeqFileRandomAccess):
 _FormatToRandomAccess = {
     "ace": SequentialSeqFileRandomAccess,
     "embl": EmblRandomAccess,
+    "embl-lazy": EmblRandomAccess,
     "fasta": SequentialSeqFileRandomAccess,
     "fastq": FastqRandomAccess,  # Class handles all three variants
     "fastq-sanger": FastqRandomAccess,  # alias of the above
@@ -705,6 +708,7 @@ _FormatToRandomAccess = {
     "fastq-illumina": FastqRandomAccess,
     "genbank": GenBankRandomAccess,
     "gb": GenBankRandomAccess,  # alias of the above
+    "genbank-lazy": GenBankRandomAccess,
     "ig": IntelliGeneticsRandomAccess,
     "imgt": EmblRandomAccess,
     "phd": SequentialSeqFileRandomAccess,
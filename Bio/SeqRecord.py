@@ -29,6 +29,7 @@ from Bio.Seq import Seq
 from Bio.Seq import UndefinedSequenceError
 
 if TYPE_CHECKING:
+    from Bio.SeqFeature import FeatureTable
     from Bio.SeqFeature import SeqFeature
 
 _NO_SEQRECORD_COMPARISON = "SeqRecord comparison is deliberately not implemented. Explicitly compare the attributes of interest."
@@ -184,7 +185,7 @@ class SeqRecord:
         name: str = "<unknown name>",
         description: str = "<unknown description>",
         dbxrefs: list[str] | None = None,
-        features: list["SeqFeature"] | None = None,
+        features: Union[list["SeqFeature"], "FeatureTable"] | None = None,
         annotations: _AnnotationsDict | None = None,
         letter_annotations: dict[str, Sequence[Any]] | None = None,
     ) -> None:
@@ -196,7 +197,8 @@ class SeqRecord:
          - name        - Sequence name, optional (string)
          - description - Sequence description, optional (string)
          - dbxrefs     - Database cross references, optional (list of strings)
-         - features    - Any (sub)features, optional (list of SeqFeature objects)
+         - features    - Any (sub)features, optional (list of SeqFeature objects,
+           or a FeatureTable)
          - annotations - Dictionary of annotations for the whole sequence
          - letter_annotations - Dictionary of per-letter-annotations, values
            should be strings, list or tuples of the same length as the full
@@ -253,9 +255,12 @@ class SeqRecord:
         if features is None:
             features = []
         elif not isinstance(features, list):
-            raise TypeError(
-                "features argument should be a list (of SeqFeature objects)"
-            )
+            from Bio.SeqFeature import FeatureTable
+
+            if not isinstance(features, FeatureTable):
+                raise TypeError(
+                    "features argument should be a list (of SeqFeature objects)"
+                )
         self.features = features
 
     @property
@@ -578,7 +583,15 @@ class SeqRecord:
             if step == 1:
                 # Select relevant features, add them with shifted locations
                 # assert str(self.seq)[index] == str(self.seq)[start:stop]
-                for f in self.features:
+                from Bio.SeqFeature import FeatureTable
+
+                if isinstance(self.features, FeatureTable):
+                    # Widen the query so zero-length features (insertion
+                    # sites) at either end of the slice are also found:
+                    features = self.features.overlapping(start - 1, stop + 1)
+                else:
+                    features = self.features
+                for f in features:
                     if f.location.ref or f.location.ref_db:
                         # TODO - Implement this (with lots of tests)?
                         import warnings
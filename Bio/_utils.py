@@ -7,9 +7,13 @@
 # package.
 """Common utility functions for various Bio submodules."""
 
+import importlib
 import os
 from typing import Any
 from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterator
+from collections.abc import MutableMapping
 from typing import cast
 from typing import Optional
 from typing import Protocol
@@ -68,6 +72,58 @@ def find_test_dir(start_dir: str | None = None) -> str:
     )
 
 
+class LazyImportDict(MutableMapping):
+    """Dictionary of objects that are imported when first accessed.
+
+    The initial values are given as strings with the full name of the object,
+    such as "Bio.SeqIO.FastaIO.FastaIterator". The module is imported when the
+    value is first retrieved, after which the object itself is stored. Testing
+    for a key, or iterating over the keys, does not import anything.
+    """
+
+    def __init__(self, names: dict[Hashable, str]) -> None:
+        """Initialize the dictionary with the object names."""
+        self._data: dict[Hashable, Any] = dict(names)
+        self._loaded: set[Hashable] = set()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """Return the object, importing it if needed."""
+        value = self._data[key]
+        if key not in self._loaded:
+            module_name, name = value.rsplit(".", 1)
+            module = importlib.import_module(module_name)
+            value = getattr(module, name)
+            self._data[key] = value
+            self._loaded.add(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """Store an object (which will not be imported lazily)."""
+        self._data[key] = value
+        self._loaded.add(key)
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Remove an object."""
+        del self._data[key]
+        self._loaded.discard(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Test if the key is present, without importing its object."""
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the keys."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Return a representation of the dictionary."""
+        return f"{self.__class__.__name__}({list(self._data)!r})"
+
+
 def run_doctest(target_dir: str | None = None, *args: Any, **kwargs: Any) -> None:
     """Run doctest for the importing module."""
     import doctest
@@ -148,20 +148,39 @@ class CodonAlignment(MultipleSeqAlignment):
         alignments = [SeqRecord(rec.seq.toSeq(), id=rec.id) for rec in self._records]
         return MultipleSeqAlignment(alignments)
 
-    def get_dn_ds_matrix(self, method="NG86", codon_table=None):
+    def get_dn_ds_matrix(self, method="NG86", codon_table=None, workers=1):
         """Available methods include NG86, LWL85, YN00 and ML.
 
         Argument:
          - method       - Available methods include NG86, LWL85, YN00 and ML.
          - codon_table  - Codon table to use for forward translation.
+         - workers      - Number of processes used to calculate dN and dS with
+           the ML method (default 1). If None, the number of processors is used.
 
         """
+        from Bio.Align.analysis import _dn_ds_matrices
+        from Bio.Align.analysis import _encode_codons
         from Bio.Phylo.TreeConstruction import DistanceMatrix as DM
 
         if codon_table is None:
             codon_table = CodonTable.generic_by_id[1]
         names = [i.id for i in self._records]
         size = len(self._records)
+        if size > 1:
+            rows = []
+            for record in self._records:
+                codons = [str(codon) for codon in _get_codon_list(record.seq)]
+                if any(len(codon) != 3 for codon in codons):
+                    break
+                codons = ["---" if "-" in codon else codon for codon in codons]
+                rows.append("".join(codons))
+            else:
+                codons = _encode_codons(rows)
+                if codons is not None:
+                    matrices = _dn_ds_matrices(codons, method, codon_table, workers)
+                    if matrices is not None:
+                        dn_matrix, ds_matrix = matrices
+                        return DM(names, matrix=dn_matrix), DM(names, matrix=ds_matrix)
         dn_matrix = []
         ds_matrix = []
         for i in range(size):
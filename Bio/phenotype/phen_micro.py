@@ -25,8 +25,11 @@ Functions:
 """
 
 import csv
+import itertools
 import json
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
@@ -54,6 +57,9 @@ _csvData = "csv_data"
 _measurements = "measurements"
 #
 
+# Sigmoid functions that can be fitted to the signals, in their default order
+_fit_functions = ("gompertz", "logistic", "richards")
+
 
 class PlateRecord:
     """PlateRecord object for storing Phenotype Microarray plates data.
@@ -162,7 +168,7 @@ class PlateRecord:
         try:
             for w in wells:
                 self._is_well(w)
-                self[w.id] = w
+                self._wells[w.id] = w
         except TypeError:
             raise TypeError(
                 "You must provide an iterator-like object containing the single wells"
@@ -424,10 +430,15 @@ class PlateRecord:
         if {x.id for x in self} != {x.id for x in plate}:
             raise ValueError("The two plates have different wells")
 
-        wells = []
-
-        for w in self:
-            wells.append(w + plate[w.id])
+        times = _get_shared_times(
+            itertools.chain(self._wells.values(), plate._wells.values())
+        )
+        if times is None:
+            wells = [w + plate[w.id] for w in self]
+        else:
+            wellids = sorted(self._wells)
+            signals = self._get_array(times, wellids) + plate._get_array(times, wellids)
+            wells = _make_wells(wellids, times, signals)
 
         newp = PlateRecord(self.id, wells=wells)
 
@@ -447,10 +458,15 @@ class PlateRecord:
         if {x.id for x in self} != {x.id for x in plate}:
             raise ValueError("The two plates have different wells")
 
-        wells = []
-
-        for w in self:
-            wells.append(w - plate[w.id])
+        times = _get_shared_times(
+            itertools.chain(self._wells.values(), plate._wells.values())
+        )
+        if times is None:
+            wells = [w - plate[w.id] for w in self]
+        else:
+            wellids = sorted(self._wells)
+            signals = self._get_array(times, wellids) - plate._get_array(times, wellids)
+            wells = _make_wells(wellids, times, signals)
 
         newp = PlateRecord(self.id, wells=wells)
 
@@ -508,18 +524,146 @@ class PlateRecord:
         if missing:
             raise ValueError("Some wells to be subtracted are not present")
 
-        nwells = []
-
-        for w in self:
-            if w.id in wells:
-                nwells.append(w - wcontrol)
-            else:
-                nwells.append(w)
+        wells = sorted(set(wells))
+        times = _get_shared_times(self._wells.values())
+        if times is None:
+            nwells = [self._wells[w] - wcontrol for w in wells]
+        else:
+            signals = self._get_array(times, wells)
+            signals -= self._get_array(times, [control])
+            nwells = _make_wells(wells, times, signals)
+        nwells = dict(zip(wells, nwells))
 
-        newp = PlateRecord(self.id, wells=nwells)
+        newp = PlateRecord(self.id, wells=[nwells.get(w.id, w) for w in self])
 
         return newp
 
+    def _get_array(self, times, wells=None):
+        """Return the signals of wells sharing the same time points (PRIVATE).
+
+        The signals are returned as a 2D NumPy array, with one row for each
+        well, and one column for each time point. By default, all wells are
+        included, in the order of their identifiers.
+        """
+        if wells is None:
+            wells = sorted(self._wells)
+        signals = np.empty((len(wells), len(times)))
+        for row, w in zip(signals, wells):
+            row[:] = [self._wells[w]._signals[t] for t in times]
+        return signals
+
+    def get_times(self):
+        """Get a list of the time points recorded in any well of the plate."""
+        times = set()
+        for w in self._wells.values():
+            times.update(w._signals)
+        return sorted(times)
+
+    def get_signals(self):
+        """Get the signals of all wells as a 2D NumPy array.
+
+        The array has one row for each well, ordered by their identifiers,
+        and one column for each time point returned by ``get_times``. If a
+        time point was not recorded in a well, the interpolated signal is
+        used, or nan if the time point is outside the time span of the well:
+
+        >>> from Bio import phenotype
+        >>> plate = phenotype.read("phenotype/Plate.json", "pm-json")
+        >>> signals = plate.get_signals()
+        >>> signals.shape
+        (96, 384)
+        >>> print(signals[4, :4])
+        [14. 13. 15. 15.]
+
+        """
+        times = _get_shared_times(self._wells.values())
+        if times is not None:
+            return self._get_array(times)
+        times = self.get_times()
+        signals = np.full((len(self._wells), len(times)), np.nan)
+        for row, w in zip(signals, sorted(self._wells)):
+            if self._wells[w]._signals:
+                row[:] = self._wells[w]._interpolate(times)
+        return signals
+
+    def fit_all(self, function=_fit_functions, workers=1):
+        """Fit a sigmoid function to all wells and extract their curve parameters.
+
+        This is equivalent to calling the ``fit`` method of each well, except
+        that no exception is raised if no function can be fitted to the
+        signals of a well; instead, the ``.model`` of that well is set to None.
+
+        If all wells share the same time points, the summary statistics and
+        the initial guesses of the curve parameters are calculated for all
+        wells at once. The sigmoid functions are then fitted using ``workers``
+        processes; the default value of 1 fits the wells one by one, while
+        None uses all CPUs.
+
+        There is no return value.
+        """
+        if function:
+            for sigmoid_func in function:
+                if sigmoid_func not in _fit_functions:
+                    raise ValueError(f"Fitting function {sigmoid_func!r} not supported")
+
+        wells = list(self)
+        times = _get_shared_times(wells)
+        if times is None:
+            xs = [w.get_times() for w in wells]
+            ys = [np.array(w.get_signals()) for w in wells]
+        else:
+            signals = self._get_array(times)
+            xs = [times] * len(wells)
+            ys = list(signals)
+        for w, y in zip(wells, ys):
+            # Parameters not dependent on curve fitting
+            w.max = float(y.max())
+            w.min = float(y.min())
+            w.average_height = y.mean()
+            w.area = None
+            w.model = None
+
+        if not function:
+            return
+
+        # Parameters that depend on scipy curve_fit
+        from .pm_fitting import get_area
+        from .pm_fitting import guess_parameters
+
+        if times is None:
+            areas = [get_area(y, x) for x, y in zip(xs, ys)]
+            guesses = [guess_parameters(x, y) for x, y in zip(xs, ys)]
+        else:
+            areas = get_area(signals, times)
+            guesses = guess_parameters(times, signals)
+        for w, area in zip(wells, areas):
+            w.area = area
+
+        function = tuple(function)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(wells))
+        if workers > 1:
+            # Send the wells to the processes in chunks to reduce the overhead
+            chunksize = max(1, len(wells) // (4 * workers))
+            with ProcessPoolExecutor(workers) as executor:
+                results = list(
+                    executor.map(
+                        _fit_well,
+                        itertools.repeat(function),
+                        xs,
+                        ys,
+                        guesses,
+                        chunksize=chunksize,
+                    )
+                )
+        else:
+            results = map(_fit_well, itertools.repeat(function), xs, ys, guesses)
+        for w, (model, params) in zip(wells, results):
+            if model is not None:
+                (w.plateau, w.slope, w.lag, w.v, w.y0) = params
+                w.model = model
+
     def __repr__(self):
         """Return a (truncated) representation of the plate for debugging."""
         if len(self._wells) > 4:
@@ -734,10 +878,11 @@ class WellRecord:
             if list(self._signals.keys()) != list(other._signals.keys()):
                 return False
             # Account for the presence of NaNs
-            for k in self._signals:
-                if np.isnan(self[k]) and np.isnan(other[k]):
+            for k, signal in self._signals.items():
+                other_signal = other._signals[k]
+                if np.isnan(signal) and np.isnan(other_signal):
                     continue
-                elif self[k] != other[k]:
+                elif signal != other_signal:
                     return False
             return True
         else:
@@ -752,11 +897,12 @@ class WellRecord:
         if not isinstance(well, WellRecord):
             raise TypeError("Expecting a WellRecord object")
 
-        signals = {}
-
-        times = set(self._signals.keys()).union(set(well._signals.keys()))
-        for t in sorted(times):
-            signals[t] = self[t] + well[t]
+        times = sorted(set(self._signals.keys()).union(set(well._signals.keys())))
+        if times:
+            values = self._interpolate(times) + well._interpolate(times)
+            signals = dict(zip(times, values.tolist()))
+        else:
+            signals = {}
 
         neww = WellRecord(self.id, signals=signals)
 
@@ -771,11 +917,12 @@ class WellRecord:
         if not isinstance(well, WellRecord):
             raise TypeError("Expecting a WellRecord object")
 
-        signals = {}
-
-        times = set(self._signals.keys()).union(set(well._signals.keys()))
-        for t in sorted(times):
-            signals[t] = self[t] - well[t]
+        times = sorted(set(self._signals.keys()).union(set(well._signals.keys())))
+        if times:
+            values = self._interpolate(times) - well._interpolate(times)
+            signals = dict(zip(times, values.tolist()))
+        else:
+            signals = {}
 
         neww = WellRecord(self.id, signals=signals)
 
@@ -863,8 +1010,6 @@ class WellRecord:
 
         There is no return value.
         """
-        avail_func = ("gompertz", "logistic", "richards")
-
         # Parameters not dependent on curve fitting
         self.max = max(self, key=lambda x: x[1])[1]
         self.min = min(self, key=lambda x: x[1])[1]
@@ -876,37 +1021,71 @@ class WellRecord:
             self.model = None
             return
         for sigmoid_func in function:
-            if sigmoid_func not in avail_func:
+            if sigmoid_func not in _fit_functions:
                 raise ValueError(f"Fitting function {sigmoid_func!r} not supported")
 
         # Parameters that depend on scipy curve_fit
-        from .pm_fitting import fit
         from .pm_fitting import get_area
-        from .pm_fitting import gompertz
-        from .pm_fitting import logistic
-        from .pm_fitting import richards
-
-        function_map = {
-            "logistic": logistic,
-            "gompertz": gompertz,
-            "richards": richards,
-        }
 
         self.area = get_area(self.get_signals(), self.get_times())
 
         self.model = None
-        for sigmoid_func in function:
-            func = function_map[sigmoid_func]
-            try:
-                (self.plateau, self.slope, self.lag, self.v, self.y0), pcov = fit(
-                    func, self.get_times(), self.get_signals()
-                )
+        model, params = _fit_well(function, self.get_times(), self.get_signals())
+        if model is None:
+            raise RuntimeError("Could not fit any sigmoid function")
+        (self.plateau, self.slope, self.lag, self.v, self.y0) = params
+        self.model = model
 
-                self.model = sigmoid_func
-                return
-            except RuntimeError:
-                continue
-        raise RuntimeError("Could not fit any sigmoid function")
+
+def _get_shared_times(wells):
+    """Return the time points of the wells if they are all the same (PRIVATE).
+
+    Return None if the wells have different time points.
+    """
+    times = None
+    for w in wells:
+        if times is None:
+            times = w._signals.keys()
+        elif w._signals.keys() != times:
+            return None
+    if times is None:
+        return []
+    return sorted(times)
+
+
+def _make_wells(wellids, times, signals):
+    """Create WellRecord objects from a 2D array of signals (PRIVATE)."""
+    return [
+        WellRecord(wellid, signals=dict(zip(times, values)))
+        for wellid, values in zip(wellids, signals.tolist())
+    ]
+
+
+def _fit_well(function, times, signals, p0=None):
+    """Fit the first sigmoid function that succeeds to the signals (PRIVATE).
+
+    Return the name of the fitted function and its parameters, or a tuple
+    of None values if no function could be fitted. This is a module-level
+    function so that wells can be fitted in separate processes.
+    """
+    from .pm_fitting import fit
+    from .pm_fitting import gompertz
+    from .pm_fitting import logistic
+    from .pm_fitting import richards
+
+    function_map = {
+        "logistic": logistic,
+        "gompertz": gompertz,
+        "richards": richards,
+    }
+
+    for sigmoid_func in function:
+        try:
+            params, pcov = fit(function_map[sigmoid_func], times, signals, p0)
+        except RuntimeError:
+            continue
+        return sigmoid_func, params
+    return None, None
 
 
 def JsonIterator(handle):
@@ -1174,7 +1353,7 @@ def _toOPM(plate):
         d[_measurements][_hour].append(hour)
         for wid, w in plate._wells.items():
             if hour in w._signals:
-                d[_measurements][wid].append(w[hour])
+                d[_measurements][wid].append(w._signals[hour])
             # This shouldn't happen
             else:
                 d[_measurements][wid].append(float("nan"))
@@ -16,6 +16,7 @@ gompertz           Gompertz growth model.
 richards           Richards growth model.
 guess_plateau      Guess the plateau point to improve sigmoid fitting.
 guess_lag          Guess the lag point to improve sigmoid fitting.
+guess_parameters   Guess all sigmoid parameters to improve sigmoid fitting.
 fit                Sigmoid functions fit.
 get_area           Calculate the area under the PM curve.
 """
@@ -80,28 +81,23 @@ def guess_lag(x, y):
     with the next point is higher then the mean differences between
     the points plus one standard deviation. If such point is not found
     or x and y have different lengths the function returns zero.
+
+    If y is a two-dimensional array with one row of signals for each well,
+    an array with the lag point guess of each well is returned.
     """
-    if len(x) != len(y):
+    y = np.asarray(y)
+    if len(x) != y.shape[-1]:
         return 0
 
-    diffs = []
-    indexes = range(len(x))
-
-    for i in indexes:
-        if i + 1 not in indexes:
-            continue
-        diffs.append(y[i + 1] - y[i])
-    diffs = np.array(diffs)
-
-    flex = x[-1]
-    for i in indexes:
-        if i + 1 not in indexes:
-            continue
-        if (y[i + 1] - y[i]) > (diffs.mean() + (diffs.std())):
-            flex = x[i]
-            break
-
-    return flex
+    x = np.asarray(x)
+    if y.shape[-1] < 2:
+        # Without differences between points, use the last point
+        return np.full(y.shape[:-1], x[-1])[()]
+    diffs = np.diff(y, axis=-1)
+    threshold = diffs.mean(axis=-1, keepdims=True) + diffs.std(axis=-1, keepdims=True)
+    flexes = diffs > threshold
+    # Use the last point if the difference never exceeds the threshold
+    return np.where(flexes.any(axis=-1), x[flexes.argmax(axis=-1)], x[-1])[()]
 
 
 def guess_plateau(x, y):
@@ -111,36 +107,50 @@ def guess_plateau(x, y):
     is near one standard deviation of the differences between the y points to
     the maximum y value. If such point is not found or x and y have
     different lengths the function returns zero.
+
+    If y is a two-dimensional array with one row of signals for each well,
+    an array with the plateau point guess of each well is returned.
     """
-    if len(x) != len(y):
+    y = np.asarray(y)
+    if len(x) != y.shape[-1]:
         return 0
 
-    diffs = []
-    indexes = range(len(y))
+    std = np.diff(y, axis=-1).std(axis=-1, keepdims=True)
+    ymax = y[..., -1:]
+    plateaus = (y > ymax - std) & (y < ymax + std)
+    # Use the last point if no point is near enough
+    indices = np.where(plateaus.any(axis=-1), plateaus.argmax(axis=-1), -1)
+    return np.take_along_axis(y, indices[..., None], axis=-1)[..., 0][()]
 
-    for i in indexes:
-        if i + 1 not in indexes:
-            continue
-        diffs.append(y[i + 1] - y[i])
-    diffs = np.array(diffs)
 
-    ymax = y[-1]
-    for i in indexes:
-        if y[i] > (ymax - diffs.std()) and y[i] < (ymax + diffs.std()):
-            ymax = y[i]
-            break
+def guess_parameters(x, y):
+    """Given two axes returns the initial guesses of the sigmoid parameters.
 
-    return ymax
+    The guesses are used as the starting point of the curve fitting, which
+    is necessary to get significant fits. If y is a two-dimensional array
+    with one row of signals for each well, an array with one row of guesses
+    for each well is returned.
+    """
+    y = np.asarray(y)
+    plateau = guess_plateau(x, y)
+    lag = guess_lag(x, y)
+    return np.stack(
+        np.broadcast_arrays(plateau, 4.0, lag, 0.1, y.min(axis=-1)), axis=-1
+    )
 
 
-def fit(function, x, y):
+def fit(function, x, y, p0=None):
     """Fit the provided function to the x and y values.
 
+    The initial guesses of the function parameters are calculated using
+    ``guess_parameters``, unless they are provided as p0.
+
     The function parameters and the parameters covariance.
     """
-    # Compute guesses for the parameters
-    # This is necessary to get significant fits
-    p0 = [guess_plateau(x, y), 4.0, guess_lag(x, y), 0.1, min(y)]
+    if p0 is None:
+        # Compute guesses for the parameters
+        # This is necessary to get significant fits
+        p0 = guess_parameters(x, y)
 
     params, pcov = curve_fit(function, x, y, p0=p0)
     return params, pcov
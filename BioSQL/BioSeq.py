@@ -151,109 +151,170 @@ def _retrieve_seq(adaptor, primary_id):
         return Seq(None, length=length)
 
 
+def _in_clause(ids):
+    """Return the placeholders for an SQL IN clause with the given ids (PRIVATE)."""
+    return "(" + ", ".join(["%s"] * len(ids)) + ")"
+
+
 def _retrieve_dbxrefs(adaptor, primary_id):
     """Retrieve the database cross references for the sequence (PRIVATE)."""
-    _dbxrefs = []
+    return _retrieve_dbxrefs_many(adaptor, [primary_id])[primary_id]
+
+
+def _retrieve_dbxrefs_many(adaptor, primary_ids):
+    """Retrieve the database cross references of several bioentries (PRIVATE).
+
+    Returns a dictionary mapping each primary id to its list of cross
+    references.
+    """
+    primary_ids = list(primary_ids)
+    _dbxrefs = {primary_id: [] for primary_id in primary_ids}
     dbxrefs = adaptor.execute_and_fetchall(
-        "SELECT dbname, accession, version"
+        "SELECT bioentry_id, dbname, accession, version"
         " FROM bioentry_dbxref join dbxref using (dbxref_id)"
-        " WHERE bioentry_id = %s"
-        ' ORDER BY "rank"',
-        (primary_id,),
+        f" WHERE bioentry_id IN {_in_clause(primary_ids)}"
+        ' ORDER BY bioentry_id, "rank"',
+        primary_ids,
     )
-    for dbname, accession, version in dbxrefs:
+    for primary_id, dbname, accession, version in dbxrefs:
         if version and version != "0":
             v = f"{accession}.{version}"
         else:
             v = accession
-        _dbxrefs.append(f"{dbname}:{v}")
+        _dbxrefs[primary_id].append(f"{dbname}:{v}")
     return _dbxrefs
 
 
 def _retrieve_features(adaptor, primary_id):
-    sql = (
-        'SELECT seqfeature_id, type.name, "rank"'
+    return _retrieve_features_many(adaptor, [primary_id])[primary_id]
+
+
+def _retrieve_features_many(adaptor, primary_ids):
+    """Retrieve the features of several bioentries (PRIVATE).
+
+    Rather than running several queries for each feature, all features,
+    qualifiers, cross references and locations of the bioentries are
+    fetched using one query each, and the SeqFeature objects are then
+    assembled in memory.
+
+    Returns a dictionary mapping each primary id to its list of features.
+    """
+    primary_ids = list(primary_ids)
+    in_clause = _in_clause(primary_ids)
+    rows = adaptor.execute_and_fetchall(
+        'SELECT bioentry_id, seqfeature_id, type.name, "rank"'
         " FROM seqfeature join term type on (type_term_id = type.term_id)"
-        " WHERE bioentry_id = %s"
-        ' ORDER BY "rank"'
+        f" WHERE bioentry_id IN {in_clause}"
+        ' ORDER BY bioentry_id, "rank"',
+        primary_ids,
     )
-    results = adaptor.execute_and_fetchall(sql, (primary_id,))
-    seq_feature_list = []
-    for seqfeature_id, seqfeature_type, seqfeature_rank in results:
-        # Get qualifiers [except for db_xref which is stored separately]
-        qvs = adaptor.execute_and_fetchall(
-            "SELECT name, value"
-            " FROM seqfeature_qualifier_value  join term using (term_id)"
-            " WHERE seqfeature_id = %s"
-            ' ORDER BY "rank"',
-            (seqfeature_id,),
-        )
-        qualifiers = {}
-        for qv_name, qv_value in qvs:
-            qualifiers.setdefault(qv_name, []).append(qv_value)
-        # Get db_xrefs [special case of qualifiers]
-        qvs = adaptor.execute_and_fetchall(
-            "SELECT dbxref.dbname, dbxref.accession"
-            " FROM dbxref join seqfeature_dbxref using (dbxref_id)"
-            " WHERE seqfeature_dbxref.seqfeature_id = %s"
-            ' ORDER BY "rank"',
-            (seqfeature_id,),
+    features = {primary_id: [] for primary_id in primary_ids}
+    if not rows:
+        return features
+    # Get qualifiers [except for db_xref which is stored separately]
+    qualifiers = {}
+    qvs = adaptor.execute_and_fetchall(
+        "SELECT seqfeature_id, name, value"
+        " FROM seqfeature_qualifier_value join term using (term_id)"
+        " join seqfeature using (seqfeature_id)"
+        f" WHERE bioentry_id IN {in_clause}"
+        ' ORDER BY seqfeature_id, seqfeature_qualifier_value."rank"',
+        primary_ids,
+    )
+    for seqfeature_id, qv_name, qv_value in qvs:
+        qualifiers.setdefault(seqfeature_id, {}).setdefault(qv_name, []).append(
+            qv_value
         )
-        for qv_name, qv_value in qvs:
-            value = f"{qv_name}:{qv_value}"
-            qualifiers.setdefault("db_xref", []).append(value)
-        # Get locations
-        results = adaptor.execute_and_fetchall(
-            "SELECT location_id, start_pos, end_pos, strand"
-            " FROM location"
-            " WHERE seqfeature_id = %s"
-            ' ORDER BY "rank"',
-            (seqfeature_id,),
+    # Get db_xrefs [special case of qualifiers]
+    qvs = adaptor.execute_and_fetchall(
+        "SELECT seqfeature_id, dbxref.dbname, dbxref.accession"
+        " FROM dbxref join seqfeature_dbxref using (dbxref_id)"
+        " join seqfeature using (seqfeature_id)"
+        f" WHERE bioentry_id IN {in_clause}"
+        ' ORDER BY seqfeature_id, seqfeature_dbxref."rank"',
+        primary_ids,
+    )
+    for seqfeature_id, qv_name, qv_value in qvs:
+        value = f"{qv_name}:{qv_value}"
+        qualifiers.setdefault(seqfeature_id, {}).setdefault("db_xref", []).append(value)
+    # Get locations, with possible remote reference information
+    locations = {}
+    results = adaptor.execute_and_fetchall(
+        "SELECT seqfeature_id, location_id, start_pos, end_pos, strand,"
+        " dbname, accession, dbxref.version"
+        " FROM location join seqfeature using (seqfeature_id)"
+        " left join dbxref on (location.dbxref_id = dbxref.dbxref_id)"
+        f" WHERE bioentry_id IN {in_clause}"
+        ' ORDER BY seqfeature_id, location."rank"',
+        primary_ids,
+    )
+    for row in results:
+        locations.setdefault(row[0], []).append(row[1:])
+    # Get location qualifier values; see Bug 2677, we currently don't
+    # record the location_operator so this is normally empty
+    operators = {}
+    results = adaptor.execute_and_fetchall(
+        "SELECT location_id, value"
+        " FROM location_qualifier_value join location using (location_id)"
+        " join seqfeature using (seqfeature_id)"
+        f" WHERE bioentry_id IN {in_clause}",
+        primary_ids,
+    )
+    for location_id, value in results:
+        operators.setdefault(location_id, value)
+
+    for primary_id, seqfeature_id, seqfeature_type, seqfeature_rank in rows:
+        feature = _make_feature(
+            seqfeature_id,
+            seqfeature_type,
+            qualifiers.get(seqfeature_id, {}),
+            locations.get(seqfeature_id, []),
+            operators,
         )
-        locations = []
-        # convert to Python standard form
-        # Convert strand = 0 to strand = None
-        # re: comment in Loader.py:
-        # Biopython uses None when we don't know strand information but
-        # BioSQL requires something (non null) and sets this as zero
-        # So we'll use the strand or 0 if Biopython spits out None
-        for location_id, start, end, strand in results:
-            if start:
-                start -= 1
-            if strand == 0:
-                strand = None
-            if strand not in (+1, -1, None):
-                raise ValueError(
-                    "Invalid strand %s found in database for "
-                    "seqfeature_id %s" % (strand, seqfeature_id)
-                )
-            if start is not None and end is not None and end < start:
-                import warnings
+        features[primary_id].append(feature)
+    return features
+
+
+def _make_feature(seqfeature_id, seqfeature_type, qualifiers, rows, operators):
+    """Create a SeqFeature from the data retrieved from the database (PRIVATE)."""
+    locations = []
+    lookup = {}
+    # convert to Python standard form
+    # Convert strand = 0 to strand = None
+    # re: comment in Loader.py:
+    # Biopython uses None when we don't know strand information but
+    # BioSQL requires something (non null) and sets this as zero
+    # So we'll use the strand or 0 if Biopython spits out None
+    for location_id, start, end, strand, dbname, accession, version in rows:
+        if start:
+            start -= 1
+        if strand == 0:
+            strand = None
+        if strand not in (+1, -1, None):
+            raise ValueError(
+                "Invalid strand %s found in database for "
+                "seqfeature_id %s" % (strand, seqfeature_id)
+            )
+        if start is not None and end is not None and end < start:
+            import warnings
 
-                from Bio import BiopythonWarning
+            from Bio import BiopythonWarning
 
-                warnings.warn(
-                    "Inverted location start/end (%i and %i) for "
-                    "seqfeature_id %s" % (start, end, seqfeature_id),
-                    BiopythonWarning,
-                )
+            warnings.warn(
+                "Inverted location start/end (%i and %i) for "
+                "seqfeature_id %s" % (start, end, seqfeature_id),
+                BiopythonWarning,
+            )
 
-            # For SwissProt unknown positions (?)
-            if start is None:
-                start = SeqFeature.UnknownPosition()
-            if end is None:
-                end = SeqFeature.UnknownPosition()
-
-            locations.append((location_id, start, end, strand))
-        # Get possible remote reference information
-        remote_results = adaptor.execute_and_fetchall(
-            "SELECT location_id, dbname, accession, version"
-            " FROM location join dbxref using (dbxref_id)"
-            " WHERE seqfeature_id = %s",
-            (seqfeature_id,),
-        )
-        lookup = {}
-        for location_id, dbname, accession, version in remote_results:
+        # For SwissProt unknown positions (?)
+        if start is None:
+            start = SeqFeature.UnknownPosition()
+        if end is None:
+            end = SeqFeature.UnknownPosition()
+
+        locations.append((location_id, start, end, strand))
+        if dbname is not None:
+            # Remote reference information
             if version and version != "0":
                 v = f"{accession}.{version}"
             else:
@@ -264,60 +325,46 @@ def _retrieve_features(adaptor, primary_id):
                 dbname = None
             lookup[location_id] = (dbname, v)
 
-        feature = SeqFeature.SeqFeature(type=seqfeature_type)
-        # Store the key as a private property
-        feature._seqfeature_id = seqfeature_id
-        feature.qualifiers = qualifiers
-        if len(locations) == 0:
-            pass
-        elif len(locations) == 1:
-            location_id, start, end, strand = locations[0]
-            # See Bug 2677, we currently don't record the location_operator
-            # For consistency with older versions Biopython, default to "".
-            feature.location_operator = _retrieve_location_qualifier_value(
-                adaptor, location_id
-            )
+    feature = SeqFeature.SeqFeature(type=seqfeature_type)
+    # Store the key as a private property
+    feature._seqfeature_id = seqfeature_id
+    feature.qualifiers = qualifiers
+    if len(locations) == 0:
+        pass
+    elif len(locations) == 1:
+        location_id, start, end, strand = locations[0]
+        # See Bug 2677, we currently don't record the location_operator
+        # For consistency with older versions Biopython, default to "".
+        feature.location_operator = operators.get(location_id, "")
+        dbname, version = lookup.get(location_id, (None, None))
+        feature.location = SeqFeature.SimpleLocation(start, end)
+        feature.location.strand = strand
+        feature.location.ref_db = dbname
+        feature.location.ref = version
+    else:
+        locs = []
+        for location in locations:
+            location_id, start, end, strand = location
             dbname, version = lookup.get(location_id, (None, None))
-            feature.location = SeqFeature.SimpleLocation(start, end)
-            feature.location.strand = strand
-            feature.location.ref_db = dbname
-            feature.location.ref = version
-        else:
-            locs = []
-            for location in locations:
-                location_id, start, end, strand = location
-                dbname, version = lookup.get(location_id, (None, None))
-                locs.append(
-                    SeqFeature.SimpleLocation(
-                        start, end, strand=strand, ref=version, ref_db=dbname
-                    )
+            locs.append(
+                SeqFeature.SimpleLocation(
+                    start, end, strand=strand, ref=version, ref_db=dbname
                 )
-            # Locations are typically in biological in order (see negative
-            # strands below), but because of remote locations for
-            # sub-features they are not necessarily in numerical order:
-            strands = {_.strand for _ in locs}
-            if len(strands) == 1 and -1 in strands:
-                # Evil hack time for backwards compatibility
-                # TODO - Check if BioPerl and (old) Biopython did the same,
-                # we may have an existing incompatibility lurking here...
-                locs = locs[::-1]
-            feature.location = SeqFeature.CompoundLocation(locs, "join")
-            # TODO - See Bug 2677 - we don't yet record location operator,
-            # so for consistency with older versions of Biopython default
-            # to assuming its a join.
-        seq_feature_list.append(feature)
-    return seq_feature_list
-
-
-def _retrieve_location_qualifier_value(adaptor, location_id):
-    value = adaptor.execute_and_fetch_col0(
-        "SELECT value FROM location_qualifier_value WHERE location_id = %s",
-        (location_id,),
-    )
-    try:
-        return value[0]
-    except IndexError:
-        return ""
+            )
+        # Locations are typically in biological in order (see negative
+        # strands below), but because of remote locations for
+        # sub-features they are not necessarily in numerical order:
+        strands = {_.strand for _ in locs}
+        if len(strands) == 1 and -1 in strands:
+            # Evil hack time for backwards compatibility
+            # TODO - Check if BioPerl and (old) Biopython did the same,
+            # we may have an existing incompatibility lurking here...
+            locs = locs[::-1]
+        feature.location = SeqFeature.CompoundLocation(locs, "join")
+        # TODO - See Bug 2677 - we don't yet record location operator,
+        # so for consistency with older versions of Biopython default
+        # to assuming its a join.
+    return feature
 
 
 def _retrieve_annotations(adaptor, primary_id, taxon_id):
@@ -497,7 +544,19 @@ class DBSeqRecord(SeqRecord):
         """
         self._adaptor = adaptor
         self._primary_id = primary_id
+        row = self._adaptor.execute_one(
+            "SELECT biodatabase_id, taxon_id, name, accession, version,"
+            " identifier, division, description"
+            " FROM bioentry"
+            " WHERE bioentry_id = %s",
+            (self._primary_id,),
+        )
+        # We do NOT want to load the sequence from the DB here!
+        length = _retrieve_seq_len(adaptor, primary_id)
+        self._set_bioentry(row, length)
 
+    def _set_bioentry(self, row, length):
+        """Set the attributes stored in the bioentry table (PRIVATE)."""
         (
             self._biodatabase_id,
             self._taxon_id,
@@ -507,13 +566,7 @@ class DBSeqRecord(SeqRecord):
             self._identifier,
             self._division,
             self.description,
-        ) = self._adaptor.execute_one(
-            "SELECT biodatabase_id, taxon_id, name, accession, version,"
-            " identifier, division, description"
-            " FROM bioentry"
-            " WHERE bioentry_id = %s",
-            (self._primary_id,),
-        )
+        ) = row
         if version and version != "0":
             self.id = f"{accession}.{version}"
         else:
@@ -521,8 +574,6 @@ class DBSeqRecord(SeqRecord):
         # We don't yet record any per-letter-annotations in the
         # BioSQL database, but we should set this property up
         # for completeness (and the __str__ method).
-        # We do NOT want to load the sequence from the DB here!
-        length = _retrieve_seq_len(adaptor, primary_id)
         self._per_letter_annotations = _RestrictedDict(length=length)
 
     def __get_seq(self):
@@ -590,3 +641,48 @@ class DBSeqRecord(SeqRecord):
     @annotations.deleter
     def annotations(self) -> None:
         del self._annotations
+
+
+def _retrieve_records(adaptor, primary_ids):
+    """Retrieve several DBSeqRecord objects at once (PRIVATE).
+
+    The bioentry rows, sequence lengths, cross references and features of
+    all records are fetched with a few queries in total, instead of several
+    queries per record and per feature. The annotations and sequences are
+    still retrieved on demand.
+
+    Returns a list of DBSeqRecord objects in the order of primary_ids.
+    """
+    primary_ids = list(primary_ids)
+    if not primary_ids:
+        return []
+    in_clause = _in_clause(primary_ids)
+    rows = adaptor.execute_and_fetchall(
+        "SELECT bioentry_id, biodatabase_id, taxon_id, name, accession, version,"
+        " identifier, division, description"
+        " FROM bioentry"
+        f" WHERE bioentry_id IN {in_clause}",
+        primary_ids,
+    )
+    rows = {row[0]: row[1:] for row in rows}
+    lengths = adaptor.execute_and_fetchall(
+        f"SELECT bioentry_id, length FROM biosequence WHERE bioentry_id IN {in_clause}",
+        primary_ids,
+    )
+    lengths = {primary_id: int(length) for primary_id, length in lengths}
+    dbxrefs = _retrieve_dbxrefs_many(adaptor, primary_ids)
+    features = _retrieve_features_many(adaptor, primary_ids)
+    records = []
+    for primary_id in primary_ids:
+        try:
+            row = rows[primary_id]
+        except KeyError:
+            raise KeyError(f"Entry {primary_id!r} not found") from None
+        record = DBSeqRecord.__new__(DBSeqRecord)
+        record._adaptor = adaptor
+        record._primary_id = primary_id
+        record._set_bioentry(row, lengths.get(primary_id))
+        record._dbxrefs = dbxrefs[primary_id]
+        record._features = features[primary_id]
+        records.append(record)
+    return records
@@ -718,15 +718,47 @@ class BioSeqDatabase:
         """Iterate over ids (which may not be meaningful outside this database)."""
         return iter(self)
 
-    def values(self):
-        """Iterate over DBSeqRecord objects in the namespace (sub database)."""
-        for key in self:
-            yield self[key]
+    def values(self, prefetch=None):
+        """Iterate over DBSeqRecord objects in the namespace (sub database).
 
-    def items(self):
-        """Iterate over (id, DBSeqRecord) for the namespace (sub database)."""
-        for key in self:
-            yield key, self[key]
+        By default, each record is retrieved from the database when it is
+        needed, and its features are retrieved when first accessed. If
+        prefetch is given, the records are retrieved in groups of this
+        many, fetching their features and cross references with a few
+        queries per group. This is much faster if you are going to look at
+        the features of all records, for example::
+
+            for record in db.values(prefetch=100):
+                print(record.id, len(record.features))
+
+        """
+        if prefetch is None:
+            for key in self:
+                yield self[key]
+        else:
+            for key, record in self._prefetch_items(prefetch):
+                yield record
+
+    def items(self, prefetch=None):
+        """Iterate over (id, DBSeqRecord) for the namespace (sub database).
+
+        See the values method for the prefetch argument.
+        """
+        if prefetch is None:
+            for key in self:
+                yield key, self[key]
+        else:
+            yield from self._prefetch_items(prefetch)
+
+    def _prefetch_items(self, prefetch):
+        """Iterate over (id, DBSeqRecord), retrieved in groups (PRIVATE)."""
+        if prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+        keys = self.adaptor.list_bioentry_ids(self.dbid)
+        for i in range(0, len(keys), prefetch):
+            chunk = keys[i : i + prefetch]
+            records = BioSeq._retrieve_records(self.adaptor, chunk)
+            yield from zip(chunk, records)
 
     def lookup(self, **kwargs):
         """Return a DBSeqRecord using an acceptable identifier.
@@ -748,7 +780,7 @@ class BioSeqDatabase:
         seqid = lookup_func(self.dbid, v)
         return BioSeq.DBSeqRecord(self.adaptor, seqid)
 
-    def load(self, record_iterator, fetch_NCBI_taxonomy=False):
+    def load(self, record_iterator, fetch_NCBI_taxonomy=False, chunk_size=None):
         """Load a set of SeqRecords into the BioSQL database.
 
         record_iterator is either a list of SeqRecord objects, or an
@@ -761,6 +793,15 @@ class BioSeqDatabase:
         (via Bio.Entrez) to fetch a detailed taxonomy for each
         SeqRecord.
 
+        chunk_size is the number of records to load per transaction in
+        bulk mode. By default (None), records are loaded one by one, and
+        committing the transaction is left to the caller. If chunk_size
+        is given, a BulkDatabaseLoader is used, which caches the ids of
+        ontology terms, database cross-references and taxa, and inserts
+        rows in batches; the transaction is then committed after every
+        chunk_size records, and after the last record. This is much
+        faster when loading many records, e.g. a complete RefSeq release.
+
         Example::
 
             from Bio import SeqIO
@@ -768,7 +809,16 @@ class BioSeqDatabase:
 
         Returns the number of records loaded.
         """
-        db_loader = Loader.DatabaseLoader(self.adaptor, self.dbid, fetch_NCBI_taxonomy)
+        if chunk_size is None:
+            db_loader = Loader.DatabaseLoader(
+                self.adaptor, self.dbid, fetch_NCBI_taxonomy
+            )
+        else:
+            if chunk_size < 1:
+                raise ValueError("chunk_size must be a positive integer")
+            db_loader = Loader.BulkDatabaseLoader(
+                self.adaptor, self.dbid, fetch_NCBI_taxonomy
+            )
         num_records = 0
         for cur_record in record_iterator:
             num_records += 1
@@ -801,4 +851,10 @@ class BioSeqDatabase:
                     )
             # End of hack
             db_loader.load_seqrecord(cur_record)
+            if chunk_size is not None and num_records % chunk_size == 0:
+                db_loader.flush()
+                self.adaptor.commit()
+        if chunk_size is not None:
+            db_loader.flush()
+            self.adaptor.commit()
         return num_records
@@ -67,8 +67,19 @@ class DatabaseLoader:
         for reference, rank in zip(references, list(range(len(references)))):
             self._load_reference(reference, rank, bioentry_id)
         self._load_annotations(record, bioentry_id)
-        for seq_feature_num in range(len(record.features)):
-            seq_feature = record.features[seq_feature_num]
+        self._load_seqfeatures(record.features, bioentry_id)
+
+    def _insert(self, sql, args):
+        """Insert a row for which the new id is not needed (PRIVATE).
+
+        The BulkDatabaseLoader overrides this to collect rows, which are
+        then inserted together.
+        """
+        self.adaptor.execute(sql, args)
+
+    def _load_seqfeatures(self, features, bioentry_id):
+        """Load the SeqFeature objects of a record into the database (PRIVATE)."""
+        for seq_feature_num, seq_feature in enumerate(features):
             self._load_seqfeature(seq_feature, seq_feature_num, bioentry_id)
 
     def _get_ontology_id(self, name, definition=None):
@@ -698,7 +709,7 @@ class DatabaseLoader:
             ' (bioentry_id, term_id, value, "rank")'
             " VALUES (%s, %s, %s, 1)"
         )
-        self.adaptor.execute(sql, (bioentry_id, date_id, date))
+        self._insert(sql, (bioentry_id, date_id, date))
 
     def _load_biosequence(self, record, bioentry_id):
         """Record SeqRecord's sequence and alphabet in DB (PRIVATE).
@@ -733,7 +744,7 @@ class DatabaseLoader:
             "length, seq, alphabet) "
             "VALUES (%s, 0, %s, %s, %s)"
         )
-        self.adaptor.execute(sql, (bioentry_id, len(record.seq), seq_str, alphabet))
+        self._insert(sql, (bioentry_id, len(record.seq), seq_str, alphabet))
 
     def _load_comment(self, record, bioentry_id):
         """Record a SeqRecord's annotated comment in the database (PRIVATE).
@@ -758,7 +769,7 @@ class DatabaseLoader:
                 'INSERT INTO comment (bioentry_id, comment_text, "rank")'
                 " VALUES (%s, %s, %s)"
             )
-            self.adaptor.execute(sql, (bioentry_id, comment, index + 1))
+            self._insert(sql, (bioentry_id, comment, index + 1))
 
     def _load_annotations(self, record, bioentry_id):
         """Record a SeqRecord's misc annotations in the database (PRIVATE).
@@ -794,14 +805,12 @@ class DatabaseLoader:
                     if isinstance(entry, (str, int)):
                         # Easy case
                         rank += 1
-                        self.adaptor.execute(
-                            many_sql, (bioentry_id, term_id, str(entry), rank)
-                        )
+                        self._insert(many_sql, (bioentry_id, term_id, str(entry), rank))
                     else:
                         pass
             elif isinstance(value, (str, int)):
                 # Have a simple single entry, leave rank as the DB default
-                self.adaptor.execute(mono_sql, (bioentry_id, term_id, str(value)))
+                self._insert(mono_sql, (bioentry_id, term_id, str(value)))
             else:
                 pass
                 # print("Ignoring annotation '%s' entry of type '%s'" \
@@ -871,7 +880,7 @@ class DatabaseLoader:
             "INSERT INTO bioentry_reference (bioentry_id, reference_id,"
             ' start_pos, end_pos, "rank") VALUES (%s, %s, %s, %s, %s)'
         )
-        self.adaptor.execute(sql, (bioentry_id, reference_id, start, end, rank + 1))
+        self._insert(sql, (bioentry_id, reference_id, start, end, rank + 1))
 
     def _load_seqfeature(self, feature, feature_rank, bioentry_id):
         """Load a biopython SeqFeature into the database (PRIVATE)."""
@@ -1011,7 +1020,7 @@ class DatabaseLoader:
             'start_pos, end_pos, strand, "rank") '
             "VALUES (%s, %s, %s, %s, %s, %s, %s)"
         )
-        self.adaptor.execute(
+        self._insert(
             sql, (seqfeature_id, dbxref_id, loc_term_id, start, end, strand, rank)
         )
 
@@ -1066,7 +1075,7 @@ class DatabaseLoader:
                         ' (seqfeature_id, term_id, "rank", value) VALUES'
                         " (%s, %s, %s, %s)"
                     )
-                    self.adaptor.execute(
+                    self._insert(
                         sql,
                         (
                             seqfeature_id,
@@ -1170,7 +1179,7 @@ class DatabaseLoader:
             '(seqfeature_id, dbxref_id, "rank") VALUES'
             "(%s, %s, %s)"
         )
-        self.adaptor.execute(sql, (seqfeature_id, dbxref_id, rank))
+        self._insert(sql, (seqfeature_id, dbxref_id, rank))
         return (seqfeature_id, dbxref_id)
 
     def _load_dbxrefs(self, record, bioentry_id):
@@ -1231,10 +1240,160 @@ class DatabaseLoader:
             '(bioentry_id,dbxref_id,"rank") VALUES '
             "(%s, %s, %s)"
         )
-        self.adaptor.execute(sql, (bioentry_id, dbxref_id, rank))
+        self._insert(sql, (bioentry_id, dbxref_id, rank))
         return (bioentry_id, dbxref_id)
 
 
+class BulkDatabaseLoader(DatabaseLoader):
+    """Object used to load many SeqRecord objects into a BioSQL database.
+
+    This loader stores the same data as the DatabaseLoader, but needs far
+    fewer round-trips to the database server:
+
+     - The ids of ontologies, terms, database cross-references and taxa are
+       cached in memory after the first lookup, instead of being queried
+       again for every record;
+     - All features of a record are inserted with a single ``executemany``
+       call, after which their ids are retrieved with a single query;
+     - Rows for which the new id is not needed (qualifier values,
+       locations, cross-reference links, comments, and so on) are collected,
+       and inserted with one ``executemany`` call per table when ``flush`` is
+       called.
+
+    Call ``flush`` before committing the transaction. Normally you would not
+    use this class directly, but call the load() method of a BioSeqDatabase
+    object with the ``chunk_size`` argument, which flushes and commits after
+    every chunk of records.
+
+    The cached ids are only valid while the rows they refer to exist, so the
+    loader should be discarded if the transaction is rolled back.
+    """
+
+    def __init__(self, adaptor, dbid, fetch_NCBI_taxonomy=False):
+        """Initialize with connection information for the database."""
+        super().__init__(adaptor, dbid, fetch_NCBI_taxonomy)
+        self._ontology_ids = {}
+        self._term_ids = {}
+        self._dbxref_ids = {}
+        self._taxon_ids = {}
+        # Pending rows for each INSERT statement, and the dbxref links
+        # already among them:
+        self._rows = {}
+        self._dbxref_links = set()
+
+    def flush(self):
+        """Insert all pending rows into the database."""
+        rows = self._rows
+        self._rows = {}
+        self._dbxref_links.clear()
+        for sql, args in rows.items():
+            self.adaptor.executemany(sql, args)
+
+    def _insert(self, sql, args):
+        """Collect a row, to be inserted by the next flush (PRIVATE)."""
+        try:
+            self._rows[sql].append(args)
+        except KeyError:
+            self._rows[sql] = [args]
+
+    def _get_ontology_id(self, name, definition=None):
+        """Return identifier for the named ontology, using the cache (PRIVATE)."""
+        try:
+            return self._ontology_ids[name]
+        except KeyError:
+            pass
+        ontology_id = super()._get_ontology_id(name, definition)
+        self._ontology_ids[name] = ontology_id
+        return ontology_id
+
+    def _get_term_id(self, name, ontology_id=None, definition=None, identifier=None):
+        """Get the id that corresponds to a term, using the cache (PRIVATE)."""
+        key = (name, ontology_id)
+        try:
+            return self._term_ids[key]
+        except KeyError:
+            pass
+        term_id = super()._get_term_id(name, ontology_id, definition, identifier)
+        self._term_ids[key] = term_id
+        return term_id
+
+    def _get_dbxref_id(self, db, accession):
+        """Get DB cross-reference for accession, using the cache (PRIVATE)."""
+        key = (db, accession)
+        try:
+            return self._dbxref_ids[key]
+        except KeyError:
+            pass
+        dbxref_id = super()._get_dbxref_id(db, accession)
+        self._dbxref_ids[key] = dbxref_id
+        return dbxref_id
+
+    def _get_taxon_id_from_ncbi_taxon_id(
+        self, ncbi_taxon_id, scientific_name=None, common_name=None
+    ):
+        """Get the taxon id from the NCBI taxon ID, using the cache (PRIVATE)."""
+        key = int(ncbi_taxon_id)
+        try:
+            return self._taxon_ids[key]
+        except KeyError:
+            pass
+        taxon_id = super()._get_taxon_id_from_ncbi_taxon_id(
+            ncbi_taxon_id, scientific_name, common_name
+        )
+        self._taxon_ids[key] = taxon_id
+        return taxon_id
+
+    def _load_seqfeatures(self, features, bioentry_id):
+        """Load the SeqFeature objects of a record in bulk (PRIVATE)."""
+        if not features:
+            return
+        key_ontology_id = self._get_ontology_id("SeqFeature Keys")
+        source_ontology_id = self._get_ontology_id("SeqFeature Sources")
+        rows = []
+        for feature_rank, feature in enumerate(features):
+            # See DatabaseLoader._load_seqfeature for the source qualifier
+            source = feature.qualifiers.get("source", "EMBL/GenBank/SwissProt")
+            if isinstance(source, list):
+                source = source[0]
+            type_term_id = self._get_term_id(feature.type, ontology_id=key_ontology_id)
+            source_term_id = self._get_term_id(source, ontology_id=source_ontology_id)
+            rows.append((bioentry_id, type_term_id, source_term_id, feature_rank + 1))
+        sql = (
+            "INSERT INTO seqfeature (bioentry_id, type_term_id, "
+            'source_term_id, "rank") VALUES (%s, %s, %s, %s)'
+        )
+        self.adaptor.executemany(sql, rows)
+        # The bioentry is new, so its features have distinct ranks
+        seqfeature_ids = dict(
+            self.adaptor.execute_and_fetchall(
+                'SELECT "rank", seqfeature_id FROM seqfeature WHERE bioentry_id = %s',
+                (bioentry_id,),
+            )
+        )
+        for feature_rank, feature in enumerate(features):
+            seqfeature_id = seqfeature_ids[feature_rank + 1]
+            self._load_seqfeature_locations(feature, seqfeature_id)
+            self._load_seqfeature_qualifiers(feature.qualifiers, seqfeature_id)
+
+    def _get_seqfeature_dbxref(self, seqfeature_id, dbxref_id, rank):
+        """Link a new seqfeature to a DB cross-reference once (PRIVATE)."""
+        # The seqfeature is new, so only the pending rows need to be checked
+        key = ("seqfeature", seqfeature_id, dbxref_id)
+        if key in self._dbxref_links:
+            return (seqfeature_id, dbxref_id)
+        self._dbxref_links.add(key)
+        return self._add_seqfeature_dbxref(seqfeature_id, dbxref_id, rank)
+
+    def _get_bioentry_dbxref(self, bioentry_id, dbxref_id, rank):
+        """Link a new bioentry to a DB cross-reference once (PRIVATE)."""
+        # The bioentry is new, so only the pending rows need to be checked
+        key = ("bioentry", bioentry_id, dbxref_id)
+        if key in self._dbxref_links:
+            return (bioentry_id, dbxref_id)
+        self._dbxref_links.add(key)
+        return self._add_bioentry_dbxref(bioentry_id, dbxref_id, rank)
+
+
 class DatabaseRemover:
     """Complement the Loader functionality by fully removing a database.
 
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# Copyright 2026 by The Biopython Contributors.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare the timing of loading records into BioSQL one by one and in bulk.
+
+Usage::
+
+    python biosql_performance_bulk_load.py records.gb [chunk_size]
+
+The records are loaded into a temporary SQLite database, created using the
+BioSQL schema in Tests/BioSQL, first one by one and then in bulk.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from Bio import SeqIO
+from BioSQL import BioSeqDatabase
+
+schema = os.path.join(
+    os.path.dirname(__file__), "..", "..", "Tests", "BioSQL", "biosqldb-sqlite.sql"
+)
+
+filename = sys.argv[1]
+chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+records = list(SeqIO.parse(filename, "gb"))
+num_features = sum(len(record.features) for record in records)
+print(f"Loading {len(records)} records with {num_features} features")
+
+with tempfile.TemporaryDirectory() as directory:
+    server = BioSeqDatabase.open_database(
+        driver="sqlite3", db=os.path.join(directory, "biosql.db")
+    )
+    server.load_database_sql(schema)
+    server.commit()
+    for name, keywords in (
+        ("one by one", {}),
+        (f"in bulk (chunk_size={chunk_size})", {"chunk_size": chunk_size}),
+    ):
+        db = server.new_database(name)
+        start_time = time.time()
+        num_records = db.load(records, **keywords)
+        server.commit()
+        elapsed_time = time.time() - start_time
+        print(
+            "\t%s: %i records in %.3f seconds, %.1f records per second"
+            % (name, num_records, elapsed_time, num_records / elapsed_time)
+        )
+    server.close()
@@ -1224,6 +1224,161 @@ class TransferTest(SeqRecordTestBaseClass):
         destroy_database()
 
 
+class BulkLoadTest(SeqRecordTestBaseClass):
+    """Compare loading records in bulk to loading them one by one."""
+
+    filenames = [
+        "GenBank/NC_005816.gb",
+        "GenBank/NC_000932.gb",
+        "GenBank/cor6_6.gb",
+        "GenBank/arab1.gb",
+        "GenBank/one_of.gb",
+    ]
+
+    tables = {
+        "bioentry_qualifier_value": "bioentry_qualifier_value",
+        "biosequence": "biosequence",
+        "comment": "comment",
+        "bioentry_dbxref": "bioentry_dbxref",
+        "bioentry_reference": "bioentry_reference",
+        "seqfeature": "seqfeature",
+        "location": "location JOIN seqfeature USING (seqfeature_id)",
+        "seqfeature_qualifier_value": (
+            "seqfeature_qualifier_value JOIN seqfeature USING (seqfeature_id)"
+        ),
+        "seqfeature_dbxref": "seqfeature_dbxref JOIN seqfeature USING (seqfeature_id)",
+    }
+
+    def setUp(self):
+        TESTDB = create_database()
+        self.server = BioSeqDatabase.open_database(
+            driver=DBDRIVER, user=DBUSER, passwd=DBPASSWD, host=DBHOST, db=TESTDB
+        )
+        self.records = []
+        for filename in self.filenames:
+            for record in SeqIO.parse(filename, "gb"):
+                if record.annotations.get("molecule_type") == "mRNA":
+                    record.annotations["molecule_type"] = "DNA"
+                self.records.append(record)
+
+    def tearDown(self):
+        self.server.close()
+        destroy_database()
+
+    def count_rows(self, db):
+        counts = {}
+        for name, table in self.tables.items():
+            sql = (
+                f"SELECT COUNT(*) FROM {table} JOIN bioentry USING (bioentry_id)"
+                " WHERE biodatabase_id = %s"
+            )
+            counts[name] = self.server.adaptor.execute_one(sql, (db.dbid,))[0]
+        return counts
+
+    def test_bulk_load(self):
+        """Load records in bulk, committing in chunks."""
+        with warnings.catch_warnings():
+            # BiopythonWarning: order location operators are not fully supported
+            warnings.simplefilter("ignore", BiopythonWarning)
+            db = self.server.new_database("test_one_by_one")
+            count = db.load(self.records)
+            self.assertEqual(count, len(self.records))
+            self.server.commit()
+            bulk_db = self.server.new_database("test_bulk")
+            count = bulk_db.load(self.records, chunk_size=3)
+            self.assertEqual(count, len(self.records))
+        # The last chunk was committed by load
+        self.server.rollback()
+        self.assertEqual(len(bulk_db), len(self.records))
+        self.assertEqual(self.count_rows(bulk_db), self.count_rows(db))
+        biosql_records = [bulk_db.lookup(name=rec.name) for rec in self.records]
+        self.compare_records(self.records, biosql_records)
+        # Terms and cross-references are shared with the first namespace
+        sql = "SELECT COUNT(*) FROM term WHERE name = %s"
+        self.assertEqual(self.server.adaptor.execute_one(sql, ("CDS",))[0], 1)
+        sql = "SELECT COUNT(*) FROM dbxref WHERE dbname = %s AND accession = %s"
+        self.assertEqual(
+            self.server.adaptor.execute_one(sql, ("GeneID", "2767712"))[0], 1
+        )
+
+    def test_duplicate_load(self):
+        """Make sure can't import a single record twice in bulk."""
+        db = self.server.new_database("test_bulk")
+        record = SeqRecord(
+            Seq("ATGCTATGACTAT"), id="Test1", annotations={"molecule_type": "DNA"}
+        )
+        with self.assertRaises(Exception) as cm:
+            db.load([record, record], chunk_size=10)
+        self.assertIn(
+            cm.exception.__class__.__name__,
+            ["IntegrityError", "UniqueViolation", "AttributeError", "OperationalError"],
+        )
+        self.server.rollback()
+        with self.assertRaises(ValueError):
+            db.load([record], chunk_size=0)
+
+
+class PrefetchTest(SeqRecordTestBaseClass):
+    """Retrieve features and records in batches."""
+
+    def setUp(self):
+        with warnings.catch_warnings():
+            # BiopythonWarning: order location operators are not fully supported
+            warnings.simplefilter("ignore", BiopythonWarning)
+            load_multi_database("GenBank/NC_005816.gb", "GenBank/cor6_6.gb")
+        self.server = BioSeqDatabase.open_database(
+            driver=DBDRIVER, user=DBUSER, passwd=DBPASSWD, host=DBHOST, db=TESTDB
+        )
+        self.db = self.server["biosql-test2"]
+
+    def tearDown(self):
+        self.server.close()
+        destroy_database()
+
+    def count_queries(self, function, *args):
+        adaptor = self.server.adaptor
+        calls = []
+        original = adaptor.execute_and_fetchall
+
+        def execute_and_fetchall(sql, args=None):
+            calls.append(sql)
+            return original(sql, args)
+
+        adaptor.execute_and_fetchall = execute_and_fetchall
+        try:
+            result = function(*args)
+        finally:
+            del adaptor.execute_and_fetchall
+        return result, len(calls)
+
+    def test_features(self):
+        """Retrieve all features of a record with a few queries."""
+        record = self.db.lookup(accession="AJ237582")
+        features, count = self.count_queries(lambda: record.features)
+        self.assertEqual(len(features), 7)
+        self.assertLessEqual(count, 5)
+        self.assertEqual(features[1].type, "mRNA")
+        self.assertEqual(features[1].qualifiers["gene"], ["csp14"])
+        self.assertEqual(str(features[1].location), "join{[0:48](+), [142:206](+)}")
+
+    def test_prefetch(self):
+        """Iterate over records retrieved in groups."""
+        records = list(self.db.values())
+        self.assertEqual(len(records), 6)
+        prefetched, count = self.count_queries(list, self.db.values(prefetch=4))
+        # Two groups, each with a few queries
+        self.assertLessEqual(count, 16)
+        self.compare_records(records, prefetched)
+        for record, new_record in zip(records, prefetched):
+            self.assertEqual(record.dbxrefs, new_record.dbxrefs)
+            self.assertEqual(record.annotations, new_record.annotations)
+            self.assertEqual(record.seq, new_record.seq)
+        keys = [key for key, record in self.db.items(prefetch=5)]
+        self.assertEqual(keys, list(self.db.keys()))
+        with self.assertRaises(ValueError):
+            next(self.db.values(prefetch=0))
+
+
 class InDepthLoadTest(unittest.TestCase):
     """Make sure we are loading and retrieving in a semi-lossless fashion."""
 
@@ -52,6 +52,7 @@ EXCLUDE_DOCTEST_MODULES = ["Bio.Alphabet"]
 # They are not excluded by default, use --offline to exclude them
 ONLINE_DOCTEST_MODULES = [
     "Bio.Entrez",
+    "Bio.Entrez._session",
     "Bio.ExPASy",
     "Bio.ExPASy.cellosaurus",
     "Bio.TogoWS",
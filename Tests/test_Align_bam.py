@@ -0,0 +1,441 @@
+# Copyright 2026 by Michiel de Hoon.  All rights reserved.
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for Align.bam module."""
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+
+from Bio import Align
+from Bio import bgzf
+from Bio import StreamModeError
+from Bio.Align import _aligncore  # type: ignore
+from Bio.Align import Alignment
+from Bio.Align import bam
+from Bio.Align._htsindex import reg2bin
+from Bio.Align._htsindex import reg2bins
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Install numpy if you want to use Bio.Align.bam."
+    ) from None
+
+
+class Comparison:
+    """Mixin class to compare alignments parsed from BAM and SAM files."""
+
+    def assertSameAlignment(self, alignment1, alignment2, sequences=True):
+        for attribute in (
+            "flag",
+            "mapq",
+            "rnext",
+            "pnext",
+            "tlen",
+            "score",
+            "hard_clip_left",
+            "hard_clip_right",
+            "operations",
+        ):
+            self.assertEqual(
+                getattr(alignment1, attribute, None),
+                getattr(alignment2, attribute, None),
+                msg=attribute,
+            )
+        if alignment1.coordinates is None:
+            self.assertIsNone(alignment2.coordinates)
+        else:
+            self.assertTrue(
+                np.array_equal(alignment1.coordinates, alignment2.coordinates)
+            )
+        target1, query1 = alignment1.sequences
+        target2, query2 = alignment2.sequences
+        if target1 is None:
+            self.assertIsNone(target2)
+        else:
+            self.assertEqual(target1.id, target2.id)
+        if sequences and target1 is not None:
+            ranges = target1.seq.defined_ranges
+            self.assertEqual(ranges, target2.seq.defined_ranges)
+            for start, end in ranges:
+                self.assertEqual(target1.seq[start:end], target2.seq[start:end])
+        self.assertEqual(query1.id, query2.id)
+        self.assertEqual(len(query1.seq), len(query2.seq))
+        if query1.seq.defined:
+            self.assertEqual(query1.seq, query2.seq)
+        self.assertEqual(query1.annotations, query2.annotations)
+        self.assertEqual(query1.letter_annotations, query2.letter_annotations)
+        annotations1 = getattr(alignment1, "annotations", {})
+        annotations2 = getattr(alignment2, "annotations", {})
+        self.assertEqual(annotations1.keys(), annotations2.keys())
+        for key, value in annotations1.items():
+            self.assertTrue(np.array_equal(value, annotations2[key]), msg=key)
+
+    def compare(self, alignments1, alignments2, sort=False, sequences=True):
+        alignments1 = list(alignments1)
+        alignments2 = list(alignments2)
+        self.assertEqual(len(alignments1), len(alignments2))
+        if sort:
+            # the BAM and SAM files store the alignments in a different order
+            def key(alignment):
+                return alignment.sequences[1].id, alignment.flag
+
+            alignments1.sort(key=key)
+            alignments2.sort(key=key)
+        for alignment1, alignment2 in zip(alignments1, alignments2):
+            self.assertSameAlignment(alignment1, alignment2, sequences)
+
+
+class TestAlign_bam_reading(unittest.TestCase, Comparison):
+    def test_ex1(self):
+        alignments = Align.parse("SamBam/ex1.bam", "bam")
+        self.assertEqual(alignments.metadata, {})
+        self.assertEqual(len(alignments.targets), 2)
+        self.assertEqual(alignments.targets[0].id, "chr1")
+        self.assertEqual(len(alignments.targets[0].seq), 1575)
+        self.assertEqual(alignments.targets[1].id, "chr2")
+        self.assertEqual(len(alignments.targets[1].seq), 1584)
+        alignment = next(alignments)
+        self.assertIsNone(alignment.sequences[0])
+        self.assertIsNone(alignment.coordinates)
+        self.assertEqual(alignment.sequences[1].id, "EAS56_57:6:190:289:82")
+        self.assertEqual(
+            alignment.sequences[1].seq, "CTCAAGGTTGTTGCAAGGGGGTCTATGTGAACAAA"
+        )
+        self.assertEqual(alignment.flag, 69)
+        self.assertEqual(alignment.mapq, 0)
+        self.assertEqual(alignment.rnext, "chr1")
+        self.assertEqual(alignment.pnext, 99)
+        self.assertEqual(alignment.annotations, {"MF": 192})
+        n = 0
+        for alignment in alignments:
+            n += 1
+        self.assertEqual(n, 3270)
+        self.assertEqual(alignment.sequences[0].id, "chr2")
+        self.assertEqual(alignment.sequences[1].id, "EAS114_26:7:37:79:581")
+        self.assertEqual(
+            alignment.sequences[1].seq, "TTTTCTGGCATGAAAAAAAAAAAAAAAAAAAAAAA"
+        )
+        self.assertEqual(alignment.flag, 83)
+        self.assertEqual(alignment.mapq, 68)
+        self.assertTrue(
+            np.array_equal(alignment.coordinates, np.array([[1532, 1567], [35, 0]]))
+        )
+        self.assertEqual(alignment.rnext, "chr2")
+        self.assertEqual(alignment.pnext, 1348)
+        self.assertEqual(alignment.tlen, -219)
+        self.assertEqual(
+            alignment.sequences[1].letter_annotations["phred_quality"][:8],
+            [18, 11, 11, 11, 28, 28, 28, 21],
+        )
+        self.assertEqual(
+            alignment.annotations,
+            {"MF": 18, "Aq": 27, "NM": 2, "UQ": 23, "H0": 0, "H1": 1},
+        )
+
+    def test_ex1_sam(self):
+        # ex1.sam has no header, so the target sequence lengths are unknown
+        self.compare(
+            Align.parse("SamBam/ex1.bam", "bam"),
+            Align.parse("SamBam/ex1.sam", "sam"),
+            sequences=False,
+        )
+
+    def test_ex1_header(self):
+        alignments = Align.parse("SamBam/ex1_header.bam", "bam")
+        self.assertEqual(alignments.metadata["HD"], {"VN": "1.3", "SO": "coordinate"})
+        self.assertEqual(len(alignments.targets), 2)
+        self.assertEqual(alignments.targets[0].id, "chr1")
+        self.assertEqual(len(alignments.targets[0].seq), 1575)
+        self.assertEqual(alignments.targets[1].id, "chr2")
+        self.assertEqual(len(alignments.targets[1].seq), 1584)
+        self.compare(alignments, Align.parse("SamBam/ex1_header.sam", "sam"))
+
+    def test_ex1_refresh(self):
+        # same contents as ex1_header.bam, but using a different block strategy
+        self.compare(
+            Align.parse("SamBam/ex1_refresh.bam", "bam"),
+            Align.parse("SamBam/ex1_header.sam", "sam"),
+        )
+
+    def test_bam1(self):
+        alignments = Align.parse("SamBam/bam1.bam", "bam")
+        self.assertEqual(len(alignments.targets), 1)
+        self.assertEqual(alignments.targets[0].id, "1")
+        self.assertEqual(len(alignments.targets[0].seq), 239940)
+        self.assertEqual(
+            alignments.metadata["PG"][0],
+            {"ID": "bwa", "PN": "bwa", "VN": "0.6.2-r126"},
+        )
+        self.compare(alignments, Align.parse("SamBam/sam1.sam", "sam"), sort=True)
+
+    def test_bam1_md(self):
+        # The target sequence is reconstructed from the MD tag
+        alignments = Align.parse("SamBam/bam1.bam", "bam")
+        for alignment in alignments:
+            if alignment.sequences[1].id != "HWI-1KL120:88:D0LRBACXX:1:1101:2852:2134":
+                continue
+            if alignment.flag == 137:
+                break
+        target = alignment.sequences[0]
+        self.assertEqual(target.seq.defined_ranges, ((136185, 136286),))
+        self.assertEqual(
+            target.seq[136185:136286],
+            "TCACGGTGGCCTGTTGAGGCAGGGGGTCACGCTGACCTCTGTCCGCGTGGGAGGGGCCGGTGTGAGGCAAGGGCTCACACTGACCTCTCTCAGCGTGGGAG",
+        )
+
+    def test_bam2(self):
+        self.compare(
+            Align.parse("SamBam/bam2.bam", "bam"),
+            Align.parse("SamBam/sam2.sam", "sam"),
+            sort=True,
+        )
+
+    def test_sorted(self):
+        self.compare(
+            Align.parse("SamBam/bam1_sorted.bam", "bam"),
+            Align.parse("SamBam/sam1.sam", "sam"),
+            sort=True,
+        )
+
+    def test_text_mode(self):
+        with open("SamBam/ex1.bam") as stream, self.assertRaises(StreamModeError):
+            Align.parse(stream, "bam")
+
+    def test_not_bam(self):
+        with open("SamBam/ex1.fa", "rb") as stream, self.assertRaises(ValueError):
+            Align.parse(stream, "bam")
+
+
+class TestAlign_bam_writing(unittest.TestCase, Comparison):
+    def check(self, path, md=False):
+        alignments = Align.parse(path, "sam")
+        stream = BytesIO()
+        n = Align.write(alignments, stream, "bam", md=md)
+        self.assertEqual(n, len(alignments))
+        # The file should end with the BGZF EOF marker
+        self.assertEqual(stream.getvalue()[-28:], bgzf._bgzf_eof)
+        stream.seek(0)
+        alignments.rewind()
+        written = Align.parse(stream, "bam")
+        self.assertEqual(written.metadata, alignments.metadata)
+        self.assertEqual(len(written.targets), len(alignments.targets))
+        for target1, target2 in zip(written.targets, alignments.targets):
+            self.assertEqual(target1.id, target2.id)
+            self.assertEqual(len(target1), len(target2))
+            self.assertEqual(target1.annotations, target2.annotations)
+        # the target sequence can only be reconstructed from the MD tag
+        self.compare(written, alignments, sequences=md)
+
+    def test_ex1_header(self):
+        self.check("SamBam/ex1_header.sam")
+
+    def test_sam1(self):
+        self.check("SamBam/sam1.sam")
+
+    def test_sam1_md(self):
+        self.check("SamBam/sam1.sam", md=True)
+
+    def test_dna_rna(self):
+        # alignments with introns, stored as skipped regions (N)
+        self.check("Blat/dna_rna.sam")
+
+    def test_psl_34_004(self):
+        self.check("Blat/psl_34_004.sam")
+
+    def test_no_header(self):
+        target = SeqRecord(Seq("AACCGGTTACGT"), id="chrX")
+        query = SeqRecord(Seq("CCGGTTAC"), id="read")
+        query.letter_annotations["phred_quality"] = [30, 30, 20, 20, 10, 10, 40, 40]
+        sequences = [target, query]
+        alignment1 = Alignment(sequences, np.array([[2, 6, 8, 10], [0, 4, 4, 6]]))
+        alignment1.score = 12
+        alignment1.annotations = {
+            "XA": "A",
+            "XZ": "text",
+            "XH": b"\x1a\xe3",
+            "XF": 1.5,
+            "XI": -70000,
+            "XB": np.array([1, -2, 300], np.int16),
+            "XC": np.array([0.5, 1.5], float),
+        }
+        query = SeqRecord(Seq("GTAACCGG"), id="other")
+        sequences = [target, query]
+        alignment2 = Alignment(sequences, np.array([[2, 6], [8, 4]]))
+        stream = BytesIO()
+        n = Align.write([alignment1, alignment2], stream, "bam", md=True)
+        self.assertEqual(n, 2)
+        stream.seek(0)
+        alignments = Align.parse(stream, "bam")
+        self.assertEqual(len(alignments.targets), 1)
+        self.assertEqual(alignments.targets[0].id, "chrX")
+        self.assertEqual(len(alignments.targets[0]), 12)
+        alignment = next(alignments)
+        self.assertEqual(alignment.flag, 0)
+        self.assertEqual(alignment.score, 12)
+        self.assertTrue(
+            np.array_equal(
+                alignment.coordinates, np.array([[2, 6, 8, 10], [0, 4, 4, 6]])
+            )
+        )
+        self.assertEqual(alignment.sequences[1].seq, "CCGGTTAC")
+        self.assertEqual(
+            alignment.sequences[1].letter_annotations["phred_quality"],
+            [30, 30, 20, 20, 10, 10, 40, 40],
+        )
+        # target sequence reconstructed from the MD tag
+        self.assertEqual(alignment.sequences[0].seq[2:10], "CCGGTTAC")
+        annotations = alignment.annotations
+        self.assertEqual(annotations["XA"], "A")
+        self.assertEqual(annotations["XZ"], "text")
+        self.assertEqual(annotations["XH"], b"\x1a\xe3")
+        self.assertAlmostEqual(annotations["XF"], 1.5)
+        self.assertEqual(annotations["XI"], -70000)
+        self.assertEqual(annotations["XB"].dtype, np.int16)
+        self.assertEqual(list(annotations["XB"]), [1, -2, 300])
+        self.assertEqual(annotations["XC"].dtype, np.float32)
+        self.assertEqual(list(annotations["XC"]), [0.5, 1.5])
+        alignment = next(alignments)
+        self.assertEqual(alignment.flag, 16)
+        self.assertEqual(alignment.sequences[1].seq, "GTAACCGG")
+        self.assertTrue(np.array_equal(alignment.coordinates, [[2, 6], [8, 4]]))
+        self.assertRaises(StopIteration, next, alignments)
+
+
+class TestAlign_bam_cigar(unittest.TestCase):
+    def test_binary_cigar(self):
+        operations = b"MIDNSHP=X"
+        for cigar in ("3H2S10M2I3M4D5M1S", "5=1X4N2=7H", ""):
+            values = [
+                int(length) << 4 | operations.index(operation.encode())
+                for length, operation in re.findall(r"(\d+)(\D)", cigar)
+            ]
+            binary = np.array(values, "<u4").tobytes()
+            result = _aligncore.parse_binary_cigar(binary, 100)
+            self.assertEqual(result, _aligncore.parse_cigar(cigar, 100))
+        self.assertEqual(
+            _aligncore.parse_binary_cigar(b"", 7),
+            _aligncore.parse_cigar("*", 7),
+        )
+        with self.assertRaises(NotImplementedError):
+            _aligncore.parse_binary_cigar(np.array([22], "<u4").tobytes())
+        with self.assertRaises(ValueError):
+            _aligncore.parse_binary_cigar(np.array([25], "<u4").tobytes())
+        with self.assertRaises(ValueError):
+            _aligncore.parse_binary_cigar(b"\x00\x00")
+
+
+class TestAlign_bam_index(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_bins(self):
+        self.assertEqual(reg2bin(0, 1), 4681)
+        self.assertEqual(reg2bin(16384, 16385), 4682)
+        self.assertEqual(reg2bin(16383, 16385), 585)
+        self.assertEqual(reg2bin(0, 1 << 29), 0)
+        self.assertEqual(reg2bin(0, 1, min_shift=10, depth=2), 9)
+        self.assertEqual(reg2bins(0, 1), [0, 1, 9, 73, 585, 4681])
+        self.assertEqual(reg2bins(16383, 16385)[-2:], [4681, 4682])
+
+    def check_search(self, filename, csi):
+        path = os.path.join(self.directory, os.path.basename(filename))
+        shutil.copy(filename, path)
+        bam.create_index(path, csi=csi)
+        self.assertTrue(os.path.exists(path + (".csi" if csi else ".bai")))
+        alignments = Align.parse(path, "bam")
+        records = [
+            (
+                alignment.target.id,
+                alignment.coordinates[0, 0],
+                alignment.coordinates[0, -1],
+                alignment.query.id,
+                alignment.flag,
+            )
+            for alignment in alignments
+            if alignment.coordinates is not None
+        ]
+        for target in alignments.targets:
+            length = len(target)
+            for start, end in (
+                (0, length),
+                (0, 1),
+                (length // 3, length // 3 + 100),
+                (length // 2, length // 2 + 1000),
+                (length - 100, length),
+            ):
+                expected = [
+                    (query, flag)
+                    for chromosome, chromStart, chromEnd, query, flag in records
+                    if chromosome == target.id and chromStart < end and chromEnd > start
+                ]
+                result = [
+                    (alignment.query.id, alignment.flag)
+                    for alignment in alignments.search(target.id, start, end)
+                    if alignment.coordinates is not None
+                ]
+                self.assertEqual(result, expected)
+        self.assertEqual(len(list(alignments.search())), len(alignments))
+        with self.assertRaises(ValueError):
+            next(alignments.search("chrX"))
+        with self.assertRaises(ValueError):
+            next(alignments.search("chr1", end=100))
+        with self.assertRaises(ValueError):
+            next(alignments.search(start=100))
+
+    def test_ex1_bai(self):
+        self.check_search("SamBam/ex1_header.bam", csi=False)
+
+    def test_ex1_csi(self):
+        self.check_search("SamBam/ex1_header.bam", csi=True)
+
+    def test_bam1_bai(self):
+        self.check_search("SamBam/bam1_sorted.bam", csi=False)
+
+    def test_bam2_csi(self):
+        self.check_search("SamBam/bam2_sorted.bam", csi=True)
+
+    def test_ex1_region(self):
+        path = os.path.join(self.directory, "ex1.bam")
+        shutil.copy("SamBam/ex1_header.bam", path)
+        bam.create_index(path, path[:-4] + ".bai")
+        alignments = Align.parse(path, "bam")
+        names = [
+            alignment.query.id for alignment in alignments.search("chr2", 1000, 1010)
+        ]
+        self.assertEqual(len(names), 76)
+        alignments = Align.parse(path, "bam")
+        alignment = next(alignments.search("chr1", 100))
+        self.assertEqual(alignment.query.id, "EAS56_57:6:190:289:82")
+        self.assertEqual(alignment.coordinates[0, 0], 99)
+
+    def test_unsorted(self):
+        path = os.path.join(self.directory, "unsorted.bam")
+        alignments = Align.parse("SamBam/ex1_header.bam", "bam")
+        alignments = Align.Alignments(reversed(list(alignments)))
+        alignments.targets = Align.parse("SamBam/ex1_header.bam", "bam").targets
+        Align.write(alignments, path, "bam")
+        with self.assertRaises(ValueError):
+            bam.create_index(path)
+
+    def test_no_index(self):
+        alignments = Align.parse("SamBam/ex1_header.bam", "bam")
+        with self.assertRaises(ValueError):
+            next(alignments.search("chr1", 100, 200))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -4,6 +4,7 @@
 # as part of this package.
 """Tests for Align.bed module."""
 import os
+import shutil
 import tempfile
 import unittest
 from io import StringIO
@@ -11,8 +12,10 @@ from io import StringIO
 import numpy as np
 
 from Bio import Align
+from Bio import bgzf
 from Bio import SeqIO
 from Bio.Align import Alignment
+from Bio.Align import bed
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 
@@ -12701,6 +12704,79 @@ AlignmentCounts object with
             self.check_alignments(alignments)
 
 
+class TestAlign_tabix(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open("Blat/psl_34_001.bed") as stream:
+            lines = stream.readlines()
+        lines.sort(key=lambda line: (line.split()[0], int(line.split()[1])))
+        self.path = os.path.join(self.directory, "psl_34_001.bed.gz")
+        with bgzf.BgzfWriter(self.path) as stream:
+            stream.write("".join(lines))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_search(self, csi):
+        bed.create_index(self.path, csi=csi)
+        suffix = ".csi" if csi else ".tbi"
+        self.assertTrue(os.path.exists(self.path + suffix))
+        alignments = Align.parse(self.path, "bed")
+        records = [
+            (
+                alignment.target.id,
+                alignment.coordinates[0, 0],
+                alignment.coordinates[0, -1],
+                alignment.query.id,
+            )
+            for alignment in alignments
+        ]
+        self.assertEqual(len(records), 22)
+        for chromosome, start, end in (
+            ("chr1", 0, 1000000000),
+            ("chr1", 10271800, 10271801),
+            ("chr1", 61700800, 220325700),
+            ("chr19", 35483400, 54017131),
+            ("chr4", 0, 10),
+            ("chr22", 48997442, 48997443),
+        ):
+            expected = [
+                (target, chromStart, chromEnd, query)
+                for target, chromStart, chromEnd, query in records
+                if target == chromosome and chromStart < end and chromEnd > start
+            ]
+            result = [
+                (
+                    alignment.target.id,
+                    alignment.coordinates[0, 0],
+                    alignment.coordinates[0, -1],
+                    alignment.query.id,
+                )
+                for alignment in alignments.search(chromosome, start, end)
+            ]
+            self.assertEqual(result, expected)
+        self.assertEqual(len(list(alignments.search("chr1"))), 5)
+        self.assertEqual(len(list(alignments.search("chr19", 35483400))), 1)
+        self.assertEqual(list(alignments.search("chrX", 0, 1000)), [])
+        self.assertEqual(len(list(alignments.search())), 22)
+        with self.assertRaises(ValueError):
+            next(alignments.search("chr1", end=100))
+
+    def test_tbi(self):
+        """Test searching a BGZF-compressed BED file using a TBI index."""
+        self.check_search(csi=False)
+
+    def test_csi(self):
+        """Test searching a BGZF-compressed BED file using a CSI index."""
+        self.check_search(csi=True)
+
+    def test_uncompressed(self):
+        """Test searching an uncompressed BED file."""
+        alignments = Align.parse("Blat/psl_34_001.bed", "bed")
+        with self.assertRaises(ValueError):
+            next(alignments.search("chr1", 100, 200))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
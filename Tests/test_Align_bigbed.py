@@ -7483,6 +7483,33 @@ AlignmentCounts object with
             alignments = Align.parse(output, "bigbed")
             self.check_alignments(alignments)
 
+    def test_writing_iterator(self):
+        """Test writing alignments provided by a generator."""
+        alignments = Align.parse(self.path, "bigbed")
+        targets = alignments.targets
+        declaration = alignments.declaration
+        data = []
+        for workers in (1, 2, None):
+            alignments = Align.parse(self.path, "bigbed")
+            with tempfile.TemporaryFile() as output:
+                writer = bigbed.AlignmentWriter(
+                    output,
+                    bedN=6,
+                    declaration=declaration,
+                    targets=targets,
+                    itemsPerSlot=2,
+                    workers=workers,
+                )
+                count = writer.write(alignment for alignment in alignments)
+                self.assertEqual(count, 8)
+                output.seek(0)
+                data.append(output.read())
+                output.seek(0)
+                alignments = Align.parse(output, "bigbed")
+                self.check_alignments(alignments)
+        self.assertEqual(data[0], data[1])
+        self.assertEqual(data[0], data[2])
+
     def test_search_chromosome(self):
         alignments = Align.parse(self.path, "bigbed")
         self.assertEqual(
@@ -7534,6 +7561,72 @@ table bed
         names = [alignment.query.id for alignment in selected_alignments]
         self.assertEqual(names, ["name3"])
 
+    def test_search_raw(self):
+        alignments = Align.parse(self.path, "bigbed")
+        records = list(alignments.search("chr2", 105, 1000, raw=True))
+        self.assertEqual(
+            records,
+            [
+                ("chr2", 100, 110, "name5", "4", "+"),
+                ("chr2", 200, 210, "name6", "5", "+"),
+                ("chr2", 220, 220, "name7", "6", "+"),
+            ],
+        )
+        records = list(alignments.search(raw=True))
+        self.assertEqual(len(records), 8)
+        self.assertEqual(records[7], ("chr3", 0, 0, "name8", "7", "-"))
+
+    def test_search_regions(self):
+        regions = [
+            ("chr2", 105, 1000),
+            ("chr1", 250, None),
+            ("chr2", 50, 50),
+            ("chr3", None, None),
+            ("chr1", 100, 200),
+        ]
+        expected = [["name5", "name6", "name7"], ["name3"], ["name4"], ["name8"], []]
+        alignments = Align.parse(self.path, "bigbed")
+        targets = alignments.targets
+        declaration = alignments.declaration
+        with tempfile.TemporaryFile() as stream:
+            # store one alignment per data block
+            writer = bigbed.AlignmentWriter(
+                stream,
+                bedN=6,
+                declaration=declaration,
+                targets=targets,
+                itemsPerSlot=1,
+            )
+            writer.write(alignments)
+            for cache_size in (0, 2, 32):
+                stream.seek(0)
+                alignments = bigbed.AlignmentIterator(stream, cache_size=cache_size)
+                results = alignments.search_regions(regions)
+                names = [[alignment.query.id for alignment in r] for r in results]
+                self.assertEqual(names, expected)
+                self.assertLessEqual(len(alignments._cache), cache_size)
+                results = alignments.search_regions(regions, raw=True)
+                names = [[record[3] for record in r] for r in results]
+                self.assertEqual(names, expected)
+                for region, names in zip(regions, expected):
+                    selected_alignments = alignments.search(*region)
+                    self.assertEqual(
+                        [alignment.query.id for alignment in selected_alignments],
+                        names,
+                    )
+        with self.assertRaises(ValueError):
+            alignments.search_regions([("chr4", 0, 10)])
+
+    def test_memory_map(self):
+        with bigbed.AlignmentIterator(self.path, memory_map=True) as alignments:
+            self.check_alignments(alignments)
+            selected_alignments = alignments.search("chr2", 105, 1000)
+            names = [alignment.query.id for alignment in selected_alignments]
+            self.assertEqual(names, ["name5", "name6", "name7"])
+            results = alignments.search_regions([("chr1", 250, None)])
+            names = [alignment.query.id for alignment in results[0]]
+            self.assertEqual(names, ["name3"])
+
     def test_three_iterators(self):
         """Create three iterators and use them concurrently."""
         alignments1 = Align.parse(self.path, "bigbed")
@@ -8382,6 +8382,64 @@ gi|6478867|gb|M37394.2|RATEGFR      AGAGTACCTGCGGGTGGCACCGCCAAGCAGTGAGTTTAGTGGAG
         for ds_cal, ds_corr in zip(ds_list, ds_correct):
             self.assertAlmostEqual(ds_cal, ds_corr, places=4)
 
+    def test_dn_ds_matrix_pairwise(self):
+        """Compare the dN and dS matrices to those of each pair of sequences."""
+        codon_table = CodonTable.unambiguous_dna_by_id[1]
+        codons = [
+            codon
+            for codon in codon_table.forward_table
+            if "U" not in codon and codon.startswith(("A", "C", "G"))
+        ]
+        codons.extend(["TTT", "TAT", "TGG"])
+        lines = []
+        for i in range(4):
+            # sequences of diverging codons, with a gap in the third sequence
+            row = [codons[(j + i * (j % 5 == i)) % len(codons)] for j in range(60)]
+            row[40 + i] = codons[(3 * i + 7) % len(codons)]
+            if i == 2:
+                row[10:13] = ["---"] * 3
+            lines.append("".join(row).encode())
+        sequences, coordinates = Alignment.parse_printed_alignment(lines)
+        records = [
+            SeqRecord(Seq(sequence), id=f"seq{i}")
+            for i, sequence in enumerate(sequences)
+        ]
+        alignment = Alignment(records, coordinates)
+        for method in ("NG86", "LWL85", "YN00"):
+            dn, ds = calculate_dn_ds_matrix(alignment, method=method)
+            self.assertEqual(dn.names, ["seq0", "seq1", "seq2", "seq3"])
+            for i in range(4):
+                self.assertEqual(dn[i, i], 0)
+                self.assertEqual(ds[i, i], 0)
+                for j in range(i):
+                    pairwise_alignment = Alignment(
+                        [records[i], records[j]], coordinates[(i, j), :]
+                    )
+                    dN, dS = calculate_dn_ds(pairwise_alignment, method=method)
+                    self.assertIs(type(dn[i, j]), float)
+                    self.assertIs(type(ds[i, j]), float)
+                    self.assertAlmostEqual(dn[i, j], dN, places=4)
+                    self.assertAlmostEqual(ds[i, j], dS, places=4)
+        # The ML method should give exactly the same estimates, also if
+        # the likelihood is optimized in two worker processes.
+        alignment = alignment[:3]
+        dn1, ds1 = calculate_dn_ds_matrix(alignment, method="ML")
+        dn2, ds2 = calculate_dn_ds_matrix(alignment, method="ML", workers=2)
+        self.assertEqual(dn1.matrix, dn2.matrix)
+        self.assertEqual(ds1.matrix, ds2.matrix)
+        for i in range(3):
+            for j in range(i):
+                pairwise_alignment = Alignment(
+                    [records[i], records[j]], coordinates[(i, j), :]
+                )
+                dN, dS = calculate_dn_ds(pairwise_alignment, method="ML")
+                self.assertIs(type(dn1[i, j]), float)
+                self.assertIs(type(ds1[i, j]), float)
+                self.assertEqual(dn1[i, j], dN)
+                self.assertEqual(ds1[i, j], dS)
+        self.assertGreater(dn1[1, 0], 0)
+        self.assertGreater(ds1[1, 0], 0)
+
 
 class Test_MK(unittest.TestCase):
     def test_mk(self):
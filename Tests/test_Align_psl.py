@@ -3,13 +3,18 @@
 # license.  Please see the LICENSE file that should have been included
 # as part of this package.
 """Tests for Align.psl module."""
+import os
+import shutil
+import tempfile
 import unittest
 from io import StringIO
 from tempfile import NamedTemporaryFile
 
 from Bio import Align
+from Bio import bgzf
 from Bio.Align import substitution_matrices
 from Bio.Align import Alignment
+from Bio.Align import psl
 from Bio.Seq import reverse_complement
 from Bio.Seq import Seq
 from Bio.SeqFeature import CompoundLocation
@@ -13774,6 +13779,80 @@ query             0 --TTC-GCTAGC-TG--- 11
         self.assertEqual(format(alignment, "psl"), line)
 
 
+class TestAlign_tabix(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open("Blat/psl_34_001.psl") as stream:
+            header = [next(stream) for i in range(5)]
+            lines = stream.readlines()
+        lines.sort(key=lambda line: (line.split()[13], int(line.split()[15])))
+        self.path = os.path.join(self.directory, "psl_34_001.psl.gz")
+        with bgzf.BgzfWriter(self.path) as stream:
+            stream.write("".join(header + lines))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_search(self, csi):
+        psl.create_index(self.path, csi=csi)
+        suffix = ".csi" if csi else ".tbi"
+        self.assertTrue(os.path.exists(self.path + suffix))
+        alignments = Align.parse(self.path, "psl")
+        records = [
+            (
+                alignment.target.id,
+                alignment.coordinates[0, 0],
+                alignment.coordinates[0, -1],
+                alignment.query.id,
+            )
+            for alignment in alignments
+        ]
+        self.assertEqual(len(records), 22)
+        for chromosome, start, end in (
+            ("chr1", 0, 1000000000),
+            ("chr1", 10271800, 10271801),
+            ("chr1", 61700800, 220325700),
+            ("chr19", 35483400, 54017131),
+            ("chr4", 0, 10),
+            ("chr22", 48997442, 48997443),
+        ):
+            expected = [
+                (target, chromStart, chromEnd, query)
+                for target, chromStart, chromEnd, query in records
+                if target == chromosome and chromStart < end and chromEnd > start
+            ]
+            result = [
+                (
+                    alignment.target.id,
+                    alignment.coordinates[0, 0],
+                    alignment.coordinates[0, -1],
+                    alignment.query.id,
+                )
+                for alignment in alignments.search(chromosome, start, end)
+            ]
+            self.assertEqual(result, expected)
+        self.assertEqual(len(list(alignments.search("chr1"))), 5)
+        self.assertEqual(len(list(alignments.search("chr19", 35483400))), 1)
+        self.assertEqual(list(alignments.search("chrX", 0, 1000)), [])
+        self.assertEqual(len(list(alignments.search())), 22)
+        with self.assertRaises(ValueError):
+            next(alignments.search("chr1", end=100))
+
+    def test_tbi(self):
+        """Test searching a BGZF-compressed PSL file using a TBI index."""
+        self.check_search(csi=False)
+
+    def test_csi(self):
+        """Test searching a BGZF-compressed PSL file using a CSI index."""
+        self.check_search(csi=True)
+
+    def test_uncompressed(self):
+        """Test searching an uncompressed PSL file."""
+        alignments = Align.parse("Blat/psl_34_001.psl", "psl")
+        with self.assertRaises(ValueError):
+            next(alignments.search("chr1", 100, 200))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
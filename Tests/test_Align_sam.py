@@ -3,12 +3,17 @@
 # license.  Please see the LICENSE file that should have been included
 # as part of this package.
 """Tests for Align.sam module."""
+import os
+import shutil
+import tempfile
 import unittest
 from io import StringIO
 
 from Bio import Align
+from Bio import bgzf
 from Bio import SeqIO
 from Bio.Align import Alignment
+from Bio.Align import sam
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 
@@ -9626,6 +9631,121 @@ query             0 --TTC-GCTAGC-TG--- 11
         self.assertEqual(format(alignment, "sam"), line)
 
 
+class TestAlign_bgzf(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "ex1.sam.gz")
+        with open("SamBam/ex1_header.sam", "rb") as stream:
+            data = stream.read()
+        with bgzf.BgzfWriter(self.path, "wb") as stream:
+            stream.write(data)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_reading(self):
+        """Test reading a BGZF-compressed SAM file."""
+        alignments1 = Align.parse("SamBam/ex1_header.sam", "sam")
+        alignments2 = Align.parse(self.path, "sam")
+        self.assertEqual(alignments1.metadata, alignments2.metadata)
+        self.assertEqual(len(alignments1.targets), len(alignments2.targets))
+        n = 0
+        for alignment1, alignment2 in zip(alignments1, alignments2):
+            self.assertEqual(alignment1.query.id, alignment2.query.id)
+            self.assertEqual(alignment1.flag, alignment2.flag)
+            if alignment1.coordinates is None:
+                self.assertIsNone(alignment2.coordinates)
+            else:
+                self.assertTrue(
+                    np.array_equal(alignment1.coordinates, alignment2.coordinates)
+                )
+            n += 1
+        self.assertEqual(n, 3270)
+        alignments2.rewind()
+        self.assertEqual(len(alignments2), 3270)
+
+    def test_search(self):
+        """Test searching a BGZF-compressed SAM file using a CSI index."""
+        sam.create_index(self.path)
+        self.assertTrue(os.path.exists(self.path + ".csi"))
+        alignments = Align.parse(self.path, "sam")
+        records = [
+            (
+                alignment.target.id,
+                alignment.coordinates[0, 0],
+                alignment.coordinates[0, -1],
+                alignment.query.id,
+                alignment.flag,
+            )
+            for alignment in alignments
+            if alignment.coordinates is not None
+        ]
+        for chromosome, start, end in (
+            ("chr1", 0, 1575),
+            ("chr1", 100, 101),
+            ("chr2", 1000, 1010),
+            ("chr2", 1500, 1584),
+        ):
+            expected = [
+                (query, flag)
+                for target, chromStart, chromEnd, query, flag in records
+                if target == chromosome and chromStart < end and chromEnd > start
+            ]
+            result = [
+                (alignment.query.id, alignment.flag)
+                for alignment in alignments.search(chromosome, start, end)
+                if alignment.coordinates is not None
+            ]
+            self.assertEqual(result, expected)
+        self.assertEqual(len(list(alignments.search("chr2"))), 1806)
+        self.assertEqual(len(list(alignments.search())), 3270)
+        with self.assertRaises(ValueError):
+            next(alignments.search("chrX"))
+
+    def test_uncompressed(self):
+        """Test searching an uncompressed SAM file."""
+        alignments = Align.parse("SamBam/ex1_header.sam", "sam")
+        with self.assertRaises(ValueError):
+            next(alignments.search("chr1", 100, 200))
+
+
+class TestAlign_cigar(unittest.TestCase):
+    def test_long_cigar(self):
+        """Test parsing a CIGAR string with many operations."""
+        cigar = "5H3S" + "10M2I3D4N5=1X" * 1000 + "2S7H"
+        line = f"read\t0\tchr1\t101\t60\t{cigar}\t*\t0\t0\t*\t*\n"
+        stream = StringIO("@SQ\tSN:chr1\tLN:100000\n" + line)
+        alignment = next(Align.parse(stream, "sam"))
+        self.assertEqual(alignment.coordinates.shape, (2, 6001))
+        self.assertTrue(
+            np.array_equal(
+                alignment.coordinates[:, :7],
+                # fmt: off
+                np.array([[100, 110, 110, 113, 117, 122, 123],
+                          [3, 13, 15, 15, 15, 20, 21]])
+                # fmt: on
+            )
+        )
+        self.assertEqual(alignment.coordinates[0, -1], 100 + 23 * 1000)
+        self.assertEqual(alignment.coordinates[1, -1], 3 + 18 * 1000)
+        self.assertEqual(len(alignment.query), 3 + 18 * 1000 + 2)
+        self.assertEqual(alignment.operations, bytearray(b"MIDN=X" * 1000))
+        self.assertEqual(alignment.hard_clip_left, 5)
+        self.assertEqual(alignment.hard_clip_right, 7)
+
+    def test_invalid_cigar(self):
+        """Test parsing invalid CIGAR strings."""
+        for cigar in ("M", "10M5", "10M5Q"):
+            line = f"read\t0\tchr1\t101\t60\t{cigar}\t*\t0\t0\t*\t*\n"
+            stream = StringIO("@SQ\tSN:chr1\tLN:100000\n" + line)
+            with self.assertRaises(ValueError):
+                next(Align.parse(stream, "sam"))
+        line = "read\t0\tchr1\t101\t60\t5M2P5M\t*\t0\t0\t*\t*\n"
+        stream = StringIO("@SQ\tSN:chr1\tLN:100000\n" + line)
+        with self.assertRaises(NotImplementedError):
+            next(Align.parse(stream, "sam"))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -10,6 +10,7 @@ from tempfile import NamedTemporaryFile
 
 from Bio import Align
 from Bio.Align import substitution_matrices
+from Bio.Align import tabular
 from Bio import SeqIO
 from Bio.Seq import Seq
 
@@ -5880,6 +5881,38 @@ class TestFastaBasic(unittest.TestCase):
             Align.parse(stream, "tabular")
 
 
+class TestParseOperations(unittest.TestCase):
+    def test_btop(self):
+        parse_btop = tabular.AlignmentIterator.parse_btop
+        coordinates = parse_btop(None, "12AG-C3T--T2**")
+        self.assertTrue(
+            np.array_equal(
+                coordinates,
+                # fmt: off
+                np.array([[0, 13, 14, 17, 17, 18, 21],
+                          [0, 13, 13, 16, 17, 17, 20]])
+                # fmt: on
+            )
+        )
+        coordinates = parse_btop(None, "")
+        self.assertTrue(np.array_equal(coordinates, np.array([[0], [0]])))
+
+    def test_cigar(self):
+        parse_cigar = tabular.AlignmentIterator.parse_cigar
+        coordinates = parse_cigar(None, "10M2I3M4D5M")
+        self.assertTrue(
+            np.array_equal(
+                coordinates,
+                # fmt: off
+                np.array([[0, 10, 12, 15, 15, 20],
+                          [0, 10, 10, 13, 17, 22]])
+                # fmt: on
+            )
+        )
+        with self.assertRaises(ValueError):
+            parse_cigar(None, "10M2Q")
+
+
 class TestBlast(unittest.TestCase):
     def test_2226_tblastn_001(self):
         path = "Blast/tab_2226_tblastn_001.txt"
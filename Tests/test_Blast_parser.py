@@ -15162,6 +15162,115 @@ class TestBlastErrors(unittest.TestCase):
         self.assertEqual(str(cm.exception), message)
 
 
+class TestFields(unittest.TestCase):
+    """Test parsing selected fields only."""
+
+    def check_records(self, path):
+        fields = ["qseqid", "qlen", "sseqid", "sacc", "stitle", "evalue"]
+        fields += ["bitscore", "score", "nident", "positive", "gaps"]
+        rows = []
+        with Blast.parse(path) as records:
+            for record in records:
+                query = record.query
+                for hit in record:
+                    target = hit.target
+                    for hsp in hit:
+                        annotations = hsp.annotations
+                        row = (
+                            query.id,
+                            len(query.seq),
+                            target.id,
+                            target.name,
+                            target.description,
+                            annotations["evalue"],
+                            annotations["bit score"],
+                            hsp.score,
+                            annotations["identity"],
+                            annotations.get("positive"),
+                            annotations.get("gaps"),
+                        )
+                        rows.append(row)
+        with Blast.parse(path, fields=fields) as records:
+            self.assertEqual(list(records), rows)
+        return len(rows)
+
+    def test_records(self):
+        """Compare the fields to the values stored in the Records."""
+        for filename, count in (
+            ("xml_2226_blastn_004.xml", 6),
+            ("xml_21500_blastp_001.xml", 10),
+            ("xml2_21500_blastn_001.xml", 15),
+            ("xml2_21500_blastp_001.xml", 10),
+            ("xml_2212L_blastp_001.xml", 212),
+            ("megablast_legacy.xml", 1),
+        ):
+            path = os.path.join("Blast", filename)
+            self.assertEqual(self.check_records(path), count, msg=filename)
+
+    def test_coordinates(self):
+        """Test the alignment coordinates and derived fields."""
+        path = os.path.join("Blast", "xml2_21500_blastn_001.xml")
+        fields = ["qstart", "qend", "sstart", "send", "length"]
+        fields += ["pident", "mismatch", "staxid", "slen"]
+        with Blast.parse(path, fields=fields) as rows:
+            self.assertEqual(rows.fields, tuple(fields))
+            row = next(rows)
+            self.assertEqual(row[:5], (134, 166, 101449177, 101449144, 34))
+            self.assertAlmostEqual(row[5], 88.23529411764706)
+            self.assertEqual(row[6:], (3, 10090, 160039680))
+            rows = list(rows)
+        self.assertEqual(len(rows), 14)
+
+    def test_batches(self):
+        """Test reading the fields as NumPy arrays."""
+        path = os.path.join("Blast", "wnts.xml")
+        fields = ["qseqid", "sseqid", "evalue", "length", "score"]
+        with Blast.parse(path, fields=fields) as rows:
+            expected = list(rows)
+        with Blast.parse(path, fields=fields) as rows:
+            batches = list(rows.batches(100))
+        self.assertEqual([len(batch) for batch in batches], [100, 100, 100, 56])
+        self.assertEqual(batches[0].dtype.names, tuple(fields))
+        self.assertEqual(batches[0]["length"].dtype, np.int64)
+        self.assertEqual(batches[0]["evalue"].dtype, np.float64)
+        self.assertEqual(batches[0]["score"].dtype, np.int64)
+        batch = np.concatenate(batches)
+        self.assertEqual(batch.tolist(), expected)
+        path = os.path.join("Blast", "xml2_21500_blastn_001.xml")
+        rows = Blast.parse(path, fields=["evalue", "positive"])
+        with rows, self.assertRaises(ValueError) as cm:
+            next(rows.batches())
+        self.assertEqual(
+            str(cm.exception), "field 'positive' is not available for all HSPs"
+        )
+
+    def test_errors(self):
+        """Test the errors raised for incorrect input."""
+        path = os.path.join("Blast", "wnts.xml")
+        with self.assertRaises(ValueError) as cm:
+            Blast.parse(path, fields=["qseqid", "qseq"])
+        self.assertTrue(str(cm.exception).startswith("unknown field 'qseq';"))
+        with open(path) as stream, self.assertRaises(StreamModeError):
+            Blast.parse(stream, fields=["qseqid"])
+        path = os.path.join("Blast", "tab_2226_tblastn_001.txt")
+        rows = Blast.parse(path, fields=["qseqid"])
+        with rows, self.assertRaises(Blast.NotXMLError):
+            next(rows)
+        path = os.path.join("Blast", "broken5.xml")
+        rows = Blast.parse(path, fields=["qseqid"])
+        with rows, self.assertRaises(Blast.CorruptedXMLError):
+            next(rows)
+        path = os.path.join("Blast", "broken1.xml")
+        with open(path, "rb") as stream:
+            rows = Blast.parse(stream, fields=["qseqid"])
+            with self.assertRaises(ValueError) as cm:
+                next(rows)
+            self.assertFalse(stream.closed)
+        self.assertEqual(
+            str(cm.exception), "premature end of XML file: line 10, column 0"
+        )
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -0,0 +1,287 @@
+# Copyright 2026 by The Biopython Contributors.  All rights reserved.
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Tests for Entrez sessions, using a local mock server."""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from unittest import mock
+from urllib.error import HTTPError
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from Bio import Entrez
+
+EPOST = """\
+<?xml version="1.0" encoding="UTF-8" ?>
+<!DOCTYPE ePostResult PUBLIC "-//NLM//DTD epost 20090526//EN" "https://eutils.ncbi.nlm.nih.gov/eutils/dtd/20090526/epost.dtd"><ePostResult>
+    <QueryKey>1</QueryKey>
+    <WebEnv>%s</WebEnv>
+</ePostResult>
+"""
+
+
+class EntrezHandler(BaseHTTPRequestHandler):
+    """Mock Entrez Utilities server.
+
+    efetch returns one line of text per record, either for the identifiers in
+    the request or for those posted to the mock history server.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.respond(url.path, parse_qs(url.query))
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        query = self.rfile.read(length).decode()
+        self.respond(urlsplit(self.path).path, parse_qs(query))
+
+    def respond(self, path, params):
+        params = {key.lower(): value[0] for key, value in params.items()}
+        with self.server.lock:
+            self.server.requests.append((self.command, path, params))
+            if self.server.errors:
+                status = self.server.errors.pop(0)
+                self.send(status, b"error", "text/plain")
+                return
+        tool = os.path.basename(path)
+        if tool == "epost.fcgi":
+            with self.server.lock:
+                webenv = "WEBENV_%d" % len(self.server.history)
+                self.server.history[webenv] = params["id"].split(",")
+            self.send(200, (EPOST % webenv).encode(), "text/xml")
+        elif tool == "efetch.fcgi":
+            if "webenv" in params:
+                ids = self.server.history[params["webenv"]]
+                start = int(params["retstart"])
+                ids = ids[start : start + int(params["retmax"])]
+            else:
+                ids = params["id"].split(",")
+            data = "".join(f"record {uid}\n" for uid in ids)
+            self.send(200, data.encode(), "text/plain")
+        elif tool == "einfo.fcgi":
+            with open(os.path.join("Entrez", "einfo1.xml"), "rb") as stream:
+                self.send(200, stream.read(), "text/xml")
+        else:
+            self.send(404, b"unknown tool", "text/plain")
+
+    def send(self, status, data, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSession(unittest.TestCase):
+    """Send requests to a local mock Entrez server."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), EntrezHandler)
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.requests = []
+        self.server.errors = []
+        self.server.history = {}
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        host, port = self.server.server_address
+        self.base_url = f"http://{host}:{port}/entrez/eutils/"
+        self.limiter = Entrez.TokenBucket(rate=1000, capacity=1000)
+        self.session = Entrez.Session(
+            email="biopython@example.org",
+            base_url=self.base_url,
+            limiter=self.limiter,
+        )
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_efetch(self):
+        """Reuse the connection for consecutive requests."""
+        for uid in range(5):
+            handle = self.session.efetch(db="nucleotide", id=uid, rettype="fasta")
+            self.assertEqual(handle.read(), f"record {uid}\n")
+            self.assertTrue(handle.url.startswith(self.base_url + "efetch.fcgi?"))
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(len(self.server.requests), 5)
+        method, path, params = self.server.requests[0]
+        self.assertEqual(method, "GET")
+        self.assertEqual(path, "/entrez/eutils/efetch.fcgi")
+        self.assertEqual(params["email"], "biopython@example.org")
+        self.assertEqual(params["tool"], "biopython")
+        self.assertEqual(params["rettype"], "fasta")
+
+    def test_read(self):
+        """Parse an XML response."""
+        handle = self.session.einfo()
+        record = Entrez.read(handle)
+        self.assertIn("pubmed", record["DbList"])
+
+    def test_many_ids(self):
+        """Send long lists of identifiers using POST."""
+        ids = list(range(1000))
+        handle = self.session.efetch(db="protein", id=ids)
+        self.assertEqual(len(handle.readlines()), 1000)
+        self.assertEqual(self.server.requests[0][0], "POST")
+
+    def test_efetch_batches(self):
+        """Fetch records in batches using the history server."""
+        ids = [f"ID{i}" for i in range(25)]
+        handles = self.session.efetch_batches(
+            db="nucleotide", id=ids, batch_size=10, rettype="fasta"
+        )
+        lines = [handle.read().splitlines() for handle in handles]
+        self.assertEqual([len(batch) for batch in lines], [10, 10, 5])
+        self.assertEqual(
+            [line for batch in lines for line in batch],
+            [f"record {uid}" for uid in ids],
+        )
+        self.assertEqual(self.server.requests[0][0], "POST")
+        self.assertEqual(self.server.requests[0][1], "/entrez/eutils/epost.fcgi")
+        for method, path, params in self.server.requests[1:]:
+            self.assertEqual(path, "/entrez/eutils/efetch.fcgi")
+            self.assertEqual(params["webenv"], "WEBENV_0")
+            self.assertEqual(params["query_key"], "1")
+            self.assertEqual(params["retmax"], "10")
+            self.assertEqual(params["rettype"], "fasta")
+            self.assertNotIn("id", params)
+        # Records already on the history server
+        handles = self.session.efetch_batches(
+            db="nucleotide", webenv="WEBENV_0", query_key=1, count=25, batch_size=20
+        )
+        self.assertEqual([len(handle.readlines()) for handle in handles], [20, 5])
+        with self.assertRaises(ValueError):
+            next(self.session.efetch_batches(db="nucleotide", webenv="WEBENV_0"))
+
+    def test_threads(self):
+        """Share the rate limiter between threads, each with its own connection."""
+        results = {}
+
+        def fetch(uid):
+            for i in range(3):
+                handle = session.efetch(db="nucleotide", id=f"{uid}_{i}")
+                results[uid, i] = handle.read()
+
+        # Stop the clock of the rate limiter, and record the waits instead of
+        # sleeping, so that the waits do not depend on the speed of the server.
+        with mock.patch("Bio.Entrez._session.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            limiter = Entrez.TokenBucket(rate=20)
+            session = Entrez.Session(
+                email="biopython@example.org", base_url=self.base_url, limiter=limiter
+            )
+            threads = [threading.Thread(target=fetch, args=(uid,)) for uid in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            session.close()
+        self.assertEqual(len(results), 12)
+        self.assertEqual(results[2, 1], "record 2_1\n")
+        # The first request does not wait, the remaining 11 wait 0.05 seconds
+        # longer than the previous one
+        waits = sorted(call.args[0] for call in mock_time.sleep.call_args_list)
+        self.assertEqual(len(waits), 11)
+        for i, wait in enumerate(waits):
+            self.assertAlmostEqual(wait, 0.05 * (i + 1))
+        self.assertLessEqual(self.server.connections, 4)
+
+    def test_cache(self):
+        """Store responses in the cache."""
+        directory = tempfile.mkdtemp()
+        try:
+            session = Entrez.Session(
+                email="biopython@example.org",
+                base_url=self.base_url,
+                limiter=self.limiter,
+                cache=directory,
+            )
+            for i in range(2):
+                handle = session.efetch(db="nucleotide", id="A,B")
+                self.assertEqual(handle.read(), "record A\nrecord B\n")
+                record = Entrez.read(session.einfo())
+                self.assertIn("pubmed", record["DbList"])
+            self.assertEqual(len(self.server.requests), 2)
+            # The email address is not part of the key
+            session.email = "someone.else@example.org"
+            handle = session.efetch(db="nucleotide", id=["A", "B"])
+            self.assertEqual(handle.read(), "record A\nrecord B\n")
+            self.assertEqual(len(self.server.requests), 2)
+            # Requests using the history server are not cached
+            for i in range(2):
+                handles = session.efetch_batches(db="nucleotide", id="A,B,C")
+                self.assertEqual(len(list(handles)), 1)
+            self.assertEqual(len(self.server.requests), 6)
+            session.close()
+        finally:
+            shutil.rmtree(directory)
+
+    def test_errors(self):
+        """Retry after server errors, but not after bad requests."""
+        with mock.patch("Bio.Entrez.sleep_between_tries", 0):
+            self.server.errors = [503, 502]
+            handle = self.session.efetch(db="nucleotide", id="A")
+            self.assertEqual(handle.read(), "record A\n")
+            self.assertEqual(len(self.server.requests), 3)
+            self.server.errors = [400]
+            with self.assertRaises(HTTPError) as context:
+                self.session.efetch(db="nucleotide", id="A")
+            self.assertEqual(context.exception.code, 400)
+            self.assertEqual(context.exception.read(), b"error")
+            self.assertEqual(len(self.server.requests), 4)
+            self.server.errors = [500, 500, 500]
+            with self.assertRaises(HTTPError):
+                self.session.efetch(db="nucleotide", id="A")
+            self.assertEqual(len(self.server.requests), 7)
+
+    def test_async(self):
+        """Send requests concurrently using asyncio."""
+
+        async def main():
+            async with Entrez.AsyncSession(
+                email="biopython@example.org",
+                base_url=self.base_url,
+                limiter=self.limiter,
+            ) as session:
+                handles = await asyncio.gather(
+                    *[session.efetch(db="nucleotide", id=uid) for uid in range(6)]
+                )
+                batches = [
+                    handle.read()
+                    async for handle in session.efetch_batches(
+                        db="nucleotide", id="A,B,C", batch_size=2
+                    )
+                ]
+            return [handle.read() for handle in handles], batches
+
+        records, batches = asyncio.run(main())
+        self.assertEqual(records, [f"record {uid}\n" for uid in range(6)])
+        self.assertEqual(batches, ["record A\nrecord B\n", "record C\n"])
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -12,6 +12,7 @@
 """Tests for Nexus module."""
 
 import os.path
+import random
 import sys
 import tempfile
 import unittest
@@ -1602,6 +1603,126 @@ end;
             NexusWriter(handle).write_file([a, a])
 
 
+class ArrayTest(unittest.TestCase):
+    """Test the NumPy array representation of the character matrix."""
+
+    def setUp(self):
+        self.nexus = Nexus.Nexus(os.path.join("Nexus", "test_Nexus_input.nex"))
+
+    def test_get_array(self):
+        n = self.nexus
+        array = n.get_array()
+        self.assertEqual(array.shape, (9, 48))
+        self.assertEqual(array.dtype, "uint8")
+        for taxon, row in zip(n.taxlabels, array):
+            self.assertEqual(row.tobytes(), bytes(n.matrix[taxon]))
+        array = n.get_array(delete=["t1", "t5"], exclude=[0, 2, 47, 100])
+        self.assertEqual(array.shape, (7, 45))
+        self.assertEqual(
+            array[0].tobytes(), b"--GcTc-gtg-----tct-t-t----acac-gtg-----tct-t-"
+        )
+        with self.assertRaises(Nexus.NexusError):
+            n.get_array(delete=["no such taxon"])
+
+    def test_crop_matrix(self):
+        n = self.nexus
+        exclude = [1, 5, 23, 40]
+        cropped = n.crop_matrix(delete=["t9"], exclude=exclude)
+        self.assertEqual(list(cropped), n.taxlabels[:-1])
+        for taxon, seq in cropped.items():
+            expected = "".join(
+                c for i, c in enumerate(n.matrix[taxon]) if i not in exclude
+            )
+            self.assertIsInstance(seq, Seq)
+            self.assertEqual(seq, expected)
+
+    def test_extract_charset(self):
+        n = self.nexus
+        extracted = n.extract_charset("pos3", delete=["t1"])
+        expected = n.crop_matrix(delete=["t1"], exclude=n.invert(n.charsets["pos3"]))
+        self.assertEqual(extracted, expected)
+        self.assertEqual(extracted["t9"], "cc-cccNccc-cccNc")
+        with self.assertRaises(Nexus.NexusError):
+            n.extract_charset("no such charset")
+
+    def test_bootstrap(self):
+        n = self.nexus
+        array = n.get_array(exclude=[0, 1])
+        columns = {column.tobytes() for column in array.T}
+        random.seed(1)
+        bootstrapped = n.bootstrap(exclude=[0, 1])
+        random.seed(1)
+        self.assertEqual(n.bootstrap(exclude=[0, 1]), bootstrapped)
+        self.assertEqual(list(bootstrapped), n.taxlabels)
+        array = n.get_array(bootstrapped)
+        self.assertEqual(array.shape, (9, 46))
+        for column in array.T:
+            self.assertIn(column.tobytes(), columns)
+
+    def test_write_interleaved(self):
+        n = self.nexus
+        exclude = [0, 7, 30]
+        for interleave in (True, False):
+            handle = StringIO()
+            n.write_nexus_data(
+                handle,
+                exclude=exclude,
+                delete=["t2 the name"],
+                blocksize=10,
+                interleave=interleave,
+                append_sets=False,
+            )
+            handle.seek(0)
+            m = Nexus.Nexus(handle)
+            self.assertEqual(m.nchar, 45)
+            self.assertEqual(m.interleave, interleave)
+            self.assertEqual(
+                m.matrix, n.crop_matrix(exclude=exclude, delete=["t2 the name"])
+            )
+        handle = StringIO()
+        n.write_nexus_data(
+            handle, delete=n.taxlabels[2:], interleave=True, blocksize=20
+        )
+        self.assertIn(
+            """\
+matrix
+t1            A-C-G-Tc-gtgtgtgctct
+'t2 the name' A-C-GcTc-gtg-----tct
+
+t1            -t-t------ac-gtgtgtg
+'t2 the name' -t-t----acac-gtg----
+
+t1            ctct-t-t
+'t2 the name' -tct-t-t
+
+;
+""",
+            handle.getvalue(),
+        )
+
+    def test_long_rows(self):
+        name = "a very long name " * 20
+        text = """\
+#NEXUS
+begin data; dimensions ntax=3 nchar=%d; format datatype=dna matchchar=.;
+matrix
+'%s' %s
+'it''s' %s
+last %s
+;
+end;
+"""
+        seqs = ["ACGT" * 1000, "...." * 999 + "TTTT", "AC(GT)T" * 1000]
+        n = Nexus.Nexus(text % (4000, name, *seqs))
+        self.assertEqual(n.taxlabels, [name, "it's", "last"])
+        self.assertEqual(n.matrix[name], "ACGT" * 1000)
+        self.assertEqual(n.matrix["it's"], "ACGT" * 999 + "TTTT")
+        self.assertEqual(n.matrix["last"], "ACKT" * 1000)
+        seqs[2] = "ACGJ" * 1000
+        with self.assertRaisesRegex(Nexus.NexusError, "Illegal character J"):
+            Nexus.Nexus(text % (4000, name, *seqs))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -8,8 +8,11 @@
 import itertools
 import os
 import os.path
+import sys
+import tempfile
 import unittest
 
+from Bio.Phylo.PAML import batch
 from Bio.Phylo.PAML import codeml
 from Bio.Phylo.PAML._paml import PamlError
 
@@ -572,6 +575,100 @@ class ModTest(unittest.TestCase):
             self.assertEqual(len(params), SITECLASS_PARAMS[22], version_msg)
 
 
+STUB = """\
+#!%s
+# Stub for the codeml executable, copying a results file to the output file
+import shutil
+import sys
+
+with open(sys.argv[1]) as handle:
+    options = dict(line.split(" = ", 1) for line in handle.read().splitlines())
+with open(%r, "a") as handle:
+    handle.write(options["seqfile"] + "\\n")
+if options.get("model") == "9":
+    sys.exit(1)
+shutil.copyfile(%r, options["outfile"])
+"""
+
+
+@unittest.skipIf(sys.platform == "win32", "requires an executable script")
+class BatchTest(unittest.TestCase):
+    align_dir = os.path.join("PAML", "Alignments")
+    tree_file = os.path.join("PAML", "Trees", "species.tree")
+    results_file = os.path.join(
+        "PAML", "Results", "codeml", "m2a_rel", "m2a_rel-4_9a.out"
+    )
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.directory.name, "log.txt")
+        self.command = os.path.join(self.directory.name, "codeml")
+        results_file = os.path.abspath(self.results_file)
+        with open(self.command, "w") as handle:
+            handle.write(STUB % (sys.executable, self.log_file, results_file))
+        os.chmod(self.command, 0o755)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_jobs(self):
+        jobs = {}
+        for name in ("alignment.phylip", "dottednames.phylip", "longnames.fasta"):
+            alignment = os.path.join(self.align_dir, name)
+            jobs[name] = codeml.Codeml(alignment=alignment, tree=self.tree_file)
+            jobs[name].set_options(seqtype=1, NSsites=[0, 1, 2])
+        return jobs
+
+    def get_log(self):
+        if not os.path.exists(self.log_file):
+            return []
+        with open(self.log_file) as handle:
+            return [os.path.basename(line) for line in handle.read().splitlines()]
+
+    def check_run(self, workers):
+        jobs = self.get_jobs()
+        expected = codeml.read(self.results_file)
+        cache_dir = os.path.join(self.directory.name, "cache")
+        results = dict(
+            batch.run(jobs, workers, cache_dir=cache_dir, command=self.command)
+        )
+        self.assertEqual(results.keys(), jobs.keys())
+        for value in results.values():
+            self.assertEqual(value, expected)
+        self.assertEqual(sorted(self.get_log()), sorted(jobs))
+        self.assertEqual(len(os.listdir(cache_dir)), 3)
+        # Run again, after changing the options of one job
+        jobs["longnames.fasta"].set_options(NSsites=[0])
+        results = list(
+            batch.run(jobs, workers, cache_dir=cache_dir, command=self.command)
+        )
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[-1], ("longnames.fasta", expected))
+        self.assertEqual(len(self.get_log()), 4)
+        self.assertEqual(self.get_log()[-1], "longnames.fasta")
+
+    def test_serial(self):
+        """Run a batch of codeml jobs serially."""
+        self.check_run(workers=1)
+
+    def test_parallel(self):
+        """Run a batch of codeml jobs in separate processes."""
+        self.check_run(workers=2)
+
+    def test_errors(self):
+        """Check errors in a batch of codeml jobs."""
+        jobs = self.get_jobs()
+        jobs["dottednames.phylip"].set_options(model=9)
+        with self.assertRaises(PamlError):
+            dict(batch.run(jobs, command=self.command))
+        self.assertEqual(len(self.get_log()), 2)
+        jobs["dottednames.phylip"].tree = None
+        with self.assertRaises(ValueError):
+            list(batch.run(jobs, command=self.command))
+        with self.assertRaises(TypeError):
+            list(batch.run([None]))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -17,6 +17,9 @@ import os
 import tempfile
 import unittest
 import warnings
+from io import StringIO
+
+import numpy as np
 
 from Bio.PDB import Atom
 from Bio.PDB import MMCIFIO
@@ -231,6 +234,30 @@ class WriteTest(unittest.TestCase):
         finally:
             os.remove(filename)
 
+    def test_mmcifio_save_frames(self):
+        """Write coordinate frames of a structure as models."""
+        pdb_struct = self.pdb_parser.get_structure(
+            "1SSU_mod_pdb", self.mmcif_multimodel_pdb_file
+        )
+        coords = np.array([atom.coord for atom in pdb_struct[0].get_atoms()])
+        frames = [coords, coords - 2.0]
+        io = MMCIFIO()
+        io.set_structure(pdb_struct)
+        handle = StringIO()
+        io.save_frames(handle, frames)
+        handle.seek(0)
+        struct_in = self.mmcif_parser.get_structure("1SSU_mod_in", handle)
+        self.assertEqual(len(struct_in), 2)
+        for model, frame in zip(struct_in, frames):
+            new_coords = np.array([atom.coord for atom in model.get_atoms()])
+            self.assertTrue(np.allclose(new_coords, frame, atol=1e-3))
+        self.assertEqual(
+            [residue.get_full_id()[2:] for residue in struct_in[1].get_residues()],
+            [residue.get_full_id()[2:] for residue in pdb_struct[0].get_residues()],
+        )
+        with self.assertRaises(ValueError):
+            io.save_frames(StringIO(), [coords[:-1]])
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
@@ -17,6 +17,9 @@ import os
 import tempfile
 import unittest
 import warnings
+from io import StringIO
+
+import numpy as np
 
 from Bio import BiopythonWarning
 from Bio.PDB import Atom
@@ -539,6 +542,38 @@ class WriteTest(unittest.TestCase):
             data = handle.read()
             self.assertEqual(data, blurb)
 
+    def test_pdbio_save_frames(self):
+        """Write coordinate frames of a structure as models."""
+        atoms = [
+            atom
+            for residue in self.structure[0]["A"]
+            for atom in residue.get_unpacked_list()
+        ]
+        coords = np.array([atom.coord for atom in atoms], dtype=float)
+        frames = (coords + shift for shift in (0.0, 1.0, 2.5))
+        self.io.set_structure(self.structure)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBIOWarning)
+            handle = StringIO()
+            self.io.save(handle, write_end=False)
+            expected = handle.getvalue()
+            handle = StringIO()
+            self.io.save_frames(handle, frames)
+        lines = handle.getvalue().splitlines(True)
+        self.assertEqual(lines[0], "MODEL      1\n")
+        self.assertEqual("".join(lines[1 : lines.index("ENDMDL\n")]), expected)
+        self.assertEqual(lines[-1], "END   \n")
+        handle.seek(0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            structure = self.parser.get_structure("frames", handle)
+        self.assertEqual(len(structure), 3)
+        for model, shift in zip(structure, (0.0, 1.0, 2.5)):
+            new_coords = np.array([atom.coord for atom in model.get_atoms()])
+            self.assertTrue(np.allclose(new_coords, coords + shift, atol=1e-3))
+        with self.assertRaises(PDBIOException):
+            self.io.save_frames(StringIO(), [coords[:10]])
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,207 @@
+# Copyright 2026 by The Biopython Contributors.  All rights reserved.
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Testing PDBList downloads against a local HTTP server."""
+
+import gzip
+import hashlib
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from Bio.PDB.PDBList import DownloadManager
+from Bio.PDB.PDBList import PDBList
+
+
+class MirrorHandler(BaseHTTPRequestHandler):
+    """Serve files from the server's dictionary, with support for ranges."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, self.headers.get("Range")))
+        data = self.server.files.get(self.path)
+        if data is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        start = 0
+        byte_range = self.headers.get("Range")
+        if byte_range:
+            start = int(byte_range.split("=")[1].split("-")[0])
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.end_headers()
+        if self.path in self.server.interrupt:
+            # Simulate a dropped connection halfway through the file
+            self.server.interrupt.remove(self.path)
+            self.wfile.write(data[start : start + (len(data) - start) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(data[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPDBListMirror(unittest.TestCase):
+    """Download files from a local stand-in for the PDB server."""
+
+    codes = ["1a8o", "1lcd", "2beg", "1ssu"]
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), MirrorHandler)
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.requests = []
+        self.server.interrupt = set()
+        self.server.files = {}
+        self.contents = {}
+        for code in self.codes:
+            filename = os.path.join("PDB", f"{code.upper()}.pdb")
+            if not os.path.exists(filename):
+                filename = os.path.join("PDB", f"{code.upper()}_mod.pdb")
+            with open(filename, "rb") as handle:
+                data = handle.read()
+            self.contents[code] = data
+            path = f"/pub/pdb/data/structures/divided/pdb/{code[1:3]}/pdb{code}.ent.gz"
+            self.server.files[path] = gzip.compress(data)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        host, port = self.server.server_address
+        self.url = f"http://{host}:{port}"
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp)
+
+    def local_file(self, code):
+        return os.path.join(self.tmp, code[1:3], f"pdb{code}.ent")
+
+    def test_download_pdb_files(self):
+        """Download several files concurrently into a PDB-style tree."""
+        pdblist = PDBList(server=self.url, pdb=self.tmp, verbose=False)
+        filenames = pdblist.download_pdb_files(
+            self.codes, file_format="pdb", max_num_threads=2
+        )
+        self.assertEqual(
+            sorted(filenames), sorted(self.local_file(code) for code in self.codes)
+        )
+        for code in self.codes:
+            with open(self.local_file(code), "rb") as handle:
+                self.assertEqual(handle.read(), self.contents[code])
+        # Connections are kept alive and reused between files
+        self.assertLessEqual(self.server.connections, 2)
+        self.assertEqual(len(self.server.requests), len(self.codes))
+        self.assertEqual(os.listdir(os.path.join(self.tmp, "a8")), ["pdb1a8o.ent"])
+        # Existing files are not downloaded again
+        pdblist.download_pdb_files(self.codes, file_format="pdb")
+        self.assertEqual(len(self.server.requests), len(self.codes))
+
+    def test_resume(self):
+        """Resume an interrupted download with a range request."""
+        path = "/pub/pdb/data/structures/divided/pdb/a8/pdb1a8o.ent.gz"
+        self.server.interrupt.add(path)
+        pdblist = PDBList(server=self.url, pdb=self.tmp, verbose=False)
+        filename = pdblist.retrieve_pdb_file("1A8O", file_format="pdb")
+        self.assertEqual(filename, self.local_file("1a8o"))
+        with open(filename, "rb") as handle:
+            self.assertEqual(handle.read(), self.contents["1a8o"])
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertIsNone(self.server.requests[0][1])
+        size = len(self.server.files[path]) // 2
+        self.assertEqual(self.server.requests[1][1], f"bytes={size}-")
+
+    def test_resume_partial_file(self):
+        """Continue from a partial file left behind by an earlier run."""
+        path = "/pub/pdb/data/structures/divided/pdb/lc/pdb1lcd.ent.gz"
+        data = self.server.files[path]
+        os.makedirs(os.path.join(self.tmp, "lc"))
+        with open(self.local_file("1lcd") + ".part", "wb") as handle:
+            handle.write(data[:1000])
+        pdblist = PDBList(server=self.url, pdb=self.tmp, verbose=False)
+        pdblist.download_pdb_files(["1lcd"], file_format="pdb")
+        self.assertEqual(self.server.requests, [(path, "bytes=1000-")])
+        with open(self.local_file("1lcd"), "rb") as handle:
+            self.assertEqual(handle.read(), self.contents["1lcd"])
+        self.assertEqual(os.listdir(os.path.join(self.tmp, "lc")), ["pdb1lcd.ent"])
+
+    def test_missing_file(self):
+        """Report a missing file without creating any local file."""
+        pdblist = PDBList(server=self.url, pdb=self.tmp, verbose=False)
+        filenames = pdblist.download_pdb_files(["9xyz", "1ssu"], file_format="pdb")
+        self.assertEqual(filenames, [self.local_file("1ssu")])
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, "xy", "pdb9xyz.ent")))
+        self.assertIsNone(pdblist.retrieve_pdb_file("9xyz", file_format="pdb"))
+
+    def test_checksum(self):
+        """Verify the checksum of a downloaded file."""
+        path = "/pub/pdb/data/structures/divided/pdb/be/pdb2beg.ent.gz"
+        url = self.url + path
+        filename = os.path.join(self.tmp, "pdb2beg.ent.gz")
+        md5 = hashlib.md5(self.server.files[path]).hexdigest()
+        manager = DownloadManager()
+        with self.assertRaises(OSError):
+            manager.download(url, filename, checksum=("md5", "0" * 32))
+        self.assertFalse(os.path.exists(filename))
+        self.assertFalse(os.path.exists(filename + ".part"))
+        manager.download(url, filename, checksum=("md5", md5))
+        with open(filename, "rb") as handle:
+            self.assertEqual(handle.read(), self.server.files[path])
+        manager.close()
+
+    def test_close(self):
+        """Close the kept-alive connections of a PDBList."""
+        with PDBList(server=self.url, pdb=self.tmp, verbose=False) as pdblist:
+            pdblist.retrieve_pdb_file("1A8O", file_format="pdb")
+            self.assertEqual(len(pdblist._download_manager._connections), 1)
+        self.assertEqual(pdblist._download_manager._connections, [])
+        pdblist.retrieve_pdb_file("1SSU", file_format="pdb")
+        pdblist.close()
+        self.assertEqual(pdblist._download_manager._connections, [])
+
+    def test_file_mirror(self):
+        """Download from a mirror given as a file:// URL."""
+        mirror = os.path.join(self.tmp, "mirror")
+        for path, data in self.server.files.items():
+            filename = os.path.join(mirror, *path.split("/"))
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, "wb") as handle:
+                handle.write(data)
+        server = pathlib.Path(mirror).absolute().as_uri()
+        pdb = os.path.join(self.tmp, "pdb")
+        with PDBList(server=server, pdb=pdb, verbose=False) as pdblist:
+            filename = pdblist.retrieve_pdb_file("2BEG", file_format="pdb")
+            self.assertIsNone(pdblist.retrieve_pdb_file("9xyz", file_format="pdb"))
+        self.assertEqual(filename, os.path.join(pdb, "be", "pdb2beg.ent"))
+        with open(filename, "rb") as handle:
+            self.assertEqual(handle.read(), self.contents["2beg"])
+        self.assertEqual(self.server.requests, [])
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
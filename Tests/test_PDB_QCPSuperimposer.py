@@ -19,7 +19,11 @@ except ImportError:
 
 from Bio.PDB import PDBParser
 from Bio.PDB import Selection
+from Bio.PDB.PDBExceptions import PDBException
+from Bio.PDB.qcprot import get_ensemble_coords
 from Bio.PDB.qcprot import QCPSuperimposer
+from Bio.PDB.qcprot import rmsd_matrix
+from Bio.PDB.qcprot import superimpose_ensemble
 from Bio.SVDSuperimposer import SVDSuperimposer
 
 
@@ -180,6 +184,50 @@ class QCPSuperimposerTest(unittest.TestCase):
         self.assertAlmostEqual(rms, rms_fitted, places=6)
 
 
+class QCPEnsembleTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.structure = PDBParser(QUIET=True).get_structure("1LCD", "PDB/1LCD.pdb")
+        cls.coords = get_ensemble_coords(cls.structure, atom_names={"CA"})
+
+    def test_get_ensemble_coords(self):
+        """Extract the coordinates of all models of an NMR structure."""
+        self.assertEqual(self.coords.shape, (3, 51, 3))
+        self.assertTrue(np.allclose(self.coords[0, 0], [27.91, 28.67, 6.97]))
+        # The models do not all contain the same atoms
+        with self.assertRaises(PDBException):
+            get_ensemble_coords(self.structure)
+
+    def test_rmsd_matrix(self):
+        """Compare the RMSD matrix to pairwise QCPSuperimposer runs."""
+        matrix = rmsd_matrix(self.coords)
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertTrue(np.allclose(matrix, matrix.T))
+        self.assertTrue(np.allclose(np.diag(matrix), 0.0))
+        sup = QCPSuperimposer()
+        for i, j in ((0, 1), (1, 2), (2, 0)):
+            sup.set(self.coords[i], self.coords[j])
+            sup.run()
+            self.assertAlmostEqual(matrix[i, j], sup.get_rms(), places=6)
+
+    def test_superimpose_ensemble(self):
+        """Superimpose all models onto the first one."""
+        rmsds, rotations, translations = superimpose_ensemble(self.coords)
+        self.assertAlmostEqual(rmsds[0], 0.0, places=6)
+        sup = QCPSuperimposer()
+        for i in range(len(self.coords)):
+            sup.set(self.coords[0], self.coords[i])
+            sup.run()
+            self.assertAlmostEqual(rmsds[i], sup.get_rms(), places=6)
+            self.assertTrue(np.allclose(rotations[i], sup.rot, atol=1e-6))
+            self.assertTrue(np.allclose(translations[i], sup.tran, atol=1e-6))
+        reference = self.coords[2] + 10.0
+        rmsds, rotations, translations = superimpose_ensemble(self.coords, reference)
+        fitted = self.coords[2] @ rotations[2] + translations[2]
+        self.assertTrue(np.allclose(fitted, reference, atol=1e-6))
+        self.assertAlmostEqual(rmsds[2], 0.0, places=6)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
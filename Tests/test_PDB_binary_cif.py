@@ -2,9 +2,12 @@
 Tests for BinaryCIF code in the PDB package.
 """
 
+import os
+import tempfile
 import unittest
 
 from Bio.PDB import MMCIFParser
+from Bio.PDB.binary_cif import BinaryCIFIO
 from Bio.PDB.binary_cif import BinaryCIFParser
 
 
@@ -23,3 +26,57 @@ class TestBinaryCIFParser(unittest.TestCase):
                     bcif_structure, compare_coordinates=True
                 )
             )
+
+
+class TestBinaryCIFIO(unittest.TestCase):
+    def test_write_structure(self):
+        bcif_parser = BinaryCIFParser()
+        io = BinaryCIFIO()
+
+        # Coordinates are written with three decimals, as in mmCIF files
+        for entry in ["1gbt", "3jqh"]:
+            structure = bcif_parser.get_structure(entry, f"PDB/{entry}.bcif.gz")
+            io.set_structure(structure)
+            for suffix in (".bcif", ".bcif.gz"):
+                filenumber, filename = tempfile.mkstemp(suffix=suffix)
+                os.close(filenumber)
+                try:
+                    io.save(filename)
+                    structure_in = bcif_parser.get_structure(entry, filename)
+                finally:
+                    os.remove(filename)
+                self.assertTrue(
+                    structure.strictly_equals(structure_in, compare_coordinates=True)
+                )
+
+    def test_write_selection(self):
+        class CAlphaSelect:
+            def accept_model(self, model):
+                return True
+
+            def accept_chain(self, chain):
+                return chain.id == "A"
+
+            def accept_residue(self, residue):
+                return True
+
+            def accept_atom(self, atom):
+                return atom.name == "CA"
+
+        bcif_parser = BinaryCIFParser()
+        structure = bcif_parser.get_structure("1gbt", "PDB/1gbt.bcif.gz")
+        io = BinaryCIFIO()
+        io.set_structure(structure)
+        filenumber, filename = tempfile.mkstemp(suffix=".bcif")
+        os.close(filenumber)
+        try:
+            io.save(filename, select=CAlphaSelect())
+            structure_in = bcif_parser.get_structure("1gbt", filename)
+        finally:
+            os.remove(filename)
+        atoms = [atom for atom in structure[0]["A"].get_atoms() if atom.name == "CA"]
+        atoms_in = list(structure_in.get_atoms())
+        self.assertEqual(len(atoms_in), len(atoms))
+        self.assertEqual([chain.id for chain in structure_in[0]], ["A"])
+        for atom, atom_in in zip(atoms, atoms_in):
+            self.assertTrue(atom.strictly_equals(atom_in, compare_coordinates=True))
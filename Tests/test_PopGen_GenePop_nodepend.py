@@ -9,8 +9,12 @@
 import os
 import tempfile
 import unittest
+from io import StringIO
+
+import numpy as np
 
 from Bio.PopGen import GenePop
+from Bio.PopGen.GenePop import ArrayParser
 from Bio.PopGen.GenePop import FileParser
 
 
@@ -209,6 +213,100 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(len(rec.loci_list), initial_loci - 2)
 
 
+class ArrayParserTest(unittest.TestCase):
+    """Array parser tests."""
+
+    files = (
+        "c2line.gen",
+        "c3line.gen",
+        "c2space.gen",
+        "c3space.gen",
+        "haplo3.gen",
+        "haplo2.gen",
+        "big.gen",
+    )
+
+    def test_array_parser(self):
+        """Compare the array parser to the record parser."""
+        for filename in self.files:
+            with open(os.path.join("PopGen", filename)) as handle:
+                rec = GenePop.read(handle)
+            with open(os.path.join("PopGen", filename)) as handle:
+                arrays = ArrayParser.read(handle)
+            self.assertEqual(arrays.comment_line, rec.comment_line)
+            self.assertEqual(arrays.loci_list, rec.loci_list)
+            self.assertEqual(arrays.pop_list, rec.pop_list)
+            self.assertEqual(arrays.marker_len, rec.marker_len)
+            self.assertEqual(arrays.genotypes.dtype, np.int16)
+            for i, population in enumerate(rec.populations):
+                start, end = arrays.pop_offsets[i : i + 2]
+                self.assertEqual(end - start, len(population))
+                for j, (name, markers) in enumerate(population, start):
+                    self.assertEqual(arrays.indiv_names[j], name)
+                    for locus, marker in enumerate(markers):
+                        alleles = [0 if al is None else al for al in marker]
+                        self.assertEqual(list(arrays.genotypes[j, locus]), alleles)
+            with open(os.path.join("PopGen", filename)) as handle:
+                chunks = list(ArrayParser.read_chunks(handle, 2))
+            self.assertEqual(len(chunks), (len(rec.loci_list) + 1) // 2)
+            for i, chunk in enumerate(chunks):
+                self.assertEqual(chunk.loci_list, rec.loci_list[2 * i : 2 * i + 2])
+                self.assertEqual(chunk.pop_list, rec.pop_list)
+                self.assertTrue(
+                    np.array_equal(
+                        chunk.genotypes, arrays.genotypes[:, 2 * i : 2 * i + 2]
+                    )
+                )
+
+    def test_statistics(self):
+        """Test the allele frequencies, heterozygosities, and F-statistics."""
+        with open(os.path.join("PopGen", "c3line.gen")) as handle:
+            rec = ArrayParser.read(handle)
+        self.assertEqual(list(rec.pop_offsets), [0, 4, 7, 12])
+        alleles, counts = rec.allele_counts()
+        self.assertEqual(alleles.tolist(), [[2, 3, 0], [1, 3, 4], [2, 0, 0]])
+        self.assertEqual(
+            counts.tolist(),
+            [
+                [[0, 8, 0], [0, 2, 6], [6, 0, 0]],
+                [[0, 0, 0], [0, 0, 6], [6, 0, 0]],
+                [[1, 7, 0], [3, 0, 7], [10, 0, 0]],
+            ],
+        )
+        alleles, frequencies = rec.allele_frequencies()
+        self.assertTrue(np.isnan(frequencies[1, 0]).all())
+        self.assertEqual(frequencies[2, 0].tolist(), [0.125, 0.875, 0.0])
+        observed, expected = rec.heterozygosity()
+        self.assertTrue(np.isnan(observed[1, 0]))
+        self.assertEqual(observed[:, 1].tolist(), [0.5, 0.0, 0.2])
+        self.assertTrue(np.allclose(expected[:, 1], [0.375, 0.0, 0.42]))
+        self.assertEqual(expected[2, 0], 0.21875)
+        fis, fst, fit = rec.f_statistics()
+        # Locus 1: Ho = 0.125, Hs = 0.109375, Ht = 0.1171875
+        self.assertAlmostEqual(fis[0], 1 - 0.125 / 0.109375)
+        self.assertAlmostEqual(fst[0], 1 - 0.109375 / 0.1171875)
+        self.assertAlmostEqual(fit[0], 1 - 0.125 / 0.1171875)
+        # Locus 3 is monomorphic
+        self.assertTrue(np.isnan(fst[2]))
+        with open(os.path.join("PopGen", "haplo2.gen")) as handle:
+            rec = ArrayParser.read(handle)
+        self.assertEqual(rec.genotypes.shape, (12, 3, 1))
+        self.assertEqual(rec.allele_counts()[1].sum(), 31)
+        self.assertRaises(ValueError, rec.heterozygosity)
+
+    def test_wrong_file_parser(self):
+        """Testing the ability to deal with wrongly formatted files."""
+        with open(os.path.join("PopGen", "README")) as handle:
+            self.assertRaises(ValueError, ArrayParser.read, handle)
+        for data in (
+            "Title\nLoc1\nLoc2\nPop\nInd1, 0101 0102 0101\n",
+            "Title\nLoc1\nLoc2\nPop\nInd1, 0101 012\n",
+            "Title\nLoc1\nLoc2\nPop\nInd1, 0101 01A2\n",
+            "Title\nLoc1\nLoc2\nPop\nPop\nInd1, 0101 0102\n",
+        ):
+            self.assertRaises(ValueError, ArrayParser.read, StringIO(data))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
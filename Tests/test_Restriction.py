@@ -5,6 +5,7 @@
 
 """Testing code for Restriction enzyme classes of Biopython."""
 
+import random
 import unittest
 
 from Bio import BiopythonWarning
@@ -14,6 +15,7 @@ from Bio.Restriction import AllEnzymes
 from Bio.Restriction import Analysis
 from Bio.Restriction import Asp718I
 from Bio.Restriction import BamHI
+from Bio.Restriction import BmgI
 from Bio.Restriction import BsmBI
 from Bio.Restriction import CommOnly
 from Bio.Restriction import EarI
@@ -578,6 +580,59 @@ class RestrictionBatches(unittest.TestCase):
         # Don't cut within
         self.assertEqual(ana.do_not_cut(7, 12), {EcoRI: [2, 14]})
 
+    def test_search_single_scan(self):
+        """Compare the batch search to the search of each enzyme."""
+        random.seed(0)
+        letters = "ACGT" * 10 + "NRYWacgt"
+        seq = Seq("".join(random.choice(letters) for i in range(3000)))
+        batch = RestrictionBatch(AllEnzymes)
+        finder = batch._site_finder()
+        for blocksize in (finder.blocksize, 500):
+            finder.blocksize = blocksize
+            for linear in (True, False):
+                batch.already_mapped = None
+                hits = batch.search(seq, linear)
+                for enzyme in AllEnzymes:
+                    self.assertEqual(
+                        hits[enzyme], enzyme.search(seq, linear), msg=enzyme
+                    )
+        # GGGCCC matches the site of BmgI (GKGCCC) on both strands,
+        # but is reported on the forward strand only
+        seq = Seq("AAAGGGCCCAAAAGGGCACA")
+        self.assertEqual(RestrictionBatch([BmgI]).search(seq), {BmgI: [4, 14]})
+        self.assertEqual(BmgI.on_minus, [14])
+
+    def test_search_cache(self):
+        """Reuse the search results unless the sequence or batch changed."""
+        seq = Seq("AAAAGAATTCAAAAGGATCCAAAA")
+        batch = RestrictionBatch([EcoRI])
+        hits = batch.search(seq)
+        self.assertEqual(hits, {EcoRI: [6]})
+        self.assertIs(batch.search(Seq(str(seq))), hits)
+        self.assertIsNot(batch.search(seq, linear=False), hits)
+        batch.add(BamHI)
+        self.assertEqual(batch.search(seq), {EcoRI: [6], BamHI: [16]})
+
+    def test_search_chunks(self):
+        """Search a sequence given in chunks."""
+        seq = "TTCAAAAAAAAAAAAAAAAAAAAAAAAAAAAGAA"
+        batch = RestrictionBatch([EcoRI, KpnI, EcoRV])
+        chunks = [seq[i : i + 5] for i in range(0, len(seq), 5)]
+        self.assertEqual(batch.search_chunks(chunks), {EcoRI: [], KpnI: [], EcoRV: []})
+        hits = batch.search_chunks(iter(chunks), linear=False)
+        self.assertEqual(hits, {EcoRI: [33], KpnI: [], EcoRV: []})
+        self.assertEqual(hits, batch.search(Seq(seq), linear=False))
+        chunks = [Seq("AAGAATT"), MutableSeq("CAAGAT"), b"ATCAAA", "GAT\nAT"]
+        self.assertEqual(
+            batch.search_chunks(chunks), {EcoRI: [4], KpnI: [], EcoRV: [14]}
+        )
+        with self.assertRaises(TypeError):
+            batch.search_chunks(["AAAA", "GAA?TTC"])
+        ana = Analysis(batch, chunks)
+        self.assertEqual(len(ana.sequence), 24)
+        self.assertEqual(ana.with_sites(), {EcoRI: [4], EcoRV: [14]})
+        self.assertEqual(ana.only_between(10, 20), {EcoRV: [14]})
+
 
 class TestPrintOutputs(unittest.TestCase):
     """Class to test various print outputs."""
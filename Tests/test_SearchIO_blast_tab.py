@@ -9,6 +9,7 @@ import os
 import unittest
 
 from Bio.SearchIO import parse
+from Bio.SearchIO.BlastIO import BlastTabParser
 from Bio.SearchIO.BlastIO.blast_tab import _LONG_SHORT_MAP as all_fields
 
 # test case files are in the Blast directory
@@ -979,6 +980,86 @@ class BlastTabCases(unittest.TestCase):
         self.assertEqual(1, counter)
 
 
+class TableCases(unittest.TestCase):
+    """Test reading the rows into NumPy arrays."""
+
+    def check_queries(self, filename, **kwargs):
+        rows = []
+        qresults = []
+        for qresult in parse(filename, FMT, **kwargs):
+            hsp_rows = []
+            for hit in qresult:
+                for hsp in hit:
+                    hsp_rows.append(
+                        (
+                            qresult.id,
+                            hit.id,
+                            hsp.ident_pct,
+                            hsp.aln_span,
+                            hsp.mismatch_num,
+                            hsp.gapopen_num,
+                            hsp.query_start + 1,
+                            hsp.query_end,
+                            hsp.evalue,
+                            hsp.bitscore,
+                        )
+                    )
+            qresults.append((qresult.id, hsp_rows))
+            rows.extend(hsp_rows)
+        names = ["qseqid", "sseqid", "pident", "length", "mismatch", "gapopen"]
+        names += ["qstart", "qend", "evalue", "bitscore"]
+        for size in (1, 2, 100000):
+            tables = BlastTabParser.read_batches(filename, size=size, **kwargs)
+            values = [row for table in tables for row in table[names].tolist()]
+            self.assertEqual(values, rows)
+            values = [
+                (query_id, table[names].tolist())
+                for query_id, table in BlastTabParser.read_queries(
+                    filename, size=size, **kwargs
+                )
+            ]
+            self.assertEqual(values, qresults)
+
+    def test_tab_2226_tblastn(self):
+        """Read the rows of BLAST tabular output."""
+        self.check_queries(get_file("tab_2226_tblastn_001.txt"))
+        self.check_queries(get_file("tab_2226_tblastn_004.txt"))
+        self.check_queries(get_file("tab_2226_tblastn_005.txt"), comments=True)
+        self.check_queries(get_file("tab_2226_tblastn_006.txt"), comments=True)
+        self.check_queries(get_file("tab_2226_tblastn_012.txt"), comments=True)
+
+    def test_dtype(self):
+        """Test the column types."""
+        filename = get_file("tab_2226_tblastn_013.txt")
+        (table,) = BlastTabParser.read_batches(filename, fields="qseq std sseq")
+        self.assertEqual(table.dtype.names[:3], ("qseq", "qseqid", "sseqid"))
+        self.assertEqual(table.dtype.names[-1], "sseq")
+        self.assertEqual(table["qseq"].dtype.kind, "U")
+        self.assertEqual(table["length"].dtype.kind, "i")
+        self.assertEqual(table["evalue"].dtype.kind, "f")
+        self.assertEqual(table["sstart"].tolist(), [1744, 1057, 1057])
+        filename = get_file("tab_2228_tblastn_001.txt")
+        ((query_id, table),) = BlastTabParser.read_queries(filename, comments=True)
+        self.assertEqual(query_id, "gi|148227874|ref|NP_001088636.1|")
+        self.assertEqual(table.dtype.names, ("evalue", "sallseqid", "qseqid"))
+        self.assertEqual(
+            table["sallseqid"][0],
+            "gi|148227873|ref|NM_001095167.1|;gi|55250552|gb|BC086280.1|",
+        )
+
+    def test_errors(self):
+        """Test reading files with the wrong arguments."""
+        filename = get_file("tab_2226_tblastn_005.txt")
+        with self.assertRaises(ValueError):
+            next(BlastTabParser.read_batches(filename))
+        filename = get_file("tab_2226_tblastn_004.txt")
+        with self.assertRaises(ValueError) as cm:
+            next(BlastTabParser.read_batches(filename, fields=["qseqid", "sseqid"]))
+        self.assertEqual(str(cm.exception), "Expected 2 columns, found: 12")
+        with self.assertRaises(ValueError):
+            next(BlastTabParser.read_queries(filename, fields=["evalue"]))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
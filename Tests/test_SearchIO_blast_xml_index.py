@@ -5,11 +5,15 @@
 
 """Tests for SearchIO blast-xml indexing."""
 
+import os
+import tempfile
 import unittest
 
 from search_tests_common import CheckIndex
 from search_tests_common import CheckRaw
 
+from Bio import SearchIO
+
 
 class BlastXmlRawCases(CheckRaw):
     """Check BLAST XML get_raw method."""
@@ -761,6 +765,45 @@ class BlastXmlIndexCases(CheckIndex):
         self.check_index(filename, self.fmt)
 
 
+class BlastXmlIndexDbCases(unittest.TestCase):
+    filenames = ("Blast/mirna.xml", "Blast/wnts.xml", "Blast/xml_2226_tblastn_001.xml")
+
+    def test_workers(self):
+        """Test blast-xml index_db, indexing the files in parallel."""
+        serial = SearchIO.index_db(":memory:", self.filenames, "blast-xml")
+        parallel = SearchIO.index_db(":memory:", self.filenames, "blast-xml", workers=2)
+        self.assertEqual(len(parallel), 11)
+        self.assertEqual(list(parallel), list(serial))
+        for key in serial:
+            self.assertEqual(parallel.get_raw(key), serial.get_raw(key))
+        self.assertEqual(len(parallel["33212"]), 44)
+        serial.close()
+        parallel.close()
+
+    def test_reload(self):
+        """Test blast-xml index_db, reloading an index built in parallel."""
+        with tempfile.TemporaryDirectory() as directory:
+            index_filename = os.path.join(directory, "blast.idx")
+            db_idx = SearchIO.index_db(
+                index_filename,
+                self.filenames,
+                "blast-xml",
+                key_function=str.upper,
+                workers=None,
+            )
+            keys = list(db_idx)
+            db_idx.close()
+            db_idx._con.close()
+            db_idx = SearchIO.index_db(index_filename, key_function=str.upper)
+            self.assertEqual(list(db_idx), keys)
+            self.assertIn("GI|156630997:105-1160", db_idx)
+            self.assertEqual(
+                db_idx["GI|156630997:105-1160"].id, "gi|156630997:105-1160"
+            )
+            db_idx.close()
+            db_idx._con.close()
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -9,6 +9,8 @@ import os
 import unittest
 
 from Bio.SearchIO import parse
+from Bio.SearchIO.HmmerIO import Hmmer3DomtabHmmhitParser
+from Bio.SearchIO.HmmerIO import Hmmer3DomtabHmmqueryParser
 
 # test case files are in the Blast directory
 TEST_DIR = "Hmmer"
@@ -642,6 +644,69 @@ class HmmersearchCases(unittest.TestCase):
         self.assertEqual(0.95, hsp.acc_avg)
 
 
+class TableCases(unittest.TestCase):
+    """Test reading the hits and domains into NumPy arrays."""
+
+    def check_table(self, filename, fmt, parser):
+        hits, domains = parser.read_table(filename)
+        hit_rows = []
+        domain_rows = []
+        for qresult in parse(filename, fmt):
+            for hit in qresult:
+                hit_rows.append(
+                    (
+                        qresult.id,
+                        hit.id,
+                        hit.accession,
+                        hit.seq_len,
+                        hit.evalue,
+                        hit.bitscore,
+                        hit.bias,
+                        hit.description,
+                    )
+                )
+                for hsp in hit:
+                    domain_rows.append(
+                        (
+                            qresult.id,
+                            hit.id,
+                            hsp.domain_index,
+                            hsp.evalue_cond,
+                            hsp.evalue,
+                            hsp.bitscore,
+                            hsp.bias,
+                            hsp.query_start,
+                            hsp.query_end,
+                            hsp.hit_start,
+                            hsp.hit_end,
+                            hsp.env_start,
+                            hsp.env_end,
+                            hsp.acc_avg,
+                        )
+                    )
+        self.assertEqual(hits.tolist(), hit_rows)
+        self.assertEqual(domains.tolist(), domain_rows)
+        hits2, domains2 = parser.read_table(filename, workers=2)
+        self.assertEqual(hits2.tolist(), hit_rows)
+        self.assertEqual(domains2.tolist(), domain_rows)
+
+    def test_hmmscan(self):
+        """Read the hits and domains of hmmscan output."""
+        parser = Hmmer3DomtabHmmhitParser
+        filename = get_file("domtab_30_hmmscan_001.out")
+        self.check_table(filename, "hmmscan3-domtab", parser)
+        filename = get_file("domtab_31b1_hmmscan_001.out")
+        self.check_table(filename, "hmmscan3-domtab", parser)
+
+    def test_hmmsearch(self):
+        """Read the hits and domains of hmmsearch output."""
+        parser = Hmmer3DomtabHmmqueryParser
+        filename = get_file("domtab_30_hmmsearch_001.out")
+        self.check_table(filename, "hmmsearch3-domtab", parser)
+        filename = get_file("domtab_31b1_hmmsearch_001.out")
+        self.check_table(filename, "hmmsearch3-domtab", parser)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -9,6 +9,7 @@ import os
 import unittest
 
 from Bio.SearchIO import parse
+from Bio.SearchIO.HmmerIO import Hmmer3TextParser
 
 # test case files are in the Blast directory
 TEST_DIR = "Hmmer"
@@ -2804,6 +2805,82 @@ class PhmmerCases(unittest.TestCase):
         )
 
 
+class TableCases(unittest.TestCase):
+    """Test reading the hit and domain tables into NumPy arrays."""
+
+    def check_table(self, filename, fmt):
+        hits, domains = Hmmer3TextParser.read_table(filename)
+        hit_rows = []
+        domain_rows = []
+        for qresult in parse(filename, fmt):
+            for hit in qresult:
+                hit_rows.append(
+                    (
+                        qresult.id,
+                        hit.id,
+                        hit.description,
+                        hit.evalue,
+                        hit.bitscore,
+                        hit.bias,
+                        hit.domain_exp_num,
+                        hit.domain_obs_num,
+                        hit.is_included,
+                    )
+                )
+                for hsp in hit:
+                    domain_rows.append(
+                        (
+                            qresult.id,
+                            hit.id,
+                            hsp.domain_index,
+                            hsp.is_included,
+                            hsp.bitscore,
+                            hsp.bias,
+                            hsp.evalue_cond,
+                            hsp.evalue,
+                            hsp.query_start,
+                            hsp.query_end,
+                            hsp.query_endtype,
+                            hsp.hit_start,
+                            hsp.hit_end,
+                            hsp.hit_endtype,
+                            hsp.env_start,
+                            hsp.env_end,
+                            hsp.env_endtype,
+                            hsp.acc_avg,
+                        )
+                    )
+        self.assertEqual(hits.tolist(), hit_rows)
+        self.assertEqual(domains.tolist(), domain_rows)
+        with open(filename) as handle:
+            hits2, domains2 = Hmmer3TextParser.read_table(handle)
+        self.assertEqual(hits2.tolist(), hit_rows)
+        self.assertEqual(domains2.tolist(), domain_rows)
+        hits2, domains2 = Hmmer3TextParser.read_table(filename, workers=2)
+        self.assertEqual(hits2.tolist(), hit_rows)
+        self.assertEqual(domains2.tolist(), domain_rows)
+
+    def test_hmmscan(self):
+        """Read the tables of hmmscan output, multiple queries."""
+        self.check_table(get_file("text_30_hmmscan_001.out"), "hmmer3-text")
+        self.check_table(get_file("text_31b1_hmmscan_001.out"), "hmmer3-text")
+
+    def test_hmmsearch(self):
+        """Read the tables of hmmsearch output, with inclusion thresholds."""
+        self.check_table(get_file("text_30_hmmsearch_002.out"), "hmmer3-text")
+        self.check_table(get_file("text_31b2_hmmsearch_002.out"), "hmmer3-text")
+
+    def test_phmmer(self):
+        """Read the tables of phmmer output."""
+        self.check_table(get_file("text_31b2_phmmer_001.out"), "hmmer3-text")
+
+    def test_workers(self):
+        """Use multiple workers only with a file name."""
+        filename = get_file("text_30_hmmscan_001.out")
+        with open(filename) as handle, self.assertRaises(ValueError):
+            Hmmer3TextParser.read_table(handle, workers=2)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -6,21 +6,26 @@
 # as part of this package.
 """Tests Bio.SeqFeature."""
 
+import random
 import unittest
 import warnings
 from copy import deepcopy
+from io import StringIO
 from os import path
 
 from Bio import BiopythonParserWarning
 from Bio import Seq
 from Bio import SeqIO
 from Bio import SeqRecord
+from Bio.SeqIO.InsdcIO import EmblIterator
+from Bio.SeqIO.InsdcIO import GenBankIterator
 from Bio.Data.CodonTable import TranslationError
 from Bio.SeqFeature import AfterPosition, Location
 from Bio.SeqFeature import BeforePosition
 from Bio.SeqFeature import BetweenPosition
 from Bio.SeqFeature import CompoundLocation
 from Bio.SeqFeature import ExactPosition
+from Bio.SeqFeature import FeatureTable
 from Bio.SeqFeature import OneOfPosition
 from Bio.SeqFeature import SeqFeature
 from Bio.SeqFeature import SimpleLocation
@@ -204,6 +209,123 @@ class TestSeqFeature(unittest.TestCase):
             f.translate(seq)
 
 
+class TestFeatureTable(unittest.TestCase):
+    """Tests for the FeatureTable class."""
+
+    def check_overlapping(self, table, features, start, end):
+        expected = [
+            feature
+            for feature in features
+            if feature.location is not None
+            and feature.location.start < end
+            and feature.location.end > start
+        ]
+        found = table.overlapping(start, end)
+        self.assertEqual([id(feature) for feature in found], [id(f) for f in expected])
+
+    def test_overlapping(self):
+        """Compare the indexed search to a linear search."""
+        rng = random.Random(0)
+        features = []
+        for i in range(300):
+            start = rng.randint(0, 5000)
+            end = start + rng.choice([0, 1, 10, 100, 1000, 5000])
+            strand = rng.choice([1, -1, 0, None])
+            location = SimpleLocation(start, end, strand)
+            features.append(SeqFeature(location, type=rng.choice(["CDS", "gene"])))
+        features.append(SeqFeature(None, type="misc_feature"))
+        table = FeatureTable(features)
+        self.assertEqual(len(table), 301)
+        for i in range(300):
+            start = rng.randint(-10, 6000)
+            end = start + rng.choice([0, 1, 50, 500])
+            self.check_overlapping(table, features, start, end)
+        found = table.overlapping(1000, 2000, type="CDS", strand=-1)
+        expected = [
+            feature
+            for feature in table.overlapping(1000, 2000)
+            if feature.type == "CDS" and feature.location.strand == -1
+        ]
+        self.assertEqual(found, expected)
+        self.assertEqual(table.overlapping(1000, 2000, type="exon"), [])
+
+    def test_list_operations(self):
+        """Update the index after modifying the table."""
+        f1 = SeqFeature(SimpleLocation(10, 20), type="a")
+        f2 = SeqFeature(SimpleLocation(30, 40), type="b")
+        f3 = SeqFeature(SimpleLocation(0, 100), type="c")
+        table = FeatureTable([f1, f2])
+        self.assertEqual(table.overlapping(15, 35), [f1, f2])
+        table.insert(0, f3)
+        self.assertEqual(table[:], [f3, f1, f2])
+        self.assertEqual(table.overlapping(50, 60), [f3])
+        del table[1]
+        self.assertEqual(list(table), [f3, f2])
+        self.assertEqual(table.overlapping(15, 20), [f3])
+        f2.location = SimpleLocation(200, 300)
+        table[1] = f2
+        self.assertEqual(table.overlapping(150, 250), [f2])
+        table.extend([f1])
+        table.sort()
+        self.assertEqual(list(table), [f3, f1, f2])
+        table.sort(key=lambda feature: feature.type, reverse=True)
+        self.assertEqual(list(table), [f3, f2, f1])
+        table[:2] = [f1]
+        self.assertEqual(list(table), [f1, f1])
+        self.assertEqual(table.overlapping(0, 1000), [f1, f1])
+        self.assertRaises(TypeError, table.append, "CDS")
+        self.assertRaises(ValueError, table.append_lazy, "data", "CDS", 0, 10)
+
+    def test_slice_insertion_sites(self):
+        """Keep zero-length features at the ends of a sliced record."""
+        features = [
+            SeqFeature(Location.fromstring("10^11"), type="site"),
+            SeqFeature(SimpleLocation(20, 20), type="site2"),
+            SeqFeature(SimpleLocation(12, 18), type="x"),
+            SeqFeature(SimpleLocation(9, 9), type="before"),
+            SeqFeature(SimpleLocation(21, 21), type="after"),
+        ]
+        record = SeqRecord.SeqRecord(Seq.Seq("ACGT" * 10), features=features)
+        types = [feature.type for feature in record[10:20].features]
+        self.assertEqual(types, ["site", "site2", "x"])
+        record.features = FeatureTable(features)
+        types = [feature.type for feature in record[10:20].features]
+        self.assertEqual(types, ["site", "site2", "x"])
+
+    def test_genbank(self):
+        """Parse a GenBank file into a FeatureTable."""
+        path = "GenBank/NC_005816.gb"
+        record = SeqIO.read(path, "genbank")
+        compact = next(GenBankIterator(path, compact_features=True))
+        self.assertIsInstance(compact.features, FeatureTable)
+        self.assertEqual(len(compact.features), len(record.features))
+        self.assertEqual(compact.features[5], record.features[5])
+        for start in range(0, 9609, 250):
+            self.check_overlapping(
+                compact.features, list(compact.features), start, start + 500
+            )
+        self.assertEqual(list(compact.features), record.features)
+        sub = compact[3000:5000]
+        self.assertEqual(sub.features, record[3000:5000].features)
+        handle = StringIO()
+        SeqIO.write(compact, handle, "genbank")
+        expected = StringIO()
+        SeqIO.write(record, expected, "genbank")
+        self.assertEqual(handle.getvalue(), expected.getvalue())
+
+    def test_embl(self):
+        """Parse an EMBL file into a FeatureTable."""
+        path = "EMBL/TRBG361.embl"
+        record = SeqIO.read(path, "embl")
+        compact = next(EmblIterator(path, compact_features=True))
+        self.assertIsInstance(compact.features, FeatureTable)
+        self.assertEqual(list(compact.features), record.features)
+        features = compact.features.overlapping(100, 200)
+        self.assertEqual(
+            [feature.type for feature in features], ["source", "CDS", "mRNA"]
+        )
+
+
 class TestLocations(unittest.TestCase):
     def test_fuzzy(self):
         """Test fuzzy representations."""
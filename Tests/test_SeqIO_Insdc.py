@@ -134,6 +134,56 @@ class TestEmblRewrite(SeqRecordTestBaseClass):
             self.check_rewrite("EMBL/AE017046.embl")
 
 
+class TestLazy(SeqRecordTestBaseClass):
+    """Parse GenBank and EMBL records lazily."""
+
+    def check_lazy(self, filename, fmt):
+        records = list(SeqIO.parse(filename, fmt))
+        lazy_records = list(SeqIO.parse(filename, fmt + "-lazy"))
+        self.compare_records(records, lazy_records)
+        for record, lazy_record in zip(records, lazy_records):
+            self.assertEqual(record.dbxrefs, lazy_record.dbxrefs)
+            self.assertEqual(record.annotations, lazy_record.annotations)
+            self.assertEqual(record.features, lazy_record.features)
+
+    def test_genbank(self):
+        """Compare lazily parsed GenBank records to the usual parser."""
+        self.check_lazy("GenBank/cor6_6.gb", "genbank")
+        self.check_lazy("GenBank/NC_005816.gb", "genbank")
+        self.check_lazy("GenBank/NC_000932.gb", "genbank")
+
+    def test_embl(self):
+        """Compare lazily parsed EMBL records to the usual parser."""
+        self.check_lazy("EMBL/TRBG361.embl", "embl")
+        self.check_lazy("EMBL/U87107.embl", "embl")
+        self.check_lazy("EMBL/epo_prt_selection.embl", "embl")
+
+    def test_on_demand(self):
+        """Parse each part of the record when first accessed."""
+        record = next(SeqIO.parse("GenBank/NC_005816.gb", "genbank-lazy"))
+        self.assertEqual(record.id, "NC_005816.1")
+        self.assertNotIn("features", record.__dict__)
+        self.assertNotIn("_seq", record.__dict__)
+        self.assertEqual(len(record.features), 41)
+        self.assertNotIn("_seq", record.__dict__)
+        record.description = "plasmid pPCP1"
+        self.assertEqual(len(record), 9609)
+        self.assertEqual(record.annotations["topology"], "circular")
+        self.assertEqual(record.description, "plasmid pPCP1")
+        self.assertEqual(record.seq[:10], "TGTAACGAAC")
+        self.assertEqual(len(record[100:3000].features), 9)
+
+    def test_index(self):
+        """Index a GenBank file with lazily parsed records."""
+        records = SeqIO.index("GenBank/cor6_6.gb", "genbank-lazy")
+        record = records["AJ237582.1"]
+        self.assertEqual(record.name, "ARU237582")
+        self.assertNotIn("features", record.__dict__)
+        self.assertEqual(len(record.features), 7)
+        self.assertEqual(len(record), 206)
+        records.close()
+
+
 class ConvertTestsInsdc(SeqIOConverterTestBaseClass):
     def test_conversion(self):
         """Test format conversion by SeqIO.write/SeqIO.parse and SeqIO.convert."""
@@ -0,0 +1,86 @@
+# Copyright 2026 by The Biopython Contributors.  All rights reserved.
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Tests for the lazy loading of the Bio.SeqIO and Bio.AlignIO format modules."""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import Bio
+
+SCRIPT = """\
+import json
+import sys
+
+import %s
+
+before = sorted(sys.modules)
+%s
+after = sorted(sys.modules)
+print(json.dumps([before, after]))
+"""
+
+
+class TestImport(unittest.TestCase):
+    """Check which modules are imported, using a fresh Python interpreter."""
+
+    def run_script(self, module, code=""):
+        env = dict(os.environ)
+        path = os.path.dirname(os.path.dirname(os.path.abspath(Bio.__file__)))
+        env["PYTHONPATH"] = os.pathsep.join([path, env.get("PYTHONPATH", "")])
+        output = subprocess.check_output(
+            [sys.executable, "-W", "ignore", "-c", SCRIPT % (module, code)],
+            env=env,
+            text=True,
+        )
+        before, after = json.loads(output)
+        return set(before), set(after)
+
+    def test_SeqIO(self):
+        """Import Bio.SeqIO without its format modules or NumPy."""
+        code = """\
+from Bio import SeqIO
+records = list(SeqIO.parse("Fasta/f002", "fasta"))
+assert len(records) == 3
+"""
+        before, after = self.run_script("Bio.SeqIO", code)
+        self.assertNotIn("numpy", before)
+        self.assertNotIn("Bio.Align", before)
+        for name in ("Bio.SeqIO.FastaIO", "Bio.SeqIO.InsdcIO", "Bio.AlignIO.NexusIO"):
+            self.assertNotIn(name, before)
+        self.assertIn("Bio.SeqIO.FastaIO", after)
+        self.assertNotIn("Bio.SeqIO.InsdcIO", after)
+        self.assertNotIn("numpy", after)
+
+    def test_AlignIO(self):
+        """Import Bio.AlignIO without its format modules or NumPy."""
+        before, after = self.run_script("Bio.AlignIO")
+        self.assertNotIn("numpy", before)
+        self.assertNotIn("Bio.Align", before)
+        self.assertNotIn("Bio.AlignIO.ClustalIO", before)
+
+    def test_attributes(self):
+        """Access the format modules as attributes."""
+        from Bio import AlignIO
+        from Bio import SeqIO
+        from Bio.Align import MultipleSeqAlignment
+        from Bio.SeqIO import FastaIO
+
+        self.assertIs(SeqIO.FastaIO, FastaIO)
+        self.assertIs(SeqIO.QualityIO, sys.modules["Bio.SeqIO.QualityIO"])
+        self.assertIs(AlignIO.ClustalIO, sys.modules["Bio.AlignIO.ClustalIO"])
+        self.assertIs(AlignIO.MultipleSeqAlignment, MultipleSeqAlignment)
+        self.assertIs(SeqIO._FormatToIterator["fasta"], FastaIO.FastaIterator)
+        with self.assertRaises(AttributeError):
+            SeqIO.NoSuchIO
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
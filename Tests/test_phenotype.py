@@ -9,8 +9,6 @@
 
 try:
     import numpy as np
-
-    del np
 except ImportError:
     from Bio import MissingExternalDependencyError
 
@@ -182,6 +180,46 @@ class TestPhenoMicro(unittest.TestCase):
         self.assertRaises(ValueError, p.__add__, p1)
         self.assertRaises(ValueError, p.__sub__, p1)
 
+    def test_PlateRecord_arrays(self):
+        """Test the signal arrays and arithmetic of PlateRecord objects."""
+        p = phenotype.read(SMALL_JSON_PLATE, "pm-json")
+        p1 = phenotype.read(SMALL_JSON_PLATE_2, "pm-json")
+        times = p["A01"].get_times()
+        self.assertEqual(p.get_times(), times)
+        signals = p.get_signals()
+        self.assertEqual(signals.shape, (24, len(times)))
+        for row, w in zip(signals, p):
+            self.assertEqual(list(row), w.get_signals())
+
+        # Arithmetic on plates with the same time points in all wells
+        p2 = p + p1
+        p3 = p - p1
+        p4 = p.subtract_control("B01", wells=["A02", "B12", "A02"])
+        self.assertEqual([w.id for w in p2], [w.id for w in p])
+        for w in p:
+            self.assertEqual(p2[w.id], w + p1[w.id])
+            self.assertEqual(p3[w.id], w - p1[w.id])
+        self.assertEqual(p4["A02"], p["A02"] - p["B01"])
+        self.assertEqual(p4["B12"], p["B12"] - p["B01"])
+        self.assertIs(p4["A01"], p["A01"])
+        self.assertIs(p4["B01"], p["B01"])
+
+        # Arithmetic on plates with a well with different time points
+        w = phenotype.phen_micro.WellRecord("A01", signals={0.0: 1.0, 200.0: 3.0})
+        p[w.id] = w
+        self.assertEqual(p.get_times(), [*times, 200.0])
+        signals = p.get_signals()
+        self.assertEqual(signals.shape, (24, len(times) + 1))
+        self.assertEqual(signals[0, 0], 1.0)
+        self.assertEqual(signals[0, -1], 3.0)
+        self.assertTrue(np.isnan(signals[1, -1]))
+        self.assertEqual(list(signals[1, :-1]), p["A02"].get_signals())
+        p2 = p + p1
+        self.assertEqual(p2["A01"], w + p1["A01"])
+        self.assertEqual(p2["A02"], p["A02"] + p1["A02"])
+        p4 = p.subtract_control()
+        self.assertEqual(p4["A02"], p["A02"] - w)
+
     def test_bad_fit_args(self):
         """Test error handling of the fit method."""
         with open(JSON_PLATE) as handle:
@@ -71,6 +71,79 @@ class TestPhenoMicro(unittest.TestCase):
         self.assertEqual(w.min, 29.0)
         self.assertEqual(w.average_height, 217.82552083333334)
 
+    def test_guess_lag_single_point(self):
+        """Guess the lag point of a signal with a single point."""
+        from Bio.phenotype.pm_fitting import guess_lag
+
+        self.assertEqual(guess_lag([1.0], [2.0]), 1.0)
+        self.assertEqual(guess_lag([1.0], [[2.0], [3.0]]).tolist(), [1.0, 1.0])
+
+    def check_fit_all(self, workers):
+        # Use wells with well-defined fits, as the fits of other wells can be
+        # numerically unstable
+        plate = phenotype.read(JSON_PLATE, "pm-json")[0:2, 9:12]
+        plate2 = phenotype.read(JSON_PLATE, "pm-json")[0:2, 9:12]
+        plate2["A10"] = phenotype.phen_micro.WellRecord(
+            "A10", signals=dict(plate2["A10"].get_raw()[1:])
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", OptimizeWarning)
+            warnings.simplefilter("ignore", RuntimeWarning)
+            plate.fit_all(workers=workers)
+            plate2.fit_all(("logistic", "gompertz"), workers=workers)
+            for well, well2 in zip(plate, plate2):
+                for w, function in (
+                    (well, ("gompertz", "logistic", "richards")),
+                    (well2, ("logistic", "gompertz")),
+                ):
+                    expected = phenotype.phen_micro.WellRecord(
+                        w.id, signals=dict(w.get_raw())
+                    )
+                    try:
+                        expected.fit(function)
+                    except RuntimeError:
+                        pass
+                    for attribute in ("max", "min", "average_height", "model"):
+                        self.assertEqual(
+                            getattr(w, attribute), getattr(expected, attribute)
+                        )
+                    # The curve fitting is numerically sensitive to the
+                    # memory alignment of the arrays
+                    for attribute in ("area", "plateau", "slope", "lag", "v", "y0"):
+                        value = getattr(w, attribute)
+                        expected_value = getattr(expected, attribute)
+                        if expected_value is None:
+                            self.assertIsNone(value)
+                        else:
+                            self.assertAlmostEqual(
+                                value, expected_value, delta=1e-3 * abs(expected_value)
+                            )
+        self.assertEqual(plate["A10"].model, "gompertz")
+        self.assertAlmostEqual(plate["A10"].lag, 6.0425868725090357, places=5)
+        self.assertEqual(plate2["A10"].model, "logistic")
+        self.assertEqual(plate2["B10"].model, "logistic")
+
+    def test_fit_all(self):
+        """Test fitting all wells of a PlateRecord."""
+        self.check_fit_all(workers=1)
+        plate = phenotype.read(JSON_PLATE, "pm-json")[0]
+        plate.fit_all(None)
+        self.assertEqual(plate["A05"].max, 23.0)
+        self.assertEqual(plate["A05"].min, 13.0)
+        self.assertIsNone(plate["A05"].model)
+        self.assertIsNone(plate["A05"].area)
+        self.assertRaises(ValueError, plate.fit_all, ("wibble",))
+        plate = phenotype.read(JSON_PLATE, "pm-json")[0:1, 3:5]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", OptimizeWarning)
+            plate.fit_all()
+        self.assertIsNone(plate["A04"].model)
+        self.assertEqual(plate["A05"].model, "logistic")
+
+    def test_fit_all_parallel(self):
+        """Test fitting all wells of a PlateRecord in separate processes."""
+        self.check_fit_all(workers=2)
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)